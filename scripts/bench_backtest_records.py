@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from trading_assistant.backtest.engine import BacktestEngine, _EquityCurveBuffer, _TradeRecord
+from trading_assistant.core.models import BacktestRequest, BacktestTrade, EquityPoint, SignalAction
+from trading_assistant.factors.engine import FactorEngine
+from trading_assistant.risk.engine import RiskEngine
+from trading_assistant.strategy.registry import StrategyRegistry
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Per-bar record allocation benchmark for BacktestEngine")
+    parser.add_argument("--bars", type=int, default=2000)
+    parser.add_argument("--strategy", default="trend_following")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def _build_bars(n: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 10.0 * np.exp(np.cumsum(rng.normal(0.0, 0.02, n)))
+    start = date(2020, 1, 2)
+    return pd.DataFrame(
+        {
+            "trade_date": [start + timedelta(days=i) for i in range(n)],
+            "symbol": "000001",
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": 1_000_000.0,
+            "amount": close * 5_000_000.0,
+            "is_suspended": False,
+            "is_st": False,
+        }
+    )
+
+
+def _measure(label: str, n: int, fn: Callable[[], object]) -> None:
+    """Report time per bar and bytes per bar still held by the records ``fn`` returns."""
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    tracemalloc.start()
+    records = fn()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    print(
+        f"{label:<34} {elapsed / n * 1e6:9.2f} us/bar  "
+        f"retained={retained / n:8.1f} B/bar  peak={peak / 1024:9.1f} KiB"
+    )
+
+
+def _model_records(n: int) -> list[object]:
+    # Per-bar models as BacktestEngine.run accumulated them before the internal record types.
+    equity: list[EquityPoint] = []
+    trades: list[BacktestTrade] = []
+    start = date(2020, 1, 2)
+    for i in range(n):
+        day = start + timedelta(days=i)
+        equity.append(EquityPoint(date=day, cash=5e5 + i, position_value=5e5, equity=1e6 + i, drawdown=0.01))
+        if i % 4 == 0:
+            trades.append(
+                BacktestTrade(date=day, action=SignalAction.BUY, price=10.0, quantity=100, cost=5.0, reason="bench")
+            )
+    return [equity, trades]
+
+
+def _fast_records(n: int) -> list[object]:
+    equity = _EquityCurveBuffer(n)
+    trades: list[_TradeRecord] = []
+    start = date(2020, 1, 2)
+    for i in range(n):
+        day = start + timedelta(days=i)
+        equity.append(day, 5e5 + i, 5e5, 1e6 + i, 0.01)
+        if i % 4 == 0:
+            trades.append(
+                _TradeRecord(date=day, action=SignalAction.BUY, price=10.0, quantity=100, cost=5.0, reason="bench")
+            )
+    return [equity, trades]
+
+
+def main() -> None:
+    args = parse_args()
+    n = max(10, int(args.bars))
+    print(f"bars={n}")
+    _measure("per-bar records (pydantic models)", n, lambda: _model_records(n))
+    _measure("per-bar records (internal)", n, lambda: _fast_records(n))
+
+    bars = _build_bars(n, args.seed)
+    req = BacktestRequest(
+        symbol="000001",
+        start_date=bars["trade_date"].iloc[0],
+        end_date=bars["trade_date"].iloc[-1],
+        strategy_name=args.strategy,
+    )
+    engine = BacktestEngine(
+        FactorEngine(),
+        RiskEngine(max_single_position=0.3, max_drawdown=0.2, max_industry_exposure=0.3, min_turnover_20d=1e6),
+    )
+    strategy = StrategyRegistry().get(args.strategy)
+    features = FactorEngine().compute(bars.sort_values("trade_date").reset_index(drop=True))
+    _measure("BacktestEngine.run end-to-end", n, lambda: engine.run(bars, req, strategy, precomputed_features=features))
+
+
+if __name__ == "__main__":
+    main()
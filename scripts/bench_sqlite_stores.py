@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from trading_assistant.core.config import Settings
+
+# Point every default store at a throwaway directory before the app reads its settings,
+# so the benchmark never creates databases under data/.
+_SETTINGS_DIR = tempfile.TemporaryDirectory(prefix="bench-sqlite-settings-", ignore_cleanup_errors=True)
+for _field in Settings.model_fields:
+    if _field.endswith("_db_path"):
+        os.environ[_field.upper()] = str(Path(_SETTINGS_DIR.name) / f"{_field[: -len('_db_path')]}.db")
+
+from fastapi.testclient import TestClient
+
+from trading_assistant.audit.service import AuditService
+from trading_assistant.audit.store import AuditStore
+from trading_assistant.core.container import get_audit_service
+from trading_assistant.core.sqlite import SQLiteSettings, configure_sqlite
+from trading_assistant.main import app
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="API latency with per-call SQLite connections vs the pooled WAL layer")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--seed-events", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=10)
+    return parser.parse_args()
+
+
+def _latencies(n: int, fn: Callable[[], object]) -> list[float]:
+    out: list[float] = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        fn()
+        out.append((time.perf_counter() - t0) * 1000.0)
+    return out
+
+
+def _report(label: str, values: list[float]) -> None:
+    values = sorted(values)
+    p95 = values[min(len(values) - 1, int(0.95 * len(values)))]
+    print(f"{label:<38} mean={statistics.fmean(values):7.3f}ms  p50={statistics.median(values):7.3f}ms  p95={p95:7.3f}ms")
+
+
+def _provide(audit: AuditService) -> Callable[[], AuditService]:
+    return lambda: audit
+
+
+def _setup(label: str, settings: SQLiteSettings, args: argparse.Namespace, workdir: Path) -> AuditService:
+    configure_sqlite(settings)
+    audit = AuditService(AuditStore(str(workdir / f"{label}.db")))
+    for i in range(args.seed_events):
+        audit.log(event_type="bench", action="seed", payload={"i": i})
+    return audit
+
+
+def main() -> None:
+    args = parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    modes = {"per-call": SQLiteSettings(pooled=False), "pooled-wal": SQLiteSettings()}
+    client = TestClient(app)
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+        workdir = Path(tmp)
+        audits = {label: _setup(label, settings, args, workdir) for label, settings in modes.items()}
+        reads: dict[str, list[float]] = {label: [] for label in modes}
+        writes: dict[str, list[float]] = {label: [] for label in modes}
+        per_round = max(1, args.requests // args.rounds)
+        try:
+            # Interleave the modes in rounds so warm-up and machine noise hit both equally.
+            for _ in range(args.rounds):
+                for label, settings in modes.items():
+                    configure_sqlite(settings)
+                    audit = audits[label]
+                    app.dependency_overrides[get_audit_service] = _provide(audit)
+                    client.get("/audit/events", params={"limit": args.limit})
+                    reads[label] += _latencies(
+                        per_round,
+                        lambda: client.get("/audit/events", params={"event_type": "bench", "limit": args.limit}),
+                    )
+                    writes[label] += _latencies(
+                        per_round, lambda: audit.log(event_type="bench", action="write", payload={"ok": True})
+                    )
+        finally:
+            app.dependency_overrides.clear()
+            configure_sqlite(SQLiteSettings())
+    for label in modes:
+        _report(f"[{label}] GET /audit/events", reads[label])
+        _report(f"[{label}] audit write (hash chain)", writes[label])
+
+
+if __name__ == "__main__":
+    main()
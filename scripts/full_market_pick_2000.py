@@ -4,17 +4,15 @@ import argparse
 import csv
 import json
 import math
-import multiprocessing as mp
 import os
 import socket
 import sys
 import time
 from dataclasses import asdict, dataclass
-from datetime import date, timedelta
-from multiprocessing import TimeoutError as MPTimeoutError
-from multiprocessing.pool import Pool
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+from zoneinfo import ZoneInfo
 
 import pandas as pd
 
@@ -38,6 +36,14 @@ from trading_assistant.trading.costs import (
     required_cash_for_min_lot,
 )
 from trading_assistant.trading.small_capital import apply_small_capital_overrides
+from trading_assistant.workflow.scan_progress import (
+    ScanResultAggregator,
+    compact_scan_jsonl,
+    load_scan_checkpoint,
+    write_json_atomic,
+    write_scan_checkpoint,
+)
+from trading_assistant.workflow.scan_scheduler import ShardedScanScheduler
 
 
 STRATEGY_2000_PARAMS: dict[str, float | int | bool | str] = {
@@ -76,9 +82,132 @@ class ScanRow:
 
 
 _WORKER_CONTEXT: dict[str, Any] = {}
+_MARKET_TZ = ZoneInfo("Asia/Shanghai")
 _STRATEGY_REGISTRY = StrategyRegistry()
 
 
+class BarFileCache:
+    """On-disk cache of fetched bars shared by all scan workers.
+
+    Entries are keyed by (provider, symbol, start_date, end_date) and keep the full
+    provider frame (including tushare advanced columns) plus the security status, so a
+    cache hit yields exactly what a fresh fetch would have produced. Ranges ending on or
+    after today (Asia/Shanghai) are never cached because that day's bar is still forming,
+    and ``prune`` drops entries older than ``max_age_days``.
+    """
+
+    def __init__(self, root: Path, *, max_age_days: float = 7.0) -> None:
+        self.root = root
+        self.max_age_days = max(0.0, float(max_age_days))
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def prune(self) -> int:
+        """Delete entries (and orphaned temp files) older than max_age_days; return the count."""
+        cutoff = time.time() - self.max_age_days * 86400.0
+        removed = 0
+        for path in self.root.rglob("*"):
+            if not path.is_file() or path.suffix not in {".pkl", ".tmp"}:
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    @staticmethod
+    def cacheable(end_date: date) -> bool:
+        return end_date < datetime.now(_MARKET_TZ).date()
+
+    def _path(self, *, provider: str, symbol: str, start_date: date, end_date: date) -> Path:
+        return self.root / provider / f"{symbol}_{start_date.isoformat()}_{end_date.isoformat()}.pkl"
+
+    def load(
+        self,
+        *,
+        provider: str,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+    ) -> tuple[pd.DataFrame, dict[str, bool]] | None:
+        if not self.cacheable(end_date):
+            return None
+        path = self._path(provider=provider, symbol=symbol, start_date=start_date, end_date=end_date)
+        if not path.exists():
+            return None
+        try:
+            payload = pd.read_pickle(path)
+        except Exception:
+            return None
+        if not isinstance(payload, dict) or not isinstance(payload.get("bars"), pd.DataFrame):
+            return None
+        return payload["bars"], dict(payload.get("status") or {})
+
+    def store(
+        self,
+        *,
+        provider: str,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        bars: pd.DataFrame,
+        status: dict[str, bool],
+    ) -> None:
+        if not self.cacheable(end_date):
+            return
+        path = self._path(provider=provider, symbol=symbol, start_date=start_date, end_date=end_date)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # write-then-rename keeps concurrent readers from seeing partial files
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            pd.to_pickle({"bars": bars, "status": dict(status)}, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:
+            # cache write is best-effort and must not block scan
+            return
+
+
+class EventSnapshotBatches:
+    """Per-worker corporate event snapshots for the whole scan universe.
+
+    Providers that score from market-wide tables (they override
+    ``get_corporate_event_snapshots_many``) are asked once for every symbol of the run
+    the first time one of their snapshots is needed. Other providers are still queried
+    one symbol at a time. Failed batches are not kept, so the next symbol retries.
+    """
+
+    def __init__(self, symbols: list[str], *, as_of: date, lookback_days: int = 120) -> None:
+        self.symbols = list(dict.fromkeys(symbols))
+        self._universe = set(self.symbols)
+        self.as_of = as_of
+        self.lookback_days = int(lookback_days)
+        self._by_provider: dict[str, dict[str, dict[str, object]]] = {}
+
+    @staticmethod
+    def batched(provider: MarketDataProvider) -> bool:
+        return (
+            type(provider).get_corporate_event_snapshots_many
+            is not MarketDataProvider.get_corporate_event_snapshots_many
+        )
+
+    def get(self, provider: MarketDataProvider, symbol: str) -> dict[str, object]:
+        if not self.batched(provider):
+            return provider.get_corporate_event_snapshot(
+                symbol=symbol, as_of=self.as_of, lookback_days=self.lookback_days
+            )
+        snapshots = self._by_provider.get(provider.name)
+        if snapshots is None or symbol not in snapshots:
+            symbols = self.symbols if symbol in self._universe else [symbol]
+            fetched = provider.get_corporate_event_snapshots_many(
+                symbols, self.as_of, lookback_days=self.lookback_days
+            )
+            snapshots = self._by_provider.setdefault(provider.name, {})
+            for requested in symbols:
+                snapshots[requested] = dict(fetched.get(requested) or {})
+        return dict(snapshots.get(symbol) or {})
+
+
 def _set_global_network_timeout(timeout_sec: float) -> None:
     if timeout_sec > 0:
         socket.setdefaulttimeout(float(timeout_sec))
@@ -109,8 +238,17 @@ def _init_scan_worker(config: dict[str, Any]) -> None:
     if not providers:
         raise RuntimeError("no data provider available in worker")
 
+    bar_cache_dir = str(config.get("bar_cache_dir") or "").strip()
+    end_date = _parse_date(str(config["end_date"]))
     _WORKER_CONTEXT = {
         "providers": providers,
+        "event_snapshots": EventSnapshotBatches(list(config.get("symbols") or []), as_of=end_date),
+        "bar_cache": (
+            BarFileCache(Path(bar_cache_dir), max_age_days=float(config.get("bar_cache_max_age_days", 7.0)))
+            if bar_cache_dir
+            else None
+        ),
+        "sleep_sec": max(0, int(config.get("sleep_ms", 0))) / 1000.0,
         "factor_engine": FactorEngine(),
         "strategy": _STRATEGY_REGISTRY.get("multi_factor"),
         "risk_engine": RiskEngine(
@@ -120,7 +258,7 @@ def _init_scan_worker(config: dict[str, Any]) -> None:
             min_turnover_20d=5_000_000,
         ),
         "start_date": _parse_date(str(config["start_date"])),
-        "end_date": _parse_date(str(config["end_date"])),
+        "end_date": end_date,
         "principal": float(config["principal"]),
         "lot_size": int(config["lot_size"]),
         "cash_buffer_ratio": float(config["cash_buffer_ratio"]),
@@ -138,6 +276,8 @@ def _scan_symbol_in_worker(symbol: str) -> dict[str, Any]:
         start_date=ctx["start_date"],
         end_date=ctx["end_date"],
         providers=ctx["providers"],
+        bar_cache=ctx["bar_cache"],
+        event_snapshots=ctx["event_snapshots"],
         factor_engine=ctx["factor_engine"],
         strategy=ctx["strategy"],
         risk_engine=ctx["risk_engine"],
@@ -170,6 +310,75 @@ def _build_timeout_row(symbol: str, timeout_sec: float) -> ScanRow:
     )
 
 
+def _build_worker_error_row(symbol: str, *, reason: str, error: str) -> ScanRow:
+    return ScanRow(
+        symbol=symbol,
+        provider="-",
+        action="ERROR",
+        confidence=0.0,
+        blocked=True,
+        risk_level="CRITICAL",
+        close=None,
+        suggested_position=None,
+        suggested_lots=0,
+        max_buy_price=None,
+        buy_price_low=None,
+        buy_price_high=None,
+        reason=reason,
+        small_capital_note=None,
+        error=error,
+    )
+
+
+def _scan_worker_main(conn, config: dict[str, Any]) -> None:
+    """Worker process loop: receive one symbol at a time, send back one row each."""
+    try:
+        _init_scan_worker(config)
+    except Exception as exc:
+        conn.send(("init_error", str(exc)))
+        conn.close()
+        return
+    conn.send(("ready", None))
+    # --sleep-ms is enforced by the parent between dispatches, so workers never sleep.
+    while True:
+        try:
+            symbol = conn.recv()
+        except (EOFError, OSError):
+            break
+        if symbol is None:
+            break
+        try:
+            row_dict = _scan_symbol_in_worker(symbol)
+        except Exception as exc:
+            row_dict = asdict(_build_worker_error_row(symbol, reason="scan worker failed", error=str(exc)))
+        conn.send(("row", row_dict))
+    conn.close()
+
+
+def _scan_in_process(
+    *,
+    symbols: list[str],
+    worker_config: dict[str, Any],
+    emit: Callable[[dict[str, Any]], None],
+) -> None:
+    _init_scan_worker(worker_config)
+    sleep_sec = float(_WORKER_CONTEXT.get("sleep_sec", 0.0))
+    for symbol in symbols:
+        try:
+            row_dict = _scan_symbol_in_worker(symbol)
+        except Exception as exc:
+            row_dict = asdict(_build_worker_error_row(symbol, reason="scan worker failed", error=str(exc)))
+        emit(row_dict)
+        if sleep_sec > 0:
+            time.sleep(sleep_sec)
+
+
+def _resolve_worker_count(raw: int) -> int:
+    if int(raw) > 0:
+        return int(raw)
+    return max(1, min(8, os.cpu_count() or 1))
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="One-click full market scan for CNY 2000 account")
     parser.add_argument("--run-id", default="", help="run id for progress tracking")
@@ -201,12 +410,39 @@ def parse_args() -> argparse.Namespace:
         help="global socket timeout seconds for external data calls",
     )
     parser.add_argument("--max-symbols", type=int, default=0, help="0 means all symbols")
-    parser.add_argument("--sleep-ms", type=int, default=0, help="sleep milliseconds between symbols")
+    parser.add_argument("--sleep-ms", type=int, default=0, help="minimum milliseconds between symbols across all workers")
+    parser.add_argument("--workers", type=int, default=4, help="scan worker processes; 0 means auto (cpu count, max 8)")
+    parser.add_argument("--shard-size", type=int, default=20, help="symbols per work shard handed to a worker")
+    parser.add_argument(
+        "--bar-cache-dir",
+        default="data/full_market_bar_cache",
+        help="on-disk bar cache shared by workers and later runs; empty string disables",
+    )
+    parser.add_argument(
+        "--bar-cache-max-age-days",
+        type=float,
+        default=7.0,
+        help="bar cache entries older than this are deleted at scan start",
+    )
     parser.add_argument("--top-n", type=int, default=30, help="top candidate count for csv")
     parser.add_argument("--output-jsonl", default="reports/full_market_signals_2000.jsonl", help="output jsonl path")
     parser.add_argument("--output-summary", default="reports/full_market_summary_2000.json", help="output summary json path")
     parser.add_argument("--output-csv", default="reports/buy_candidates_2000.csv", help="output csv path")
     parser.add_argument("--progress-file", default="", help="optional progress json path")
+    parser.add_argument(
+        "--progress-interval-sec",
+        type=float,
+        default=1.0,
+        help="minimum seconds between progress snapshot flushes",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "continue the run recorded in the output jsonl checkpoint: reuse its universe, "
+            "skip scanned symbols and retry TIMEOUT/ERROR rows; parameters must match"
+        ),
+    )
     parser.add_argument(
         "--keep-proxy",
         action="store_true",
@@ -331,14 +567,32 @@ def _get_daily_bars(
     symbol: str,
     start_date: date,
     end_date: date,
+    bar_cache: BarFileCache | None = None,
 ) -> tuple[str, pd.DataFrame, dict[str, bool]]:
     errors: list[str] = []
     for provider in providers:
         try:
-            bars = provider.get_daily_bars(symbol, start_date, end_date)
-            if bars is None or bars.empty:
-                raise RuntimeError("empty bars")
-            status = provider.get_security_status(symbol)
+            cached = (
+                bar_cache.load(provider=provider.name, symbol=symbol, start_date=start_date, end_date=end_date)
+                if bar_cache is not None
+                else None
+            )
+            if cached is not None:
+                bars, status = cached
+            else:
+                bars = provider.get_daily_bars(symbol, start_date, end_date)
+                if bars is None or bars.empty:
+                    raise RuntimeError("empty bars")
+                status = provider.get_security_status(symbol)
+                if bar_cache is not None:
+                    bar_cache.store(
+                        provider=provider.name,
+                        symbol=symbol,
+                        start_date=start_date,
+                        end_date=end_date,
+                        bars=bars,
+                        status=status,
+                    )
             out = bars.sort_values("trade_date").copy()
             out["is_st"] = bool(status.get("is_st", False))
             out["is_suspended"] = bool(status.get("is_suspended", False))
@@ -411,15 +665,17 @@ def _enrich_event_score(
     providers: list[MarketDataProvider],
     symbol: str,
     as_of: date,
+    event_snapshots: EventSnapshotBatches | None = None,
 ) -> pd.DataFrame:
     out = bars.copy()
     if "event_score" not in out.columns:
         out["event_score"] = 0.0
     if "negative_event_score" not in out.columns:
         out["negative_event_score"] = 0.0
+    batches = event_snapshots or EventSnapshotBatches([symbol], as_of=as_of)
     for provider in providers:
         try:
-            snapshot = provider.get_corporate_event_snapshot(symbol=symbol, as_of=as_of, lookback_days=120)
+            snapshot = batches.get(provider, symbol)
         except NotImplementedError:
             continue
         except Exception:
@@ -450,6 +706,8 @@ def _scan_symbol(
     cash_buffer_ratio: float,
     max_single_position: float,
     min_edge_bps: float,
+    bar_cache: BarFileCache | None = None,
+    event_snapshots: EventSnapshotBatches | None = None,
 ) -> ScanRow:
     commission_rate = 0.0003
     min_commission_cny = 5.0
@@ -463,6 +721,7 @@ def _scan_symbol(
             symbol=symbol,
             start_date=start_date,
             end_date=end_date,
+            bar_cache=bar_cache,
         )
     except Exception as exc:
         return ScanRow(
@@ -503,7 +762,13 @@ def _scan_symbol(
         )
 
     enriched = _enrich_fundamental(bars=bars, providers=providers, symbol=symbol, as_of=end_date)
-    enriched = _enrich_event_score(bars=enriched, providers=providers, symbol=symbol, as_of=end_date)
+    enriched = _enrich_event_score(
+        bars=enriched,
+        providers=providers,
+        symbol=symbol,
+        as_of=end_date,
+        event_snapshots=event_snapshots,
+    )
     features = factor_engine.compute(enriched)
     latest = features.sort_values("trade_date").iloc[-1]
     previous = features.sort_values("trade_date").iloc[-2] if len(features) >= 2 else latest
@@ -695,45 +960,6 @@ def _scan_symbol(
     )
 
 
-def _is_buy_candidate(row: dict[str, Any]) -> bool:
-    return (
-        str(row.get("action", "")) == "BUY"
-        and (not bool(row.get("blocked", False)))
-        and str(row.get("risk_level", "")) != "CRITICAL"
-        and row.get("close") is not None
-        and row.get("max_buy_price") is not None
-        and float(row.get("close")) <= float(row.get("max_buy_price"))
-        and row.get("buy_price_high") is not None
-    )
-
-
-def _collect_top_candidates_from_jsonl(*, jsonl_path: Path, top_n: int) -> list[dict[str, Any]]:
-    import heapq
-
-    top_n = max(1, int(top_n))
-    heap: list[tuple[float, int, dict[str, Any]]] = []
-    row_idx = 0
-    with jsonl_path.open("r", encoding="utf-8") as f:
-        for raw in f:
-            line = raw.strip()
-            if not line:
-                continue
-            row = json.loads(line)
-            if not _is_buy_candidate(row):
-                row_idx += 1
-                continue
-            confidence = float(row.get("confidence", 0.0))
-            item = (confidence, row_idx, row)
-            if len(heap) < top_n:
-                heapq.heappush(heap, item)
-            else:
-                if confidence > heap[0][0]:
-                    heapq.heapreplace(heap, item)
-            row_idx += 1
-    top = sorted(heap, key=lambda x: x[0], reverse=True)
-    return [x[2] for x in top]
-
-
 def _write_top_csv(*, top_rows: list[dict[str, Any]], output_csv: Path) -> None:
     output_csv.parent.mkdir(parents=True, exist_ok=True)
     fieldnames = [
@@ -780,6 +1006,7 @@ def _write_summary_json(
     top_rows: list[dict[str, Any]],
     output_jsonl: Path,
     output_csv: Path,
+    resumed_symbols: int = 0,
 ) -> None:
     output_summary.parent.mkdir(parents=True, exist_ok=True)
     payload = {
@@ -788,6 +1015,7 @@ def _write_summary_json(
         "buy_pass_symbols": int(buy_pass),
         "error_symbols": int(errors),
         "timeout_symbols": int(timeouts),
+        "resumed_symbols": int(resumed_symbols),
         "jsonl_path": str(output_jsonl),
         "csv_path": str(output_csv),
         "top_candidates": top_rows,
@@ -799,8 +1027,7 @@ def _write_progress(progress_file: Path | None, payload: dict[str, Any]) -> None
     if progress_file is None:
         return
     try:
-        progress_file.parent.mkdir(parents=True, exist_ok=True)
-        progress_file.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        write_json_atomic(progress_file, payload)
     except Exception:
         # progress write is best-effort and must not block scan
         return
@@ -826,11 +1053,9 @@ def main() -> None:
 
     _set_global_network_timeout(float(max(0.1, float(args.network_timeout_sec))))
 
-    print("[info] loading stock universe ...")
-    symbols = _load_universe(token=token, max_symbols=max(0, int(args.max_symbols)))
-    print(f"[info] universe size: {len(symbols)}")
 
     symbol_timeout_sec = float(max(5.0, float(args.symbol_timeout_sec)))
+    bar_cache_dir = str(args.bar_cache_dir or "").strip()
     worker_config = {
         "token": token,
         "keep_proxy": bool(args.keep_proxy),
@@ -842,48 +1067,18 @@ def main() -> None:
         "cash_buffer_ratio": float(args.cash_buffer_ratio),
         "max_single_position": float(args.max_single_position),
         "min_edge_bps": float(args.min_edge_bps),
+        "sleep_ms": max(0, int(args.sleep_ms)),
+        "bar_cache_dir": str(ROOT_DIR / bar_cache_dir) if bar_cache_dir else "",
+        "bar_cache_max_age_days": max(0.0, float(args.bar_cache_max_age_days)),
     }
+    if bar_cache_dir:
+        pruned = BarFileCache(
+            Path(worker_config["bar_cache_dir"]), max_age_days=worker_config["bar_cache_max_age_days"]
+        ).prune()
+        if pruned:
+            print(f"[info] pruned {pruned} expired bar cache entries")
+    workers = _resolve_worker_count(int(args.workers))
 
-    mp_ctx = mp.get_context("spawn")
-
-    def _open_worker_pool() -> Pool:
-        return mp_ctx.Pool(
-            processes=1,
-            initializer=_init_scan_worker,
-            initargs=(worker_config,),
-        )
-
-    worker_pool: Pool | None = None
-    fallback_mode = False
-    fallback_note: str | None = None
-    fallback_providers: list[MarketDataProvider] | None = None
-    fallback_factor_engine: FactorEngine | None = None
-    fallback_strategy: BaseStrategy | None = None
-    fallback_risk_engine: RiskEngine | None = None
-    try:
-        worker_pool = _open_worker_pool()
-    except Exception as exc:
-        fallback_mode = True
-        fallback_note = (
-            "worker pool unavailable; fallback to in-process scan, "
-            "hard symbol timeout disabled"
-        )
-        print(f"[warn] {fallback_note}: {exc}")
-
-    if fallback_mode:
-        fallback_providers = _build_providers(token=token)
-        if not fallback_providers:
-            raise RuntimeError("no data provider available")
-        fallback_factor_engine = FactorEngine()
-        fallback_strategy = _STRATEGY_REGISTRY.get("multi_factor")
-        fallback_risk_engine = RiskEngine(
-            max_single_position=float(args.max_single_position),
-            max_drawdown=0.12,
-            max_industry_exposure=0.20,
-            min_turnover_20d=5_000_000,
-        )
-
-    sleep_sec = max(0, int(args.sleep_ms)) / 1000.0
     output_jsonl = ROOT_DIR / args.output_jsonl
     output_summary = ROOT_DIR / args.output_summary
     output_csv = ROOT_DIR / args.output_csv
@@ -893,189 +1088,137 @@ def main() -> None:
     output_summary.parent.mkdir(parents=True, exist_ok=True)
     output_csv.parent.mkdir(parents=True, exist_ok=True)
 
-    total_scanned = 0
-    total_buy_pass = 0
-    total_errors = 0
-    total_timeouts = 0
-    total = len(symbols)
+    # Everything that changes a row's content; a resumed run must match the checkpoint exactly.
+    run_params = {
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "principal": float(args.principal),
+        "lot_size": int(args.lot_size),
+        "cash_buffer_ratio": float(args.cash_buffer_ratio),
+        "max_single_position": float(args.max_single_position),
+        "min_edge_bps": float(args.min_edge_bps),
+        "max_symbols": max(0, int(args.max_symbols)),
+    }
+    aggregator = ScanResultAggregator(top_n=int(args.top_n))
+    if args.resume:
+        # The checkpoint's universe is reused so upstream listing changes cannot mix universes.
+        symbols = load_scan_checkpoint(output_jsonl, params=run_params)
+        replay = compact_scan_jsonl(output_jsonl, aggregator)
+        print(
+            f"[info] resuming run {run_id or '-'}: {replay['kept']} symbols already scanned, "
+            f"{replay['retry']} timeout/error rows to retry, {replay['corrupt']} corrupt lines skipped"
+        )
+    else:
+        print("[info] loading stock universe ...")
+        symbols = _load_universe(token=token, max_symbols=run_params["max_symbols"])
+        write_scan_checkpoint(output_jsonl, params=run_params, universe=symbols)
+    print(f"[info] universe size: {len(symbols)}")
+    resumed_symbols = int(aggregator.scanned)
+    total = len(set(symbols) | aggregator.scanned_symbols)
+    scan_note: str | None = None
     started_at_iso = pd.Timestamp.utcnow().isoformat()
-    _write_progress(
-        progress_file,
-        {
-            "run_id": run_id or None,
-            "status": "RUNNING",
-            "total_symbols": int(total),
-            "scanned_symbols": 0,
-            "buy_pass_symbols": 0,
-            "error_symbols": 0,
-            "timeout_symbols": 0,
-            "progress_pct": 0.0,
-            "started_at": started_at_iso,
-            "updated_at": started_at_iso,
-            "finished_at": None,
-            "message": "scan started",
-        },
-    )
-    try:
-        with output_jsonl.open("w", encoding="utf-8") as sink:
-            for idx, symbol in enumerate(symbols, start=1):
-                row_dict: dict[str, Any]
-                try:
-                    if worker_pool is None:
-                        if (
-                            fallback_providers is None
-                            or fallback_factor_engine is None
-                            or fallback_strategy is None
-                            or fallback_risk_engine is None
-                        ):
-                            raise RuntimeError("fallback context unavailable")
-                        row = _scan_symbol(
-                            symbol=symbol,
-                            start_date=start_date,
-                            end_date=end_date,
-                            providers=fallback_providers,
-                            factor_engine=fallback_factor_engine,
-                            strategy=fallback_strategy,
-                            risk_engine=fallback_risk_engine,
-                            principal=float(args.principal),
-                            lot_size=int(args.lot_size),
-                            cash_buffer_ratio=float(args.cash_buffer_ratio),
-                            max_single_position=float(args.max_single_position),
-                            min_edge_bps=float(args.min_edge_bps),
-                        )
-                        row_dict = asdict(row)
-                    else:
-                        async_res = worker_pool.apply_async(_scan_symbol_in_worker, args=(symbol,))
-                        row_dict = async_res.get(timeout=symbol_timeout_sec)
-                except MPTimeoutError:
-                    timeout_row = _build_timeout_row(symbol=symbol, timeout_sec=symbol_timeout_sec)
-                    row_dict = asdict(timeout_row)
-                    try:
-                        worker_pool.terminate()
-                        worker_pool.join()
-                    except Exception:
-                        pass
-                    try:
-                        worker_pool = _open_worker_pool()
-                    except Exception as pool_exc:
-                        worker_pool = None
-                        fallback_mode = True
-                        fallback_note = (
-                            "worker pool restart failed; fallback to in-process scan, "
-                            "hard symbol timeout disabled"
-                        )
-                        print(f"[warn] {fallback_note}: {pool_exc}")
-                        if fallback_providers is None:
-                            fallback_providers = _build_providers(token=token)
-                        if not fallback_providers:
-                            raise RuntimeError("no data provider available")
-                        if fallback_factor_engine is None:
-                            fallback_factor_engine = FactorEngine()
-                        if fallback_strategy is None:
-                            fallback_strategy = _STRATEGY_REGISTRY.get("multi_factor")
-                        if fallback_risk_engine is None:
-                            fallback_risk_engine = RiskEngine(
-                                max_single_position=float(args.max_single_position),
-                                max_drawdown=0.12,
-                                max_industry_exposure=0.20,
-                                min_turnover_20d=5_000_000,
-                            )
-                except Exception as exc:
-                    row_dict = asdict(
-                        ScanRow(
-                            symbol=symbol,
-                            provider="-",
-                            action="ERROR",
-                            confidence=0.0,
-                            blocked=True,
-                            risk_level="CRITICAL",
-                            close=None,
-                            suggested_position=None,
-                            suggested_lots=0,
-                            max_buy_price=None,
-                            buy_price_low=None,
-                            buy_price_high=None,
-                            reason="scan worker failed",
-                            small_capital_note=None,
-                            error=str(exc),
-                        )
-                    )
+    progress_interval_sec = max(0.0, float(args.progress_interval_sec))
+    last_flush = 0.0
+
+    def _flush_progress(*, status: str, message: str, finished_at: str | None = None) -> None:
+        nonlocal last_flush
+        last_flush = time.monotonic()
+        _write_progress(
+            progress_file,
+            aggregator.snapshot(
+                total_symbols=total,
+                run_id=run_id or None,
+                status=status,
+                workers=int(workers),
+                checkpoint={
+                    "jsonl_path": str(output_jsonl),
+                    "jsonl_rows": int(aggregator.scanned),
+                    "last_symbol": aggregator.last_symbol,
+                    "resumed_symbols": resumed_symbols,
+                },
+                current_symbol=aggregator.last_symbol,
+                started_at=started_at_iso,
+                updated_at=finished_at or pd.Timestamp.utcnow().isoformat(),
+                finished_at=finished_at,
+                message=message,
+            ),
+        )
 
-                sink.write(json.dumps(row_dict, ensure_ascii=False) + "\n")
-                total_scanned += 1
-                if str(row_dict.get("action", "")).upper() == "TIMEOUT":
-                    total_timeouts += 1
-                elif row_dict.get("error") is not None:
-                    total_errors += 1
-                if _is_buy_candidate(row_dict):
-                    total_buy_pass += 1
-                now_iso = pd.Timestamp.utcnow().isoformat()
-                _write_progress(
-                    progress_file,
-                    {
-                        "run_id": run_id or None,
-                        "status": "RUNNING",
-                        "total_symbols": int(total),
-                        "scanned_symbols": int(total_scanned),
-                        "buy_pass_symbols": int(total_buy_pass),
-                        "error_symbols": int(total_errors),
-                        "timeout_symbols": int(total_timeouts),
-                        "progress_pct": round(float(total_scanned) / max(float(total), 1.0) * 100.0, 2),
-                        "current_symbol": symbol,
-                        "started_at": started_at_iso,
-                        "updated_at": now_iso,
-                        "finished_at": None,
-                        "message": f"scanning {symbol}" if not fallback_mode else f"scanning {symbol} ({fallback_note})",
-                    },
+    _flush_progress(
+        status="RUNNING",
+        message=f"scan resumed after {resumed_symbols} symbols" if args.resume else "scan started",
+    )
+    with output_jsonl.open("a" if args.resume else "w", encoding="utf-8") as sink:
+
+        def _emit(row_dict: dict[str, Any]) -> None:
+            sink.write(json.dumps(row_dict, ensure_ascii=False) + "\n")
+            sink.flush()
+            if not aggregator.add(row_dict):
+                return
+            if time.monotonic() - last_flush >= progress_interval_sec or aggregator.scanned == total:
+                symbol = str(row_dict.get("symbol", ""))
+                _flush_progress(
+                    status="RUNNING",
+                    message=f"scanned {symbol}" if scan_note is None else f"scanned {symbol} ({scan_note})",
                 )
-                if idx % 50 == 0 or idx == total:
-                    print(
-                        f"[progress] {idx}/{total} scanned, buy_pass={total_buy_pass}, "
-                        f"errors={total_errors}, timeouts={total_timeouts}"
-                    )
-                if sleep_sec > 0:
-                    time.sleep(sleep_sec)
-    finally:
-        if worker_pool is not None:
-            try:
-                worker_pool.close()
-                worker_pool.join()
-            except Exception:
-                try:
-                    worker_pool.terminate()
-                    worker_pool.join()
-                except Exception:
-                    pass
-
-    top_rows = _collect_top_candidates_from_jsonl(jsonl_path=output_jsonl, top_n=int(args.top_n))
+            if aggregator.scanned % 50 == 0 or aggregator.scanned == total:
+                print(
+                    f"[progress] {aggregator.scanned}/{total} scanned, buy_pass={aggregator.buy_pass}, "
+                    f"errors={aggregator.errors}, timeouts={aggregator.timeouts}"
+                )
+
+        remaining = [symbol for symbol in symbols if symbol not in aggregator]
+        # Workers score corporate events for the whole remaining universe in one batch call.
+        worker_config["symbols"] = list(remaining)
+        scheduler = ShardedScanScheduler(
+            worker_main=_scan_worker_main,
+            worker_config=worker_config,
+            workers=workers,
+            shard_size=int(args.shard_size),
+            symbol_timeout_sec=symbol_timeout_sec,
+            timeout_row=lambda symbol, timeout_sec: asdict(_build_timeout_row(symbol, timeout_sec)),
+            crash_row=lambda symbol: asdict(
+                _build_worker_error_row(symbol, reason="scan worker crashed", error="worker exited")
+            ),
+            dispatch_interval_sec=max(0, int(args.sleep_ms)) / 1000.0,
+        )
+        try:
+            remaining = scheduler.run(remaining, _emit)
+        except Exception as exc:
+            scan_note = "worker pool unavailable; fallback to in-process scan, hard symbol timeout disabled"
+            print(f"[warn] {scan_note}: {exc}")
+            remaining = [symbol for symbol in symbols if symbol not in aggregator]
+        if scheduler.recycled_workers:
+            print(f"[info] recycled scan workers: {scheduler.recycled_workers}")
+
+        if remaining:
+            if scan_note is None:
+                scan_note = "no scan worker could start; fallback to in-process scan, hard symbol timeout disabled"
+                print(f"[warn] {scan_note}")
+            _scan_in_process(
+                symbols=remaining,
+                worker_config=worker_config,
+                emit=_emit,
+            )
+
+    top_rows = aggregator.top_candidates()
     _write_top_csv(top_rows=top_rows, output_csv=output_csv)
     _write_summary_json(
         output_summary=output_summary,
-        total=total_scanned,
-        buy_pass=total_buy_pass,
-        errors=total_errors,
-        timeouts=total_timeouts,
+        total=aggregator.scanned,
+        buy_pass=aggregator.buy_pass,
+        errors=aggregator.errors,
+        timeouts=aggregator.timeouts,
         top_rows=top_rows,
         output_jsonl=output_jsonl,
         output_csv=output_csv,
+        resumed_symbols=resumed_symbols,
     )
-    finished_at_iso = pd.Timestamp.utcnow().isoformat()
-    _write_progress(
-        progress_file,
-        {
-            "run_id": run_id or None,
-            "status": "COMPLETED",
-            "total_symbols": int(total_scanned),
-            "scanned_symbols": int(total_scanned),
-            "buy_pass_symbols": int(total_buy_pass),
-            "error_symbols": int(total_errors),
-            "timeout_symbols": int(total_timeouts),
-            "progress_pct": 100.0,
-            "started_at": started_at_iso,
-            "updated_at": finished_at_iso,
-            "finished_at": finished_at_iso,
-            "message": "scan completed",
-        },
+    total = aggregator.scanned
+    _flush_progress(
+        status="COMPLETED",
+        message="scan completed",
+        finished_at=pd.Timestamp.utcnow().isoformat(),
     )
 
     print(f"[done] jsonl  : {output_jsonl}")
@@ -8,6 +8,8 @@ param(
   [double]$MinEdgeBps = 140,
   [int]$MaxSymbols = 0,
   [int]$SleepMs = 0,
+  [int]$Workers = 4,
+  [int]$ShardSize = 20,
   [int]$TopN = 30
 )
 
@@ -45,6 +47,8 @@ try {
     --min-edge-bps $MinEdgeBps `
     --max-symbols $MaxSymbols `
     --sleep-ms $SleepMs `
+    --workers $Workers `
+    --shard-size $ShardSize `
     --top-n $TopN `
     --output-jsonl reports/full_market_signals_2000.jsonl `
     --output-summary reports/full_market_summary_2000.json `
@@ -5,9 +5,9 @@ from email.message import EmailMessage
 import json
 import smtplib
 from typing import Any
-from urllib import request
 
 from trading_assistant.core.config import Settings
+from trading_assistant.core.http_client import get_http_client
 
 
 @dataclass
@@ -140,15 +140,14 @@ class RealAlertDispatcher:
                 "payload": payload,
             }
         raw = json.dumps(body, ensure_ascii=False).encode("utf-8")
-        req = request.Request(
-            url=url,
-            data=raw,
-            method="POST",
-            headers={"Content-Type": "application/json; charset=utf-8"},
-        )
         try:
-            with request.urlopen(req, timeout=self.settings.alert_notify_timeout_seconds) as resp:  # noqa: S310
-                status = getattr(resp, "status", 200)
+            resp = get_http_client().post(
+                url,
+                content=raw,
+                headers={"Content-Type": "application/json; charset=utf-8"},
+                timeout=self.settings.alert_notify_timeout_seconds,
+            )
+            status = resp.status_code
             if status >= 400:
                 return AlertSendResult(success=False, error_message=f"webhook status={status}")
             return AlertSendResult(success=True, provider_status=str(status))
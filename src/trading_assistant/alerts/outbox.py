@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+import logging
+import math
+import threading
+import time
+from typing import Any, Protocol
+
+from trading_assistant.alerts.dispatcher import AlertSendResult
+from trading_assistant.alerts.store import AlertOutboxItem, AlertStore
+from trading_assistant.core.models import (
+    AlertDeliveryStatus,
+    AlertOutboxChannelStats,
+    AlertOutboxDrainResult,
+    AlertOutboxStats,
+)
+
+logger = logging.getLogger(__name__)
+
+_SEVERITY_ORDER = {"INFO": 1, "WARNING": 2, "CRITICAL": 3}
+# Channels that render only subject/message text, so a digest reaches them in the same shape.
+# Generic IM webhooks and PagerDuty receivers parse the payload schema and always get one alert.
+_DIGEST_CHANNELS = frozenset({"email", "dingtalk", "wecom"})
+
+
+class _Sender(Protocol):
+    def send(
+        self,
+        *,
+        channel: str,
+        target: str,
+        subject: str,
+        message: str,
+        payload: dict[str, Any],
+    ) -> AlertSendResult:
+        ...
+
+
+class AlertOutboxDispatcher:
+    """Delivers queued alert messages off the sync path.
+
+    ``AlertService`` only inserts outbox rows; ``drain`` leases due rows and sends each one on
+    a per-channel thread pool so a slow webhook only occupies its own channel's workers. With
+    ``coalesce`` enabled, rows for the same text-only channel/target are merged into one digest
+    message; on-call stages and payload-schema channels are never merged. Leases of rows still
+    in flight are renewed every third of ``lease_seconds``, so another process never reclaims
+    them mid-send. Failures are retried with exponential backoff until ``max_attempts``; every
+    final outcome is written to the delivery log with its enqueue-to-delivery latency.
+    """
+
+    def __init__(
+        self,
+        *,
+        store: AlertStore,
+        dispatcher: _Sender,
+        default_concurrency: int = 4,
+        channel_concurrency: dict[str, int] | None = None,
+        max_attempts: int = 5,
+        backoff_seconds: float = 5.0,
+        backoff_max_seconds: float = 600.0,
+        batch_size: int = 200,
+        lease_seconds: int = 120,
+        coalesce: bool = False,
+        poll_seconds: float = 2.0,
+    ) -> None:
+        self.store = store
+        self.dispatcher = dispatcher
+        self.default_concurrency = max(1, int(default_concurrency))
+        self.channel_concurrency = {
+            str(k).strip().lower(): max(1, int(v)) for k, v in (channel_concurrency or {}).items()
+        }
+        self.max_attempts = max(1, int(max_attempts))
+        self.backoff_seconds = max(0.0, float(backoff_seconds))
+        self.backoff_max_seconds = max(self.backoff_seconds, float(backoff_max_seconds))
+        self.batch_size = max(1, int(batch_size))
+        self.lease_seconds = max(1, int(lease_seconds))
+        self.coalesce = bool(coalesce)
+        self.poll_seconds = max(0.05, float(poll_seconds))
+        self._executors: dict[str, ThreadPoolExecutor] = {}
+        self._executor_lock = threading.Lock()
+        self._drain_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def enqueue(
+        self,
+        *,
+        notification_id: int,
+        subscription_id: int,
+        channel: str,
+        target: str,
+        subject: str,
+        message: str,
+        payload: dict[str, Any],
+    ) -> int:
+        # Each on-call stage is its own page, so rows carrying an oncall_ref never share a digest.
+        oncall_ref = str(payload.get("oncall_ref") or "")
+        return self.store.enqueue_outbox(
+            notification_id=notification_id,
+            subscription_id=subscription_id,
+            channel=channel,
+            target=target,
+            coalesce_key=f"{channel}|{target}|{oncall_ref}",
+            subject=subject,
+            message=message,
+            payload=payload,
+        )
+
+    def drain(self, *, now: datetime | None = None) -> AlertOutboxDrainResult:
+        """Send everything due at ``now``; blocks until this batch is finished."""
+        with self._drain_lock:
+            claim_time = now or datetime.now(timezone.utc)
+            items = self.store.claim_outbox(now=claim_time, limit=self.batch_size, lease_seconds=self.lease_seconds)
+            result = AlertOutboxDrainResult(claimed=len(items))
+            if not items:
+                return result
+
+            groups: dict[str, list[AlertOutboxItem]] = defaultdict(list)
+            for item in items:
+                groups[self._group_key(item)].append(item)
+            pending: dict[Future, list[AlertOutboxItem]] = {
+                self._executor(group[0].channel).submit(self._send_group, group): group for group in groups.values()
+            }
+            result.messages_sent = len(pending)
+            result.coalesced = sum(len(group) - 1 for group in groups.values())
+
+            # Store writes stay on this thread; workers only talk to the remote endpoints.
+            heartbeat = max(0.05, self.lease_seconds / 3.0)
+            while pending:
+                done, _ = wait(pending, timeout=heartbeat, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._finish_group(pending.pop(future), future, claim_time=claim_time, result=result)
+                if pending:
+                    self.store.renew_outbox_lease(
+                        [item.id for group in pending.values() for item in group],
+                        until=datetime.now(timezone.utc) + timedelta(seconds=self.lease_seconds),
+                    )
+            return result
+
+    def _finish_group(
+        self,
+        group: list[AlertOutboxItem],
+        future: Future,
+        *,
+        claim_time: datetime,
+        result: AlertOutboxDrainResult,
+    ) -> None:
+        try:
+            send_result = future.result()
+        except Exception as exc:  # noqa: BLE001
+            send_result = AlertSendResult(success=False, error_message=str(exc))
+        finished_at = datetime.now(timezone.utc)
+        for item in group:
+            attempts = item.attempts + 1
+            payload = {
+                **item.payload,
+                "provider_status": send_result.provider_status,
+                "outbox_id": item.id,
+                "attempts": attempts,
+                "digest_size": len(group),
+            }
+            if send_result.success:
+                self.store.finish_outbox(
+                    item,
+                    status=AlertDeliveryStatus.SENT,
+                    attempts=attempts,
+                    error_message="",
+                    delivered_at=finished_at,
+                    payload=payload,
+                )
+                result.delivered += 1
+            elif attempts >= self.max_attempts:
+                self.store.finish_outbox(
+                    item,
+                    status=AlertDeliveryStatus.FAILED,
+                    attempts=attempts,
+                    error_message=send_result.error_message,
+                    delivered_at=finished_at,
+                    payload=payload,
+                )
+                result.failed += 1
+            else:
+                self.store.retry_outbox(
+                    item.id,
+                    attempts=attempts,
+                    error_message=send_result.error_message,
+                    next_attempt_at=claim_time + timedelta(seconds=self._backoff(attempts)),
+                )
+                result.retried += 1
+
+    def _group_key(self, item: AlertOutboxItem) -> str:
+        if self.coalesce and item.channel.strip().lower() in _DIGEST_CHANNELS:
+            return item.coalesce_key
+        return f"{item.coalesce_key}|{item.id}"
+
+    def stats(self, *, limit: int = 1000) -> AlertOutboxStats:
+        counts = self.store.outbox_status_counts()
+        by_channel: dict[str, list[float]] = defaultdict(list)
+        for channel, latency_ms in self.store.list_outbox_latencies(limit=limit):
+            by_channel[channel].append(latency_ms)
+        channels: list[AlertOutboxChannelStats] = []
+        for channel in sorted(by_channel):
+            values = sorted(by_channel[channel])
+            channels.append(
+                AlertOutboxChannelStats(
+                    channel=channel,
+                    samples=len(values),
+                    latency_p50_ms=round(_quantile(values, 0.50), 3),
+                    latency_p90_ms=round(_quantile(values, 0.90), 3),
+                    latency_p99_ms=round(_quantile(values, 0.99), 3),
+                    latency_max_ms=round(values[-1], 3),
+                )
+            )
+        return AlertOutboxStats(
+            generated_at=datetime.now(timezone.utc),
+            pending=counts.get(AlertDeliveryStatus.PENDING.value, 0),
+            sent=counts.get(AlertDeliveryStatus.SENT.value, 0),
+            failed=counts.get(AlertDeliveryStatus.FAILED.value, 0),
+            channels=channels,
+        )
+
+    def start(self) -> None:
+        """Run ``drain`` on a daemon thread every ``poll_seconds`` until ``stop``."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="alert-outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        with self._executor_lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                result = self.drain()
+            except Exception:  # noqa: BLE001
+                logger.exception("alert outbox drain failed")
+                result = AlertOutboxDrainResult()
+            # A full batch means more is probably waiting: go again without sleeping.
+            if result.claimed >= self.batch_size:
+                continue
+            self._stop.wait(max(0.0, self.poll_seconds - (time.monotonic() - started)))
+
+    def _executor(self, channel: str) -> ThreadPoolExecutor:
+        name = channel.strip().lower()
+        with self._executor_lock:
+            executor = self._executors.get(name)
+            if executor is None:
+                workers = self.channel_concurrency.get(name, self.default_concurrency)
+                executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"alert-{name}")
+                self._executors[name] = executor
+            return executor
+
+    def _send_group(self, group: list[AlertOutboxItem]) -> AlertSendResult:
+        first = group[0]
+        if len(group) == 1:
+            return self.dispatcher.send(
+                channel=first.channel,
+                target=first.target,
+                subject=first.subject,
+                message=first.message,
+                payload=first.payload,
+            )
+        subject, message, payload = self._digest(group)
+        return self.dispatcher.send(
+            channel=first.channel,
+            target=first.target,
+            subject=subject,
+            message=message,
+            payload=payload,
+        )
+
+    @staticmethod
+    def _digest(group: list[AlertOutboxItem]) -> tuple[str, str, dict[str, Any]]:
+        severity = max(
+            (str(x.payload.get("severity") or "WARNING").upper() for x in group),
+            key=lambda x: _SEVERITY_ORDER.get(x, 0),
+        )
+        sources = sorted({str(x.payload.get("source") or "") for x in group} - {""})
+        subject = f"[{severity}] {len(group)} alerts: {', '.join(sources) or 'digest'}"
+        message = "\n\n".join(f"#{idx} {x.subject}\n{x.message}" for idx, x in enumerate(group, start=1))
+        payload: dict[str, Any] = {
+            "digest": True,
+            "digest_size": len(group),
+            "severity": severity,
+            "source": sources[0] if len(sources) == 1 else "alert-digest",
+            "notification_ids": [x.notification_id for x in group],
+            "items": [x.payload for x in group],
+        }
+        return subject, message, payload
+
+    def _backoff(self, attempts: int) -> float:
+        return min(self.backoff_max_seconds, self.backoff_seconds * (2 ** max(0, attempts - 1)))
+
+
+def _quantile(values_sorted: list[float], q: float) -> float:
+    if len(values_sorted) == 1:
+        return float(values_sorted[0])
+    pos = (len(values_sorted) - 1) * max(0.0, min(1.0, q))
+    lo = int(math.floor(pos))
+    hi = int(math.ceil(pos))
+    return float(values_sorted[lo] + (values_sorted[hi] - values_sorted[lo]) * (pos - lo))
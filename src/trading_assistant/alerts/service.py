@@ -5,10 +5,11 @@ import hashlib
 import hmac
 import json
 from pathlib import Path
-from typing import Any, Protocol
+from typing import Any, Callable, Protocol
 from urllib import parse, request
 
 from trading_assistant.alerts.dispatcher import AlertSendResult
+from trading_assistant.alerts.outbox import AlertOutboxDispatcher
 from trading_assistant.alerts.store import AlertStore
 from trading_assistant.audit.service import AuditService
 from trading_assistant.core.models import (
@@ -17,6 +18,8 @@ from trading_assistant.core.models import (
     AlertEscalationStage,
     AlertItem,
     AlertNotificationRecord,
+    AlertOutboxDrainResult,
+    AlertOutboxStats,
     AlertSubscriptionCreateRequest,
     AlertSubscriptionRecord,
     AuditEventRecord,
@@ -114,6 +117,7 @@ class AlertService:
         store: AlertStore,
         audit: AuditService,
         dispatcher: AlertDispatcherProtocol | None = None,
+        outbox: AlertOutboxDispatcher | None = None,
         default_runbook_base_url: str = "",
         oncall_callback_signing_secret: str = "",
         oncall_callback_require_signature: bool = False,
@@ -125,6 +129,7 @@ class AlertService:
         self.store = store
         self.audit = audit
         self.dispatcher = dispatcher or _NoopDispatcher()
+        self.outbox = outbox
         self.default_runbook_base_url = default_runbook_base_url.rstrip("/")
         self.oncall_callback_signing_secret = (oncall_callback_signing_secret or "").strip()
         self.oncall_callback_require_signature = bool(oncall_callback_require_signature)
@@ -154,13 +159,15 @@ class AlertService:
     def sync_from_audit(self, limit: int = 500) -> int:
         events = self.audit.query(limit=limit)
         subscriptions = self.store.list_subscriptions(enabled_only=True, limit=1000)
+        candidates = self._index_subscriptions(subscriptions)
         inserted = 0
         for event in reversed(events):
             alert = self._event_to_alert(event)
             if alert is None:
                 continue
-            for sub in subscriptions:
-                if not self._subscription_match(sub, event, alert):
+            rank = _severity_rank(alert.severity)
+            for sub, min_rank in candidates(event.event_type):
+                if rank < min_rank:
                     continue
                 if self._should_suppress_noise(subscription=sub, alert=alert):
                     continue
@@ -187,6 +194,16 @@ class AlertService:
                 )
         return inserted
 
+    def drain_outbox(self, now: datetime | None = None) -> AlertOutboxDrainResult:
+        if self.outbox is None:
+            return AlertOutboxDrainResult()
+        return self.outbox.drain(now=now)
+
+    def outbox_stats(self, limit: int = 1000) -> AlertOutboxStats | None:
+        if self.outbox is None:
+            return None
+        return self.outbox.stats(limit=limit)
+
     def list_notifications(
         self,
         subscription_id: int | None = None,
@@ -484,22 +501,55 @@ class AlertService:
             return
 
         for target in targets:
-            result = self.dispatcher.send(
+            self._deliver(
+                notification_id=notification_id,
+                subscription_id=subscription.id,
                 channel=channel,
                 target=target,
                 subject=subject,
                 message=message,
                 payload=base_payload,
             )
-            _ = self.store.create_delivery(
+
+    def _deliver(
+        self,
+        *,
+        notification_id: int,
+        subscription_id: int,
+        channel: str,
+        target: str,
+        subject: str,
+        message: str,
+        payload: dict[str, Any],
+    ) -> None:
+        if self.outbox is not None:
+            # The outbox worker sends, retries and writes the delivery row.
+            self.outbox.enqueue(
                 notification_id=notification_id,
-                subscription_id=subscription.id,
+                subscription_id=subscription_id,
                 channel=channel,
                 target=target,
-                status=AlertDeliveryStatus.SENT if result.success else AlertDeliveryStatus.FAILED,
-                error_message=result.error_message,
-                payload={**base_payload, "provider_status": result.provider_status},
+                subject=subject,
+                message=message,
+                payload=payload,
             )
+            return
+        result = self.dispatcher.send(
+            channel=channel,
+            target=target,
+            subject=subject,
+            message=message,
+            payload=payload,
+        )
+        _ = self.store.create_delivery(
+            notification_id=notification_id,
+            subscription_id=subscription_id,
+            channel=channel,
+            target=target,
+            status=AlertDeliveryStatus.SENT if result.success else AlertDeliveryStatus.FAILED,
+            error_message=result.error_message,
+            payload={**payload, "provider_status": result.provider_status},
+        )
 
     def _dispatch_oncall(
         self,
@@ -543,25 +593,15 @@ class AlertService:
                     routing_key = subscription.channel_config.get("pagerduty_routing_key")
                     if isinstance(routing_key, str) and routing_key.strip():
                         stage_payload["pagerduty_routing_key"] = routing_key.strip()
-                result = self.dispatcher.send(
+                self._deliver(
+                    notification_id=notification_id,
+                    subscription_id=subscription.id,
                     channel=channel,
                     target=target,
                     subject=subject,
                     message=message,
                     payload=stage_payload,
                 )
-                _ = self.store.create_delivery(
-                    notification_id=notification_id,
-                    subscription_id=subscription.id,
-                    channel=channel,
-                    target=target,
-                    status=AlertDeliveryStatus.SENT if result.success else AlertDeliveryStatus.FAILED,
-                    error_message=result.error_message,
-                    payload={
-                        **stage_payload,
-                        "provider_status": result.provider_status,
-                    },
-                )
         if not triggered:
             _ = self.store.create_delivery(
                 notification_id=notification_id,
@@ -877,15 +917,26 @@ class AlertService:
             lines.append(f"Runbook: {runbook_url}")
         return "\n".join(lines)
 
-    def _subscription_match(
-        self,
-        sub: AlertSubscriptionRecord,
-        event: AuditEventRecord,
-        alert: AlertItem,
-    ) -> bool:
-        if sub.event_types and event.event_type not in set(sub.event_types):
-            return False
-        return _severity_rank(alert.severity) >= _severity_rank(sub.min_severity)
+    @staticmethod
+    def _index_subscriptions(
+        subscriptions: list[AlertSubscriptionRecord],
+    ) -> Callable[[str], list[tuple[AlertSubscriptionRecord, int]]]:
+        """Return a lookup of (subscription, min severity rank) per event type.
+
+        Candidates keep the subscription list order, so notifications are created in the same
+        order as a full scan; each event then only visits subscriptions that can match it.
+        """
+        ranked = [(sub, _severity_rank(sub.min_severity), frozenset(sub.event_types)) for sub in subscriptions]
+        cache: dict[str, list[tuple[AlertSubscriptionRecord, int]]] = {}
+
+        def _lookup(event_type: str) -> list[tuple[AlertSubscriptionRecord, int]]:
+            hit = cache.get(event_type)
+            if hit is None:
+                hit = [(sub, rank) for sub, rank, types in ranked if not types or event_type in types]
+                cache[event_type] = hit
+            return hit
+
+        return _lookup
 
     def _event_to_alert(self, event: AuditEventRecord) -> AlertItem | None:
         payload = event.payload
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 import json
 import sqlite3
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any
 
 from trading_assistant.core.models import (
     AlertDeliveryRecord,
@@ -15,18 +17,33 @@ from trading_assistant.core.models import (
     OncallEventRecord,
     SignalLevel,
 )
+from trading_assistant.core.sqlite import SQLiteConnectionPool
+
+
+@dataclass
+class AlertOutboxItem:
+    id: int
+    created_at: datetime
+    notification_id: int
+    subscription_id: int
+    channel: str
+    target: str
+    coalesce_key: str
+    subject: str
+    message: str
+    payload: dict[str, Any]
+    attempts: int
 
 
 class AlertStore:
     def __init__(self, db_path: str) -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.db_path)
         self._init_schema()
 
     def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return self._pool.connection()
 
     def _init_schema(self) -> None:
         with self._conn() as conn:
@@ -152,6 +169,43 @@ class AlertStore:
                 ON alert_oncall_events(notification_id, updated_at DESC)
                 """
             )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS alert_outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    notification_id INTEGER NOT NULL,
+                    subscription_id INTEGER NOT NULL,
+                    channel TEXT NOT NULL,
+                    target TEXT NOT NULL,
+                    coalesce_key TEXT NOT NULL,
+                    subject TEXT NOT NULL,
+                    message TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at TEXT NOT NULL,
+                    claimed_until TEXT,
+                    last_error TEXT NOT NULL DEFAULT '',
+                    delivered_at TEXT,
+                    latency_ms REAL,
+                    delivery_id INTEGER
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_alert_outbox_due
+                ON alert_outbox(status, next_attempt_at)
+                """
+            )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_alert_outbox_delivered
+                ON alert_outbox(status, delivered_at DESC)
+                """
+            )
 
     @staticmethod
     def _ensure_columns(
@@ -364,6 +418,172 @@ class AlertStore:
             )
         return int(cur.lastrowid)
 
+    def enqueue_outbox(
+        self,
+        *,
+        notification_id: int,
+        subscription_id: int,
+        channel: str,
+        target: str,
+        coalesce_key: str,
+        subject: str,
+        message: str,
+        payload: dict[str, Any],
+    ) -> int:
+        now = datetime.now(timezone.utc).isoformat()
+        with self._conn() as conn:
+            cur = conn.execute(
+                """
+                INSERT INTO alert_outbox(
+                    created_at, updated_at, notification_id, subscription_id, channel, target, coalesce_key,
+                    subject, message, payload, status, attempts, next_attempt_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?)
+                """,
+                (
+                    now,
+                    now,
+                    notification_id,
+                    subscription_id,
+                    channel,
+                    target,
+                    coalesce_key,
+                    subject,
+                    message,
+                    json.dumps(payload, ensure_ascii=False),
+                    AlertDeliveryStatus.PENDING.value,
+                    now,
+                ),
+            )
+        return int(cur.lastrowid)
+
+    def claim_outbox(self, *, now: datetime, limit: int, lease_seconds: int) -> list[AlertOutboxItem]:
+        """Lease due PENDING items so concurrent drainers (threads or processes) never double-send."""
+        now_iso = now.isoformat()
+        lease_iso = (now + timedelta(seconds=max(1, lease_seconds))).isoformat()
+        with self._conn() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                """
+                SELECT
+                    id, created_at, notification_id, subscription_id, channel, target, coalesce_key,
+                    subject, message, payload, attempts
+                FROM alert_outbox
+                WHERE status = ? AND next_attempt_at <= ? AND (claimed_until IS NULL OR claimed_until < ?)
+                ORDER BY id ASC
+                LIMIT ?
+                """,
+                (AlertDeliveryStatus.PENDING.value, now_iso, now_iso, max(1, limit)),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE alert_outbox SET claimed_until = ?, updated_at = ? WHERE id = ?",
+                [(lease_iso, now_iso, int(row["id"])) for row in rows],
+            )
+        return [
+            AlertOutboxItem(
+                id=int(row["id"]),
+                created_at=datetime.fromisoformat(str(row["created_at"])),
+                notification_id=int(row["notification_id"]),
+                subscription_id=int(row["subscription_id"]),
+                channel=str(row["channel"]),
+                target=str(row["target"]),
+                coalesce_key=str(row["coalesce_key"]),
+                subject=str(row["subject"]),
+                message=str(row["message"]),
+                payload=dict(json.loads(str(row["payload"]))),
+                attempts=int(row["attempts"]),
+            )
+            for row in rows
+        ]
+
+    def renew_outbox_lease(self, item_ids: list[int], *, until: datetime) -> None:
+        """Push the lease of still-claimed PENDING items out to ``until`` while they are being sent."""
+        if not item_ids:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+        with self._conn() as conn:
+            conn.executemany(
+                "UPDATE alert_outbox SET claimed_until = ?, updated_at = ? WHERE id = ? AND status = ?",
+                [(until.isoformat(), now, int(item_id), AlertDeliveryStatus.PENDING.value) for item_id in item_ids],
+            )
+
+    def retry_outbox(self, item_id: int, *, attempts: int, error_message: str, next_attempt_at: datetime) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        with self._conn() as conn:
+            conn.execute(
+                """
+                UPDATE alert_outbox
+                SET attempts = ?, last_error = ?, next_attempt_at = ?, claimed_until = NULL, updated_at = ?
+                WHERE id = ?
+                """,
+                (attempts, error_message, next_attempt_at.isoformat(), now, item_id),
+            )
+
+    def finish_outbox(
+        self,
+        item: AlertOutboxItem,
+        *,
+        status: AlertDeliveryStatus,
+        attempts: int,
+        error_message: str,
+        delivered_at: datetime,
+        payload: dict[str, Any],
+    ) -> int:
+        """Close an outbox item and write its delivery log row in one transaction."""
+        latency_ms = max(0.0, (delivered_at - item.created_at).total_seconds() * 1000.0)
+        delivered_iso = delivered_at.isoformat()
+        with self._conn() as conn:
+            cur = conn.execute(
+                """
+                INSERT INTO alert_deliveries(
+                    notification_id, subscription_id, created_at, channel, target, status, error_message, payload
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    item.notification_id,
+                    item.subscription_id,
+                    delivered_iso,
+                    item.channel,
+                    item.target,
+                    status.value,
+                    error_message,
+                    json.dumps(payload, ensure_ascii=False),
+                ),
+            )
+            delivery_id = int(cur.lastrowid)
+            conn.execute(
+                """
+                UPDATE alert_outbox
+                SET status = ?, attempts = ?, last_error = ?, delivered_at = ?, latency_ms = ?,
+                    delivery_id = ?, claimed_until = NULL, updated_at = ?
+                WHERE id = ?
+                """,
+                (status.value, attempts, error_message, delivered_iso, latency_ms, delivery_id, delivered_iso, item.id),
+            )
+        return delivery_id
+
+    def outbox_status_counts(self) -> dict[str, int]:
+        with self._conn() as conn:
+            rows = conn.execute("SELECT status, COUNT(1) AS c FROM alert_outbox GROUP BY status").fetchall()
+        return {str(row["status"]): int(row["c"]) for row in rows}
+
+    def list_outbox_latencies(self, *, limit: int = 1000) -> list[tuple[str, float]]:
+        """(channel, enqueue-to-delivery ms) of the most recently sent items."""
+        with self._conn() as conn:
+            rows = conn.execute(
+                """
+                SELECT channel, latency_ms
+                FROM alert_outbox
+                WHERE status = ? AND latency_ms IS NOT NULL
+                ORDER BY delivered_at DESC
+                LIMIT ?
+                """,
+                (AlertDeliveryStatus.SENT.value, max(1, min(limit, 100000))),
+            ).fetchall()
+        return [(str(row["channel"]), float(row["latency_ms"])) for row in rows]
+
     def find_notification_ids_by_delivery(self, delivery_id: int) -> list[int]:
         with self._conn() as conn:
             rows = conn.execute(
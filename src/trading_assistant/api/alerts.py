@@ -9,6 +9,8 @@ from trading_assistant.core.models import (
     AlertDeliveryStatus,
     AlertItem,
     AlertNotificationRecord,
+    AlertOutboxDrainResult,
+    AlertOutboxStats,
     OncallCallbackRequest,
     OncallCallbackResult,
     OncallEventRecord,
@@ -142,3 +144,23 @@ def list_deliveries(
         status=status,
         limit=limit,
     )
+
+
+@router.get("/outbox/stats", response_model=AlertOutboxStats)
+def outbox_stats(
+    limit: int = Query(default=1000, ge=1, le=20000),
+    alerts: AlertService = Depends(get_alert_service),
+    _auth: AuthContext = Depends(require_roles(UserRole.AUDIT, UserRole.RISK, UserRole.ADMIN)),
+) -> AlertOutboxStats:
+    stats = alerts.outbox_stats(limit=limit)
+    if stats is None:
+        raise HTTPException(status_code=404, detail="alert outbox is disabled")
+    return stats
+
+
+@router.post("/outbox/drain", response_model=AlertOutboxDrainResult)
+def drain_outbox(
+    alerts: AlertService = Depends(get_alert_service),
+    _auth: AuthContext = Depends(require_roles(UserRole.RISK, UserRole.ADMIN)),
+) -> AlertOutboxDrainResult:
+    return alerts.drain_outbox()
@@ -98,6 +98,28 @@ class MarketFactorStudyRequest(BaseModel):
         return self
 
 
+class CrossSectionalFactorStudyRequest(BaseModel):
+    symbols: list[str] = Field(default_factory=list, max_length=6000)
+    start_date: date
+    end_date: date
+    factors: list[str] | None = None
+    horizons: list[int] = Field(default_factory=lambda: [5, 10, 20])
+    quantiles: int = Field(default=5, ge=2, le=20)
+    min_symbols: int = Field(default=20, ge=3)
+    include_fundamentals: bool = False
+    include_series: bool = False
+
+    @model_validator(mode="after")
+    def _validate_request(self) -> "CrossSectionalFactorStudyRequest":
+        if self.start_date > self.end_date:
+            raise ValueError("start_date must be <= end_date")
+        if not self.symbols:
+            raise ValueError("symbols must not be empty.")
+        if not self.horizons or any(h <= 0 or h > 250 for h in self.horizons):
+            raise ValueError("horizons must be between 1 and 250 trading days.")
+        return self
+
+
 @router.post("/descriptive")
 def descriptive_analysis(
     req: DescriptiveAnalysisRequest,
@@ -257,3 +279,42 @@ def market_factor_study(
         },
     )
     return result
+
+
+@router.post("/cases/cross-sectional-factor-study")
+def cross_sectional_factor_study(
+    req: CrossSectionalFactorStudyRequest,
+    service: AppliedStatisticsService = Depends(get_applied_statistics_service),
+    audit: AuditService = Depends(get_audit_service),
+    _auth: AuthContext = Depends(require_roles(UserRole.RESEARCH, UserRole.RISK, UserRole.READONLY)),
+) -> dict[str, Any]:
+    try:
+        result = service.cross_sectional_factor_study(
+            symbols=req.symbols,
+            start_date=req.start_date,
+            end_date=req.end_date,
+            factors=req.factors,
+            horizons=req.horizons,
+            quantiles=req.quantiles,
+            min_symbols=req.min_symbols,
+            include_fundamentals=req.include_fundamentals,
+            include_series=req.include_series,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(status_code=502, detail=str(exc)) from exc
+
+    audit.log(
+        event_type="applied_stats",
+        action="cross_sectional_factor_study",
+        payload={
+            "requested_symbols": len(req.symbols),
+            "symbol_count": result.get("symbol_count"),
+            "start_date": req.start_date.isoformat(),
+            "end_date": req.end_date.isoformat(),
+            "factors": [item["factor"] for item in result.get("factors", [])],
+            "horizons": result.get("horizons"),
+        },
+    )
+    return result
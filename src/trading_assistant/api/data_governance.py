@@ -21,7 +21,7 @@ from trading_assistant.core.models import (
 from trading_assistant.core.security import AuthContext, UserRole, require_roles
 from trading_assistant.data.composite_provider import CompositeDataProvider
 from trading_assistant.data.exceptions import DataProviderError
-from trading_assistant.data.utils import dataframe_content_hash
+from trading_assistant.data.utils import CONTENT_HASH_ALGORITHM, dataframe_content_hash
 from trading_assistant.governance.data_quality import DataQualityService
 from trading_assistant.governance.pit_validator import PITValidator
 from trading_assistant.governance.snapshot_service import DataSnapshotService
@@ -53,6 +53,7 @@ def data_quality_report(
             provider=used_provider,
             row_count=len(bars),
             content_hash=dataframe_content_hash(bars),
+            hash_algorithm=CONTENT_HASH_ALGORITHM,
         )
     )
     audit.log(
@@ -18,7 +18,7 @@ from trading_assistant.core.models import DataSnapshotRegisterRequest
 from trading_assistant.core.security import AuthContext, UserRole, require_roles
 from trading_assistant.data.composite_provider import CompositeDataProvider
 from trading_assistant.data.exceptions import DataProviderError
-from trading_assistant.data.utils import dataframe_content_hash
+from trading_assistant.data.utils import CONTENT_HASH_ALGORITHM, dataframe_content_hash
 from trading_assistant.factors.engine import FactorEngine
 from trading_assistant.fundamentals.service import FundamentalService
 from trading_assistant.governance.snapshot_service import DataSnapshotService
@@ -64,6 +64,7 @@ def factor_snapshot(
             provider=used_provider,
             row_count=len(bars),
             content_hash=dataframe_content_hash(bars),
+            hash_algorithm=CONTENT_HASH_ALGORITHM,
         )
     )
 
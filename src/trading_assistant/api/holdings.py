@@ -3,9 +3,10 @@
 from datetime import date, datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 
 from trading_assistant.audit.service import AuditService
-from trading_assistant.core.container import get_audit_service, get_holding_service
+from trading_assistant.core.container import get_audit_service, get_holding_service, get_provider_executor
 from trading_assistant.core.models import (
     ManualHoldingAnalysisRequest,
     ManualHoldingAnalysisResult,
@@ -14,6 +15,7 @@ from trading_assistant.core.models import (
     ManualHoldingTradeRecord,
 )
 from trading_assistant.core.security import AuthContext, UserRole, require_roles
+from trading_assistant.data.async_provider import AsyncDataProvider
 from trading_assistant.holdings.service import HoldingService
 
 router = APIRouter(prefix="/holdings", tags=["holdings"])
@@ -106,20 +108,26 @@ def get_holding_positions(
 
 
 @router.post("/analyze", response_model=ManualHoldingAnalysisResult)
-def analyze_holding_portfolio(
+async def analyze_holding_portfolio(
     req: ManualHoldingAnalysisRequest,
     service: HoldingService = Depends(get_holding_service),
     audit: AuditService = Depends(get_audit_service),
     _auth: AuthContext = Depends(require_roles(UserRole.RESEARCH, UserRole.PORTFOLIO, UserRole.RISK)),
 ) -> ManualHoldingAnalysisResult:
+    # Fetch bars for every held/candidate symbol concurrently, then analyze off the event loop.
+    symbols = await run_in_threadpool(service.analysis_symbols, req)
+    start_date, end_date = service.snapshot_window(req.as_of_date)
+    provider = AsyncDataProvider(service.provider, executor=get_provider_executor())
+    prefetched = await provider.gather_daily_bars_with_source(symbols, start_date, end_date)
     try:
-        result = service.analyze(req)
+        result = await run_in_threadpool(service.analyze, req, prefetched_bars=prefetched)
     except KeyError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
 
-    audit.log(
+    await run_in_threadpool(
+        audit.log,
         event_type="manual_holding",
         action="analyze",
         payload={
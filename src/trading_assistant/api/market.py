@@ -18,7 +18,7 @@ from trading_assistant.core.security import AuthContext, UserRole, require_roles
 from trading_assistant.data.composite_provider import CompositeDataProvider
 from trading_assistant.data.exceptions import DataProviderError
 from trading_assistant.data.base import MarketDataProvider
-from trading_assistant.data.utils import dataframe_content_hash
+from trading_assistant.data.utils import CONTENT_HASH_ALGORITHM, dataframe_content_hash
 from trading_assistant.governance.license_service import DataLicenseService
 from trading_assistant.governance.snapshot_service import DataSnapshotService
 
@@ -223,6 +223,7 @@ def get_market_bars(
             provider=used_provider,
             row_count=len(bars),
             content_hash=dataframe_content_hash(bars),
+            hash_algorithm=CONTENT_HASH_ALGORITHM,
         )
     )
 
@@ -377,6 +378,7 @@ def get_market_intraday_bars(
             provider=used_provider,
             row_count=len(bars),
             content_hash=dataframe_content_hash(bars),
+            hash_algorithm=CONTENT_HASH_ALGORITHM,
         )
     )
     records = bars.sort_values("bar_time").tail(limit).to_dict(orient="records")
@@ -5,8 +5,14 @@ from collections import Counter
 from fastapi import APIRouter, Depends, Query
 
 from trading_assistant.audit.service import AuditService
-from trading_assistant.core.container import get_audit_service, get_ops_dashboard_service
-from trading_assistant.core.models import OpsDashboardSummary, ServiceMetricsSummary
+from trading_assistant.core.container import get_audit_service, get_data_provider, get_ops_dashboard_service
+from trading_assistant.core.models import (
+    OpsDashboardSummary,
+    ProviderCoalescingStats,
+    ProviderEndpointSchedulerStats,
+    ServiceMetricsSummary,
+)
+from trading_assistant.data.composite_provider import CompositeDataProvider
 from trading_assistant.core.security import AuthContext, UserRole, require_roles
 from trading_assistant.ops.dashboard import OpsDashboardService
 
@@ -31,6 +37,22 @@ def metrics_summary(
     )
 
 
+@router.get("/provider-coalescing", response_model=ProviderCoalescingStats)
+def provider_coalescing(
+    provider: CompositeDataProvider = Depends(get_data_provider),
+    _auth: AuthContext = Depends(require_roles(UserRole.AUDIT, UserRole.RISK, UserRole.ADMIN)),
+) -> ProviderCoalescingStats:
+    return ProviderCoalescingStats(**provider.coalescing_stats())
+
+
+@router.get("/provider-scheduler", response_model=list[ProviderEndpointSchedulerStats])
+def provider_scheduler(
+    provider: CompositeDataProvider = Depends(get_data_provider),
+    _auth: AuthContext = Depends(require_roles(UserRole.AUDIT, UserRole.RISK, UserRole.ADMIN)),
+) -> list[ProviderEndpointSchedulerStats]:
+    return [ProviderEndpointSchedulerStats(**row) for row in provider.scheduler_stats()]
+
+
 @router.get("/ops-dashboard", response_model=OpsDashboardSummary)
 def ops_dashboard(
     lookback_hours: int = Query(default=24, ge=1, le=24 * 30),
@@ -13,10 +13,14 @@ from trading_assistant.core.container import (
 from trading_assistant.core.models import (
     PortfolioOptimizeRequest,
     PortfolioOptimizeResult,
+    PortfolioRiskBatchRequest,
+    PortfolioRiskBatchResult,
     PortfolioRiskRequest,
     PortfolioRiskResult,
     RebalancePlan,
     RebalanceRequest,
+    StressTestBatchRequest,
+    StressTestBatchResult,
     StressTestRequest,
     StressTestResult,
 )
@@ -49,6 +53,25 @@ def check_portfolio_risk(
     return result
 
 
+@router.post("/risk/check-batch", response_model=PortfolioRiskBatchResult)
+def check_portfolio_risk_batch(
+    req: PortfolioRiskBatchRequest,
+    risk_engine: RiskEngine = Depends(get_risk_engine),
+    audit: AuditService = Depends(get_audit_service),
+    _auth: AuthContext = Depends(require_roles(UserRole.RISK, UserRole.PORTFOLIO)),
+) -> PortfolioRiskBatchResult:
+    results = risk_engine.evaluate_portfolio_many(req.requests)
+    audit.log(
+        event_type="portfolio_risk",
+        action="check_batch",
+        payload={
+            "count": len(results),
+            "blocked": sum(1 for r in results if r.blocked),
+        },
+    )
+    return PortfolioRiskBatchResult(results=results)
+
+
 @router.post("/optimize", response_model=PortfolioOptimizeResult)
 def optimize_portfolio(
     req: PortfolioOptimizeRequest,
@@ -105,3 +128,23 @@ def stress_test_portfolio(
         },
     )
     return result
+
+
+@router.post("/stress-test/batch", response_model=StressTestBatchResult)
+def stress_test_portfolio_batch(
+    req: StressTestBatchRequest,
+    tester: PortfolioStressTester = Depends(get_portfolio_stress_tester),
+    audit: AuditService = Depends(get_audit_service),
+    _auth: AuthContext = Depends(require_roles(UserRole.PORTFOLIO, UserRole.RISK)),
+) -> StressTestBatchResult:
+    names = list(req.portfolios)
+    results = tester.run_many([req.portfolios[name] for name in names], req.scenarios)
+    audit.log(
+        event_type="portfolio_stress",
+        action="run_batch",
+        payload={
+            "scenarios": len(req.scenarios),
+            "portfolios": len(names),
+        },
+    )
+    return StressTestBatchResult(results=dict(zip(names, results)))
@@ -11,7 +11,7 @@ from threading import Lock
 from typing import Any
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field, model_validator
 
 from trading_assistant.audit.service import AuditService
@@ -25,6 +25,7 @@ from trading_assistant.core.models import ResearchWorkflowRequest, ResearchWorkf
 from trading_assistant.core.security import AuthContext, UserRole, require_roles
 from trading_assistant.strategy.governance_service import StrategyGovernanceService
 from trading_assistant.workflow.research import ResearchWorkflowService
+from trading_assistant.workflow.scan_progress import JsonSnapshotReader
 
 router = APIRouter(prefix="/research", tags=["research"])
 
@@ -41,8 +42,11 @@ class FullMarket2000ScanRequest(BaseModel):
     network_timeout_sec: float = Field(default=12.0, ge=1.0, le=120.0)
     max_symbols: int = Field(default=0, ge=0, le=20_000)
     sleep_ms: int = Field(default=0, ge=0, le=5_000)
+    workers: int = Field(default=4, ge=1, le=32)
+    shard_size: int = Field(default=20, ge=1, le=1_000)
     top_n: int = Field(default=30, ge=1, le=500)
     timeout_minutes: int = Field(default=120, ge=1, le=24 * 60)
+    resume_run_id: str | None = Field(default=None, pattern=r"^[A-Za-z0-9_-]{1,64}$")
 
     @model_validator(mode="after")
     def _validate_dates(self) -> "FullMarket2000ScanRequest":
@@ -76,6 +80,7 @@ class FullMarket2000ScanResponse(BaseModel):
     buy_pass_symbols: int
     error_symbols: int
     timeout_symbols: int = 0
+    resumed_symbols: int = 0
     summary_path: str
     csv_path: str
     jsonl_path: str
@@ -91,12 +96,24 @@ class FullMarket2000ScanProgressResponse(BaseModel):
     error_symbols: int = 0
     timeout_symbols: int = 0
     progress_pct: float = 0.0
+    resumed_symbols: int = 0
+    checkpoint_symbol: str | None = None
     started_at: datetime | None = None
     updated_at: datetime | None = None
     finished_at: datetime | None = None
     message: str | None = None
 
 
+class FullMarket2000ScanTopResponse(BaseModel):
+    run_id: str | None = None
+    status: str = "IDLE"
+    scanned_symbols: int = 0
+    total_symbols: int = 0
+    buy_pass_symbols: int = 0
+    updated_at: datetime | None = None
+    top_candidates: list[FullMarket2000Candidate] = Field(default_factory=list)
+
+
 class FullMarket2000ScanCancelRequest(BaseModel):
     run_id: str | None = None
 
@@ -123,6 +140,7 @@ _FULL_MARKET_PROGRESS_STATE: dict[str, Any] = {
     "message": "idle",
     "progress_path": None,
 }
+_FULL_MARKET_SNAPSHOT_READER = JsonSnapshotReader()
 _FULL_MARKET_RUNTIME_LOCK = Lock()
 _FULL_MARKET_RUNTIME_STATE: dict[str, Any] = {
     "run_id": None,
@@ -216,13 +234,8 @@ def _terminate_process(proc: subprocess.Popen[str], timeout_sec: int = 8) -> Non
 
 
 def _read_full_market_progress_file(progress_path: Path) -> dict[str, Any]:
-    if not progress_path.exists():
-        return {}
-    try:
-        payload = json.loads(progress_path.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
-    return payload if isinstance(payload, dict) else {}
+    # The scan script rewrites the snapshot atomically; parse it only when it changed.
+    return _FULL_MARKET_SNAPSHOT_READER.read(progress_path)
 
 
 def _merge_full_market_progress(base: dict[str, Any], from_file: dict[str, Any]) -> dict[str, Any]:
@@ -336,6 +349,9 @@ def get_full_market_2000_scan_progress(
     if isinstance(progress_path_raw, str) and progress_path_raw:
         progress_file_payload = _read_full_market_progress_file(Path(progress_path_raw))
     merged = _merge_full_market_progress(state, progress_file_payload)
+    checkpoint = progress_file_payload.get("checkpoint")
+    if not isinstance(checkpoint, dict):
+        checkpoint = {}
 
     status = str(merged.get("status") or "IDLE").upper()
     if status in {"RUNNING", "CANCELLING"}:
@@ -384,6 +400,8 @@ def get_full_market_2000_scan_progress(
         error_symbols=_safe_int(merged.get("error_symbols"), 0),
         timeout_symbols=_safe_int(merged.get("timeout_symbols"), 0),
         progress_pct=_safe_float(merged.get("progress_pct"), 0.0),
+        resumed_symbols=_safe_int(checkpoint.get("resumed_symbols"), 0),
+        checkpoint_symbol=(str(checkpoint.get("last_symbol")) if checkpoint.get("last_symbol") else None),
         started_at=merged.get("started_at"),
         updated_at=merged.get("updated_at"),
         finished_at=merged.get("finished_at"),
@@ -391,6 +409,32 @@ def get_full_market_2000_scan_progress(
     )
 
 
+@router.get("/full-market-2000-scan/top", response_model=FullMarket2000ScanTopResponse)
+def get_full_market_2000_scan_top(
+    limit: int = Query(default=30, ge=1, le=200),
+    _auth: AuthContext = Depends(require_roles(UserRole.RESEARCH, UserRole.PORTFOLIO, UserRole.RISK, UserRole.ADMIN)),
+) -> FullMarket2000ScanTopResponse:
+    state = _get_full_market_progress()
+    snapshot: dict[str, Any] = {}
+    progress_path_raw = state.get("progress_path")
+    if isinstance(progress_path_raw, str) and progress_path_raw:
+        snapshot = _read_full_market_progress_file(Path(progress_path_raw))
+    merged = _merge_full_market_progress(state, snapshot)
+    rows = snapshot.get("top_candidates")
+    rows = rows if isinstance(rows, list) else []
+    return FullMarket2000ScanTopResponse(
+        run_id=merged.get("run_id"),
+        status=str(merged.get("status") or "IDLE"),
+        scanned_symbols=_safe_int(merged.get("scanned_symbols"), 0),
+        total_symbols=_safe_int(merged.get("total_symbols"), 0),
+        buy_pass_symbols=_safe_int(merged.get("buy_pass_symbols"), 0),
+        updated_at=merged.get("updated_at"),
+        top_candidates=[
+            FullMarket2000Candidate(**item) for item in rows[:limit] if isinstance(item, dict)
+        ],
+    )
+
+
 @router.post("/full-market-2000-scan/cancel", response_model=FullMarket2000ScanCancelResponse)
 def cancel_full_market_2000_scan(
     req: FullMarket2000ScanCancelRequest,
@@ -443,7 +487,8 @@ def run_full_market_2000_scan(
     _auth: AuthContext = Depends(require_roles(UserRole.RESEARCH, UserRole.PORTFOLIO, UserRole.RISK, UserRole.ADMIN)),
 ) -> FullMarket2000ScanResponse:
     started_at = _utc_now()
-    run_id = uuid4().hex
+    resume = bool(req.resume_run_id)
+    run_id = req.resume_run_id or uuid4().hex
 
     root = _resolve_project_root()
     script_path = root / "scripts" / "full_market_pick_2000.py"
@@ -464,6 +509,8 @@ def run_full_market_2000_scan(
     output_jsonl = root / "reports" / f"full_market_signals_2000_{run_id}.jsonl"
     output_csv = root / "reports" / f"buy_candidates_2000_{run_id}.csv"
     progress_path = root / "reports" / f"full_market_progress_2000_{run_id}.json"
+    if resume and not output_jsonl.exists():
+        raise HTTPException(status_code=404, detail=f"no scan output to resume for run_id={run_id}")
 
     active_runtime = _get_full_market_runtime()
     active_run_id = active_runtime.get("run_id")
@@ -486,7 +533,7 @@ def run_full_market_2000_scan(
         started_at=started_at,
         updated_at=started_at,
         finished_at=None,
-        message="scan started",
+        message="scan resuming" if resume else "scan started",
         progress_path=str(progress_path),
     )
 
@@ -517,6 +564,10 @@ def run_full_market_2000_scan(
         str(req.max_symbols),
         "--sleep-ms",
         str(req.sleep_ms),
+        "--workers",
+        str(req.workers),
+        "--shard-size",
+        str(req.shard_size),
         "--top-n",
         str(req.top_n),
         "--output-summary",
@@ -528,6 +579,8 @@ def run_full_market_2000_scan(
         "--progress-file",
         str(progress_path.relative_to(root)),
     ]
+    if resume:
+        cmd.append("--resume")
 
     proc: subprocess.Popen[str] | None = None
     stdout_text = ""
@@ -729,6 +782,7 @@ def run_full_market_2000_scan(
         buy_pass_symbols=int(summary.get("buy_pass_symbols", 0)),
         error_symbols=int(summary.get("error_symbols", 0)),
         timeout_symbols=int(summary.get("timeout_symbols", 0)),
+        resumed_symbols=int(summary.get("resumed_symbols", 0)),
         summary_path=str(output_summary),
         csv_path=str(output_csv),
         jsonl_path=str(output_jsonl),
@@ -760,6 +814,8 @@ def run_full_market_2000_scan(
             "principal": req.principal,
             "lot_size": req.lot_size,
             "max_symbols": req.max_symbols,
+            "workers": req.workers,
+            "resume": resume,
             "top_n": req.top_n,
             "total_symbols": response.total_symbols,
             "buy_pass_symbols": response.buy_pass_symbols,
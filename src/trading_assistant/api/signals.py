@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from typing import Any
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 
 from trading_assistant.audit.service import AuditService
 from trading_assistant.autotune.service import AutoTuneService
@@ -16,6 +19,7 @@ from trading_assistant.core.container import (
     get_factor_engine,
     get_fundamental_service,
     get_pit_validator,
+    get_provider_executor,
     get_risk_engine,
     get_signal_service,
     get_snapshot_service,
@@ -33,9 +37,10 @@ from trading_assistant.core.models import (
     TradePrepSheet,
 )
 from trading_assistant.core.security import AuthContext, UserRole, require_roles
+from trading_assistant.data.async_provider import AsyncDataProvider
 from trading_assistant.data.composite_provider import CompositeDataProvider
 from trading_assistant.data.exceptions import DataProviderError
-from trading_assistant.data.utils import dataframe_content_hash
+from trading_assistant.data.utils import CONTENT_HASH_ALGORITHM, dataframe_content_hash
 from trading_assistant.factors.engine import FactorEngine
 from trading_assistant.fundamentals.service import FundamentalService
 from trading_assistant.governance.snapshot_service import DataSnapshotService
@@ -70,7 +75,7 @@ def _infer_limit_flags(close_today: float, close_yesterday: float, is_st: bool)
 
 
 @router.post("/generate", response_model=list[TradePrepSheet])
-def generate_signals(
+async def generate_signals(
     req: GenerateSignalRequest,
     provider: CompositeDataProvider = Depends(get_data_provider),
     license_service: DataLicenseService = Depends(get_data_license_service),
@@ -89,6 +94,51 @@ def generate_signals(
     audit: AuditService = Depends(get_audit_service),
     _auth: AuthContext = Depends(require_roles(UserRole.RESEARCH, UserRole.RISK)),
 ) -> list[TradePrepSheet]:
+    strategy, strategy_params, autotune_profile = await run_in_threadpool(
+        _resolve_strategy,
+        req,
+        registry=registry,
+        autotune=autotune,
+        strategy_gov=strategy_gov,
+        settings=settings,
+    )
+    # Bars and security status are independent upstream calls; await them together.
+    async_provider = AsyncDataProvider(provider, executor=get_provider_executor())
+    bars_result, status_result = await asyncio.gather(
+        async_provider.get_daily_bars_with_source(req.symbol, req.start_date, req.end_date),
+        async_provider.get_security_status(req.symbol),
+        return_exceptions=True,
+    )
+    return await run_in_threadpool(
+        _generate_from_market_data,
+        req,
+        bars_result=bars_result,
+        status_result=status_result,
+        strategy=strategy,
+        strategy_params=strategy_params,
+        autotune_profile=autotune_profile,
+        license_service=license_service,
+        factor_engine=factor_engine,
+        fundamentals=fundamentals,
+        pit=pit,
+        events=events,
+        risk_engine=risk_engine,
+        signal_service=signal_service,
+        snapshots=snapshots,
+        replay=replay,
+        settings=settings,
+        audit=audit,
+    )
+
+
+def _resolve_strategy(
+    req: GenerateSignalRequest,
+    *,
+    registry: StrategyRegistry,
+    autotune: AutoTuneService,
+    strategy_gov: StrategyGovernanceService,
+    settings: Settings,
+):
     try:
         strategy = registry.get(req.strategy_name)
     except KeyError as exc:
@@ -104,17 +154,40 @@ def generate_signals(
         explicit_params=req.strategy_params,
         use_profile=req.use_autotune_profile,
     )
+    return strategy, strategy_params, autotune_profile
 
-    try:
-        used_provider, bars = provider.get_daily_bars_with_source(req.symbol, req.start_date, req.end_date)
-    except DataProviderError as exc:
+
+def _generate_from_market_data(
+    req: GenerateSignalRequest,
+    *,
+    bars_result: Any,
+    status_result: Any,
+    strategy,
+    strategy_params: dict,
+    autotune_profile,
+    license_service: DataLicenseService,
+    factor_engine: FactorEngine,
+    fundamentals: FundamentalService,
+    pit: PITValidator,
+    events: EventService,
+    risk_engine: RiskEngine,
+    signal_service: SignalService,
+    snapshots: DataSnapshotService,
+    replay: ReplayService,
+    settings: Settings,
+    audit: AuditService,
+) -> list[TradePrepSheet]:
+    if isinstance(bars_result, DataProviderError):
         audit.log(
             event_type="signal_generation",
             action="generate",
-            payload={"symbol": req.symbol, "strategy": req.strategy_name, "error": str(exc)},
+            payload={"symbol": req.symbol, "strategy": req.strategy_name, "error": str(bars_result)},
             status="ERROR",
         )
-        raise HTTPException(status_code=502, detail=str(exc)) from exc
+        raise HTTPException(status_code=502, detail=str(bars_result)) from bars_result
+    if isinstance(bars_result, BaseException):
+        raise bars_result
+    used_provider, bars = bars_result
 
     if bars.empty:
         raise HTTPException(status_code=404, detail="No market data available for requested range.")
@@ -145,16 +218,15 @@ def generate_signals(
         "is_st": bool(bars.iloc[-1].get("is_st", False)),
         "is_suspended": bool(bars.iloc[-1].get("is_suspended", False)),
     }
-    try:
-        fetched_status = provider.get_security_status(req.symbol)
-        status["is_st"] = bool(fetched_status.get("is_st", status["is_st"]))
-        status["is_suspended"] = bool(fetched_status.get("is_suspended", status["is_suspended"]))
-    except Exception as exc:  # noqa: BLE001
+    if isinstance(status_result, BaseException):
         logger.warning(
             "Security status lookup failed for %s in signal generation; fallback to bars/default status: %s",
             req.symbol,
-            exc,
+            status_result,
         )
+    else:
+        status["is_st"] = bool(status_result.get("is_st", status["is_st"]))
+        status["is_suspended"] = bool(status_result.get("is_suspended", status["is_suspended"]))
     bars["is_st"] = bool(status.get("is_st", False))
     bars["is_suspended"] = bool(status.get("is_suspended", False))
     use_event_enrichment = req.enable_event_enrichment or req.strategy_name == "event_driven"
@@ -184,6 +256,7 @@ def generate_signals(
             provider=used_provider,
             row_count=len(bars),
             content_hash=dataframe_content_hash(bars),
+            hash_algorithm=CONTENT_HASH_ALGORITHM,
         )
     )
 
@@ -17,11 +17,16 @@ from trading_assistant.applied_stats.statistics import (
     ols_regression,
     ridge_regression,
     ridge_select_alpha_cv,
-    rolling_information_coefficient,
+    rolling_information_coefficient_many,
     summarize_series,
     two_sample_mean_test,
 )
 from trading_assistant.data.composite_provider import CompositeDataProvider
+from trading_assistant.factors.cross_section import (
+    DEFAULT_PANEL_FACTORS,
+    CrossSectionalFactorEngine,
+    FactorPanelBuilder,
+)
 from trading_assistant.factors.engine import FactorEngine
 from trading_assistant.fundamentals.service import FundamentalService
 
@@ -273,13 +278,26 @@ class AppliedStatisticsService:
             out["dropped_middle_pct"] = float(max(0.0, float(high_pct) - float(low_pct)))
             return out
 
+        rolling_window = 60
+
+        def _rolling_ics(factor_map: dict[str, pd.Series], target_cols: list[str]) -> dict[tuple[str, str], dict[str, Any]]:
+            # One rolling-IC pass for every factor/target pair instead of one pass per pair.
+            return rolling_information_coefficient_many(
+                trade_dates=dataset["trade_date"],
+                factors={name: pd.to_numeric(series, errors="coerce") for name, series in factor_map.items()},
+                targets={col: numeric[col] for col in target_cols},
+                window=int(rolling_window),
+                method="spearman",
+                min_obs=min(20, max(8, int(rolling_window // 3))),
+            )
+
         def _evaluate_factor(
             *,
             name: str,
             factor_series: pd.Series,
             target_col: str,
+            rolling: dict[str, Any],
             include_rolling_series: bool = False,
-            rolling_window: int = 60,
         ) -> dict[str, object]:
             y = numeric[target_col]
             x = pd.to_numeric(factor_series, errors="coerce")
@@ -288,14 +306,6 @@ class AppliedStatisticsService:
 
             ic_sp = information_coefficient(x, y, method="spearman")
             ic_pe = information_coefficient(x, y, method="pearson")
-            rolling = rolling_information_coefficient(
-                trade_dates=dataset["trade_date"],
-                factor=x,
-                target=y,
-                window=int(rolling_window),
-                method="spearman",
-                min_obs=min(20, max(8, int(rolling_window // 3))),
-            )
             series_tail = list(rolling.get("series") or [])[-20:]
             rolling_payload: dict[str, object] = {
                 "window": int(rolling.get("window", rolling_window)),
@@ -319,6 +329,7 @@ class AppliedStatisticsService:
                 "group_mean_test": group_test,
             }
 
+        momentum_rolling = _rolling_ics({col: numeric[col] for col in momentum_cols}, target_cols)
         horizon_evaluations: list[dict[str, object]] = []
         for target_horizon in target_horizons:
             target_col = f"ret_next_{target_horizon}d"
@@ -328,6 +339,7 @@ class AppliedStatisticsService:
                     name=col,
                     factor_series=numeric[col],
                     target_col=target_col,
+                    rolling=momentum_rolling[(col, target_col)],
                     include_rolling_series=False,
                 )
                 ev["horizon"] = int(momentum_horizon)
@@ -361,6 +373,7 @@ class AppliedStatisticsService:
             name=selected_momentum_col,
             factor_series=numeric[selected_momentum_col],
             target_col=selected_target_col,
+            rolling=momentum_rolling[(selected_momentum_col, selected_target_col)],
             include_rolling_series=True,
         )
         selected_horizon_evaluation["horizon"] = int(selected_horizon)
@@ -376,22 +389,25 @@ class AppliedStatisticsService:
                 return s * np.nan
             return (s - mu) / sd
 
+        combos: dict[str, tuple[tuple[int, ...], pd.Series]] = {}
         for r in range(2, len(momentum_horizons) + 1):
             for subset in itertools.combinations(momentum_horizons, r):
                 subset_cols = [f"momentum{h}" for h in subset]
                 z = pd.concat([_zscore(numeric[c]) for c in subset_cols], axis=1)
                 # Require all components to be present to keep a stable factor definition over time.
-                combo = z.mean(axis=1, skipna=False)
-                name = "momentum_combo_" + "_".join(str(h) for h in subset)
-                ev = _evaluate_factor(
-                    name=name,
-                    factor_series=combo,
-                    target_col=selected_target_col,
-                    include_rolling_series=False,
-                )
-                ev["horizons"] = [int(h) for h in subset]
-                ev["target_horizon"] = int(selected_target_horizon)
-                combo_candidates.append(ev)
+                combos["momentum_combo_" + "_".join(str(h) for h in subset)] = (subset, z.mean(axis=1, skipna=False))
+        combo_rolling = _rolling_ics({name: combo for name, (_, combo) in combos.items()}, [selected_target_col])
+        for name, (subset, combo) in combos.items():
+            ev = _evaluate_factor(
+                name=name,
+                factor_series=combo,
+                target_col=selected_target_col,
+                rolling=combo_rolling[(name, selected_target_col)],
+                include_rolling_series=False,
+            )
+            ev["horizons"] = [int(h) for h in subset]
+            ev["target_horizon"] = int(selected_target_horizon)
+            combo_candidates.append(ev)
 
         available_combos = [ev for ev in combo_candidates if bool(ev.get("available"))]
         combo_sorted = sorted(available_combos, key=_eval_score, reverse=True)
@@ -657,6 +673,70 @@ class AppliedStatisticsService:
             report["markdown_report_path"] = self._export_market_study_markdown(report)
         return report
 
+    def cross_sectional_factor_study(
+        self,
+        *,
+        symbols: list[str],
+        start_date: date,
+        end_date: date,
+        factors: list[str] | None = None,
+        horizons: list[int] | None = None,
+        quantiles: int = 5,
+        min_symbols: int = 20,
+        include_fundamentals: bool = False,
+        include_series: bool = False,
+    ) -> dict[str, Any]:
+        if start_date > end_date:
+            raise ValueError("start_date must be <= end_date.")
+        universe = list(dict.fromkeys(str(s).strip() for s in symbols if str(s).strip()))
+        if not universe:
+            raise ValueError("symbols must not be empty.")
+        factor_names = list(factors) if factors else list(DEFAULT_PANEL_FACTORS)
+        target_horizons = sorted({int(h) for h in (horizons or [5, 10, 20])})
+
+        # Symbols are processed one at a time and only the panel columns are kept, so peak
+        # memory is the float32 panel rather than every symbol's full feature frame.
+        builder = FactorPanelBuilder(factor_names)
+        providers: set[str] = set()
+        failed: list[dict[str, str]] = []
+        for symbol in universe:
+            try:
+                provider_name, bars = self.provider.get_daily_bars_with_source(symbol, start_date, end_date)
+                if bars.empty:
+                    failed.append({"symbol": symbol, "reason": "no_market_data"})
+                    continue
+                if include_fundamentals and self.fundamental_service is not None:
+                    bars, _ = self.fundamental_service.enrich_bars_point_in_time(
+                        symbol=symbol,
+                        bars=bars,
+                        max_staleness_days=540,
+                        anchor_frequency="month",
+                    )
+                builder.add(symbol, self.factor_engine.compute(bars))
+                providers.add(provider_name)
+            except Exception as exc:  # noqa: BLE001
+                failed.append({"symbol": symbol, "reason": str(exc)})
+        if len(builder) < 3:
+            raise ValueError("Cross-sectional study needs market data for at least 3 symbols.")
+
+        engine = CrossSectionalFactorEngine(builder.build(), min_symbols=min(int(min_symbols), len(builder)))
+        report = engine.evaluate(
+            factors=factor_names,
+            horizons=target_horizons,
+            quantiles=int(quantiles),
+            include_series=include_series,
+        )
+        return {
+            "study_name": "cross_sectional_factor_study",
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "providers": sorted(providers),
+            "requested_symbols": len(universe),
+            "failed_symbols": failed,
+            "horizons": target_horizons,
+            **report,
+        }
+
     def _export_market_study_markdown(self, report: dict[str, Any]) -> str:
         output_dir = Path("reports")
         output_dir.mkdir(parents=True, exist_ok=True)
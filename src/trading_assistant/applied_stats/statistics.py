@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 import math
-from typing import Any
+from typing import Any, Callable
 
 import numpy as np
 import pandas as pd
 
 _EPS = 1e-12
 _NORMAL_95 = 1.959963984540054
+# Resampling kernels materialize at most this many draws per block (8 MB of float64).
+_RESAMPLE_BLOCK_ELEMENTS = 1 << 20
+# Spearman rolling IC keeps (lt, eq) float32 comparison tensors of shape (windows, w, w) for every
+# target column plus the current factor column; this caps their combined size (16 MB).
+_RANK_BLOCK_ELEMENTS = 1 << 22
+# Replicates per independently seeded chunk in process-parallel mode.
+_PARALLEL_CHUNK = 4096
+_ROLLING_REL_VAR_TOL = 1e-10
 
 
 def _normal_cdf(value: float) -> float:
@@ -21,6 +30,62 @@ def _to_clean_array(values: list[float | int | None] | np.ndarray | pd.Series) -
     return arr[np.isfinite(arr)]
 
 
+def _resample_block_rows(width: int) -> int:
+    return max(1, _RESAMPLE_BLOCK_ELEMENTS // max(1, width))
+
+
+def _permutation_abs_diffs(rng: np.random.Generator, pooled: np.ndarray, n_a: int, count: int) -> np.ndarray:
+    # Row-wise ``permuted`` draws the same stream as ``count`` sequential ``rng.permutation`` calls.
+    n = int(pooled.size)
+    out = np.empty(count, dtype=float)
+    rows = _resample_block_rows(n)
+    for start in range(0, count, rows):
+        m = min(rows, count - start)
+        idx = rng.permuted(np.tile(np.arange(n), (m, 1)), axis=1)
+        shuffled = pooled[idx]
+        out[start : start + m] = np.abs(shuffled[:, :n_a].mean(axis=1) - shuffled[:, n_a:].mean(axis=1))
+    return out
+
+
+def _bootstrap_estimates(rng: np.random.Generator, arr: np.ndarray, stat_name: str, count: int) -> np.ndarray:
+    # ``rng.integers`` over a (rows, n) block matches ``rows`` sequential ``rng.choice(arr, n)`` draws.
+    n = int(arr.size)
+    out = np.empty(count, dtype=float)
+    rows = _resample_block_rows(n)
+    for start in range(0, count, rows):
+        m = min(rows, count - start)
+        sample = arr[rng.integers(0, n, size=(m, n))]
+        out[start : start + m] = sample.mean(axis=1) if stat_name == "mean" else np.median(sample, axis=1)
+    return out
+
+
+def _run_resample_chunk(kernel: Callable[..., np.ndarray], seed: np.random.SeedSequence, count: int, args: tuple) -> np.ndarray:
+    return kernel(np.random.default_rng(seed), *args, count)
+
+
+def _resample(
+    kernel: Callable[..., np.ndarray],
+    args: tuple,
+    *,
+    count: int,
+    random_seed: int,
+    parallel_workers: int,
+) -> np.ndarray:
+    """Run a resampling kernel serially, or over independently seeded chunks in worker processes.
+
+    The serial stream reproduces the original per-replicate loop. The parallel stream is
+    derived from ``SeedSequence(random_seed).spawn`` per fixed-size chunk, so it is identical
+    for a given seed whatever the worker count, but differs from the serial stream.
+    """
+    if parallel_workers <= 1 or count <= _PARALLEL_CHUNK:
+        return kernel(np.random.default_rng(random_seed), *args, count)
+    sizes = [min(_PARALLEL_CHUNK, count - start) for start in range(0, count, _PARALLEL_CHUNK)]
+    seeds = np.random.SeedSequence(random_seed).spawn(len(sizes))
+    with ProcessPoolExecutor(max_workers=min(int(parallel_workers), len(sizes))) as pool:
+        parts = list(pool.map(_run_resample_chunk, [kernel] * len(sizes), seeds, sizes, [args] * len(sizes)))
+    return np.concatenate(parts)
+
+
 def summarize_series(values: list[float | int | None] | np.ndarray | pd.Series) -> dict[str, float | int | None]:
     arr = _to_clean_array(values)
     if arr.size == 0:
@@ -84,6 +149,7 @@ def two_sample_mean_test(
     equal_var: bool = False,
     permutations: int = 2000,
     random_seed: int = 42,
+    parallel_workers: int = 1,
 ) -> dict[str, float | int]:
     a = _to_clean_array(sample_a)
     b = _to_clean_array(sample_b)
@@ -118,15 +184,16 @@ def two_sample_mean_test(
     pooled_std_for_d = math.sqrt(max(_EPS, pooled_var_for_d))
     cohen_d = float(diff / pooled_std_for_d)
 
-    rng = np.random.default_rng(random_seed)
     pooled_values = np.concatenate([a, b])
-    more_extreme = 0
     perm_n = max(100, int(permutations))
-    for _ in range(perm_n):
-        shuffled = rng.permutation(pooled_values)
-        perm_diff = float(np.mean(shuffled[:n_a]) - np.mean(shuffled[n_a:]))
-        if abs(perm_diff) >= abs(diff):
-            more_extreme += 1
+    perm_diffs = _resample(
+        _permutation_abs_diffs,
+        (pooled_values, n_a),
+        count=perm_n,
+        random_seed=random_seed,
+        parallel_workers=parallel_workers,
+    )
+    more_extreme = int(np.count_nonzero(perm_diffs >= abs(diff)))
     p_value_permutation = float((more_extreme + 1) / (perm_n + 1))
 
     return {
@@ -152,6 +219,7 @@ def bootstrap_confidence_interval(
     statistic: str = "mean",
     bootstrap_samples: int = 2000,
     random_seed: int = 42,
+    parallel_workers: int = 1,
 ) -> dict[str, float | int | str]:
     arr = _to_clean_array(values)
     n = int(arr.size)
@@ -166,12 +234,14 @@ def bootstrap_confidence_interval(
     else:
         raise ValueError("Unsupported statistic. Expected one of: mean, median.")
 
-    rng = np.random.default_rng(random_seed)
     b = max(200, int(bootstrap_samples))
-    estimates = np.empty(b, dtype=float)
-    for i in range(b):
-        sample = rng.choice(arr, size=n, replace=True)
-        estimates[i] = float(stat_fn(sample))
+    estimates = _resample(
+        _bootstrap_estimates,
+        (arr, stat_name),
+        count=b,
+        random_seed=random_seed,
+        parallel_workers=parallel_workers,
+    )
 
     estimate = float(stat_fn(arr))
     ci_low = float(np.quantile(estimates, 0.025))
@@ -565,36 +635,143 @@ def information_coefficient(
     raise ValueError("method must be 'spearman' or 'pearson'.")
 
 
-def rolling_information_coefficient(
+def _centered(values: np.ndarray, finite: np.ndarray) -> np.ndarray:
+    # Centre each column so running sums of squares do not cancel catastrophically.
+    mean = np.where(finite, values, 0.0).sum(axis=0) / np.maximum(finite.sum(axis=0), 1)
+    return np.where(finite, values - mean, 0.0)
+
+
+def _rolling_pearson(x: np.ndarray, y: np.ndarray, valid: np.ndarray, w: int) -> tuple[np.ndarray, np.ndarray]:
+    # x: (T, F, 1), y: (T, 1, K), valid: (T, F, K) -> windowed (corr, pair count) via cumulative sums.
+    xv = np.where(valid, x, 0.0)
+    yv = np.where(valid, y, 0.0)
+    parts = np.stack([valid.astype(float), xv, yv, xv * xv, yv * yv, xv * yv], axis=0)
+    cs = np.concatenate([np.zeros_like(parts[:, :1]), np.cumsum(parts, axis=1)], axis=1)
+    n, sx, sy, sxx, syy, sxy = cs[:, w:] - cs[:, :-w]
+    return _corr_from_sums(n, sx, sy, sxx, syy, sxy), n
+
+
+def _corr_from_sums(
+    n: np.ndarray, sx: np.ndarray, sy: np.ndarray, sxx: np.ndarray, syy: np.ndarray, sxy: np.ndarray
+) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dof = np.maximum(n - 1.0, 1.0)
+        var_x = np.maximum((sxx - sx * sx / n) / dof, 0.0)
+        var_y = np.maximum((syy - sy * sy / n) / dof, 0.0)
+        # Running sums leave ~1e-16 relative residue on constant windows; treat that as zero.
+        var_x = np.where(var_x <= _ROLLING_REL_VAR_TOL * sxx / np.maximum(n, 1.0), 0.0, var_x)
+        var_y = np.where(var_y <= _ROLLING_REL_VAR_TOL * syy / np.maximum(n, 1.0), 0.0, var_y)
+        cov = (sxy - sx * sy / n) / dof
+        denom = np.sqrt(var_x * var_y)
+        corr = np.clip(cov / denom, -1.0, 1.0)
+    # Same degenerate-variance rule as ``information_coefficient``.
+    return np.where((n >= 3) & (denom > _EPS), corr, np.nan)
+
+
+def _window_rank_counts(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # values: (B, w) -> lt[b, j, i] = values[b, i] < values[b, j], eq likewise (NaN compares false).
+    lt = (values[:, None, :] < values[:, :, None]).astype(np.float32)
+    eq = (values[:, None, :] == values[:, :, None]).astype(np.float32)
+    return lt, eq
+
+
+def _masked_average_ranks(lt: np.ndarray, eq: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    # Average (tie-aware) 1-based rank of each element among the valid members of its window.
+    v = valid.astype(np.float32)[:, :, None]
+    less = np.matmul(lt, v)[:, :, 0]
+    ties = np.matmul(eq, v)[:, :, 0]
+    return (less + (ties + 1.0) / 2.0).astype(float)
+
+
+def rolling_ic_matrix(
+    factors: np.ndarray | pd.DataFrame,
+    targets: np.ndarray | pd.DataFrame,
     *,
-    trade_dates: list[object] | pd.Series | np.ndarray,
-    factor: list[float | int | None] | np.ndarray | pd.Series,
-    target: list[float | int | None] | np.ndarray | pd.Series,
     window: int = 60,
     method: str = "spearman",
     min_obs: int = 20,
-) -> dict[str, Any]:
-    dates = list(trade_dates)
-    x = np.asarray(factor, dtype=float).reshape(-1)
-    y = np.asarray(target, dtype=float).reshape(-1)
-    if len(dates) != int(x.size) or int(x.size) != int(y.size):
-        raise ValueError("trade_dates, factor, and target must have identical lengths.")
+) -> np.ndarray:
+    """
+    Rolling IC of every factor column against every target column in one pass.
 
-    w = max(5, int(window))
-    min_n = max(5, int(min_obs))
+    Returns an array shaped ``(T - window + 1, n_factors, n_targets)``; row ``i`` is the window
+    ending at observation ``i + window - 1``. Entries are NaN when the window has fewer than
+    ``min_obs`` finite pairs or a degenerate variance, matching ``information_coefficient``.
+
+    - Pearson uses sliding sums, O(T) per factor/target pair.
+    - Spearman ranks each window by vectorized pairwise counting instead of re-sorting: the
+      comparison tensors are built once per factor/target column and reused across pairs.
+    """
+    x = np.asarray(factors, dtype=float)
+    y = np.asarray(targets, dtype=float)
+    x = x.reshape(-1, 1) if x.ndim == 1 else x
+    y = y.reshape(-1, 1) if y.ndim == 1 else y
+    if x.shape[0] != y.shape[0]:
+        raise ValueError("factors and targets must have the same number of rows.")
+    t_len, n_f = x.shape
+    n_k = y.shape[1]
+    w = int(window)
+    min_n = int(min_obs)
+    key = str(method or "").strip().lower()
+    if key not in ("spearman", "rank", "pearson", "linear"):
+        raise ValueError("method must be 'spearman' or 'pearson'.")
+    if w < 1 or t_len < w:
+        return np.full((0, n_f, n_k), np.nan)
+    if n_f == 0 or n_k == 0:
+        return np.full((t_len - w + 1, n_f, n_k), np.nan)
+
+    fx = np.isfinite(x)
+    fy = np.isfinite(y)
+    if key in ("pearson", "linear"):
+        valid = fx[:, :, None] & fy[:, None, :]
+        out, n = _rolling_pearson(_centered(x, fx)[:, :, None], _centered(y, fy)[:, None, :], valid, w)
+        return np.where(n >= min_n, out, np.nan)
+
+    xw = np.lib.stride_tricks.sliding_window_view(x, w, axis=0)  # (R, F, w)
+    yw = np.lib.stride_tricks.sliding_window_view(y, w, axis=0)  # (R, K, w)
+    fxw = np.lib.stride_tricks.sliding_window_view(fx, w, axis=0)
+    fyw = np.lib.stride_tricks.sliding_window_view(fy, w, axis=0)
+    rows = xw.shape[0]
+    out = np.full((rows, n_f, n_k), np.nan)
+    block = max(1, _RANK_BLOCK_ELEMENTS // max(1, 2 * (n_k + 1) * w * w))
+    for start in range(0, rows, block):
+        stop = min(rows, start + block)
+        y_counts = [_window_rank_counts(yw[start:stop, k]) for k in range(n_k)]
+        for f in range(n_f):
+            lt_x, eq_x = _window_rank_counts(xw[start:stop, f])
+            for k in range(n_k):
+                valid = fxw[start:stop, f] & fyw[start:stop, k]
+                n = valid.sum(axis=1).astype(float)
+                rx = np.where(valid, _masked_average_ranks(lt_x, eq_x, valid), 0.0)
+                ry = np.where(valid, _masked_average_ranks(*y_counts[k], valid), 0.0)
+                corr = _corr_from_sums(
+                    n,
+                    rx.sum(axis=1),
+                    ry.sum(axis=1),
+                    (rx * rx).sum(axis=1),
+                    (ry * ry).sum(axis=1),
+                    (rx * ry).sum(axis=1),
+                )
+                out[start:stop, f, k] = np.where(n >= min_n, corr, np.nan)
+    return out
+
+
+def _rolling_ic_payload(
+    dates: list[object],
+    ic_column: np.ndarray,
+    *,
+    w: int,
+    method: str,
+    min_n: int,
+) -> dict[str, Any]:
     series: list[dict[str, object]] = []
-    for idx in range(w - 1, int(x.size)):
-        xs = x[idx - w + 1 : idx + 1]
-        ys = y[idx - w + 1 : idx + 1]
-        mask = np.isfinite(xs) & np.isfinite(ys)
-        ic = None
-        if int(mask.sum()) >= min_n:
-            ic = information_coefficient(xs[mask], ys[mask], method=method)
-        d = dates[idx]
+    for offset, value in enumerate(ic_column):
+        d = dates[offset + w - 1]
         date_text = d.isoformat() if hasattr(d, "isoformat") else str(d)
-        series.append({"trade_date": date_text, "ic": ic})
+        series.append({"trade_date": date_text, "ic": float(value) if np.isfinite(value) else None})
 
-    ic_values = np.array([row["ic"] for row in series if isinstance(row.get("ic"), (int, float)) and np.isfinite(row["ic"])], dtype=float)
+    ic_values = np.asarray(ic_column, dtype=float)
+    ic_values = ic_values[np.isfinite(ic_values)]
     if ic_values.size == 0:
         summary = {
             "count": 0,
@@ -629,3 +806,55 @@ def rolling_information_coefficient(
         "summary": summary,
         "series": series,
     }
+
+
+def rolling_information_coefficient_many(
+    *,
+    trade_dates: list[object] | pd.Series | np.ndarray,
+    factors: dict[str, list[float | int | None] | np.ndarray | pd.Series],
+    targets: dict[str, list[float | int | None] | np.ndarray | pd.Series],
+    window: int = 60,
+    method: str = "spearman",
+    min_obs: int = 20,
+) -> dict[tuple[str, str], dict[str, Any]]:
+    """``rolling_information_coefficient`` for every (factor, target) pair, keyed by name pair.
+
+    An empty ``factors`` or ``targets`` mapping has no pairs and returns ``{}``.
+    """
+    dates = list(trade_dates)
+    factor_names = list(factors)
+    target_names = list(targets)
+    if not factor_names or not target_names:
+        return {}
+    x = np.column_stack([np.asarray(factors[name], dtype=float).reshape(-1) for name in factor_names])
+    y = np.column_stack([np.asarray(targets[name], dtype=float).reshape(-1) for name in target_names])
+    if len(dates) != x.shape[0] or x.shape[0] != y.shape[0]:
+        raise ValueError("trade_dates, factor, and target must have identical lengths.")
+
+    w = max(5, int(window))
+    min_n = max(5, int(min_obs))
+    ic = rolling_ic_matrix(x, y, window=w, method=method, min_obs=min_n)
+    return {
+        (f_name, t_name): _rolling_ic_payload(dates, ic[:, f_idx, t_idx], w=w, method=method, min_n=min_n)
+        for f_idx, f_name in enumerate(factor_names)
+        for t_idx, t_name in enumerate(target_names)
+    }
+
+
+def rolling_information_coefficient(
+    *,
+    trade_dates: list[object] | pd.Series | np.ndarray,
+    factor: list[float | int | None] | np.ndarray | pd.Series,
+    target: list[float | int | None] | np.ndarray | pd.Series,
+    window: int = 60,
+    method: str = "spearman",
+    min_obs: int = 20,
+) -> dict[str, Any]:
+    return rolling_information_coefficient_many(
+        trade_dates=trade_dates,
+        factors={"factor": factor},
+        targets={"target": target},
+        window=window,
+        method=method,
+        min_obs=min_obs,
+    )[("factor", "target")]
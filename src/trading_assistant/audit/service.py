@@ -4,6 +4,7 @@ import io
 import csv
 import json
 import logging
+from typing import Iterator
 
 from trading_assistant.audit.store import AuditStore
 from trading_assistant.core.models import AuditChainVerifyResult, AuditEventCreate, AuditEventRecord
@@ -26,6 +27,14 @@ class AuditService:
     def query(self, event_type: str | None = None, limit: int = 100) -> list[AuditEventRecord]:
         return self.store.list_events(event_type=event_type, limit=limit)
 
+    def iter_events(
+        self,
+        event_type: str | None = None,
+        limit: int | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[AuditEventRecord]:
+        return self.store.iter_events(event_type=event_type, limit=limit, page_size=page_size)
+
     def export_csv(self, event_type: str | None = None, limit: int = 1000) -> str:
         rows = self.query(event_type=event_type, limit=limit)
         buf = io.StringIO()
@@ -5,20 +5,21 @@ import json
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterable, Iterator
 
 from trading_assistant.core.models import AuditEventCreate, AuditEventRecord
+from trading_assistant.core.sqlite import SQLiteConnectionPool
 
 
 class AuditStore:
     def __init__(self, db_path: str) -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.db_path)
         self._init_schema()
 
     def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return self._pool.connection()
 
     def _init_schema(self) -> None:
         with self._conn() as conn:
@@ -81,21 +82,65 @@ class AuditStore:
 
         with self._conn() as conn:
             rows = conn.execute(sql, params).fetchall()
-        return [
-            AuditEventRecord(
-                id=int(row["id"]),
-                event_time=datetime.fromisoformat(row["event_time"]),
-                event_type=str(row["event_type"]),
-                action=str(row["action"]),
-                status=str(row["status"]),
-                payload=json.loads(str(row["payload"])),
-                prev_hash=str(row["prev_hash"]) if row["prev_hash"] is not None else None,
-                event_hash=str(row["event_hash"]) if row["event_hash"] is not None else None,
-            )
-            for row in rows
-        ]
+        return [self._to_record(row) for row in rows]
+
+    def iter_events(
+        self,
+        event_type: str | None = None,
+        limit: int | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[AuditEventRecord]:
+        """Yield events newest first, reading one keyset page (``id < last id``) at a time.
+
+        Unlike ``list_events`` there is no hard cap: only ``page_size`` rows are held in
+        memory, and no read transaction stays open between pages.
+        """
+        page_size = max(1, int(page_size))
+        remaining = None if limit is None else max(0, int(limit))
+        last_id: int | None = None
+        while remaining is None or remaining > 0:
+            clauses: list[str] = []
+            params: list[str | int] = []
+            if event_type:
+                clauses.append("event_type = ?")
+                params.append(event_type)
+            if last_id is not None:
+                clauses.append("id < ?")
+                params.append(last_id)
+            sql = """
+                SELECT id, event_time, event_type, action, status, payload, prev_hash, event_hash
+                FROM audit_events
+            """
+            if clauses:
+                sql += " WHERE " + " AND ".join(clauses)
+            batch = page_size if remaining is None else min(page_size, remaining)
+            sql += " ORDER BY id DESC LIMIT ? "
+            params.append(batch)
+            with self._conn() as conn:
+                rows = conn.execute(sql, params).fetchall()
+            for row in rows:
+                yield self._to_record(row)
+            if len(rows) < batch:
+                return
+            last_id = int(rows[-1]["id"])
+            if remaining is not None:
+                remaining -= len(rows)
+
+    @staticmethod
+    def _to_record(row: sqlite3.Row) -> AuditEventRecord:
+        return AuditEventRecord(
+            id=int(row["id"]),
+            event_time=datetime.fromisoformat(row["event_time"]),
+            event_type=str(row["event_type"]),
+            action=str(row["action"]),
+            status=str(row["status"]),
+            payload=json.loads(str(row["payload"])),
+            prev_hash=str(row["prev_hash"]) if row["prev_hash"] is not None else None,
+            event_hash=str(row["event_hash"]) if row["event_hash"] is not None else None,
+        )
 
     def verify_hash_chain(self, limit: int = 5000) -> tuple[bool, int | None, int]:
+        # Iterate the cursor instead of fetchall() so only one row is materialized at a time.
         with self._conn() as conn:
             rows = conn.execute(
                 """
@@ -105,8 +150,11 @@ class AuditStore:
                 LIMIT ?
                 """,
                 (max(1, min(limit, 50000)),),
-            ).fetchall()
+            )
+            return self._verify_rows(rows)
 
+    @staticmethod
+    def _verify_rows(rows: Iterable[sqlite3.Row]) -> tuple[bool, int | None, int]:
         previous_hash = ""
         checked = 0
         for row in rows:
@@ -189,18 +189,30 @@ class AutoTuneService:
     def delete_rollout_rule(self, rule_id: int) -> bool:
         return self.store.delete_rollout_rule(rule_id)
 
-    def run(self, req: AutoTuneRunRequest) -> AutoTuneRunResult:
+    def run(
+        self,
+        req: AutoTuneRunRequest,
+        *,
+        bars: pd.DataFrame | None = None,
+        provider_name: str | None = None,
+    ) -> AutoTuneRunResult:
+        """Tune ``req``; ``bars`` (sorted, with ``is_st``/``is_suspended``) skips the provider fetch."""
         strategy = self.registry.get(req.strategy_name)
         run_id = uuid4().hex
 
-        used_provider, bars = self.provider.get_daily_bars_with_source(req.symbol, req.start_date, req.end_date)
-        if bars.empty:
-            raise ValueError("No market data available for requested range.")
-
-        bars = bars.sort_values("trade_date").reset_index(drop=True).copy()
-        status = self._resolve_security_status(provider=self.provider, symbol=req.symbol, bars=bars)
-        bars["is_st"] = bool(status.get("is_st", False))
-        bars["is_suspended"] = bool(status.get("is_suspended", False))
+        if bars is not None and not bars.empty:
+            used_provider = provider_name or "preloaded"
+            # Shallow copy: enrichment adds columns without touching the caller's (shared) frame.
+            bars = bars.copy(deep=False)
+        else:
+            used_provider, bars = self.provider.get_daily_bars_with_source(req.symbol, req.start_date, req.end_date)
+            if bars.empty:
+                raise ValueError("No market data available for requested range.")
+
+            bars = bars.sort_values("trade_date").reset_index(drop=True).copy()
+            status = self._resolve_security_status(provider=self.provider, symbol=req.symbol, bars=bars)
+            bars["is_st"] = bool(status.get("is_st", False))
+            bars["is_suspended"] = bool(status.get("is_suspended", False))
 
         if (req.enable_event_enrichment or req.strategy_name == "event_driven") and self.event_service is not None:
             bars, _ = self.event_service.enrich_bars(
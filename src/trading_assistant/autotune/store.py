@@ -7,18 +7,18 @@ from pathlib import Path
 from typing import Any
 
 from trading_assistant.core.models import AutoTuneApplyScope, AutoTuneProfileRecord, AutoTuneRolloutRuleRecord
+from trading_assistant.core.sqlite import SQLiteConnectionPool
 
 
 class AutoTuneStore:
     def __init__(self, db_path: str) -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.db_path)
         self._init_schema()
 
     def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return self._pool.connection()
 
     def _init_schema(self) -> None:
         with self._conn() as conn:
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from datetime import date
 import math
 
+import numpy as np
 import pandas as pd
 
 from trading_assistant.core.models import (
@@ -44,6 +45,57 @@ class BacktestState:
     winning_trades: int = 0
 
 
+@dataclass(slots=True)
+class _TradeRecord:
+    date: date
+    action: SignalAction
+    price: float
+    quantity: int
+    cost: float
+    reason: str
+    blocked: bool = False
+
+
+class _EquityCurveBuffer:
+    """Preallocated per-bar equity columns; materialized into EquityPoint models once per run."""
+
+    __slots__ = ("dates", "cash", "position_value", "equity", "drawdown", "size")
+
+    def __init__(self, capacity: int) -> None:
+        self.dates: list[date] = []
+        self.cash = np.empty(capacity, dtype=float)
+        self.position_value = np.empty(capacity, dtype=float)
+        self.equity = np.empty(capacity, dtype=float)
+        self.drawdown = np.empty(capacity, dtype=float)
+        self.size = 0
+
+    def append(self, day: date, cash: float, position_value: float, equity: float, drawdown: float) -> None:
+        i = self.size
+        self.dates.append(day)
+        self.cash[i] = round(cash, 2)
+        self.position_value[i] = round(position_value, 2)
+        self.equity[i] = round(equity, 2)
+        self.drawdown[i] = round(drawdown, 6)
+        self.size = i + 1
+
+    def to_points(self) -> list[EquityPoint]:
+        n = self.size
+        return [
+            EquityPoint(date=d, cash=c, position_value=pv, equity=e, drawdown=dd)
+            for d, c, pv, e, dd in zip(
+                self.dates,
+                self.cash[:n].tolist(),
+                self.position_value[:n].tolist(),
+                self.equity[:n].tolist(),
+                self.drawdown[:n].tolist(),
+            )
+        ]
+
+
+def _opt_float(value):
+    return float(value) if (value is not None and value == value) else None
+
+
 @dataclass
 class BacktestDiagnostics:
     signal_count: int = 0
@@ -123,8 +175,9 @@ class BacktestEngine:
             peak_equity=req.initial_cash,
         )
         diagnostics = BacktestDiagnostics()
-        equity_curve: list[EquityPoint] = []
-        trades: list[BacktestTrade] = []
+        # Per-bar state stays in plain arrays/slotted records; Pydantic models are built once in _build_result.
+        equity_curve = _EquityCurveBuffer(len(sorted_bars))
+        trades: list[_TradeRecord] = []
         buy_date = None
 
         for i in range(len(sorted_bars)):
@@ -157,15 +210,7 @@ class BacktestEngine:
             drawdown = 0.0 if state.peak_equity <= 0 else max(0.0, 1 - equity / state.peak_equity)
 
             if signal is None:
-                equity_curve.append(
-                    EquityPoint(
-                        date=trade_date,
-                        cash=round(state.cash, 2),
-                        position_value=round(position_value, 2),
-                        equity=round(equity, 2),
-                        drawdown=round(drawdown, 6),
-                    )
-                )
+                equity_curve.append(trade_date, state.cash, position_value, equity, drawdown)
                 continue
 
             diagnostics.signal_count += 1
@@ -194,9 +239,6 @@ class BacktestEngine:
             fundamental_score = (
                 float(latest_feature.get("fundamental_score", 0.5)) if fundamental_available else None
             )
-            def _opt_float(value):
-                return float(value) if (value is not None and value == value) else None
-
             tushare_disclosure_risk = _opt_float(latest_feature.get("tushare_disclosure_risk_score"))
             tushare_audit_risk = _opt_float(latest_feature.get("tushare_audit_opinion_risk"))
             tushare_forecast_mid = _opt_float(latest_feature.get("tushare_forecast_pchg_mid"))
@@ -292,7 +334,7 @@ class BacktestEngine:
                     if any((not hit.passed) and hit.rule_name == "t_plus_one" for hit in risk_result.hits):
                         diagnostics.blocked_tplus1_sell_count += 1
                 trades.append(
-                    BacktestTrade(
+                    _TradeRecord(
                         date=trade_date,
                         action=signal.action,
                         price=close,
@@ -330,15 +372,7 @@ class BacktestEngine:
             updated_drawdown = (
                 0.0 if state.peak_equity <= 0 else max(0.0, 1 - updated_equity / state.peak_equity)
             )
-            equity_curve.append(
-                EquityPoint(
-                    date=trade_date,
-                    cash=round(state.cash, 2),
-                    position_value=round(updated_position_value, 2),
-                    equity=round(updated_equity, 2),
-                    drawdown=round(updated_drawdown, 6),
-                )
-            )
+            equity_curve.append(trade_date, state.cash, updated_position_value, updated_equity, updated_drawdown)
 
         return self._build_result(
             req=req,
@@ -355,7 +389,7 @@ class BacktestEngine:
         trade_date: date,
         close: float,
         state: BacktestState,
-        trades: list[BacktestTrade],
+        trades: list[_TradeRecord],
         diagnostics: BacktestDiagnostics,
         available_qty: int,
         turnover20: float | None,
@@ -412,7 +446,7 @@ class BacktestEngine:
             if qty <= 0:
                 diagnostics.buy_no_fill_count += 1
                 trades.append(
-                    BacktestTrade(
+                    _TradeRecord(
                         date=trade_date,
                         action=SignalAction.BUY,
                         price=round(close, 4),
@@ -460,7 +494,7 @@ class BacktestEngine:
             if state.quantity > 0:
                 state.avg_cost = ((prev_cost * prev_qty) + total_cost) / state.quantity
             trades.append(
-                BacktestTrade(
+                _TradeRecord(
                     date=trade_date,
                     action=SignalAction.BUY,
                     price=round(trade_price, 4),
@@ -513,7 +547,7 @@ class BacktestEngine:
             if qty <= 0:
                 diagnostics.sell_no_fill_count += 1
                 trades.append(
-                    BacktestTrade(
+                    _TradeRecord(
                         date=trade_date,
                         action=SignalAction.SELL,
                         price=round(close, 4),
@@ -548,7 +582,7 @@ class BacktestEngine:
                 state.quantity = 0
                 state.avg_cost = 0.0
             trades.append(
-                BacktestTrade(
+                _TradeRecord(
                     date=trade_date,
                     action=SignalAction.SELL,
                     price=round(trade_price, 4),
@@ -563,26 +597,27 @@ class BacktestEngine:
         req: BacktestRequest,
         state: BacktestState,
         diagnostics: BacktestDiagnostics,
-        trades: list[BacktestTrade],
-        equity_curve: list[EquityPoint],
+        trades: list[_TradeRecord],
+        equity_curve: _EquityCurveBuffer,
     ) -> BacktestResult:
-        final_equity = equity_curve[-1].equity if equity_curve else req.initial_cash
+        equities = equity_curve.equity[: equity_curve.size].tolist()
+        final_equity = equities[-1] if equities else req.initial_cash
         total_return = final_equity / req.initial_cash - 1
-        max_drawdown = max((p.drawdown for p in equity_curve), default=0.0)
+        max_drawdown = float(equity_curve.drawdown[: equity_curve.size].max()) if equities else 0.0
         win_rate = 0.0 if state.realized_trades == 0 else state.winning_trades / state.realized_trades
         annualized_return = 0.0
         sharpe = 0.0
-        if equity_curve:
+        if equities:
             days = max(1, (req.end_date - req.start_date).days)
             annualized_return = (1 + total_return) ** (365 / days) - 1 if total_return > -1 else -1.0
 
-        if len(equity_curve) >= 3:
+        if len(equities) >= 3:
             rets: list[float] = []
-            prev = equity_curve[0].equity
-            for point in equity_curve[1:]:
+            prev = equities[0]
+            for equity in equities[1:]:
                 if prev > 0:
-                    rets.append(point.equity / prev - 1)
-                prev = point.equity
+                    rets.append(equity / prev - 1)
+                prev = equity
             if rets:
                 mean_ret = sum(rets) / len(rets)
                 var = sum((r - mean_ret) ** 2 for r in rets) / len(rets)
@@ -598,7 +633,7 @@ class BacktestEngine:
             metrics=BacktestMetrics(
                 total_return=round(total_return, 6),
                 max_drawdown=round(max_drawdown, 6),
-                trade_count=len([t for t in trades if not t.blocked and t.quantity > 0]),
+                trade_count=sum(1 for t in trades if not t.blocked and t.quantity > 0),
                 win_rate=round(win_rate, 6),
                 blocked_signal_count=state.blocked_signal_count,
                 annualized_return=round(annualized_return, 6),
@@ -615,6 +650,17 @@ class BacktestEngine:
                 buy_budget_insufficient_count=int(diagnostics.buy_budget_insufficient_count),
                 sell_without_position_count=int(diagnostics.sell_without_position_count),
             ),
-            trades=trades,
-            equity_curve=equity_curve,
+            trades=[
+                BacktestTrade(
+                    date=t.date,
+                    action=t.action,
+                    price=t.price,
+                    quantity=t.quantity,
+                    cost=t.cost,
+                    reason=t.reason,
+                    blocked=t.blocked,
+                )
+                for t in trades
+            ],
+            equity_curve=equity_curve.to_points(),
         )
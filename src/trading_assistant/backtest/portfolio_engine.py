@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date
 import math
 
+import numpy as np
 import pandas as pd
 
+from trading_assistant.backtest.portfolio_panel import PortfolioPanel
 from trading_assistant.core.models import (
     OptimizeCandidate,
     PortfolioBacktestMetrics,
@@ -22,6 +22,7 @@ from trading_assistant.core.models import (
 from trading_assistant.factors.engine import FactorEngine
 from trading_assistant.portfolio.optimizer import PortfolioOptimizer
 from trading_assistant.risk.engine import RiskEngine
+from trading_assistant.risk.metrics import RollingVarEs
 from trading_assistant.strategy.base import BaseStrategy, StrategyContext
 from trading_assistant.trading.costs import (
     calc_side_fee,
@@ -32,10 +33,29 @@ from trading_assistant.trading.costs import (
 )
 
 
-@dataclass
-class _Holding:
-    qty: int = 0
-    avg_cost: float = 0.0
+class _Book:
+    """Positions as symbol-aligned vectors (column order of the panel)."""
+
+    def __init__(self, symbols: list[str], *, industry_map: dict[str, str], theme_map: dict[str, str]) -> None:
+        n = len(symbols)
+        self.symbols = symbols
+        self.qty = np.zeros(n, dtype=np.int64)
+        self.avg_cost = np.zeros(n)
+        self.last_price = np.zeros(n)
+        # Shares bought on the current day; T+1 keeps them out of same-day sells.
+        self.locked = np.zeros(n, dtype=np.int64)
+        self.industries = [industry_map.get(x, "UNKNOWN") for x in symbols]
+        self.themes = [theme_map.get(x, "UNKNOWN") for x in symbols]
+
+    def held(self) -> np.ndarray:
+        return np.flatnonzero(self.qty > 0)
+
+    def market_value(self) -> float:
+        # Sequential sum in symbol order so cash/equity arithmetic is reproducible bar for bar.
+        total = 0.0
+        for j in self.held():
+            total += int(self.qty[j]) * float(self.last_price[j])
+        return total
 
 
 class PortfolioBacktestEngine:
@@ -58,8 +78,9 @@ class PortfolioBacktestEngine:
         strategy: BaseStrategy,
         params_by_symbol: dict[str, dict[str, float | int | str | bool]] | None = None,
     ) -> PortfolioBacktestResult:
-        normalized = self._normalize_bars(bars_by_symbol)
-        calendar = self._build_calendar(normalized)
+        symbols = list(dict.fromkeys(req.symbols))
+        panel = PortfolioPanel.build(bars_by_symbol=bars_by_symbol, symbols=symbols, factor_engine=self.factor_engine)
+        calendar = panel.dates
         if not calendar:
             return PortfolioBacktestResult(
                 strategy_name=req.strategy_name,
@@ -79,11 +100,7 @@ class PortfolioBacktestEngine:
                 equity_curve=[],
             )
 
-        holdings: dict[str, _Holding] = {symbol: _Holding() for symbol in req.symbols}
-        last_price: dict[str, float] = {}
-        feature_cache: dict[str, pd.DataFrame] = {}
-        latest_turnover: dict[str, float] = {}
-        latest_flags: dict[str, dict[str, bool]] = {}
+        book = _Book(symbols, industry_map=req.industry_map, theme_map=req.theme_map)
 
         cash = float(req.initial_cash)
         peak = float(req.initial_cash)
@@ -94,6 +111,7 @@ class PortfolioBacktestEngine:
         risk_blocked_days = 0
         risk_warning_days = 0
         daily_returns: list[float] = []
+        rolling_var_es = RollingVarEs(int(req.risk_return_lookback_days), confidence=req.risk_var_confidence)
         recent_trade_pnls: list[float] = []
         prev_equity = float(req.initial_cash)
 
@@ -102,25 +120,18 @@ class PortfolioBacktestEngine:
 
         for idx, trade_day in enumerate(calendar):
             # Mark-to-market update.
-            for symbol, frame in normalized.items():
-                row = frame.get(trade_day)
-                if row is None:
-                    continue
-                close = float(row.get("close", 0.0) or 0.0)
-                if close > 0:
-                    last_price[symbol] = close
-
-            pre_exposure, pre_industry_exposure, pre_theme_exposure = self._exposure(
-                holdings=holdings,
-                last_price=last_price,
-                industry_map=req.industry_map,
-                theme_map=req.theme_map,
-            )
+            closes = panel.close[idx]
+            priced = closes > 0
+            book.last_price[priced] = closes[priced]
+            book.locked[:] = 0
+
+            pre_exposure, pre_industry_exposure, pre_theme_exposure = self._exposure(book)
             pre_equity = cash + pre_exposure
             if pre_equity <= 0:
                 continue
             if idx > 0 and prev_equity > 0:
                 daily_returns.append(float(pre_equity) / float(prev_equity) - 1.0)
+                rolling_var_es.update(daily_returns[-1])
                 max_return_keep = max(100, int(req.risk_return_lookback_days) * 2)
                 if len(daily_returns) > max_return_keep:
                     daily_returns = daily_returns[-max_return_keep:]
@@ -130,12 +141,9 @@ class PortfolioBacktestEngine:
             if idx % rebalance_step == 0:
                 targets = self._build_targets(
                     req=req,
-                    normalized=normalized,
-                    feature_cache=feature_cache,
-                    latest_turnover=latest_turnover,
-                    latest_flags=latest_flags,
+                    panel=panel,
+                    t=idx,
                     strategy=strategy,
-                    trade_day=trade_day,
                     gross_target=gross_target,
                     params_by_symbol=params_by_symbol or {},
                 )
@@ -166,7 +174,8 @@ class PortfolioBacktestEngine:
                             var_confidence=req.risk_var_confidence,
                             max_var=req.risk_max_var,
                             max_es=req.risk_max_es,
-                        )
+                        ),
+                        var_es=rolling_var_es.value(),
                     )
                     if risk_result.blocked:
                         risk_blocked_days += 1
@@ -176,12 +185,10 @@ class PortfolioBacktestEngine:
 
                 cash, realized_trade_pnls = self._rebalance(
                     req=req,
-                    trade_day=trade_day,
+                    panel=panel,
+                    t=idx,
                     targets=targets,
-                    holdings=holdings,
-                    last_price=last_price,
-                    latest_turnover=latest_turnover,
-                    latest_flags=latest_flags,
+                    book=book,
                     cash=cash,
                     trades=trades,
                 )
@@ -191,12 +198,7 @@ class PortfolioBacktestEngine:
                     if len(recent_trade_pnls) > max_pnl_keep:
                         recent_trade_pnls = recent_trade_pnls[-max_pnl_keep:]
 
-            exposure, industry_exposure, theme_exposure = self._exposure(
-                holdings=holdings,
-                last_price=last_price,
-                industry_map=req.industry_map,
-                theme_map=req.theme_map,
-            )
+            exposure, industry_exposure, theme_exposure = self._exposure(book)
             equity = cash + exposure
             if equity <= 0:
                 continue
@@ -229,18 +231,9 @@ class PortfolioBacktestEngine:
             risk_blocked_days=risk_blocked_days,
             risk_warning_days=risk_warning_days,
         )
-        _, industry_exposure, theme_exposure = self._exposure(
-            holdings=holdings,
-            last_price=last_price,
-            industry_map=req.industry_map,
-            theme_map=req.theme_map,
-        )
+        _, industry_exposure, theme_exposure = self._exposure(book)
         final_equity = equity_curve[-1].equity if equity_curve else req.initial_cash
-        final_weights = self._final_weights(
-            holdings=holdings,
-            last_price=last_price,
-            equity=max(1.0, float(final_equity)),
-        )
+        final_weights = self._final_weights(book=book, equity=max(1.0, float(final_equity)))
         return PortfolioBacktestResult(
             strategy_name=req.strategy_name,
             symbols=list(req.symbols),
@@ -254,39 +247,13 @@ class PortfolioBacktestEngine:
             theme_exposure=theme_exposure,
         )
 
-    @staticmethod
-    def _normalize_bars(bars_by_symbol: dict[str, pd.DataFrame]) -> dict[str, dict[date, dict[str, object]]]:
-        out: dict[str, dict[date, dict[str, object]]] = {}
-        for symbol, frame in bars_by_symbol.items():
-            if frame is None or frame.empty:
-                out[symbol] = {}
-                continue
-            tmp = frame.sort_values("trade_date").copy()
-            tmp["trade_date"] = pd.to_datetime(tmp["trade_date"], errors="coerce").dt.date
-            tmp = tmp[tmp["trade_date"].notna()]
-            out[symbol] = {
-                d: row
-                for d, row in zip(tmp["trade_date"], tmp.to_dict("records"), strict=False)
-            }
-        return out
-
-    @staticmethod
-    def _build_calendar(normalized: dict[str, dict[date, dict[str, object]]]) -> list[date]:
-        dates: set[date] = set()
-        for values in normalized.values():
-            dates.update(values.keys())
-        return sorted(dates)
-
     def _build_targets(
         self,
         *,
         req: PortfolioBacktestRequest,
-        normalized: dict[str, dict[date, dict[str, object]]],
-        feature_cache: dict[str, pd.DataFrame],
-        latest_turnover: dict[str, float],
-        latest_flags: dict[str, dict[str, bool]],
+        panel: PortfolioPanel,
+        t: int,
         strategy: BaseStrategy,
-        trade_day: date,
         gross_target: float,
         params_by_symbol: dict[str, dict[str, float | int | str | bool]],
     ) -> dict[str, float]:
@@ -301,25 +268,15 @@ class PortfolioBacktestEngine:
                 return None
             return out
 
+        column = panel.index
         for symbol in req.symbols:
-            rows = normalized.get(symbol, {})
-            if not rows:
-                continue
-            history_rows = [row for d, row in rows.items() if d <= trade_day]
-            if not history_rows:
+            j = column[symbol]
+            k = int(panel.row[t, j])
+            if k < 0:
                 continue
-            history = pd.DataFrame(history_rows).sort_values("trade_date").reset_index(drop=True)
-            features = self.factor_engine.compute(history)
-            feature_cache[symbol] = features
-            latest = features.iloc[-1]
-            latest_turnover[symbol] = float(_opt_float(latest.get("turnover20")) or 0.0)
-            latest_flags[symbol] = {
-                "is_suspended": bool(latest.get("is_suspended", False)),
-                "at_limit_up": bool(latest.get("at_limit_up", False)),
-                "at_limit_down": bool(latest.get("at_limit_down", False)),
-                "is_one_word_limit_up": bool(latest.get("is_one_word_limit_up", False)),
-                "is_one_word_limit_down": bool(latest.get("is_one_word_limit_down", False)),
-            }
+            # Features were computed once over the full history; the first k + 1 rows are the
+            # history known on this day.
+            features = panel.features[j].iloc[: k + 1]
 
             strategy_signals = strategy.generate(
                 features,
@@ -330,6 +287,7 @@ class PortfolioBacktestEngine:
             signal = strategy_signals[-1]
             if signal.action != SignalAction.BUY:
                 continue
+            latest = features.iloc[-1]
             momentum = _opt_float(latest.get("momentum20"))
             volatility = _opt_float(latest.get("volatility20"))
             if momentum is None or volatility is None:
@@ -337,7 +295,7 @@ class PortfolioBacktestEngine:
             fundamental = float(latest.get("fundamental_score", 0.5) or 0.5)
             expected = 0.65 * float(momentum) + 0.35 * (fundamental - 0.5)
             volatility = max(0.001, float(volatility))
-            liquidity = min(1.0, latest_turnover[symbol] / 40_000_000.0)
+            liquidity = min(1.0, float(panel.turnover20[t, j]) / 40_000_000.0)
             candidates.append(
                 OptimizeCandidate(
                     symbol=symbol,
@@ -388,42 +346,39 @@ class PortfolioBacktestEngine:
         self,
         *,
         req: PortfolioBacktestRequest,
-        trade_day: date,
+        panel: PortfolioPanel,
+        t: int,
         targets: dict[str, float],
-        holdings: dict[str, _Holding],
-        last_price: dict[str, float],
-        latest_turnover: dict[str, float],
-        latest_flags: dict[str, dict[str, bool]],
+        book: _Book,
         cash: float,
         trades: list[PortfolioBacktestTrade],
     ) -> tuple[float, list[float]]:
-        equity = cash + sum(h.qty * max(0.0, float(last_price.get(s, 0.0))) for s, h in holdings.items())
+        trade_day = panel.dates[t]
+        equity = cash + book.market_value()
         if equity <= 0:
             return cash, []
         realized_trade_pnls: list[float] = []
-        current_weights = {
-            symbol: (
-                (holdings[symbol].qty * max(0.0, float(last_price.get(symbol, 0.0))) / equity)
-                if equity > 0
-                else 0.0
-            )
-            for symbol in holdings
-        }
-        universe = sorted(set(list(current_weights.keys()) + list(targets.keys())))
-        for symbol in universe:
-            price = max(0.0, float(last_price.get(symbol, 0.0)))
-            if price <= 0:
-                continue
-            target_weight = float(targets.get(symbol, 0.0))
-            current_weight = float(current_weights.get(symbol, 0.0))
-            delta_weight = target_weight - current_weight
-            delta_value = equity * delta_weight
-            desired_qty = int(abs(delta_value) / price / req.lot_size) * req.lot_size
-            if desired_qty <= 0:
-                continue
+
+        # Whole-book order sizing: weight gap -> value gap -> lot-rounded share count.
+        column = panel.index
+        target_weights = np.zeros(len(book.symbols))
+        for symbol, weight in targets.items():
+            target_weights[column[symbol]] = float(weight)
+        prices = book.last_price
+        delta_weights = target_weights - book.qty * prices / equity
+        priced = prices > 0
+        desired = np.zeros(len(book.symbols), dtype=np.int64)
+        desired[priced] = (np.abs(equity * delta_weights[priced]) / prices[priced] / req.lot_size).astype(np.int64)
+        desired *= req.lot_size
+
+        # Orders execute one by one in symbol order: each buy is capped by the cash left.
+        for j in sorted(np.flatnonzero(desired > 0), key=lambda x: book.symbols[x]):
+            symbol = book.symbols[j]
+            price = float(prices[j])
+            desired_qty = int(desired[j])
+            delta_weight = float(delta_weights[j])
             side = SignalAction.BUY if delta_weight > 0 else SignalAction.SELL
-            turnover = float(latest_turnover.get(symbol, 0.0))
-            flags = latest_flags.get(symbol, {})
+            turnover = float(panel.turnover20[t, j])
             order_notional = desired_qty * price
             if req.enable_realistic_cost_model:
                 slip_rate = tiered_slippage_rate(
@@ -439,11 +394,11 @@ class PortfolioBacktestEngine:
                 )
                 fill_prob = estimate_fill_probability(
                     side=side,
-                    is_suspended=bool(flags.get("is_suspended", False)),
-                    at_limit_up=bool(flags.get("at_limit_up", False)),
-                    at_limit_down=bool(flags.get("at_limit_down", False)),
-                    is_one_word_limit_up=bool(flags.get("is_one_word_limit_up", False)),
-                    is_one_word_limit_down=bool(flags.get("is_one_word_limit_down", False)),
+                    is_suspended=panel.flag("is_suspended", t, j),
+                    at_limit_up=panel.flag("at_limit_up", t, j),
+                    at_limit_down=panel.flag("at_limit_down", t, j),
+                    is_one_word_limit_up=panel.flag("is_one_word_limit_up", t, j),
+                    is_one_word_limit_down=panel.flag("is_one_word_limit_down", t, j),
                     avg_turnover_20d=turnover,
                     order_notional=order_notional,
                     probability_floor=req.fill_probability_floor,
@@ -489,12 +444,13 @@ class PortfolioBacktestEngine:
                 )
                 total = gross + fee
                 cash -= total
-                holding = holdings[symbol]
-                old_qty = holding.qty
-                old_cost = holding.avg_cost
-                holding.qty += qty
-                if holding.qty > 0:
-                    holding.avg_cost = ((old_qty * old_cost) + total) / holding.qty
+                old_qty = int(book.qty[j])
+                old_cost = float(book.avg_cost[j])
+                new_qty = old_qty + qty
+                book.qty[j] = new_qty
+                book.locked[j] += qty
+                if new_qty > 0:
+                    book.avg_cost[j] = ((old_qty * old_cost) + total) / new_qty
                 trades.append(
                     PortfolioBacktestTrade(
                         date=trade_day,
@@ -509,11 +465,10 @@ class PortfolioBacktestEngine:
                     )
                 )
             else:
-                holding = holdings[symbol]
-                available = min(holding.qty, qty)
+                available = min(int(book.qty[j] - book.locked[j]), qty)
                 if available <= 0:
                     continue
-                avg_cost = float(holding.avg_cost)
+                avg_cost = float(book.avg_cost[j])
                 trade_price = price * (1.0 - slip_rate - impact_rate)
                 gross = available * trade_price
                 fee = calc_side_fee(
@@ -527,10 +482,10 @@ class PortfolioBacktestEngine:
                 net = gross - fee
                 cash += net
                 realized_trade_pnls.append(float(net - available * avg_cost))
-                holding.qty -= available
-                if holding.qty <= 0:
-                    holding.qty = 0
-                    holding.avg_cost = 0.0
+                book.qty[j] -= available
+                if book.qty[j] <= 0:
+                    book.qty[j] = 0
+                    book.avg_cost[j] = 0.0
                 trades.append(
                     PortfolioBacktestTrade(
                         date=trade_day,
@@ -547,24 +502,17 @@ class PortfolioBacktestEngine:
         return cash, realized_trade_pnls
 
     @staticmethod
-    def _exposure(
-        *,
-        holdings: dict[str, _Holding],
-        last_price: dict[str, float],
-        industry_map: dict[str, str],
-        theme_map: dict[str, str],
-    ) -> tuple[float, dict[str, float], dict[str, float]]:
+    def _exposure(book: _Book) -> tuple[float, dict[str, float], dict[str, float]]:
         gross = 0.0
         industry_raw: dict[str, float] = {}
         theme_raw: dict[str, float] = {}
-        for symbol, holding in holdings.items():
-            px = max(0.0, float(last_price.get(symbol, 0.0)))
-            value = px * max(0, int(holding.qty))
+        for j in book.held():
+            value = float(book.last_price[j]) * int(book.qty[j])
             if value <= 0:
                 continue
             gross += value
-            industry = industry_map.get(symbol, "UNKNOWN")
-            theme = theme_map.get(symbol, "UNKNOWN")
+            industry = book.industries[j]
+            theme = book.themes[j]
             industry_raw[industry] = industry_raw.get(industry, 0.0) + value
             theme_raw[theme] = theme_raw.get(theme, 0.0) + value
         if gross <= 0:
@@ -574,15 +522,15 @@ class PortfolioBacktestEngine:
         return gross, industry, theme
 
     @staticmethod
-    def _final_weights(*, holdings: dict[str, _Holding], last_price: dict[str, float], equity: float) -> dict[str, float]:
+    def _final_weights(*, book: _Book, equity: float) -> dict[str, float]:
         if equity <= 0:
             return {}
         out: dict[str, float] = {}
-        for symbol, holding in holdings.items():
-            value = holding.qty * max(0.0, float(last_price.get(symbol, 0.0)))
+        for j in book.held():
+            value = int(book.qty[j]) * float(book.last_price[j])
             if value <= 0:
                 continue
-            out[symbol] = round(value / equity, 6)
+            out[book.symbols[j]] = round(value / equity, 6)
         return out
 
     @staticmethod
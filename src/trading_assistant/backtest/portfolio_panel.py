@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from trading_assistant.factors.engine import FactorEngine
+
+_FLAG_COLUMNS = (
+    "is_suspended",
+    "at_limit_up",
+    "at_limit_down",
+    "is_one_word_limit_up",
+    "is_one_word_limit_down",
+)
+
+
+@dataclass
+class PortfolioPanel:
+    """Dense date x symbol view of the bars a portfolio backtest reads.
+
+    Rows follow the union trading calendar of every supplied frame, columns follow the
+    request's (deduplicated) symbol order. ``row[t, j]`` is the latest feature row of symbol
+    ``j`` dated on or before ``dates[t]`` (-1 before its first bar), so "latest known value"
+    lookups are plain array indexing. Features are computed once per symbol over the whole
+    history: the factor engine only uses trailing windows, so feature row ``k`` is the same
+    as recomputing on the first ``k + 1`` bars.
+    """
+
+    dates: list[date]
+    symbols: list[str]
+    close: np.ndarray
+    row: np.ndarray
+    features: list[pd.DataFrame]
+    turnover20: np.ndarray
+    flags: dict[str, np.ndarray]
+
+    @property
+    def index(self) -> dict[str, int]:
+        return {symbol: j for j, symbol in enumerate(self.symbols)}
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        bars_by_symbol: dict[str, pd.DataFrame],
+        symbols: list[str],
+        factor_engine: FactorEngine,
+    ) -> PortfolioPanel:
+        normalized = {symbol: _normalize(frame) for symbol, frame in bars_by_symbol.items()}
+        calendar = sorted({d for frame in normalized.values() for d in frame["trade_date"]})
+        day_ordinals = np.array([d.toordinal() for d in calendar], dtype=np.int64)
+
+        n_days, n_symbols = len(calendar), len(symbols)
+        close = np.full((n_days, n_symbols), np.nan)
+        row = np.full((n_days, n_symbols), -1, dtype=np.int64)
+        turnover20 = np.zeros((n_days, n_symbols))
+        flags = {name: np.zeros((n_days, n_symbols), dtype=bool) for name in _FLAG_COLUMNS}
+        features: list[pd.DataFrame] = []
+
+        for j, symbol in enumerate(symbols):
+            frame = normalized.get(symbol)
+            if frame is None or frame.empty:
+                features.append(pd.DataFrame())
+                continue
+            ordinals = np.array([d.toordinal() for d in frame["trade_date"]], dtype=np.int64)
+            at = np.searchsorted(day_ordinals, ordinals)
+            if "close" in frame.columns:
+                close[at, j] = pd.to_numeric(frame["close"], errors="coerce").to_numpy(dtype=float)
+
+            # copy() consolidates the feature blocks, which keeps the per-rebalance slices cheap.
+            symbol_features = factor_engine.compute(frame).reset_index(drop=True).copy()
+            features.append(symbol_features)
+            latest = np.searchsorted(ordinals, day_ordinals, side="right") - 1
+            row[:, j] = latest
+            known = latest >= 0
+            turnover = _turnover_values(symbol_features)
+            turnover20[known, j] = turnover[latest[known]]
+            for name in _FLAG_COLUMNS:
+                if name in symbol_features.columns:
+                    values = np.fromiter((bool(x) for x in symbol_features[name].to_numpy(dtype=object)), dtype=bool)
+                    flags[name][known, j] = values[latest[known]]
+
+        return cls(
+            dates=calendar,
+            symbols=list(symbols),
+            close=close,
+            row=row,
+            features=features,
+            turnover20=turnover20,
+            flags=flags,
+        )
+
+    def flag(self, name: str, t: int, j: int) -> bool:
+        return bool(self.flags[name][t, j])
+
+
+def _normalize(frame: pd.DataFrame | None) -> pd.DataFrame:
+    """Sorted bars with ``date`` trade dates; a repeated date keeps the row sorted last."""
+    if frame is None or frame.empty:
+        return pd.DataFrame({"trade_date": []})
+    tmp = frame.sort_values("trade_date").copy()
+    tmp["trade_date"] = pd.to_datetime(tmp["trade_date"], errors="coerce").dt.date
+    tmp = tmp[tmp["trade_date"].notna()]
+    tmp = tmp.drop_duplicates(subset="trade_date", keep="last")
+    # Same dtypes a frame rebuilt from row dicts would get (e.g. None-padded floats -> NaN).
+    return tmp.reset_index(drop=True).infer_objects()
+
+
+def _turnover_values(features: pd.DataFrame) -> np.ndarray:
+    if "turnover20" not in features.columns:
+        return np.zeros(len(features))
+    values = pd.to_numeric(features["turnover20"], errors="coerce").to_numpy(dtype=float)
+    return np.where(np.isnan(values), 0.0, values)
@@ -4,6 +4,7 @@ from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone
 import logging
 import multiprocessing as mp
+import tempfile
 from uuid import uuid4
 
 import pandas as pd
@@ -21,6 +22,7 @@ from trading_assistant.core.models import (
     StrategyChallengeRunStatus,
     StrategyChallengeStrategyResult,
 )
+from trading_assistant.data.bar_store import MemoryMappedBarStore
 from trading_assistant.data.composite_provider import CompositeDataProvider
 from trading_assistant.fundamentals.service import FundamentalService
 from trading_assistant.governance.event_service import EventService
@@ -29,12 +31,28 @@ from trading_assistant.strategy.registry import StrategyRegistry
 logger = logging.getLogger(__name__)
 
 
-def _run_single_strategy_subprocess(req_payload: dict[str, object], strategy_name: str) -> dict[str, object]:
-    from trading_assistant.core.container import get_strategy_challenge_service
+def _run_single_strategy_subprocess(
+    req_payload: dict[str, object],
+    strategy_name: str,
+    bar_store_dir: str | None = None,
+) -> dict[str, object]:
+    from trading_assistant.core.container import get_sqlite_settings, get_strategy_challenge_service
     from trading_assistant.core.models import StrategyChallengeRequest
 
+    # Spawned workers do not import the app, so apply the SQLite settings here.
+    get_sqlite_settings()
     service = get_strategy_challenge_service()
     req = StrategyChallengeRequest.model_validate(req_payload)
+    if bar_store_dir:
+        # Bars were loaded once by the parent; map them instead of refetching per worker.
+        store = MemoryMappedBarStore.open(bar_store_dir)
+        shared = (store.source(req.symbol), store.frame(req.symbol))
+        item, evaluated_count = service._evaluate_single_strategy(req=req, strategy_name=strategy_name, shared=shared)
+        return {
+            "strategy_name": strategy_name,
+            "evaluated_count": int(evaluated_count),
+            "result": item.model_dump(mode="json"),
+        }
     single_req = req.model_copy(update={"strategy_names": [strategy_name]})
     single_result = service.run(single_req)
     selected = next((item for item in single_result.results if item.strategy_name == strategy_name), None)
@@ -174,8 +192,13 @@ class StrategyChallengeService:
     ) -> tuple[list[StrategyChallengeStrategyResult], int]:
         results: list[StrategyChallengeStrategyResult] = []
         total_evaluated = 0
+        shared = self._load_shared_bars(req)
         for strategy_name in strategy_names:
-            item, evaluated_count = self._evaluate_single_strategy(req=req, strategy_name=strategy_name)
+            item, evaluated_count = self._evaluate_single_strategy(
+                req=req,
+                strategy_name=strategy_name,
+                shared=shared,
+            )
             results.append(item)
             total_evaluated += int(evaluated_count)
         return results, total_evaluated
@@ -193,11 +216,23 @@ class StrategyChallengeService:
         payload = req.model_dump(mode="json")
         results: list[StrategyChallengeStrategyResult] = []
         total_evaluated = 0
+        shared = self._load_shared_bars(req)
         try:
             mp_ctx = mp.get_context("spawn")
-            with ProcessPoolExecutor(max_workers=worker_count, mp_context=mp_ctx) as executor:
+            with tempfile.TemporaryDirectory(prefix="bar-store-") as store_dir, ProcessPoolExecutor(
+                max_workers=worker_count, mp_context=mp_ctx
+            ) as executor:
+                bar_store_dir: str | None = None
+                if shared is not None:
+                    provider_name, bars = shared
+                    try:
+                        MemoryMappedBarStore.build(store_dir, {req.symbol: bars}, sources={req.symbol: provider_name})
+                        bar_store_dir = store_dir
+                    except ValueError:
+                        # Unmappable columns: workers load their own bars as before.
+                        logger.warning("bar store build failed for %s; workers will load bars", req.symbol, exc_info=True)
                 future_map = {
-                    executor.submit(_run_single_strategy_subprocess, payload, strategy_name): strategy_name
+                    executor.submit(_run_single_strategy_subprocess, payload, strategy_name, bar_store_dir): strategy_name
                     for strategy_name in strategy_names
                 }
                 for future in as_completed(future_map):
@@ -231,10 +266,14 @@ class StrategyChallengeService:
         *,
         req: StrategyChallengeRequest,
         strategy_name: str,
+        shared: tuple[str, pd.DataFrame] | None = None,
     ) -> tuple[StrategyChallengeStrategyResult, int]:
         try:
             autotune_req = self._build_autotune_request(req=req, strategy_name=strategy_name)
-            autotune_result = self.autotune.run(autotune_req)
+            if shared is not None:
+                autotune_result = self.autotune.run(autotune_req, bars=shared[1], provider_name=shared[0])
+            else:
+                autotune_result = self.autotune.run(autotune_req)
             evaluated_count = int(autotune_result.evaluated_count)
 
             best = autotune_result.best
@@ -257,6 +296,7 @@ class StrategyChallengeService:
                 req=req,
                 strategy_name=strategy_name,
                 strategy_params=best.strategy_params,
+                shared=shared,
             )
             base_result = StrategyChallengeStrategyResult(
                 strategy_name=strategy_name,
@@ -385,16 +425,13 @@ class StrategyChallengeService:
         req: StrategyChallengeRequest,
         strategy_name: str,
         strategy_params: dict[str, float | int | str | bool],
+        shared: tuple[str, pd.DataFrame] | None = None,
     ) -> tuple[BacktestMetrics, str]:
         strategy = self.registry.get(strategy_name)
-        provider_name, bars = self.provider.get_daily_bars_with_source(req.symbol, req.start_date, req.end_date)
-        if bars.empty:
-            raise ValueError("No market data available for challenge full-window backtest.")
-
-        bars = bars.sort_values("trade_date").reset_index(drop=True).copy()
-        status = self._resolve_security_status(symbol=req.symbol, bars=bars)
-        bars["is_st"] = bool(status.get("is_st", False))
-        bars["is_suspended"] = bool(status.get("is_suspended", False))
+        if shared is not None:
+            provider_name, bars = shared[0], shared[1].copy(deep=False)
+        else:
+            provider_name, bars = self._load_bars(req)
 
         if (req.enable_event_enrichment or strategy_name == "event_driven") and self.event_service is not None:
             bars, _ = self.event_service.enrich_bars(
@@ -441,6 +478,25 @@ class StrategyChallengeService:
         result = self.backtest_engine.run(bars, run_req, strategy)
         return result.metrics, provider_name
 
+    def _load_bars(self, req: StrategyChallengeRequest) -> tuple[str, pd.DataFrame]:
+        provider_name, bars = self.provider.get_daily_bars_with_source(req.symbol, req.start_date, req.end_date)
+        if bars.empty:
+            raise ValueError("No market data available for challenge full-window backtest.")
+
+        bars = bars.sort_values("trade_date").reset_index(drop=True).copy()
+        status = self._resolve_security_status(symbol=req.symbol, bars=bars)
+        bars["is_st"] = bool(status.get("is_st", False))
+        bars["is_suspended"] = bool(status.get("is_suspended", False))
+        return provider_name, bars
+
+    def _load_shared_bars(self, req: StrategyChallengeRequest) -> tuple[str, pd.DataFrame] | None:
+        """Bars shared by every strategy of one challenge; ``None`` lets each strategy fetch (and fail) itself."""
+        try:
+            return self._load_bars(req)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Challenge shared bar load failed for %s; fetching per strategy: %s", req.symbol, exc)
+            return None
+
     def _resolve_security_status(self, *, symbol: str, bars: pd.DataFrame) -> dict[str, bool]:
         fallback = {
             "is_st": bool(bars.iloc[-1].get("is_st", False)) if (bars is not None and not bars.empty) else False,
@@ -4,7 +4,11 @@ import argparse
 import json
 from datetime import date, timedelta
 
-from trading_assistant.core.container import get_applied_statistics_service, get_pipeline_runner
+from trading_assistant.core.container import (
+    get_applied_statistics_service,
+    get_pipeline_runner,
+    get_sqlite_settings,
+)
 from trading_assistant.core.models import PipelineRunRequest
 
 
@@ -36,6 +40,7 @@ def build_parser() -> argparse.ArgumentParser:
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
+    get_sqlite_settings()
     if args.command == "daily-run":
         symbols = [x.strip() for x in args.symbols.split(",") if x.strip()]
         req = PipelineRunRequest(
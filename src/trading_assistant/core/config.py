@@ -56,6 +56,10 @@ class Settings(BaseSettings):
     tushare_token: str | None = Field(default=None)
     market_data_cache_enabled: bool = Field(default=True)
     market_data_cache_db_path: str = Field(default="data/market_cache.db")
+    market_data_single_flight_wait_sec: float = Field(default=30.0)
+    market_data_rate_limits: str = Field(default="tushare=400,akshare=120")
+    market_data_max_concurrency: int = Field(default=4)
+    market_data_async_workers: int = Field(default=16)
 
     max_single_position: float = Field(default=0.35)
     max_drawdown: float = Field(default=0.18)
@@ -97,6 +101,12 @@ class Settings(BaseSettings):
     job_db_path: str = Field(default="data/job.db")
     alert_db_path: str = Field(default="data/alert.db")
     event_db_path: str = Field(default="data/event.db")
+    sqlite_pooled_connections: bool = Field(default=True)
+    sqlite_journal_mode: str = Field(default="WAL")
+    sqlite_synchronous: str = Field(default="NORMAL")
+    sqlite_busy_timeout_ms: int = Field(default=5000, ge=0)
+    sqlite_mmap_size_mb: int = Field(default=128, ge=0)
+    sqlite_cached_statements: int = Field(default=256, ge=0)
     enforce_data_license: bool = Field(default=False)
 
     alert_email_enabled: bool = Field(default=False)
@@ -111,6 +121,15 @@ class Settings(BaseSettings):
     alert_im_default_webhook: str | None = Field(default=None)
     alert_notify_timeout_seconds: int = Field(default=10)
     alert_runbook_base_url: str = Field(default="")
+    alert_outbox_enabled: bool = Field(default=True)
+    alert_outbox_workers_per_channel: int = Field(default=4, ge=1)
+    alert_outbox_channel_workers_json: str = Field(default="")
+    alert_outbox_max_attempts: int = Field(default=5, ge=1)
+    alert_outbox_backoff_seconds: float = Field(default=5.0, ge=0)
+    alert_outbox_backoff_max_seconds: float = Field(default=600.0, ge=0)
+    alert_outbox_batch_size: int = Field(default=200, ge=1)
+    alert_outbox_poll_seconds: float = Field(default=2.0, gt=0)
+    alert_outbox_coalesce: bool = Field(default=False)
     oncall_callback_signing_secret: str = Field(default="")
     oncall_callback_require_signature: bool = Field(default=False)
     oncall_callback_signature_ttl_seconds: int = Field(default=600)
@@ -123,6 +142,7 @@ class Settings(BaseSettings):
     ops_scheduler_timezone: str = Field(default="Asia/Shanghai")
     ops_scheduler_sla_log_cooldown_seconds: int = Field(default=1800)
     ops_scheduler_sync_alerts_from_audit: bool = Field(default=True)
+    ops_scheduler_catchup_minutes: int = Field(default=1440, ge=0)
     ops_job_sla_grace_minutes: int = Field(default=15)
     ops_job_running_timeout_minutes: int = Field(default=120)
     compliance_evidence_signing_secret: str = Field(default="")
@@ -167,6 +187,23 @@ class Settings(BaseSettings):
     def provider_priority_list(self) -> list[str]:
         return [item.strip().lower() for item in self.data_provider_priority.split(",") if item.strip()]
 
+    @property
+    def market_data_rate_limits_map(self) -> dict[str, float]:
+        """``"tushare=400,tushare.get_daily_bars=300"`` as calls-per-minute limits; bad items are skipped."""
+        out: dict[str, float] = {}
+        for item in self.market_data_rate_limits.split(","):
+            key, sep, value = item.partition("=")
+            key = key.strip().lower()
+            if not sep or not key:
+                continue
+            try:
+                limit = float(value)
+            except ValueError:
+                continue
+            if limit > 0:
+                out[key] = limit
+        return out
+
     @property
     def required_approval_roles_list(self) -> list[str]:
         return [item.strip().lower() for item in self.strategy_required_approval_roles.split(",") if item.strip()]
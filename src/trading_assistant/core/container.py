@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import json
 import logging
 import os
@@ -15,15 +16,19 @@ from trading_assistant.challenge.service import StrategyChallengeService
 from trading_assistant.alerts.service import AlertService
 from trading_assistant.alerts.store import AlertStore
 from trading_assistant.alerts.dispatcher import RealAlertDispatcher
+from trading_assistant.alerts.outbox import AlertOutboxDispatcher
 from trading_assistant.audit.service import AuditService
 from trading_assistant.audit.store import AuditStore
 from trading_assistant.backtest.engine import BacktestEngine
 from trading_assistant.backtest.portfolio_engine import PortfolioBacktestEngine
 from trading_assistant.core.config import Settings, get_settings
+from trading_assistant.core.sqlite import SQLiteSettings, configure_sqlite
 from trading_assistant.data.akshare_provider import AkshareProvider
 from trading_assistant.data.base import MarketDataProvider
 from trading_assistant.data.cache_store import LocalTimeseriesCache
 from trading_assistant.data.composite_provider import CompositeDataProvider
+from trading_assistant.data.rate_limit import ProviderScheduler
+from trading_assistant.data.single_flight import SingleFlight
 from trading_assistant.data.tushare_provider import TushareProvider
 from trading_assistant.factors.engine import FactorEngine
 from trading_assistant.fundamentals.service import FundamentalService
@@ -74,6 +79,23 @@ def _build_provider(name: str, settings: Settings) -> MarketDataProvider:
     raise ValueError(f"Unsupported provider: {name}")
 
 
+@lru_cache
+def get_sqlite_settings() -> SQLiteSettings:
+    # Entry points (app, CLI, subprocess workers) apply this once before opening any store;
+    # stores opened without it use the SQLiteSettings defaults, which match Settings defaults.
+    settings = get_settings()
+    sqlite_settings = SQLiteSettings(
+        pooled=settings.sqlite_pooled_connections,
+        journal_mode=settings.sqlite_journal_mode,
+        synchronous=settings.sqlite_synchronous,
+        busy_timeout_ms=settings.sqlite_busy_timeout_ms,
+        mmap_size_bytes=settings.sqlite_mmap_size_mb * 1024 * 1024,
+        cached_statements=settings.sqlite_cached_statements,
+    )
+    configure_sqlite(sqlite_settings)
+    return sqlite_settings
+
+
 @lru_cache
 def get_data_provider() -> CompositeDataProvider:
     settings = get_settings()
@@ -90,6 +112,21 @@ def get_data_provider() -> CompositeDataProvider:
         providers=providers,
         cache_store=cache_store,
         enable_cache=settings.market_data_cache_enabled,
+        single_flight=SingleFlight(wait_timeout_sec=settings.market_data_single_flight_wait_sec),
+        scheduler=ProviderScheduler(
+            rate_limits_per_min=settings.market_data_rate_limits_map,
+            max_concurrency=settings.market_data_max_concurrency,
+        ),
+    )
+
+
+@lru_cache
+def get_provider_executor() -> ThreadPoolExecutor:
+    # Dedicated pool for async handlers awaiting blocking provider SDK calls.
+    settings = get_settings()
+    return ThreadPoolExecutor(
+        max_workers=max(1, int(settings.market_data_async_workers)),
+        thread_name_prefix="provider-io",
     )
 
 
@@ -204,6 +241,10 @@ def get_audit_service() -> AuditService:
         try:
             if source.exists():
                 shutil.copy2(source, recovered)
+                # Under WAL, committed pages may still live only in the -wal sidecar.
+                source_wal = source.with_name(f"{source.name}-wal")
+                if source_wal.exists():
+                    shutil.copy2(source_wal, recovered.with_name(f"{recovered.name}-wal"))
             logger.warning(
                 "Audit DB open failed (%s). Fallback to recovered copy: %s -> %s",
                 exc,
@@ -457,6 +498,38 @@ def get_model_risk_service() -> ModelRiskService:
     )
 
 
+@lru_cache
+def get_alert_store() -> AlertStore:
+    settings = get_settings()
+    return AlertStore(settings.alert_db_path)
+
+
+@lru_cache
+def get_alert_outbox() -> AlertOutboxDispatcher:
+    settings = get_settings()
+    channel_workers: dict[str, int] = {}
+    raw_workers = (settings.alert_outbox_channel_workers_json or "").strip()
+    if raw_workers:
+        try:
+            parsed = json.loads(raw_workers)
+            if isinstance(parsed, dict):
+                channel_workers = {str(key): int(value) for key, value in parsed.items()}
+        except Exception:  # noqa: BLE001
+            channel_workers = {}
+    return AlertOutboxDispatcher(
+        store=get_alert_store(),
+        dispatcher=RealAlertDispatcher(settings=settings),
+        default_concurrency=settings.alert_outbox_workers_per_channel,
+        channel_concurrency=channel_workers,
+        max_attempts=settings.alert_outbox_max_attempts,
+        backoff_seconds=settings.alert_outbox_backoff_seconds,
+        backoff_max_seconds=settings.alert_outbox_backoff_max_seconds,
+        batch_size=settings.alert_outbox_batch_size,
+        coalesce=settings.alert_outbox_coalesce,
+        poll_seconds=settings.alert_outbox_poll_seconds,
+    )
+
+
 @lru_cache
 def get_alert_service() -> AlertService:
     settings = get_settings()
@@ -474,9 +547,10 @@ def get_alert_service() -> AlertService:
         except Exception:  # noqa: BLE001
             mapping_templates = {}
     return AlertService(
-        store=AlertStore(settings.alert_db_path),
+        store=get_alert_store(),
         audit=get_audit_service(),
         dispatcher=RealAlertDispatcher(settings=settings),
+        outbox=get_alert_outbox() if settings.alert_outbox_enabled else None,
         default_runbook_base_url=settings.alert_runbook_base_url,
         oncall_callback_signing_secret=settings.oncall_callback_signing_secret,
         oncall_callback_require_signature=settings.oncall_callback_require_signature,
@@ -502,6 +576,7 @@ def get_job_service() -> JobService:
         replay=get_replay_service(),
         scheduler_timezone=settings.ops_scheduler_timezone,
         running_timeout_minutes=settings.ops_job_running_timeout_minutes,
+        catchup_minutes=settings.ops_scheduler_catchup_minutes,
     )
 
 
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+from threading import Lock
+import weakref
+
+import httpx
+
+_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=16, keepalive_expiry=30.0)
+_TIMEOUT = httpx.Timeout(10.0)
+
+_lock = Lock()
+_sync_client: httpx.Client | None = None
+_async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+
+
+def get_http_client() -> httpx.Client:
+    """Process-wide keep-alive client for blocking callers (connectors, alert webhooks)."""
+    global _sync_client
+    with _lock:
+        if _sync_client is None or _sync_client.is_closed:
+            _sync_client = httpx.Client(limits=_LIMITS, timeout=_TIMEOUT, follow_redirects=True)
+        return _sync_client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Keep-alive client bound to the running event loop; AsyncClient pools cannot cross loops."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=_LIMITS, timeout=_TIMEOUT, follow_redirects=True)
+            _async_clients[loop] = client
+        return client
+
+
+async def aclose_http_clients() -> None:
+    global _sync_client
+    with _lock:
+        sync_client, _sync_client = _sync_client, None
+        async_client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if sync_client is not None:
+        sync_client.close()
+    if async_client is not None:
+        await async_client.aclose()
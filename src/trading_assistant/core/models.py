@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -713,6 +713,14 @@ class PortfolioRiskResult(BaseModel):
     es_value: float | None = None
 
 
+class PortfolioRiskBatchRequest(BaseModel):
+    requests: list[PortfolioRiskRequest] = Field(default_factory=list, min_length=1, max_length=5000)
+
+
+class PortfolioRiskBatchResult(BaseModel):
+    results: list[PortfolioRiskResult] = Field(default_factory=list)
+
+
 class AuditEventCreate(BaseModel):
     event_type: str
     action: str
@@ -785,6 +793,9 @@ class PipelineRunResult(BaseModel):
     total_warnings: int = 0
 
 
+ContentHashAlgorithm = Literal["sha256-csv-v1", "sha256-columnar-v2"]
+
+
 class DataSnapshotRegisterRequest(BaseModel):
     dataset_name: str
     symbol: str
@@ -794,6 +805,8 @@ class DataSnapshotRegisterRequest(BaseModel):
     row_count: int = Field(ge=0)
     schema_version: str = Field(default="v1")
     content_hash: str
+    # Client-supplied hashes predate the columnar hash, so an omitted id means the CSV one.
+    hash_algorithm: ContentHashAlgorithm = Field(default="sha256-csv-v1")
 
 
 class DataSnapshotRecord(BaseModel):
@@ -807,6 +820,7 @@ class DataSnapshotRecord(BaseModel):
     row_count: int
     schema_version: str
     content_hash: str
+    hash_algorithm: str = "sha256-csv-v1"
 
 
 class DataQualityRequest(BaseModel):
@@ -939,6 +953,25 @@ class StressTestResult(BaseModel):
     results: list[StressScenarioResult] = Field(default_factory=list)
 
 
+class StressTestBatchRequest(BaseModel):
+    portfolios: dict[str, list[OptimizedWeight]] = Field(default_factory=dict)
+    scenarios: list[StressScenario] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def _validate_payload(self) -> "StressTestBatchRequest":
+        if not self.portfolios:
+            raise ValueError("portfolios must not be empty")
+        if any(not weights for weights in self.portfolios.values()):
+            raise ValueError("every portfolio must have weights")
+        if not self.scenarios:
+            raise ValueError("scenarios must not be empty")
+        return self
+
+
+class StressTestBatchResult(BaseModel):
+    results: dict[str, StressTestResult] = Field(default_factory=dict)
+
+
 class SignalDecisionRecord(BaseModel):
     signal_id: str
     symbol: str
@@ -1318,6 +1351,31 @@ class ServiceMetricsSummary(BaseModel):
     warning_events: int = 0
 
 
+class ProviderCoalescingStats(BaseModel):
+    calls: int = 0
+    executed: int = 0
+    coalesced: int = 0
+    wait_timeouts: int = 0
+    errors: int = 0
+    inflight: int = 0
+
+
+class ProviderEndpointSchedulerStats(BaseModel):
+    provider: str
+    endpoint: str
+    rate_limit_per_min: float | None = None
+    provider_rate_limit_per_min: float | None = None
+    concurrency_limit: float
+    inflight: int = 0
+    waiting_interactive: int = 0
+    waiting_bulk: int = 0
+    calls: int = 0
+    throttle_events: int = 0
+    errors: int = 0
+    queue_wait_ms_total: float = 0.0
+    queue_wait_ms_max: float = 0.0
+
+
 class ModelDriftRequest(BaseModel):
     strategy_name: str
     symbol: str | None = None
@@ -1508,7 +1566,7 @@ class ComplianceEvidenceExportRequest(BaseModel):
     connector_name: str | None = None
     source_name: str | None = None
     audit_event_type: str | None = None
-    audit_event_limit: int = Field(default=3000, ge=1, le=20000)
+    audit_event_limit: int = Field(default=3000, ge=1, le=5_000_000)
     audit_verify_limit: int = Field(default=10000, ge=1, le=100000)
     strategy_version_limit: int = Field(default=200, ge=1, le=2000)
     connector_run_limit: int = Field(default=500, ge=1, le=5000)
@@ -2935,6 +2993,7 @@ class JobScheduleTickResult(BaseModel):
     matched_jobs: list[int] = Field(default_factory=list)
     triggered_runs: list[JobRunRecord] = Field(default_factory=list)
     skipped_jobs: list[int] = Field(default_factory=list)
+    caught_up_jobs: list[int] = Field(default_factory=list)
     errors: list[str] = Field(default_factory=list)
 
 
@@ -3073,6 +3132,32 @@ class AlertDeliveryRecord(BaseModel):
     payload: dict[str, Any] = Field(default_factory=dict)
 
 
+class AlertOutboxDrainResult(BaseModel):
+    claimed: int = 0
+    messages_sent: int = 0
+    delivered: int = 0
+    retried: int = 0
+    failed: int = 0
+    coalesced: int = 0
+
+
+class AlertOutboxChannelStats(BaseModel):
+    channel: str
+    samples: int = 0
+    latency_p50_ms: float | None = None
+    latency_p90_ms: float | None = None
+    latency_p99_ms: float | None = None
+    latency_max_ms: float | None = None
+
+
+class AlertOutboxStats(BaseModel):
+    generated_at: datetime
+    pending: int = 0
+    sent: int = 0
+    failed: int = 0
+    channels: list[AlertOutboxChannelStats] = Field(default_factory=list)
+
+
 class OncallCallbackRequest(BaseModel):
     provider: str = "generic_oncall"
     incident_id: str | None = None
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+import sqlite3
+import threading
+import weakref
+
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+@dataclass(frozen=True)
+class SQLiteSettings:
+    """Connection settings shared by every SQLite-backed store."""
+
+    pooled: bool = True
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = 5000
+    mmap_size_bytes: int = 128 * 1024 * 1024
+    cached_statements: int = 256
+
+    def __post_init__(self) -> None:
+        if self.journal_mode.upper() not in _JOURNAL_MODES:
+            raise ValueError(f"Unsupported SQLite journal_mode: {self.journal_mode}")
+        if self.synchronous.upper() not in _SYNCHRONOUS_MODES:
+            raise ValueError(f"Unsupported SQLite synchronous mode: {self.synchronous}")
+
+
+_settings = SQLiteSettings()
+
+
+def configure_sqlite(settings: SQLiteSettings) -> None:
+    """Set the process-wide settings; connections opened afterwards use them."""
+    global _settings
+    _settings = settings
+
+
+def sqlite_settings() -> SQLiteSettings:
+    return _settings
+
+
+class SQLiteConnectionPool:
+    """Per-thread connections to one database file.
+
+    Each thread keeps one long-lived connection, so the statement cache and mmap survive
+    across calls and the WAL/pragmas are applied once per connection rather than per query.
+    Stores keep using ``with self._conn() as conn:``, which commits or rolls back but does
+    not close. With ``pooled=False`` every call gets a fresh connection (legacy behaviour).
+    """
+
+    def __init__(self, db_path: str | Path) -> None:
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Keyed weakly by thread so connections of finished threads are not kept alive here.
+        self._connections: weakref.WeakKeyDictionary[threading.Thread, sqlite3.Connection] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def connection(self) -> sqlite3.Connection:
+        settings = _settings
+        if not settings.pooled:
+            return self._open(settings)
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "settings", None) is not settings:
+            conn = self._open(settings)
+            self._local.conn = conn
+            self._local.settings = settings
+            with self._lock:
+                self._connections[threading.current_thread()] = conn
+        return conn
+
+    def close_all(self) -> None:
+        """Close every pooled connection, including ones owned by other threads.
+
+        Meant for shutdown and test resets: callers must make sure no thread is mid-query.
+        Every thread reopens lazily on its next ``connection()`` call.
+        """
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
+
+    def _open(self, settings: SQLiteSettings) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=max(0.0, settings.busy_timeout_ms / 1000.0),
+            cached_statements=max(0, int(settings.cached_statements)),
+            # Each connection is used by one thread only; this lets close_all close it from another.
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        if settings.pooled:
+            conn.execute(f"PRAGMA journal_mode={settings.journal_mode.upper()}")
+            conn.execute(f"PRAGMA synchronous={settings.synchronous.upper()}")
+            conn.execute(f"PRAGMA busy_timeout={int(settings.busy_timeout_ms)}")
+            conn.execute(f"PRAGMA mmap_size={int(settings.mmap_size_bytes)}")
+        return conn
@@ -4,6 +4,8 @@ from datetime import date, datetime, timedelta
 import logging
 import math
 import re
+from threading import Lock
+import time
 from typing import Any
 
 import pandas as pd
@@ -14,6 +16,81 @@ from trading_assistant.data.utils import date_to_yyyymmdd, normalize_akshare_dai
 logger = logging.getLogger(__name__)
 
 
+class _MarketTable:
+    """A downloaded market-wide akshare table with a symbol -> row-position index.
+
+    Row dates and keyword-matched numerics are parsed once per table and shared by every
+    symbol looked up against it, instead of re-parsing the matched rows per symbol.
+    """
+
+    def __init__(self, frame: pd.DataFrame, *, fetched_at: float) -> None:
+        self.frame = frame
+        self.fetched_at = fetched_at
+        self._lock = Lock()
+        self._row_dates: list[date | None] | None = None
+        self._numerics: dict[tuple[str, ...], list[float | None]] = {}
+        self._index: dict[str, list[int]] | None = None
+        sym_col = AkshareProvider._find_symbol_column(frame)
+        if sym_col is not None:
+            index: dict[str, list[int]] = {}
+            for pos, value in enumerate(frame[sym_col].tolist()):
+                index.setdefault(str(value).strip().upper(), []).append(pos)
+            self._index = index
+
+    def positions_for(self, symbol: str) -> list[int]:
+        """Row positions matching ``symbol`` with the same rules as ``_filter_symbol_rows``."""
+        if self.frame.empty:
+            return []
+        if self._index is None:
+            return list(range(len(self.frame)))
+        key = str(symbol).strip().upper()
+        exact = self._index.get(key)
+        if exact:
+            return exact
+        # Some sources include exchange suffix, e.g. 000001.SZ.
+        return sorted(pos for value, rows in self._index.items() if value.startswith(key) for pos in rows)
+
+    def row_dates(self) -> list[date | None]:
+        with self._lock:
+            if self._row_dates is None:
+                candidates = [
+                    col
+                    for col in self.frame.columns
+                    if any(token in str(col).strip().lower() for token in ("date", "时间", "日期", "公告"))
+                ]
+                parsed = [[AkshareProvider._parse_date(v) for v in self.frame[col].tolist()] for col in candidates]
+                self._row_dates = [
+                    next((values[pos] for values in parsed if values[pos] is not None), None)
+                    for pos in range(len(self.frame))
+                ]
+            return self._row_dates
+
+    def row_numerics(self, keywords: tuple[str, ...]) -> list[float | None]:
+        with self._lock:
+            cached = self._numerics.get(keywords)
+            if cached is not None:
+                return cached
+            scored: list[tuple[int, int, Any]] = []
+            for col_idx, col in enumerate(self.frame.columns):
+                key = str(col).strip().lower()
+                score = 0
+                for idx, kw in enumerate(keywords):
+                    kw_key = str(kw).strip().lower()
+                    if kw_key and kw_key in key:
+                        score += (len(keywords) - idx) * 4
+                if score > 0:
+                    scored.append((-score, col_idx, col))
+            # Highest score wins, earliest column on ties: same choice as _extract_row_numeric.
+            scored.sort(key=lambda item: (item[0], item[1]))
+            parsed = [[AkshareProvider._parse_float(v) for v in self.frame[col].tolist()] for _, _, col in scored]
+            values = [
+                next((float(vals[pos]) for vals in parsed if vals[pos] is not None), None)
+                for pos in range(len(self.frame))
+            ]
+            self._numerics[keywords] = values
+            return values
+
+
 class AkshareProvider(MarketDataProvider):
     name = "akshare"
 
@@ -26,10 +103,18 @@ class AkshareProvider(MarketDataProvider):
         "1h": "60",
     }
 
+    # Market-wide announcement tables change intraday, so cached copies expire.
+    _MARKET_TABLE_TTL_SEC = 900.0
+    _FORECAST_KEYWORDS_MIN = ("下限", "最小", "p_change_min", "变动")
+    _FORECAST_KEYWORDS_MAX = ("上限", "最大", "p_change_max", "变动")
+    _EXPRESS_KEYWORDS = ("净利润同比", "yoy_net_profit", "增长", "同比")
+
     def __init__(self) -> None:
         import akshare as ak
 
         self._ak = ak
+        self._market_tables: dict[tuple[str, str], _MarketTable] = {}
+        self._market_tables_lock = Lock()
 
     def get_daily_bars(self, symbol: str, start_date: date, end_date: date) -> pd.DataFrame:
         raw = self._ak.stock_zh_a_hist(
@@ -145,7 +230,53 @@ class AkshareProvider(MarketDataProvider):
         *,
         lookback_days: int = 120,
     ) -> dict[str, object]:
+        return self.get_corporate_event_snapshots_many([symbol], as_of, lookback_days=lookback_days)[symbol]
+
+    def get_corporate_event_snapshots_many(
+        self,
+        symbols: list[str],
+        as_of: date,
+        *,
+        lookback_days: int = 120,
+    ) -> dict[str, dict[str, object]]:
         report_dates = self._build_recent_quarter_dates(as_of=as_of, limit=max(2, min(8, lookback_days // 45 + 2)))
+        report_tables: list[tuple[date, _MarketTable | None, _MarketTable | None]] = []
+        for rep in report_dates:
+            rep_text = rep.strftime("%Y%m%d")
+            report_tables.append(
+                (
+                    rep,
+                    self._market_table("stock_yjyg_em", rep_text, date=rep_text),
+                    self._market_table("stock_yjkb_em", rep_text, date=rep_text),
+                )
+            )
+        notice_tables: list[_MarketTable] = []
+        for lag in range(0, min(6, max(2, lookback_days // 20))):
+            day_text = (as_of - timedelta(days=lag)).strftime("%Y%m%d")
+            notice = self._market_table("stock_notice_report", day_text, symbol="全部", date=day_text)
+            if notice is not None:
+                notice_tables.append(notice)
+
+        out: dict[str, dict[str, object]] = {}
+        for symbol in symbols:
+            out[symbol] = self._score_corporate_events(
+                symbol=symbol,
+                as_of=as_of,
+                lookback_days=lookback_days,
+                report_tables=report_tables,
+                notice_tables=notice_tables,
+            )
+        return out
+
+    def _score_corporate_events(
+        self,
+        *,
+        symbol: str,
+        as_of: date,
+        lookback_days: int,
+        report_tables: list[tuple[date, _MarketTable | None, _MarketTable | None]],
+        notice_tables: list[_MarketTable],
+    ) -> dict[str, object]:
         pos_score = 0.0
         neg_score = 0.0
         event_count = 0
@@ -154,12 +285,13 @@ class AkshareProvider(MarketDataProvider):
         latest_forecast_mid: float | None = None
         latest_express_growth: float | None = None
 
-        for rep in report_dates:
-            rep_text = rep.strftime("%Y%m%d")
-            yjyg = self._safe_api_call("stock_yjyg_em", date=rep_text)
-            if yjyg is not None and not yjyg.empty:
-                for _, row in self._filter_symbol_rows(yjyg, symbol=symbol).iterrows():
-                    pub = self._extract_row_date(row)
+        for rep, yjyg, yjkb in report_tables:
+            if yjyg is not None:
+                row_dates = yjyg.row_dates()
+                p_mins = yjyg.row_numerics(self._FORECAST_KEYWORDS_MIN)
+                p_maxs = yjyg.row_numerics(self._FORECAST_KEYWORDS_MAX)
+                for pos in yjyg.positions_for(symbol):
+                    pub = row_dates[pos]
                     if pub is not None and pub > as_of:
                         continue
                     event_count += 1
@@ -168,8 +300,8 @@ class AkshareProvider(MarketDataProvider):
                     if rep <= as_of and (latest_report_date is None or rep > latest_report_date):
                         latest_report_date = rep
 
-                    p_min = self._extract_row_numeric(row, ("下限", "最小", "p_change_min", "变动"))
-                    p_max = self._extract_row_numeric(row, ("上限", "最大", "p_change_max", "变动"))
+                    p_min = p_mins[pos]
+                    p_max = p_maxs[pos]
                     if p_min is not None and p_max is not None:
                         mid = (p_min + p_max) / 2.0
                     else:
@@ -184,10 +316,11 @@ class AkshareProvider(MarketDataProvider):
                     elif mid <= -10.0:
                         neg_score += min(1.0, abs(mid + 8.0) / 45.0) * decay
 
-            yjkb = self._safe_api_call("stock_yjkb_em", date=rep_text)
-            if yjkb is not None and not yjkb.empty:
-                for _, row in self._filter_symbol_rows(yjkb, symbol=symbol).iterrows():
-                    pub = self._extract_row_date(row)
+            if yjkb is not None:
+                row_dates = yjkb.row_dates()
+                yoys = yjkb.row_numerics(self._EXPRESS_KEYWORDS)
+                for pos in yjkb.positions_for(symbol):
+                    pub = row_dates[pos]
                     if pub is not None and pub > as_of:
                         continue
                     event_count += 1
@@ -195,7 +328,7 @@ class AkshareProvider(MarketDataProvider):
                         latest_publish_date = pub
                     if rep <= as_of and (latest_report_date is None or rep > latest_report_date):
                         latest_report_date = rep
-                    yoy = self._extract_row_numeric(row, ("净利润同比", "yoy_net_profit", "增长", "同比"))
+                    yoy = yoys[pos]
                     if yoy is None:
                         continue
                     latest_express_growth = float(yoy)
@@ -207,17 +340,7 @@ class AkshareProvider(MarketDataProvider):
                         neg_score += min(1.0, abs(yoy + 10.0) / 65.0) * decay
 
         # Optional notice intensity for near-term event risk.
-        notice_rows = 0
-        for lag in range(0, min(6, max(2, lookback_days // 20))):
-            day = as_of - timedelta(days=lag)
-            day_text = day.strftime("%Y%m%d")
-            notice = self._safe_api_call("stock_notice_report", symbol="全部", date=day_text)
-            if notice is None or notice.empty:
-                continue
-            matched = self._filter_symbol_rows(notice, symbol=symbol)
-            if matched.empty:
-                continue
-            notice_rows += len(matched)
+        notice_rows = sum(len(notice.positions_for(symbol)) for notice in notice_tables)
         if notice_rows > 0:
             # More notices imply higher short-term uncertainty; cap the effect.
             neg_score += min(0.35, math.log1p(float(notice_rows)) / 8.5)
@@ -246,6 +369,36 @@ class AkshareProvider(MarketDataProvider):
             "express_yoy_net_profit": latest_express_growth,
         }
 
+    def _market_table(self, method_name: str, key: str, **kwargs) -> _MarketTable | None:
+        """Fetch a market-wide table once per (dataset, date) within the TTL.
+
+        Empty tables (no notices on a holiday, no forecasts yet for a report date) are cached
+        like any other; only failed calls return None and are retried on the next lookup.
+        """
+        now = time.monotonic()
+        cache_key = (method_name, key)
+        with self._market_tables_lock:
+            cached = self._market_tables.get(cache_key)
+        if cached is not None and now - cached.fetched_at < self._MARKET_TABLE_TTL_SEC:
+            return cached
+        method = getattr(self._ak, method_name, None)
+        if method is None:
+            return None
+        try:
+            frame = method(**kwargs)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("akshare method %s failed: %s", method_name, exc)
+            return None
+        if frame is None or not isinstance(frame, pd.DataFrame):
+            frame = pd.DataFrame()
+        table = _MarketTable(frame, fetched_at=now)
+        with self._market_tables_lock:
+            expired = [k for k, v in self._market_tables.items() if now - v.fetched_at >= self._MARKET_TABLE_TTL_SEC]
+            for stale_key in expired:
+                self._market_tables.pop(stale_key, None)
+            self._market_tables[cache_key] = table
+        return table
+
     def get_market_style_snapshot(
         self,
         as_of: date,
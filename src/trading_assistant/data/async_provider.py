@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+import contextvars
+from datetime import date, datetime
+import functools
+import logging
+from typing import Any
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDataProvider:
+    """Awaitable facade over a blocking provider (usually ``CompositeDataProvider``).
+
+    The tushare/akshare SDKs only expose blocking calls, so each call runs on a dedicated
+    executor instead of the server threadpool. Context variables (e.g. the provider priority
+    lane) are carried into the worker thread. Handlers can ``asyncio.gather`` many calls.
+    """
+
+    def __init__(self, provider: Any, *, executor: Executor | None = None) -> None:
+        self.provider = provider
+        self.executor = executor
+
+    async def call(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        fn = functools.partial(getattr(self.provider, method_name), *args, **kwargs)
+        ctx = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(self.executor, ctx.run, fn)
+
+    async def get_daily_bars_with_source(
+        self, symbol: str, start_date: date, end_date: date
+    ) -> tuple[str, pd.DataFrame]:
+        return await self.call("get_daily_bars_with_source", symbol, start_date, end_date)
+
+    async def get_trade_calendar_with_source(self, start_date: date, end_date: date) -> tuple[str, pd.DataFrame]:
+        return await self.call("get_trade_calendar_with_source", start_date, end_date)
+
+    async def get_intraday_bars_with_source(
+        self,
+        symbol: str,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        *,
+        interval: str = "15m",
+    ) -> tuple[str, pd.DataFrame]:
+        return await self.call(
+            "get_intraday_bars_with_source",
+            symbol=symbol,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            interval=interval,
+        )
+
+    async def get_security_status(self, symbol: str) -> dict[str, bool]:
+        return await self.call("get_security_status", symbol)
+
+    async def gather_daily_bars_with_source(
+        self,
+        symbols: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, tuple[str, pd.DataFrame]]:
+        """Fetch daily bars for many symbols concurrently; failed symbols are left out."""
+        unique = list(dict.fromkeys(symbols))
+        results = await asyncio.gather(
+            *(self.get_daily_bars_with_source(symbol, start_date, end_date) for symbol in unique),
+            return_exceptions=True,
+        )
+        out: dict[str, tuple[str, pd.DataFrame]] = {}
+        for symbol, result in zip(unique, results):
+            if isinstance(result, BaseException):
+                logger.debug("Concurrent daily bar fetch failed for %s: %s", symbol, result)
+                continue
+            out[symbol] = result
+        return out
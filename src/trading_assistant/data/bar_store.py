@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+import json
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+_MANIFEST = "manifest.json"
+_DATE_COLUMN = "trade_date"
+
+
+class MemoryMappedBarStore:
+    """Columnar on-disk bar store shared zero-copy between worker processes.
+
+    ``build`` concatenates the bars of every symbol into one fixed-dtype ``.npy`` file per
+    column (``trade_date`` as ``datetime64[D]``) plus a manifest with each symbol's row range.
+    Object columns are coerced to bool, float, datetime or fixed-width text; a column whose
+    values fit none of those raises ValueError rather than being stringified.
+    ``open`` maps those files with ``np.load(mmap_mode=...)``, so every process that opens the
+    same directory reads the same page-cache pages instead of unpickling its own copy.
+    Frames are copy-on-write views by default: a worker may add or overwrite columns locally
+    without touching the files or the other workers.
+    """
+
+    def __init__(self, directory: Path, manifest: dict, arrays: dict[str, np.ndarray]) -> None:
+        self.directory = directory
+        self._arrays = arrays
+        self._entries: dict[str, dict] = {str(item["symbol"]): item for item in manifest["symbols"]}
+
+    @classmethod
+    def build(
+        cls,
+        directory: str | Path,
+        bars_by_symbol: dict[str, pd.DataFrame],
+        *,
+        sources: dict[str, str] | None = None,
+    ) -> MemoryMappedBarStore:
+        root = Path(directory)
+        root.mkdir(parents=True, exist_ok=True)
+        columns = _column_order(bars_by_symbol.values())
+        entries: list[dict] = []
+        parts: dict[str, list[np.ndarray | int]] = {name: [] for name in columns}
+        offset = 0
+        for symbol, frame in bars_by_symbol.items():
+            ordered = frame.sort_values(_DATE_COLUMN).reset_index(drop=True) if _DATE_COLUMN in frame.columns else frame
+            length = len(ordered)
+            entries.append(
+                {
+                    "symbol": str(symbol),
+                    "offset": offset,
+                    "length": length,
+                    "source": str((sources or {}).get(symbol, "")),
+                    "columns": [str(x) for x in ordered.columns],
+                }
+            )
+            for name in columns:
+                # Columns a symbol lacks are padded later with the dtype of the symbols that have it.
+                parts[name].append(_to_array(ordered[name], name) if name in ordered.columns else length)
+            offset += length
+
+        kinds: dict[str, str] = {}
+        for idx, name in enumerate(columns):
+            values = _concat(parts[name], name)
+            kinds[name] = str(values.dtype)
+            np.save(root / f"c{idx}.npy", values, allow_pickle=False)
+        manifest = {
+            "version": 1,
+            "rows": offset,
+            "columns": [{"name": name, "file": f"c{idx}.npy", "dtype": kinds[name]} for idx, name in enumerate(columns)],
+            "symbols": entries,
+        }
+        (root / _MANIFEST).write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+        return cls.open(root)
+
+    @classmethod
+    def open(cls, directory: str | Path, *, mmap_mode: str = "c") -> MemoryMappedBarStore:
+        root = Path(directory)
+        manifest = json.loads((root / _MANIFEST).read_text(encoding="utf-8"))
+        arrays = {
+            str(col["name"]): np.load(root / str(col["file"]), mmap_mode=mmap_mode, allow_pickle=False)
+            for col in manifest["columns"]
+        }
+        return cls(root, manifest, arrays)
+
+    @property
+    def symbols(self) -> list[str]:
+        return list(self._entries)
+
+    def source(self, symbol: str) -> str:
+        return str(self._entry(symbol).get("source") or "")
+
+    def column(self, symbol: str, name: str) -> np.ndarray:
+        """Zero-copy slice of one column for ``symbol``."""
+        entry = self._entry(symbol)
+        offset = int(entry["offset"])
+        return self._arrays[name][offset : offset + int(entry["length"])]
+
+    def dates(self, symbol: str) -> np.ndarray:
+        return self.column(symbol, _DATE_COLUMN)
+
+    def frame(self, symbol: str) -> pd.DataFrame:
+        """Bars of ``symbol`` with the columns it was built with; numeric columns stay mapped."""
+        entry = self._entry(symbol)
+        data: dict[str, object] = {}
+        for name in entry["columns"]:
+            values = self.column(symbol, name)
+            if values.dtype == np.dtype("datetime64[D]"):
+                # Providers hand out python ``date`` objects; keep that contract.
+                data[name] = values.astype(object)
+            elif values.dtype.kind == "U":
+                data[name] = values.astype(object)
+            else:
+                # Plain ndarray view over the mapped pages (pandas does not expect np.memmap).
+                data[name] = values.view(np.ndarray)
+        return pd.DataFrame(data, copy=False)
+
+    def bars_by_symbol(self) -> dict[str, pd.DataFrame]:
+        return {symbol: self.frame(symbol) for symbol in self._entries}
+
+    def _entry(self, symbol: str) -> dict:
+        found = self._entries.get(symbol)
+        if found is None:
+            raise KeyError(f"symbol not in bar store: {symbol}")
+        return found
+
+
+def _column_order(frames: Iterable[pd.DataFrame]) -> list[str]:
+    names: list[str] = []
+    seen: set[str] = set()
+    for frame in frames:
+        for name in frame.columns:
+            key = str(name)
+            if key not in seen:
+                seen.add(key)
+                names.append(key)
+    return names
+
+
+def _to_array(series: pd.Series, name: str) -> np.ndarray:
+    """Fixed-dtype array for one column; raises ValueError instead of stringifying values."""
+    if name == _DATE_COLUMN:
+        return pd.to_datetime(series, errors="coerce").to_numpy(dtype="datetime64[D]")
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return series.to_numpy(dtype=bool)
+    if pd.api.types.is_numeric_dtype(dtype):
+        if isinstance(dtype, np.dtype):
+            return series.to_numpy()
+        return series.to_numpy(dtype=float, na_value=np.nan)
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        raise ValueError(f"bar column '{name}' is timezone-aware; convert it to naive datetimes first")
+    if pd.api.types.is_datetime64_dtype(dtype):
+        return series.to_numpy(dtype="datetime64[ns]")
+    return _object_to_array(series, name)
+
+
+def _object_to_array(series: pd.Series, name: str) -> np.ndarray:
+    present = series.notna()
+    values = series[present].tolist()
+    if not values:
+        return np.full(len(series), np.nan)
+    if all(isinstance(v, (bool, np.bool_)) for v in values):
+        # Missing flags read as False, the same default providers use for is_st/is_suspended.
+        return series.where(present, False).to_numpy(dtype=bool)
+    if all(isinstance(v, (bool, int, float, np.number)) for v in values):
+        return pd.to_numeric(series, errors="raise").to_numpy(dtype=float, na_value=np.nan)
+    if all(isinstance(v, str) for v in values):
+        return series.where(present, "").to_numpy(dtype=str)
+    if all(isinstance(v, date) for v in values):
+        unit = "datetime64[ns]" if any(isinstance(v, datetime) for v in values) else "datetime64[D]"
+        return pd.to_datetime(series, errors="raise").to_numpy(dtype=unit)
+    kinds = sorted({type(v).__name__ for v in values})
+    raise ValueError(f"bar column '{name}' holds values that map to no fixed dtype: {', '.join(kinds)}")
+
+
+def _concat(raw_parts: list[np.ndarray | int], name: str) -> np.ndarray:
+    present = [p for p in raw_parts if isinstance(p, np.ndarray)]
+    if not present:
+        return np.empty(0)
+    kinds = {p.dtype.kind for p in present}
+    for kind in ("U", "M"):
+        if kind in kinds and kinds != {kind}:
+            raise ValueError(f"bar column '{name}' mixes incompatible dtypes across symbols: {sorted(kinds)}")
+    padded = len(present) != len(raw_parts)
+    if kinds == {"U"}:
+        width = max(p.dtype.itemsize // 4 for p in present)
+        dtype, fill = np.dtype(f"<U{max(1, width)}"), ""
+    elif kinds == {"M"}:
+        dtype, fill = np.result_type(*present), np.datetime64("NaT")
+    elif kinds == {"b"}:
+        dtype, fill = np.dtype(bool), False
+    else:
+        # Symbols lacking a numeric column read it as NaN, which needs a float dtype.
+        dtype = np.result_type(*present, np.float64) if padded else np.result_type(*present)
+        fill = np.nan
+    parts = [p.astype(dtype, copy=False) if isinstance(p, np.ndarray) else np.full(p, fill, dtype=dtype) for p in raw_parts]
+    return np.concatenate(parts)
@@ -95,6 +95,23 @@ class MarketDataProvider(ABC):
         _ = (symbol, as_of, lookback_days)
         raise NotImplementedError("corporate event snapshot is not implemented by this provider")
 
+    def get_corporate_event_snapshots_many(
+        self,
+        symbols: list[str],
+        as_of: date,
+        *,
+        lookback_days: int = 120,
+    ) -> dict[str, dict[str, object]]:
+        """
+        Optional method.
+        Batch form of get_corporate_event_snapshot keyed by symbol. Providers backed by
+        market-wide tables override it to score all symbols from one download.
+        """
+        return {
+            symbol: self.get_corporate_event_snapshot(symbol, as_of, lookback_days=lookback_days)
+            for symbol in symbols
+        }
+
     def get_market_style_snapshot(
         self,
         as_of: date,
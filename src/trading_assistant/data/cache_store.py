@@ -4,19 +4,21 @@ from datetime import date, datetime
 import sqlite3
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from trading_assistant.core.sqlite import SQLiteConnectionPool
+
 
 class LocalTimeseriesCache:
     def __init__(self, db_path: str) -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.db_path)
         self._init_schema()
 
     def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return self._pool.connection()
 
     def _init_schema(self) -> None:
         with self._conn() as conn:
@@ -69,6 +71,24 @@ class LocalTimeseriesCache:
                 ON intraday_bars_cache(provider, symbol, interval, bar_time)
                 """
             )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS trade_calendar_cache (
+                    provider TEXT NOT NULL,
+                    trade_date TEXT NOT NULL,
+                    PRIMARY KEY(provider, trade_date)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS trade_calendar_coverage (
+                    provider TEXT PRIMARY KEY,
+                    start_date TEXT NOT NULL,
+                    end_date TEXT NOT NULL
+                )
+                """
+            )
 
     def upsert_daily_bars(self, *, provider: str, symbol: str, bars: pd.DataFrame) -> int:
         if bars is None or bars.empty:
@@ -116,6 +136,19 @@ class LocalTimeseriesCache:
             )
         return len(rows)
 
+    _DAILY_COLUMNS = [
+        "trade_date",
+        "symbol",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "amount",
+        "is_suspended",
+        "is_st",
+    ]
+
     def load_daily_bars(self, *, provider: str, symbol: str, start_date: date, end_date: date) -> pd.DataFrame:
         with self._conn() as conn:
             rows = conn.execute(
@@ -129,27 +162,18 @@ class LocalTimeseriesCache:
                 (provider, symbol, start_date.isoformat(), end_date.isoformat()),
             ).fetchall()
         if not rows:
-            return pd.DataFrame(
-                columns=[
-                    "trade_date",
-                    "symbol",
-                    "open",
-                    "high",
-                    "low",
-                    "close",
-                    "volume",
-                    "amount",
-                    "is_suspended",
-                    "is_st",
-                ]
-            )
-        frame = pd.DataFrame([dict(row) for row in rows])
-        frame["trade_date"] = pd.to_datetime(frame["trade_date"], errors="coerce").dt.date
-        frame["is_suspended"] = frame["is_suspended"].astype(int).eq(1)
-        frame["is_st"] = frame["is_st"].astype(int).eq(1)
-        for col in ("open", "high", "low", "close", "volume", "amount"):
-            frame[col] = pd.to_numeric(frame[col], errors="coerce")
-        return frame
+            return pd.DataFrame(columns=self._DAILY_COLUMNS)
+        # Build typed columns in one pass; trade_date is always an ISO string written by upsert_daily_bars.
+        columns = list(zip(*rows))
+        data: dict[str, object] = {
+            "trade_date": [date.fromisoformat(str(value)) for value in columns[0]],
+            "symbol": list(columns[1]),
+        }
+        for idx, col in enumerate(("open", "high", "low", "close", "volume", "amount"), start=2):
+            data[col] = np.asarray(columns[idx], dtype=float)
+        data["is_suspended"] = np.asarray(columns[8], dtype=int) == 1
+        data["is_st"] = np.asarray(columns[9], dtype=int) == 1
+        return pd.DataFrame(data, columns=self._DAILY_COLUMNS)
 
     def coverage(self, *, provider: str, symbol: str) -> tuple[date | None, date | None, int]:
         with self._conn() as conn:
@@ -168,6 +192,56 @@ class LocalTimeseriesCache:
         cnt = int(row["cnt"] or 0)
         return min_date, max_date, cnt
 
+    def upsert_trade_calendar(
+        self,
+        *,
+        provider: str,
+        start_date: date,
+        end_date: date,
+        open_dates: list[date],
+    ) -> int:
+        """Persist the open days of a fetched calendar range and widen the provider's coverage."""
+        rows = [(provider, d.isoformat()) for d in open_dates if start_date <= d <= end_date]
+        with self._conn() as conn:
+            if rows:
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO trade_calendar_cache(provider, trade_date)
+                    VALUES (?, ?)
+                    """,
+                    rows,
+                )
+            conn.execute(
+                """
+                INSERT INTO trade_calendar_coverage(provider, start_date, end_date)
+                VALUES (?, ?, ?)
+                ON CONFLICT(provider) DO UPDATE SET
+                    start_date = MIN(trade_calendar_coverage.start_date, excluded.start_date),
+                    end_date = MAX(trade_calendar_coverage.end_date, excluded.end_date)
+                """,
+                (provider, start_date.isoformat(), end_date.isoformat()),
+            )
+        return len(rows)
+
+    def load_trade_calendar(self, *, provider: str) -> tuple[date | None, date | None, list[date]]:
+        """Return (covered_start, covered_end, sorted open days) for a provider's cached calendar."""
+        with self._conn() as conn:
+            coverage = conn.execute(
+                "SELECT start_date, end_date FROM trade_calendar_coverage WHERE provider = ?",
+                (provider,),
+            ).fetchone()
+            if coverage is None:
+                return None, None, []
+            rows = conn.execute(
+                "SELECT trade_date FROM trade_calendar_cache WHERE provider = ? ORDER BY trade_date",
+                (provider,),
+            ).fetchall()
+        return (
+            date.fromisoformat(str(coverage["start_date"])),
+            date.fromisoformat(str(coverage["end_date"])),
+            [date.fromisoformat(str(row["trade_date"])) for row in rows],
+        )
+
     def upsert_intraday_bars(
         self,
         *,
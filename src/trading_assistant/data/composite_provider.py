@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from datetime import date, datetime, timedelta
+from threading import Lock
 from typing import Callable, Iterable
 
 import pandas as pd
@@ -9,6 +10,9 @@ import pandas as pd
 from trading_assistant.data.base import MarketDataProvider
 from trading_assistant.data.cache_store import LocalTimeseriesCache
 from trading_assistant.data.exceptions import DataProviderError
+from trading_assistant.data.rate_limit import ProviderScheduler
+from trading_assistant.data.single_flight import SingleFlight, freeze_key
+from trading_assistant.data.trade_calendar import TradeCalendarIndex
 
 logger = logging.getLogger(__name__)
 
@@ -22,12 +26,32 @@ class CompositeDataProvider(MarketDataProvider):
         *,
         cache_store: LocalTimeseriesCache | None = None,
         enable_cache: bool = False,
+        single_flight: SingleFlight | None = None,
+        scheduler: ProviderScheduler | None = None,
     ) -> None:
         self.providers = list(providers)
         if not self.providers:
             raise ValueError("At least one provider must be configured.")
         self.cache_store = cache_store
         self.enable_cache = bool(enable_cache and cache_store is not None)
+        self._calendar_lock = Lock()
+        self._calendar_indexes: dict[str, TradeCalendarIndex] = {}
+        # Concurrent identical fetches (API bursts, scheduled jobs) share one upstream call.
+        self.single_flight = single_flight or SingleFlight()
+        # Optional per-endpoint rate limiting, adaptive concurrency and priority lanes.
+        self.scheduler = scheduler
+
+    def coalescing_stats(self) -> dict[str, int]:
+        return self.single_flight.stats()
+
+    def scheduler_stats(self) -> list[dict]:
+        return self.scheduler.stats() if self.scheduler is not None else []
+
+    def _invoke(self, provider: MarketDataProvider, method_name: str, *args, **kwargs):
+        fn: Callable = getattr(provider, method_name)
+        if self.scheduler is None:
+            return fn(*args, **kwargs)
+        return self.scheduler.call(provider.name, method_name, lambda: fn(*args, **kwargs))
 
     def get_provider_by_name(self, name: str) -> MarketDataProvider | None:
         key = name.strip().lower()
@@ -47,12 +71,33 @@ class CompositeDataProvider(MarketDataProvider):
         allow_empty_dict: bool = False,
         return_source: bool = False,
         **kwargs,
+    ):
+        key = ("call", method_name, freeze_key(args), freeze_key(kwargs), allow_empty_df, allow_empty_dict, return_source)
+        return self.single_flight.do(
+            key,
+            lambda: self._call_with_fallback_uncoalesced(
+                method_name,
+                *args,
+                allow_empty_df=allow_empty_df,
+                allow_empty_dict=allow_empty_dict,
+                return_source=return_source,
+                **kwargs,
+            ),
+        )
+
+    def _call_with_fallback_uncoalesced(
+        self,
+        method_name: str,
+        *args,
+        allow_empty_df: bool = False,
+        allow_empty_dict: bool = False,
+        return_source: bool = False,
+        **kwargs,
     ):
         errors: list[str] = []
         for provider in self.providers:
             try:
-                fn: Callable = getattr(provider, method_name)
-                result = fn(*args, **kwargs)
+                result = self._invoke(provider, method_name, *args, **kwargs)
                 if isinstance(result, pd.DataFrame) and result.empty and not allow_empty_df:
                     raise RuntimeError("empty result")
                 if isinstance(result, dict) and (not result) and not allow_empty_dict:
@@ -93,6 +138,17 @@ class CompositeDataProvider(MarketDataProvider):
         return bars
 
     def get_daily_bars_with_source(self, symbol: str, start_date: date, end_date: date) -> tuple[str, pd.DataFrame]:
+        return self.single_flight.do(
+            ("get_daily_bars", symbol, start_date, end_date),
+            lambda: self._get_daily_bars_with_source_uncoalesced(symbol, start_date, end_date),
+        )
+
+    def _get_daily_bars_with_source_uncoalesced(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+    ) -> tuple[str, pd.DataFrame]:
         errors: list[str] = []
         for provider in self.providers:
             try:
@@ -104,7 +160,7 @@ class CompositeDataProvider(MarketDataProvider):
                         end_date=end_date,
                     )
                 else:
-                    bars = provider.get_daily_bars(symbol, start_date, end_date)
+                    bars = self._invoke(provider, "get_daily_bars", symbol, start_date, end_date)
                 if bars.empty:
                     raise RuntimeError("empty result")
                 return provider.name, bars
@@ -131,8 +187,20 @@ class CompositeDataProvider(MarketDataProvider):
         *,
         interval: str = "15m",
     ) -> tuple[str, pd.DataFrame]:
-        errors: list[str] = []
         interval_key = str(interval).strip().lower()
+        return self.single_flight.do(
+            ("get_intraday_bars", symbol, start_datetime, end_datetime, interval_key),
+            lambda: self._get_intraday_bars_with_source_uncoalesced(symbol, start_datetime, end_datetime, interval_key),
+        )
+
+    def _get_intraday_bars_with_source_uncoalesced(
+        self,
+        symbol: str,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        interval_key: str,
+    ) -> tuple[str, pd.DataFrame]:
+        errors: list[str] = []
         for provider in self.providers:
             try:
                 if self.enable_cache and self.cache_store is not None:
@@ -144,7 +212,9 @@ class CompositeDataProvider(MarketDataProvider):
                         interval=interval_key,
                     )
                 else:
-                    bars = provider.get_intraday_bars(
+                    bars = self._invoke(
+                        provider,
+                        "get_intraday_bars",
                         symbol,
                         start_datetime,
                         end_datetime,
@@ -196,6 +266,36 @@ class CompositeDataProvider(MarketDataProvider):
             return_source=True,
         )
 
+    def get_corporate_event_snapshots_many(
+        self,
+        symbols: list[str],
+        as_of: date,
+        *,
+        lookback_days: int = 120,
+    ) -> dict[str, dict[str, object]]:
+        _, snapshots = self.get_corporate_event_snapshots_many_with_source(
+            symbols=symbols,
+            as_of=as_of,
+            lookback_days=lookback_days,
+        )
+        return snapshots
+
+    def get_corporate_event_snapshots_many_with_source(
+        self,
+        *,
+        symbols: list[str],
+        as_of: date,
+        lookback_days: int = 120,
+    ) -> tuple[str, dict[str, dict[str, object]]]:
+        return self._call_with_fallback(
+            "get_corporate_event_snapshots_many",
+            list(symbols),
+            as_of,
+            lookback_days=lookback_days,
+            allow_empty_dict=True,
+            return_source=True,
+        )
+
     def get_market_style_snapshot(
         self,
         as_of: date,
@@ -228,17 +328,7 @@ class CompositeDataProvider(MarketDataProvider):
         end_date: date,
     ) -> pd.DataFrame:
         assert self.cache_store is not None
-        min_date, max_date, count = self.cache_store.coverage(provider=provider.name, symbol=symbol)
-        missing_ranges: list[tuple[date, date]] = []
-        if count <= 0 or min_date is None or max_date is None:
-            missing_ranges.append((start_date, end_date))
-        else:
-            if start_date < min_date:
-                missing_ranges.append((start_date, min_date - timedelta(days=1)))
-            if end_date > max_date:
-                missing_ranges.append((max_date + timedelta(days=1), end_date))
-
-        cached_before_fetch = self.cache_store.load_daily_bars(
+        cached = self.cache_store.load_daily_bars(
             provider=provider.name,
             symbol=symbol,
             start_date=start_date,
@@ -249,45 +339,49 @@ class CompositeDataProvider(MarketDataProvider):
             start_date=start_date,
             end_date=end_date,
         )
-        if expected_trade_dates:
-            cached_dates = set()
-            if not cached_before_fetch.empty:
-                cached_dates = set(
-                    pd.to_datetime(cached_before_fetch["trade_date"], errors="coerce")
-                    .dropna()
-                    .dt.date
-                    .tolist()
-                )
+        missing_ranges: list[tuple[date, date]] = []
+        if expected_trade_dates is not None:
+            cached_dates = set(cached["trade_date"].tolist()) if not cached.empty else set()
             missing_ranges.extend(
                 self._missing_ranges_from_expected_dates(
                     expected_dates=expected_trade_dates,
                     cached_dates=cached_dates,
                 )
             )
-
-        missing_ranges = self._merge_ranges(missing_ranges)
-
-        for missing_start, missing_end in missing_ranges:
-            if missing_start > missing_end:
-                continue
-            fetched = provider.get_daily_bars(symbol, missing_start, missing_end)
+        else:
+            # No usable calendar: fall back to the symbol's overall cache coverage edges.
+            min_date, max_date, count = self.cache_store.coverage(provider=provider.name, symbol=symbol)
+            if count <= 0 or min_date is None or max_date is None:
+                missing_ranges.append((start_date, end_date))
+            else:
+                if start_date < min_date:
+                    missing_ranges.append((start_date, min_date - timedelta(days=1)))
+                if end_date > max_date:
+                    missing_ranges.append((max_date + timedelta(days=1), end_date))
+
+        fetched_any = False
+        for missing_start, missing_end in self._merge_ranges(missing_ranges):
+            fetched = self._invoke(provider, "get_daily_bars", symbol, missing_start, missing_end)
             if fetched is None or fetched.empty:
                 continue
             self.cache_store.upsert_daily_bars(provider=provider.name, symbol=symbol, bars=fetched)
+            fetched_any = True
 
-        cached = self.cache_store.load_daily_bars(
-            provider=provider.name,
-            symbol=symbol,
-            start_date=start_date,
-            end_date=end_date,
-        )
+        if fetched_any:
+            cached = self.cache_store.load_daily_bars(
+                provider=provider.name,
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+            )
         if cached.empty:
             # Force direct fetch when cache has no rows for requested range.
-            direct = provider.get_daily_bars(symbol, start_date, end_date)
+            direct = self._invoke(provider, "get_daily_bars", symbol, start_date, end_date)
             if direct is not None and not direct.empty:
                 self.cache_store.upsert_daily_bars(provider=provider.name, symbol=symbol, bars=direct)
                 return direct.sort_values("trade_date").reset_index(drop=True)
-        return cached.sort_values("trade_date").reset_index(drop=True)
+        # load_daily_bars returns a fresh frame already ordered by trade_date.
+        return cached
 
     def _get_intraday_bars_with_cache(
         self,
@@ -323,7 +417,9 @@ class CompositeDataProvider(MarketDataProvider):
             need_fetch = True
 
         if need_fetch:
-            fetched = provider.get_intraday_bars(
+            fetched = self._invoke(
+                provider,
+                "get_intraday_bars",
                 symbol,
                 start_datetime,
                 end_datetime,
@@ -367,26 +463,95 @@ class CompositeDataProvider(MarketDataProvider):
         provider: MarketDataProvider,
         start_date: date,
         end_date: date,
-    ) -> list[date]:
+    ) -> list[date] | None:
+        """Open days in range from the persisted calendar, fetching only uncovered edges upstream.
+
+        Returns None when any uncovered edge could not be fetched, so callers fall back to
+        coverage-based gap detection. Edges fetched successfully are kept either way.
+        """
+        if start_date > end_date:
+            return []
+        with self._calendar_lock:
+            index = self._calendar_indexes.get(provider.name)
+            if index is None:
+                index = self._load_calendar_index(provider.name)
+                self._calendar_indexes[provider.name] = index
+            gaps = index.missing_ranges(start_date, end_date)
+            if not gaps:
+                return index.open_dates_between(start_date, end_date)
+
+        # Upstream calls run outside the lock; concurrent requests for the same edge share one call.
+        complete = True
+        fetched: list[date] = []
+        for gap_start, gap_end in gaps:
+            open_dates = self.single_flight.do(
+                ("trade_calendar", provider.name, gap_start, gap_end),
+                lambda s=gap_start, e=gap_end: self._fetch_open_dates(provider, s, e),
+            )
+            if open_dates is None:
+                complete = False
+                continue
+            fetched.extend(open_dates)
+            with self._calendar_lock:
+                # A concurrent caller may have seeded a disjoint range meanwhile; never bridge it.
+                if not index.can_extend(gap_start, gap_end):
+                    continue
+                if self.cache_store is not None:
+                    self.cache_store.upsert_trade_calendar(
+                        provider=provider.name,
+                        start_date=gap_start,
+                        end_date=gap_end,
+                        open_dates=open_dates,
+                    )
+                index.extend(gap_start, gap_end, open_dates)
+        if not complete:
+            return None
+        with self._calendar_lock:
+            known = set(index.open_dates_between(start_date, end_date))
+        known.update(d for d in fetched if start_date <= d <= end_date)
+        return sorted(known)
+
+    def _fetch_open_dates(self, provider: MarketDataProvider, start_date: date, end_date: date) -> list[date] | None:
         try:
-            calendar = provider.get_trade_calendar(start_date, end_date)
+            calendar = self._invoke(provider, "get_trade_calendar", start_date, end_date)
         except Exception:  # noqa: BLE001
+            return None
+        return self._open_dates_from_calendar(calendar, start_date, end_date)
+
+    def _load_calendar_index(self, provider_name: str) -> TradeCalendarIndex:
+        if self.cache_store is None:
+            return TradeCalendarIndex()
+        covered_start, covered_end, open_dates = self.cache_store.load_trade_calendar(provider=provider_name)
+        return TradeCalendarIndex(covered_start, covered_end, open_dates)
+
+    @classmethod
+    def _open_dates_from_calendar(
+        cls,
+        calendar: pd.DataFrame | None,
+        start_date: date,
+        end_date: date,
+    ) -> list[date] | None:
+        """Open days within range, or None when the calendar response is unusable.
+
+        Providers such as akshare list open days only, so an empty frame is a valid answer for
+        a range holding only weekends or holidays.
+        """
+        if calendar is None:
+            return None
+        if calendar.empty:
             return []
-        if calendar is None or calendar.empty or "trade_date" not in calendar.columns:
-            return []
+        if "trade_date" not in calendar.columns:
+            return None
         frame = calendar.copy()
         frame["trade_date"] = pd.to_datetime(frame["trade_date"], errors="coerce").dt.date
         frame = frame[frame["trade_date"].notna()]
         if frame.empty:
-            return []
+            return None
 
         if "is_open" in frame.columns:
-            open_mask = frame["is_open"].apply(self._as_bool)
+            open_mask = frame["is_open"].apply(cls._as_bool)
             frame = frame[open_mask]
-        if frame.empty:
-            return []
-        out = sorted(set(d for d in frame["trade_date"].tolist() if start_date <= d <= end_date))
-        return out
+        return sorted(set(d for d in frame["trade_date"].tolist() if start_date <= d <= end_date))
 
     @staticmethod
     def _missing_ranges_from_expected_dates(
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+import re
+from threading import Condition
+import time
+from typing import Any, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class RequestPriority(IntEnum):
+    INTERACTIVE = 0
+    BULK = 1
+
+
+_REQUEST_PRIORITY: ContextVar[RequestPriority] = ContextVar(
+    "provider_request_priority",
+    default=RequestPriority.INTERACTIVE,
+)
+
+
+@contextmanager
+def provider_priority(priority: RequestPriority) -> Iterator[None]:
+    """Run upstream provider calls made inside the block in the given priority lane."""
+    token = _REQUEST_PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        _REQUEST_PRIORITY.reset(token)
+
+
+def current_priority() -> RequestPriority:
+    return _REQUEST_PRIORITY.get()
+
+
+_THROTTLE_MARKERS = (
+    "每分钟",
+    "频率",
+    "访问次数",
+    "rate limit",
+    "too many requests",
+    "throttl",
+)
+# A bare "429" also appears in symbols (600429) and row counts, so only status-like mentions count.
+_HTTP_429_PATTERN = re.compile(r"\b(?:http|status|status[ _]code|code)\s*[:=]?\s*429\b", re.IGNORECASE)
+
+
+def _status_code(exc: BaseException) -> int | None:
+    # httpx.HTTPStatusError / requests.HTTPError carry the response, urllib's HTTPError a code.
+    response = getattr(exc, "response", None)
+    for value in (getattr(response, "status_code", None), getattr(exc, "status_code", None), getattr(exc, "code", None)):
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def is_throttle_error(exc: BaseException) -> bool:
+    if _status_code(exc) == 429:
+        return True
+    text = str(exc).lower()
+    return any(marker in text for marker in _THROTTLE_MARKERS) or _HTTP_429_PATTERN.search(text) is not None
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate_per_min: float,
+        *,
+        burst: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate_per_sec = max(1e-9, float(rate_per_min) / 60.0)
+        self.capacity = max(1.0, float(burst) if burst is not None else float(rate_per_min) / 12.0)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_sec)
+        self._updated = now
+
+    def available_in(self) -> float:
+        """Seconds until a token is available (0.0 if one is available now); takes nothing."""
+        self._refill()
+        if self._tokens >= 1.0:
+            return 0.0
+        return (1.0 - self._tokens) / self.rate_per_sec
+
+    def try_acquire(self) -> float:
+        """Take one token; returns 0.0 on success, otherwise seconds until one is available."""
+        wait_sec = self.available_in()
+        if wait_sec <= 0.0:
+            self._tokens -= 1.0
+        return wait_sec
+
+    def drain(self) -> None:
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+
+
+@dataclass
+class _EndpointState:
+    provider: str
+    endpoint: str
+    bucket: TokenBucket | None
+    rate_limit_per_min: float | None
+    provider_bucket: TokenBucket | None
+    provider_rate_limit_per_min: float | None
+    concurrency_limit: float
+    inflight: int = 0
+    waiting: dict[RequestPriority, int] = field(default_factory=lambda: {p: 0 for p in RequestPriority})
+    calls: int = 0
+    throttle_events: int = 0
+    errors: int = 0
+    queue_wait_sec_total: float = 0.0
+    queue_wait_sec_max: float = 0.0
+
+
+class ProviderScheduler:
+    """Admission control for upstream provider calls.
+
+    ``rate_limits_per_min`` holds calls-per-minute token buckets: a ``"provider"`` key is
+    one bucket shared by every endpoint of that provider, a ``"provider.endpoint"`` key adds
+    a bucket for that endpoint alone; a call needs a token from each bucket that applies.
+    Each (provider, endpoint) pair also gets an AIMD concurrency limit that halves on
+    throttling errors and grows by ``1/limit`` per success.
+    Waiting INTERACTIVE calls are admitted before any waiting BULK call on the same endpoint.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate_limits_per_min: dict[str, float] | None = None,
+        max_concurrency: int = 4,
+        min_concurrency: int = 1,
+    ) -> None:
+        self.rate_limits_per_min = {k.lower(): float(v) for k, v in (rate_limits_per_min or {}).items()}
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.min_concurrency = max(1, min(int(min_concurrency), self.max_concurrency))
+        self._cond = Condition()
+        self._states: dict[tuple[str, str], _EndpointState] = {}
+        self._provider_buckets: dict[str, TokenBucket] = {}
+
+    def call(
+        self,
+        provider: str,
+        endpoint: str,
+        fn: Callable[[], T],
+        *,
+        priority: RequestPriority | None = None,
+    ) -> T:
+        lane = current_priority() if priority is None else priority
+        state = self._state(provider, endpoint)
+        self._acquire(state, lane)
+        throttled = False
+        failed = False
+        try:
+            return fn()
+        except Exception as exc:
+            failed = True
+            throttled = is_throttle_error(exc)
+            raise
+        finally:
+            self._release(state, throttled=throttled, failed=failed)
+
+    def stats(self) -> list[dict[str, Any]]:
+        with self._cond:
+            return [
+                {
+                    "provider": s.provider,
+                    "endpoint": s.endpoint,
+                    "rate_limit_per_min": s.rate_limit_per_min,
+                    "provider_rate_limit_per_min": s.provider_rate_limit_per_min,
+                    "concurrency_limit": round(s.concurrency_limit, 3),
+                    "inflight": s.inflight,
+                    "waiting_interactive": s.waiting[RequestPriority.INTERACTIVE],
+                    "waiting_bulk": s.waiting[RequestPriority.BULK],
+                    "calls": s.calls,
+                    "throttle_events": s.throttle_events,
+                    "errors": s.errors,
+                    "queue_wait_ms_total": round(s.queue_wait_sec_total * 1000.0, 3),
+                    "queue_wait_ms_max": round(s.queue_wait_sec_max * 1000.0, 3),
+                }
+                for s in self._states.values()
+            ]
+
+    def _state(self, provider: str, endpoint: str) -> _EndpointState:
+        key = (provider.strip().lower(), endpoint.strip().lower())
+        with self._cond:
+            state = self._states.get(key)
+            if state is None:
+                limit = self.rate_limits_per_min.get(f"{key[0]}.{key[1]}")
+                provider_limit = self.rate_limits_per_min.get(key[0])
+                provider_bucket = self._provider_buckets.get(key[0])
+                if provider_bucket is None and provider_limit:
+                    provider_bucket = self._provider_buckets[key[0]] = TokenBucket(provider_limit)
+                state = _EndpointState(
+                    provider=key[0],
+                    endpoint=key[1],
+                    bucket=TokenBucket(limit) if limit else None,
+                    rate_limit_per_min=limit,
+                    provider_bucket=provider_bucket,
+                    provider_rate_limit_per_min=provider_limit,
+                    concurrency_limit=float(self.max_concurrency),
+                )
+                self._states[key] = state
+            return state
+
+    def _acquire(self, state: _EndpointState, lane: RequestPriority) -> None:
+        started = time.monotonic()
+        with self._cond:
+            state.waiting[lane] += 1
+            try:
+                while True:
+                    preempted = any(state.waiting[p] > 0 for p in RequestPriority if p < lane)
+                    if not preempted and state.inflight < int(state.concurrency_limit):
+                        buckets = [b for b in (state.bucket, state.provider_bucket) if b is not None]
+                        wait_sec = max((b.available_in() for b in buckets), default=0.0)
+                        if wait_sec <= 0.0:
+                            for bucket in buckets:
+                                bucket.try_acquire()
+                            state.inflight += 1
+                            break
+                        self._cond.wait(timeout=wait_sec)
+                    else:
+                        self._cond.wait(timeout=1.0)
+            finally:
+                state.waiting[lane] -= 1
+                self._cond.notify_all()
+            waited = time.monotonic() - started
+            state.calls += 1
+            state.queue_wait_sec_total += waited
+            state.queue_wait_sec_max = max(state.queue_wait_sec_max, waited)
+
+    def _release(self, state: _EndpointState, *, throttled: bool, failed: bool) -> None:
+        with self._cond:
+            state.inflight -= 1
+            if throttled:
+                state.throttle_events += 1
+                state.concurrency_limit = max(float(self.min_concurrency), state.concurrency_limit / 2.0)
+                for bucket in (state.bucket, state.provider_bucket):
+                    if bucket is not None:
+                        bucket.drain()
+            elif failed:
+                state.errors += 1
+            else:
+                state.concurrency_limit = min(
+                    float(self.max_concurrency),
+                    state.concurrency_limit + 1.0 / max(1.0, state.concurrency_limit),
+                )
+            self._cond.notify_all()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass, field
+from threading import Event, Lock
+from typing import Any, Callable, Hashable, TypeVar
+
+import pandas as pd
+
+T = TypeVar("T")
+
+
+@dataclass
+class _InflightCall:
+    done: Event = field(default_factory=Event)
+    result: Any = None
+    error: BaseException | None = None
+    followers: int = 0
+
+
+def freeze_key(value: Any) -> Hashable:
+    """Turn call arguments into a hashable single-flight key (lists/dicts become tuples)."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), freeze_key(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        items = sorted(value, key=str) if isinstance(value, set) else value
+        return tuple(freeze_key(v) for v in items)
+    return value
+
+
+def _share_result(value: Any) -> Any:
+    # Every caller gets its own deep copy so one caller mutating a frame (or a nested
+    # container) in place cannot affect another.
+    if isinstance(value, pd.DataFrame):
+        return value.copy()
+    return copy.deepcopy(value)
+
+
+def _share_error(error: BaseException) -> BaseException:
+    # Raising one exception instance from many threads interleaves their tracebacks; each
+    # follower raises its own copy chained to the leader's original.
+    try:
+        clone = copy.copy(error)
+    except Exception:  # noqa: BLE001
+        return error
+    if type(clone) is not type(error):
+        return error
+    clone.__traceback__ = None
+    return clone
+
+
+class SingleFlight:
+    """In-process request coalescing: concurrent calls with the same key share one execution.
+
+    The first caller for a key (the leader) runs the function; callers arriving while it is
+    in flight wait up to ``wait_timeout_sec`` for its result or exception. A follower whose
+    wait times out runs the function itself rather than blocking indefinitely. When followers
+    joined, the published result is never handed out directly: the leader and each follower
+    receive their own copy.
+    """
+
+    def __init__(self, *, wait_timeout_sec: float = 30.0) -> None:
+        self.wait_timeout_sec = max(0.0, float(wait_timeout_sec))
+        self._lock = Lock()
+        self._inflight: dict[Hashable, _InflightCall] = {}
+        self._calls = 0
+        self._executed = 0
+        self._coalesced = 0
+        self._wait_timeouts = 0
+        self._errors = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            self._calls += 1
+            call = self._inflight.get(key)
+            leader = call is None
+            if call is None:
+                call = _InflightCall()
+                self._inflight[key] = call
+                self._executed += 1
+            else:
+                call.followers += 1
+
+        if leader:
+            try:
+                call.result = fn()
+            except BaseException as exc:
+                call.error = exc
+                raise
+            finally:
+                with self._lock:
+                    self._inflight.pop(key, None)
+                    if call.error is not None:
+                        self._errors += 1
+                    shared = call.followers > 0
+                call.done.set()
+            # No follower can join once the key is popped, so an unshared result is safe to return as is.
+            return _share_result(call.result) if shared else call.result
+
+        if not call.done.wait(self.wait_timeout_sec):
+            with self._lock:
+                self._wait_timeouts += 1
+                self._executed += 1
+            return fn()
+        with self._lock:
+            self._coalesced += 1
+        if call.error is not None:
+            error = _share_error(call.error)
+            if error is call.error:
+                raise error
+            raise error from call.error
+        return _share_result(call.result)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "calls": int(self._calls),
+                "executed": int(self._executed),
+                "coalesced": int(self._coalesced),
+                "wait_timeouts": int(self._wait_timeouts),
+                "errors": int(self._errors),
+                "inflight": len(self._inflight),
+            }
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from typing import Iterable
+
+
+class TradeCalendarIndex:
+    """Sorted open-day index over one contiguous covered date range.
+
+    ``covered_start``/``covered_end`` bound the span whose calendar has been fetched; open
+    days inside it are answered by bisection without touching the upstream provider.
+    """
+
+    def __init__(
+        self,
+        covered_start: date | None = None,
+        covered_end: date | None = None,
+        open_dates: Iterable[date] = (),
+    ) -> None:
+        self.covered_start = covered_start
+        self.covered_end = covered_end
+        self._dates: list[date] = sorted(set(open_dates))
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def covers(self, start_date: date, end_date: date) -> bool:
+        if self.covered_start is None or self.covered_end is None:
+            return False
+        return self.covered_start <= start_date and end_date <= self.covered_end
+
+    def missing_ranges(self, start_date: date, end_date: date) -> list[tuple[date, date]]:
+        """Ranges to fetch so coverage stays contiguous and includes [start_date, end_date]."""
+        if start_date > end_date:
+            return []
+        if self.covered_start is None or self.covered_end is None:
+            return [(start_date, end_date)]
+        out: list[tuple[date, date]] = []
+        if start_date < self.covered_start:
+            out.append((start_date, self.covered_start - timedelta(days=1)))
+        if end_date > self.covered_end:
+            out.append((self.covered_end + timedelta(days=1), end_date))
+        return out
+
+    def can_extend(self, start_date: date, end_date: date) -> bool:
+        """True when [start_date, end_date] would keep the coverage contiguous."""
+        if self.covered_start is None or self.covered_end is None:
+            return True
+        return start_date <= self.covered_end + timedelta(days=1) and end_date >= self.covered_start - timedelta(days=1)
+
+    def extend(self, start_date: date, end_date: date, open_dates: Iterable[date]) -> None:
+        """Merge a freshly fetched range; it must touch or overlap the current coverage."""
+        merged = set(self._dates)
+        merged.update(d for d in open_dates if start_date <= d <= end_date)
+        self._dates = sorted(merged)
+        self.covered_start = start_date if self.covered_start is None else min(self.covered_start, start_date)
+        self.covered_end = end_date if self.covered_end is None else max(self.covered_end, end_date)
+
+    def open_dates_between(self, start_date: date, end_date: date) -> list[date]:
+        lo = bisect_left(self._dates, start_date)
+        hi = bisect_right(self._dates, end_date)
+        return self._dates[lo:hi]
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from datetime import date
 import hashlib
+import struct
+from typing import Iterable
 
+import numpy as np
 import pandas as pd
 
 
@@ -239,7 +242,122 @@ def normalize_tushare_daily(df: pd.DataFrame) -> pd.DataFrame:
     ].rename(columns={"vol": "volume"}).sort_values("trade_date")
 
 
-def dataframe_content_hash(df: pd.DataFrame) -> str:
+CONTENT_HASH_CSV_V1 = "sha256-csv-v1"
+CONTENT_HASH_COLUMNAR_V2 = "sha256-columnar-v2"
+CONTENT_HASH_ALGORITHM = CONTENT_HASH_COLUMNAR_V2
+
+
+def dataframe_content_hash(df: pd.DataFrame, algorithm: str = CONTENT_HASH_ALGORITHM) -> str:
+    """Content hash of ``df`` (index ignored) under a versioned algorithm id.
+
+    The id is stored next to each snapshot, so hashes written by older releases can still be
+    recomputed and verified. ``sha256-csv-v1`` is the original CSV serialization;
+    ``sha256-columnar-v2`` (default) hashes column buffers, see ``ColumnarContentHasher``.
+    """
+    if algorithm == CONTENT_HASH_COLUMNAR_V2:
+        hasher = ColumnarContentHasher()
+        hasher.update(df)
+        return hasher.hexdigest()
+    if algorithm == CONTENT_HASH_CSV_V1:
+        return _csv_content_hash(df)
+    raise ValueError(f"Unsupported content hash algorithm: {algorithm}")
+
+
+def dataframe_content_hash_chunks(chunks: Iterable[pd.DataFrame]) -> str:
+    """``sha256-columnar-v2`` hash of row chunks, equal to hashing their concatenation.
+
+    Only one chunk is held at a time, so frames too large to materialize can be hashed while
+    they are read. Chunks must share the same columns and column kinds.
+    """
+    hasher = ColumnarContentHasher()
+    for chunk in chunks:
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class ColumnarContentHasher:
+    """Incremental ``sha256-columnar-v2`` hasher.
+
+    Columns are taken in ``str(name)`` order (position breaks ties). Each column keeps its own
+    SHA-256 over a canonical little-endian buffer of its values:
+
+    - bool -> ``u1``; signed ints -> ``<i8``; unsigned ints -> ``<u8``;
+    - floats -> ``<f8`` with every NaN mapped to one bit pattern;
+    - datetime64/timedelta64 -> ``<i8`` nanoseconds (tz-aware columns converted to UTC first);
+    - object columns holding only ``datetime.date`` -> ``<i8`` proleptic ordinals;
+    - anything else (object, string, category, nullable extension dtypes) -> the ``<u8`` row
+      hashes of ``pd.util.hash_pandas_object(series, index=False)`` with pandas' default key.
+
+    The final digest is SHA-256 over the algorithm id, the total row count and, per column,
+    its name, kind tag and column digest. Because column digests are fed row chunk by row
+    chunk, hashing chunks in order equals hashing the concatenated frame.
+    """
+
+    def __init__(self) -> None:
+        self._names: list[str] | None = None
+        self._tags: list[str] = []
+        self._digests: list[hashlib._Hash] = []
+        self._rows = 0
+
+    def update(self, df: pd.DataFrame) -> None:
+        order = sorted(range(df.shape[1]), key=lambda pos: (str(df.columns[pos]), pos))
+        names = [str(df.columns[pos]) for pos in order]
+        payloads = [_column_payload(df.iloc[:, pos]) for pos in order]
+        tags = [tag for tag, _ in payloads]
+        if self._names is None:
+            self._names = names
+            self._tags = tags
+            self._digests = [hashlib.sha256() for _ in names]
+        elif names != self._names or tags != self._tags:
+            raise ValueError("All chunks must share the same columns and column kinds.")
+        for digest, (_, values) in zip(self._digests, payloads):
+            digest.update(memoryview(np.ascontiguousarray(values)).cast("B"))
+        self._rows += int(df.shape[0])
+
+    def hexdigest(self) -> str:
+        final = hashlib.sha256()
+        final.update(CONTENT_HASH_COLUMNAR_V2.encode("ascii"))
+        final.update(struct.pack("<Q", self._rows))
+        for name, tag, digest in zip(self._names or [], self._tags, self._digests):
+            encoded = name.encode("utf-8")
+            final.update(struct.pack("<I", len(encoded)))
+            final.update(encoded)
+            final.update(tag.encode("ascii").ljust(8, b"\0"))
+            final.update(digest.digest())
+        return final.hexdigest()
+
+
+def _column_payload(series: pd.Series) -> tuple[str, np.ndarray]:
+    dtype = series.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        utc = series.dt.tz_convert("UTC").dt.tz_localize(None)
+        return "M8utc", utc.to_numpy(dtype="datetime64[ns]").view("<i8")
+    if isinstance(dtype, np.dtype):
+        values = series.to_numpy()
+        if dtype.kind == "b":
+            return "u1", values.astype(np.uint8)
+        if dtype.kind == "i":
+            return "i8", values.astype("<i8")
+        if dtype.kind == "u":
+            return "u8", values.astype("<u8")
+        if dtype.kind == "f":
+            floats = values.astype("<f8")
+            nan_mask = np.isnan(floats)
+            if nan_mask.any():
+                floats = np.where(nan_mask, np.nan, floats)
+            return "f8", floats
+        if dtype.kind == "M":
+            return "M8", values.astype("datetime64[ns]").view("<i8")
+        if dtype.kind == "m":
+            return "m8", values.astype("timedelta64[ns]").view("<i8")
+    values = series.to_numpy()
+    if dtype == object and pd.api.types.infer_dtype(values, skipna=False) == "date":
+        # Python ``date`` columns (e.g. ``trade_date``) would otherwise be stringified row by row.
+        return "date", np.fromiter((value.toordinal() for value in values), dtype="<i8", count=len(values))
+    return "obj", pd.util.hash_pandas_object(series, index=False).to_numpy().astype("<u8")
+
+
+def _csv_content_hash(df: pd.DataFrame) -> str:
     if df.empty:
         return hashlib.sha256(b"empty").hexdigest()
     normalized = df.sort_index(axis=1).copy()
@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_PANEL_FACTORS = (
+    "momentum5",
+    "momentum20",
+    "momentum60",
+    "momentum120",
+    "zscore20",
+    "fundamental_score",
+    "tushare_advanced_score",
+)
+
+# Upper bound on (dates x symbols) cells materialized per ranking block; keeps the argsort
+# and float64 rank temporaries to a few dozen MB whatever the universe size.
+_RANK_BLOCK_ELEMENTS = 1 << 20
+_EPS = 1e-12
+
+
+@dataclass
+class FactorPanel:
+    """Dense (date x symbol) float32 panel of closes and factor values."""
+
+    trade_dates: np.ndarray
+    symbols: list[str]
+    close: np.ndarray
+    factors: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return int(self.trade_dates.size), len(self.symbols)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.close.nbytes + sum(arr.nbytes for arr in self.factors.values()))
+
+
+class FactorPanelBuilder:
+    """Accumulates per-symbol ``FactorEngine`` output into a ``FactorPanel``.
+
+    Only ``trade_date``, ``close`` and the requested factor columns are kept (as compact
+    float32 arrays), so the wide per-symbol frames can be dropped right after ``add``.
+    """
+
+    def __init__(self, factor_columns: list[str] | tuple[str, ...] = DEFAULT_PANEL_FACTORS) -> None:
+        self.factor_columns = list(dict.fromkeys(factor_columns))
+        self._symbols: list[str] = []
+        self._dates: list[np.ndarray] = []
+        self._values: list[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def add(self, symbol: str, frame: pd.DataFrame) -> None:
+        if frame.empty or "trade_date" not in frame.columns or "close" not in frame.columns:
+            return
+        dates = pd.to_datetime(frame["trade_date"]).to_numpy(dtype="datetime64[D]")
+        columns = ["close", *self.factor_columns]
+        values = np.full((len(frame), len(columns)), np.nan, dtype=np.float32)
+        for idx, col in enumerate(columns):
+            if col in frame.columns:
+                values[:, idx] = pd.to_numeric(frame[col], errors="coerce").to_numpy(dtype=np.float32)
+        _, keep = np.unique(dates[::-1], return_index=True)
+        keep = dates.size - 1 - keep  # last row wins on duplicated dates
+        self._symbols.append(str(symbol))
+        self._dates.append(dates[keep])
+        self._values.append(values[keep])
+
+    def build(self) -> FactorPanel:
+        if not self._symbols:
+            raise ValueError("No symbol data added to the factor panel.")
+        trade_dates = np.unique(np.concatenate(self._dates))
+        n_dates, n_symbols = trade_dates.size, len(self._symbols)
+        columns = ["close", *self.factor_columns]
+        arrays = {col: np.full((n_dates, n_symbols), np.nan, dtype=np.float32) for col in columns}
+        for col_idx, (dates, values) in enumerate(zip(self._dates, self._values)):
+            rows = np.searchsorted(trade_dates, dates)
+            for idx, col in enumerate(columns):
+                arrays[col][rows, col_idx] = values[:, idx]
+        close = arrays.pop("close")
+        return FactorPanel(trade_dates=trade_dates, symbols=list(self._symbols), close=close, factors=arrays)
+
+
+def _row_blocks(n_rows: int, n_cols: int) -> list[tuple[int, int]]:
+    step = max(1, _RANK_BLOCK_ELEMENTS // max(1, n_cols))
+    return [(start, min(n_rows, start + step)) for start in range(0, n_rows, step)]
+
+
+class _SortedRows:
+    """Rows of a (dates x symbols) block sorted once.
+
+    Average-tie ranks restricted to any sub-mask of the finite cells are then derived from
+    a running count over the sorted order, so one argsort per factor/horizon serves every
+    factor x horizon pairing in the block. Indices are kept flat because 1-D ``take`` is
+    several times faster than ``take_along_axis``.
+    """
+
+    def __init__(self, values: np.ndarray) -> None:
+        n_rows, n_cols = values.shape
+        self.shape = (n_rows, n_cols)
+        keyed = np.where(np.isfinite(values), values, np.inf)
+        # Tied values end up averaged, so the sort need not be stable.
+        order = np.argsort(keyed, axis=1)
+        order += np.arange(0, n_rows * n_cols, n_cols)[:, None]
+        self.order = order.ravel()
+        self.position = np.empty(n_rows * n_cols, dtype=np.intp)
+        self.position[self.order] = np.arange(n_rows * n_cols)
+
+        ordered = keyed.ravel()[self.order].reshape(n_rows, n_cols)
+        tied = ordered[:, 1:] == ordered[:, :-1]
+        tied &= np.isfinite(ordered[:, 1:])
+        # Only sorted positions inside a run of equal values need the averaging fix-up.
+        self.tie_pos = self.tie_first = self.tie_last = None
+        if tied.any():
+            pos = np.broadcast_to(np.arange(n_cols), (n_rows, n_cols))
+            starts = np.ones((n_rows, n_cols), dtype=bool)
+            starts[:, 1:] = ~tied
+            ends = np.ones((n_rows, n_cols), dtype=bool)
+            ends[:, :-1] = ~tied
+            in_run = ~(starts & ends)
+            first = np.maximum.accumulate(np.where(starts, pos, 0), axis=1)
+            last = np.minimum.accumulate(np.where(ends, pos, n_cols - 1)[:, ::-1], axis=1)[:, ::-1]
+            rows, cols = np.nonzero(in_run)
+            self.tie_pos = rows * n_cols + cols
+            self.tie_first = rows * n_cols + first[rows, cols]
+            self.tie_last = rows * n_cols + last[rows, cols]
+
+    def ranks(self, mask: np.ndarray, *, fill: float = np.nan) -> np.ndarray:
+        """1-based average-tie ranks among ``mask`` cells of each row; ``fill`` elsewhere."""
+        n_rows, n_cols = self.shape
+        held = mask.ravel()[self.order].reshape(n_rows, n_cols)
+        count = np.cumsum(held, axis=1, dtype=np.int32).ravel()
+        ordered_ranks = count.astype(np.float64)
+        if self.tie_pos is not None:
+            below = count[self.tie_first] - held.ravel()[self.tie_first]
+            ordered_ranks[self.tie_pos] = (below + 1 + count[self.tie_last]) / 2.0
+        ranks = ordered_ranks[self.position].reshape(n_rows, n_cols)
+        ranks[~mask] = fill
+        return ranks
+
+
+def grouped_average_ranks(values: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """1-based average-tie ranks within each row over ``valid`` cells; NaN elsewhere.
+
+    Matches ``DataFrame.rank(axis=1, method="average")`` on the masked values.
+    """
+    if values.size == 0:
+        return np.full(values.shape, np.nan, dtype=np.float64)
+    return _SortedRows(values).ranks(valid & np.isfinite(values))
+
+
+def _rank_pearson(rx: np.ndarray, ry: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """Row-wise Pearson of average ranks (zero outside the ranked cells).
+
+    Average ranks over ``n`` cells always have mean (n + 1) / 2, so only raw sums are needed.
+    """
+    n = n.astype(np.float64)
+    shift = n * ((n + 1.0) / 2.0) ** 2
+    cov = np.einsum("ij,ij->i", rx, ry) - shift
+    var_x = np.einsum("ij,ij->i", rx, rx) - shift
+    var_y = np.einsum("ij,ij->i", ry, ry) - shift
+    with np.errstate(invalid="ignore", divide="ignore"):
+        denom = np.sqrt(var_x * var_y)
+        return np.where(denom > _EPS * np.maximum(shift, 1.0), cov / denom, np.nan)
+
+
+def _series_summary(series: np.ndarray, *, ratio_key: str = "ir") -> dict[str, float | int | None]:
+    values = series[np.isfinite(series)]
+    if values.size == 0:
+        return {"count": 0, "mean": None, "std": None, ratio_key: None, "t_stat": None, "positive_ratio": None}
+    mean_val = float(np.mean(values))
+    std_val = float(np.std(values, ddof=1)) if values.size > 1 else 0.0
+    ratio = mean_val / std_val if std_val > _EPS else None
+    return {
+        "count": int(values.size),
+        "mean": mean_val,
+        "std": std_val,
+        ratio_key: ratio,
+        "t_stat": ratio * math.sqrt(float(values.size)) if ratio is not None else None,
+        "positive_ratio": float(np.mean(values > 0.0)),
+    }
+
+
+def _nan_mean(values: np.ndarray) -> float | None:
+    finite = values[np.isfinite(values)]
+    return float(np.mean(finite)) if finite.size else None
+
+
+@dataclass
+class _PanelScan:
+    ic: dict[tuple[str, int], np.ndarray]
+    quantile_returns: dict[tuple[str, int], np.ndarray]
+    turnover: dict[str, np.ndarray]
+
+
+class CrossSectionalFactorEngine:
+    """Per-date cross-sectional evaluation (rank IC, quantile returns, turnover) of a panel.
+
+    Work is done in row blocks of at most ``_RANK_BLOCK_ELEMENTS`` cells so temporaries stay
+    small; inside a block each factor and each forward-return horizon is sorted once.
+    Forward-return panels are computed once per horizon and cached as float32.
+    """
+
+    def __init__(self, panel: FactorPanel, *, min_symbols: int = 20) -> None:
+        self.panel = panel
+        self.min_symbols = max(3, int(min_symbols))
+        self._forward_returns: dict[int, np.ndarray] = {}
+
+    def forward_returns(self, horizon: int) -> np.ndarray:
+        h = int(horizon)
+        if h <= 0:
+            raise ValueError("horizon must be positive.")
+        cached = self._forward_returns.get(h)
+        if cached is None:
+            close = self.panel.close
+            cached = np.full(close.shape, np.nan, dtype=np.float32)
+            if h < close.shape[0]:
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    base = np.where(close[:-h] > 0.0, close[:-h], np.nan)
+                    cached[:-h] = close[h:] / base - 1.0
+            self._forward_returns[h] = cached
+        return cached
+
+    def _factor(self, name: str) -> np.ndarray:
+        if name not in self.panel.factors:
+            raise ValueError(f"Unknown panel factor: {name}")
+        return self.panel.factors[name]
+
+    def rank_ic_and_quantiles(
+        self, factor: str, horizon: int, *, quantiles: int = 5
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Daily rank IC ``(D,)`` and mean forward return per factor quantile ``(D, Q)``.
+
+        Both use the symbols where the factor and the forward return are finite on that date;
+        dates with fewer than ``min_symbols`` such symbols are NaN.
+        """
+        scan = self._scan([factor], [int(horizon)], quantiles=quantiles)
+        return scan.ic[(factor, int(horizon))], scan.quantile_returns[(factor, int(horizon))]
+
+    def top_quantile_turnover(self, factor: str, *, quantiles: int = 5) -> np.ndarray:
+        """Share of the top-quantile names on each date that were not in it the day before."""
+        return self._scan([factor], [], quantiles=quantiles).turnover[factor]
+
+    def _scan(self, factors: list[str], horizons: list[int], *, quantiles: int) -> _PanelScan:
+        q = int(quantiles)
+        if q < 2:
+            raise ValueError("quantiles must be >= 2.")
+        values = {name: self._factor(name) for name in factors}
+        forward = {h: self.forward_returns(h) for h in horizons}
+        n_rows, n_cols = self.panel.shape
+        floor_n = max(self.min_symbols, q)
+        scan = _PanelScan(
+            ic={(f, h): np.full(n_rows, np.nan) for f in factors for h in horizons},
+            quantile_returns={(f, h): np.full((n_rows, q), np.nan) for f in factors for h in horizons},
+            turnover={f: np.full(n_rows, np.nan) for f in factors},
+        )
+        prev_top = {f: np.zeros(n_cols, dtype=bool) for f in factors}
+        for start, stop in _row_blocks(n_rows, n_cols):
+            sorted_factors = {f: _SortedRows(x[start:stop]) for f, x in values.items()}
+            sorted_forward = {h: _SortedRows(y[start:stop]) for h, y in forward.items()}
+            for f, x in values.items():
+                x_valid = np.isfinite(x[start:stop])
+                n = x_valid.sum(axis=1)
+                usable = n >= floor_n
+                ranks = sorted_factors[f].ranks(x_valid & usable[:, None])
+                with np.errstate(invalid="ignore"):
+                    top = np.floor((ranks - 1.0) * q / n[:, None]) >= q - 1
+                previous = np.vstack([prev_top[f][None, :], top[:-1]])
+                size = top.sum(axis=1)
+                kept = (top & previous).sum(axis=1)
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    scan.turnover[f][start:stop] = np.where(
+                        usable & previous.any(axis=1) & (size > 0), 1.0 - kept / size, np.nan
+                    )
+                prev_top[f] = top[-1]
+
+                for h, y in forward.items():
+                    y_block = y[start:stop]
+                    joint = x_valid & np.isfinite(y_block)
+                    n = joint.sum(axis=1)
+                    usable = n >= floor_n
+                    if not usable.any():
+                        continue
+                    joint &= usable[:, None]
+                    rx = sorted_factors[f].ranks(joint, fill=0.0)
+                    ry = sorted_forward[h].ranks(joint, fill=0.0)
+                    scan.ic[(f, h)][start:stop] = np.where(usable, _rank_pearson(rx, ry, n), np.nan)
+
+                    # Non-member cells go to an extra overflow bucket q that is dropped.
+                    with np.errstate(invalid="ignore", divide="ignore"):
+                        buckets = np.floor((rx - 1.0) * q / np.maximum(n, 1)[:, None])
+                    buckets = np.where(joint, np.clip(buckets, 0, q - 1), q).astype(np.intp)
+                    buckets += np.arange(stop - start)[:, None] * (q + 1)
+                    size = (stop - start) * (q + 1)
+                    weights = np.where(joint, y_block, 0.0).ravel()
+                    sums = np.bincount(buckets.ravel(), weights=weights, minlength=size)
+                    counts = np.bincount(buckets.ravel(), minlength=size)
+                    with np.errstate(invalid="ignore", divide="ignore"):
+                        block = (sums / counts).reshape(stop - start, q + 1)[:, :q]
+                    scan.quantile_returns[(f, h)][start:stop] = block
+        return scan
+
+    def evaluate(
+        self,
+        *,
+        factors: list[str] | None = None,
+        horizons: list[int] | tuple[int, ...] = (5, 10, 20),
+        quantiles: int = 5,
+        include_series: bool = False,
+    ) -> dict[str, Any]:
+        names = list(factors) if factors is not None else list(self.panel.factors)
+        target_horizons = [int(h) for h in horizons]
+        scan = self._scan(names, target_horizons, quantiles=quantiles)
+        dates_text = [str(d) for d in self.panel.trade_dates]
+        results: list[dict[str, Any]] = []
+        for name in names:
+            turnover = scan.turnover[name]
+            coverage = np.isfinite(self._factor(name)).sum(axis=1)
+            by_horizon: list[dict[str, Any]] = []
+            for horizon in target_horizons:
+                ic = scan.ic[(name, horizon)]
+                bucket_returns = scan.quantile_returns[(name, horizon)]
+                spread = bucket_returns[:, -1] - bucket_returns[:, 0]
+                item: dict[str, Any] = {
+                    "horizon": horizon,
+                    "rank_ic": _series_summary(ic, ratio_key="icir"),
+                    "quantile_mean_return": [_nan_mean(bucket_returns[:, k]) for k in range(bucket_returns.shape[1])],
+                    "long_short": _series_summary(spread),
+                }
+                if include_series:
+                    item["series"] = [
+                        {
+                            "trade_date": dates_text[i],
+                            "rank_ic": float(ic[i]),
+                            "long_short": float(spread[i]) if np.isfinite(spread[i]) else None,
+                        }
+                        for i in np.flatnonzero(np.isfinite(ic))
+                    ]
+                by_horizon.append(item)
+            results.append(
+                {
+                    "factor": name,
+                    "mean_coverage": float(np.mean(coverage)) if coverage.size else 0.0,
+                    "top_quantile_turnover_mean": _nan_mean(turnover),
+                    "horizons": by_horizon,
+                }
+            )
+        return {
+            "trade_date_count": int(self.panel.trade_dates.size),
+            "symbol_count": len(self.panel.symbols),
+            "quantiles": int(quantiles),
+            "min_symbols": self.min_symbols,
+            "panel_bytes": self.panel.nbytes
+            + int(sum(arr.nbytes for arr in self._forward_returns.values())),
+            "factors": results,
+        }
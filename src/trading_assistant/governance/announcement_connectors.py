@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
-from urllib import parse, request
+from urllib import parse
 from zoneinfo import ZoneInfo
 
 import pandas as pd
 
+from trading_assistant.core.http_client import get_async_http_client, get_http_client
 from trading_assistant.core.models import AnnouncementRawRecord, EventConnectorType
 
 
@@ -103,6 +105,10 @@ class AnnouncementConnector:
     def fetch(self, *, cursor: str | None, limit: int) -> AnnouncementFetchResult:  # pragma: no cover - interface
         raise NotImplementedError
 
+    async def fetch_async(self, *, cursor: str | None, limit: int) -> AnnouncementFetchResult:
+        # SDK-backed connectors (tushare/akshare) are blocking; run them off the event loop.
+        return await asyncio.to_thread(self.fetch, cursor=cursor, limit=limit)
+
 
 class FileAnnouncementConnector(AnnouncementConnector):
     def __init__(self, config: dict[str, Any]) -> None:
@@ -343,7 +349,24 @@ class HttpJsonAnnouncementConnector(AnnouncementConnector):
         self.timezone = str(config.get("timezone", "Asia/Shanghai"))
 
     def fetch(self, *, cursor: str | None, limit: int) -> AnnouncementFetchResult:
-        payload = self._load_payload(cursor=cursor, limit=limit)
+        return self._parse_payload(self._load_payload(cursor=cursor, limit=limit), cursor=cursor, limit=limit)
+
+    async def fetch_async(self, *, cursor: str | None, limit: int) -> AnnouncementFetchResult:
+        payload = self._load_local_payload()
+        if payload is None:
+            url, data = self._build_request(cursor=cursor, limit=limit)
+            resp = await get_async_http_client().request(
+                self.method,
+                url,
+                content=data,
+                headers={"Accept": "application/json", **self.headers},
+                timeout=self.timeout_seconds,
+            )
+            resp.raise_for_status()
+            payload = json.loads(resp.content.decode("utf-8"))
+        return self._parse_payload(payload, cursor=cursor, limit=limit)
+
+    def _parse_payload(self, payload: Any, *, cursor: str | None, limit: int) -> AnnouncementFetchResult:
         rows = _extract_from_path(payload, self.records_path) if self.records_path else payload
         if not isinstance(rows, list):
             raise ValueError("http_json connector response must map to a list")
@@ -428,6 +451,21 @@ class HttpJsonAnnouncementConnector(AnnouncementConnector):
         )
 
     def _load_payload(self, *, cursor: str | None, limit: int) -> Any:
+        payload = self._load_local_payload()
+        if payload is not None:
+            return payload
+        url, data = self._build_request(cursor=cursor, limit=limit)
+        resp = get_http_client().request(
+            self.method,
+            url,
+            content=data,
+            headers={"Accept": "application/json", **self.headers},
+            timeout=self.timeout_seconds,
+        )
+        resp.raise_for_status()
+        return json.loads(resp.content.decode("utf-8"))
+
+    def _load_local_payload(self) -> Any | None:
         parsed = parse.urlparse(self.url)
         if parsed.scheme == "file":
             raw_path = parse.unquote(parsed.path)
@@ -439,7 +477,9 @@ class HttpJsonAnnouncementConnector(AnnouncementConnector):
             local_path = Path(self.url.replace("local://", ""))
             if local_path.exists():
                 return json.loads(local_path.read_text(encoding="utf-8"))
+        return None
 
+    def _build_request(self, *, cursor: str | None, limit: int) -> tuple[str, bytes | None]:
         params = dict(self.query_params)
         params[self.limit_param] = str(limit)
         if cursor:
@@ -457,16 +497,7 @@ class HttpJsonAnnouncementConnector(AnnouncementConnector):
             if cursor:
                 body[self.cursor_param] = cursor
             data = json.dumps(body, ensure_ascii=False).encode("utf-8")
-
-        req = request.Request(
-            url=url,
-            method=self.method,
-            data=data,
-            headers={"Accept": "application/json", **self.headers},
-        )
-        with request.urlopen(req, timeout=self.timeout_seconds) as resp:  # noqa: S310
-            raw = resp.read().decode("utf-8")
-        return json.loads(raw)
+        return url, data
 
 
 class AkshareAnnouncementConnector(AnnouncementConnector):
@@ -6,6 +6,7 @@ import hmac
 import json
 from pathlib import Path
 import shutil
+from typing import BinaryIO, Iterable, Iterator
 from urllib import parse, request
 import zipfile
 from uuid import uuid4
@@ -64,261 +65,246 @@ class ComplianceEvidenceService:
         bundle_id = f"{req.package_prefix}_{stamp}_{uuid4().hex[:8]}"
         output_root = Path(req.output_dir)
         bundle_dir = output_root / bundle_id
-        bundle_dir.mkdir(parents=True, exist_ok=True)
-
-        files: list[ComplianceEvidenceFileItem] = []
-        summary: dict[str, object] = {
-            "retention_policy": req.retention_policy,
-            "vault_mode": req.vault_mode,
-            "kms_key_id": req.kms_key_id or "",
-            "archive_policy_version": "v1",
-            "external_worm_endpoint": req.external_worm_endpoint or self.default_external_worm_endpoint,
-            "external_kms_wrap_endpoint": req.external_kms_wrap_endpoint or self.default_external_kms_wrap_endpoint,
-        }
-        archive_policy = {
-            "policy_version": "v1",
-            "retention_policy": req.retention_policy,
-            "vault_mode": req.vault_mode,
-            "kms_key_id": req.kms_key_id or "",
-            "triggered_by": req.triggered_by,
-            "generated_at": now.isoformat(),
-        }
-        files.append(
-            self._write_json(
-                bundle_dir=bundle_dir,
-                relative_path="archive_policy.json",
-                payload=archive_policy,
+        package_path = output_root / f"{bundle_id}.zip"
+        with _EvidenceBundleWriter(
+            package_path=package_path,
+            bundle_dir=None if req.cleanup_bundle_dir else bundle_dir,
+        ) as bundle:
+            files: list[ComplianceEvidenceFileItem] = []
+            summary: dict[str, object] = {
+                "retention_policy": req.retention_policy,
+                "vault_mode": req.vault_mode,
+                "kms_key_id": req.kms_key_id or "",
+                "archive_policy_version": "v1",
+                "external_worm_endpoint": req.external_worm_endpoint or self.default_external_worm_endpoint,
+                "external_kms_wrap_endpoint": req.external_kms_wrap_endpoint or self.default_external_kms_wrap_endpoint,
+            }
+            archive_policy = {
+                "policy_version": "v1",
+                "retention_policy": req.retention_policy,
+                "vault_mode": req.vault_mode,
+                "kms_key_id": req.kms_key_id or "",
+                "triggered_by": req.triggered_by,
+                "generated_at": now.isoformat(),
+            }
+            files.append(
+                bundle.write_json(
+                    relative_path="archive_policy.json",
+                    payload=archive_policy,
+                )
             )
-        )
 
-        chain = self.audit.verify_chain(limit=req.audit_verify_limit)
-        files.append(
-            self._write_json(
-                bundle_dir=bundle_dir,
-                relative_path="audit_chain_verify.json",
-                payload=chain.model_dump(mode="json"),
+            chain = self.audit.verify_chain(limit=req.audit_verify_limit)
+            files.append(
+                bundle.write_json(
+                    relative_path="audit_chain_verify.json",
+                    payload=chain.model_dump(mode="json"),
+                )
             )
-        )
 
-        audit_events = self.audit.query(event_type=req.audit_event_type, limit=req.audit_event_limit)
-        files.append(
-            self._write_jsonl(
-                bundle_dir=bundle_dir,
+            # Audit history can be millions of rows: page through it and stream each line into the zip.
+            audit_file, audit_count = bundle.write_jsonl(
                 relative_path="audit_events.jsonl",
-                rows=[row.model_dump(mode="json") for row in audit_events],
+                rows=(
+                    row.model_dump(mode="json")
+                    for row in self.audit.iter_events(event_type=req.audit_event_type, limit=req.audit_event_limit)
+                ),
             )
-        )
-        summary["audit_events"] = len(audit_events)
-        summary["audit_chain_valid"] = chain.valid
+            files.append(audit_file)
+            summary["audit_events"] = audit_count
+            summary["audit_chain_valid"] = chain.valid
 
-        autotune_events = self.audit.query(event_type="autotune", limit=min(req.audit_event_limit, 5000))
-        files.append(
-            self._write_jsonl(
-                bundle_dir=bundle_dir,
+            autotune_file, autotune_count = bundle.write_jsonl(
                 relative_path="autotune_events.jsonl",
-                rows=[row.model_dump(mode="json") for row in autotune_events],
+                rows=(
+                    row.model_dump(mode="json")
+                    for row in self.audit.iter_events(event_type="autotune", limit=min(req.audit_event_limit, 5000))
+                ),
             )
-        )
-        summary["autotune_events"] = len(autotune_events)
-        if self.autotune is not None:
-            profiles = self.autotune.list_profiles(limit=2000)
-            rollout_rules = self.autotune.list_rollout_rules(limit=2000)
+            files.append(autotune_file)
+            summary["autotune_events"] = autotune_count
+            if self.autotune is not None:
+                profiles = self.autotune.list_profiles(limit=2000)
+                rollout_rules = self.autotune.list_rollout_rules(limit=2000)
+                files.append(
+                    bundle.write_json(
+                        relative_path="autotune_profiles.json",
+                        payload=[x.model_dump(mode="json") for x in profiles],
+                    )
+                )
+                files.append(
+                    bundle.write_json(
+                        relative_path="autotune_rollout_rules.json",
+                        payload=[x.model_dump(mode="json") for x in rollout_rules],
+                    )
+                )
+                summary["autotune_profiles"] = len(profiles)
+                summary["autotune_rollout_rules"] = len(rollout_rules)
+
+            versions = self.strategy_gov.list_versions(
+                strategy_name=req.strategy_name,
+                limit=req.strategy_version_limit,
+            )
+            decisions_payload: list[dict] = []
+            for version in versions:
+                decisions = self.strategy_gov.list_decisions(
+                    strategy_name=version.strategy_name,
+                    version=version.version,
+                    limit=500,
+                )
+                decisions_payload.append(
+                    {
+                        "strategy_name": version.strategy_name,
+                        "version": version.version,
+                        "decision_count": len(decisions),
+                        "decisions": [x.model_dump(mode="json") for x in decisions],
+                    }
+                )
             files.append(
-                self._write_json(
-                    bundle_dir=bundle_dir,
-                    relative_path="autotune_profiles.json",
-                    payload=[x.model_dump(mode="json") for x in profiles],
+                bundle.write_json(
+                    relative_path="strategy_versions.json",
+                    payload=[x.model_dump(mode="json") for x in versions],
                 )
             )
             files.append(
-                self._write_json(
-                    bundle_dir=bundle_dir,
-                    relative_path="autotune_rollout_rules.json",
-                    payload=[x.model_dump(mode="json") for x in rollout_rules],
+                bundle.write_json(
+                    relative_path="strategy_decisions.json",
+                    payload=decisions_payload,
                 )
             )
-            summary["autotune_profiles"] = len(profiles)
-            summary["autotune_rollout_rules"] = len(rollout_rules)
+            summary["strategy_versions"] = len(versions)
 
-        versions = self.strategy_gov.list_versions(
-            strategy_name=req.strategy_name,
-            limit=req.strategy_version_limit,
-        )
-        decisions_payload: list[dict] = []
-        for version in versions:
-            decisions = self.strategy_gov.list_decisions(
-                strategy_name=version.strategy_name,
-                version=version.version,
-                limit=500,
+            connector_overview = self.event_connector.overview(limit=1000)
+            source_states = self.event_connector.list_source_states(
+                connector_name=req.connector_name,
+                limit=5000,
             )
-            decisions_payload.append(
-                {
-                    "strategy_name": version.strategy_name,
-                    "version": version.version,
-                    "decision_count": len(decisions),
-                    "decisions": [x.model_dump(mode="json") for x in decisions],
-                }
+            sla_report = self.event_connector.evaluate_sla(include_disabled=True)
+            sla_states = self.event_connector.list_sla_alert_states(
+                connector_name=req.connector_name,
+                open_only=False,
+                limit=req.connector_state_limit,
             )
-        files.append(
-            self._write_json(
-                bundle_dir=bundle_dir,
-                relative_path="strategy_versions.json",
-                payload=[x.model_dump(mode="json") for x in versions],
+            runs = self.event_connector.list_runs(
+                connector_name=req.connector_name,
+                limit=req.connector_run_limit,
             )
-        )
-        files.append(
-            self._write_json(
-                bundle_dir=bundle_dir,
-                relative_path="strategy_decisions.json",
-                payload=decisions_payload,
+            failures = self.event_connector.list_failures(
+                connector_name=req.connector_name,
+                status=None,
+                error_keyword=None,
+                limit=req.connector_failure_limit,
             )
-        )
-        summary["strategy_versions"] = len(versions)
-
-        connector_overview = self.event_connector.overview(limit=1000)
-        source_states = self.event_connector.list_source_states(
-            connector_name=req.connector_name,
-            limit=5000,
-        )
-        sla_report = self.event_connector.evaluate_sla(include_disabled=True)
-        sla_states = self.event_connector.list_sla_alert_states(
-            connector_name=req.connector_name,
-            open_only=False,
-            limit=req.connector_state_limit,
-        )
-        runs = self.event_connector.list_runs(
-            connector_name=req.connector_name,
-            limit=req.connector_run_limit,
-        )
-        failures = self.event_connector.list_failures(
-            connector_name=req.connector_name,
-            status=None,
-            error_keyword=None,
-            limit=req.connector_failure_limit,
-        )
-        coverage = self.event_connector.coverage_summary(lookback_days=req.event_lookback_days)
+            coverage = self.event_connector.coverage_summary(lookback_days=req.event_lookback_days)
 
-        files.append(
-            self._write_json(
-                bundle_dir=bundle_dir,
-                relative_path="event_connector_overview.json",
-                payload=connector_overview.model_dump(mode="json"),
+            files.append(
+                bundle.write_json(
+                    relative_path="event_connector_overview.json",
+                    payload=connector_overview.model_dump(mode="json"),
+                )
             )
-        )
-        files.append(
-            self._write_json(
-                bundle_dir=bundle_dir,
-                relative_path="event_connector_source_states.json",
-                payload=[x.model_dump(mode="json") for x in source_states],
+            files.append(
+                bundle.write_json(
+                    relative_path="event_connector_source_states.json",
+                    payload=[x.model_dump(mode="json") for x in source_states],
+                )
             )
-        )
-        files.append(
-            self._write_json(
-                bundle_dir=bundle_dir,
-                relative_path="event_connector_sla_report.json",
-                payload=sla_report.model_dump(mode="json"),
+            files.append(
+                bundle.write_json(
+                    relative_path="event_connector_sla_report.json",
+                    payload=sla_report.model_dump(mode="json"),
+                )
             )
-        )
-        files.append(
-            self._write_json(
-                bundle_dir=bundle_dir,
-                relative_path="event_connector_sla_states.json",
-                payload=[x.model_dump(mode="json") for x in sla_states],
+            files.append(
+                bundle.write_json(
+                    relative_path="event_connector_sla_states.json",
+                    payload=[x.model_dump(mode="json") for x in sla_states],
+                )
             )
-        )
-        files.append(
-            self._write_json(
-                bundle_dir=bundle_dir,
-                relative_path="event_connector_runs.json",
-                payload=[x.model_dump(mode="json") for x in runs],
+            files.append(
+                bundle.write_json(
+                    relative_path="event_connector_runs.json",
+                    payload=[x.model_dump(mode="json") for x in runs],
+                )
             )
-        )
-        files.append(
-            self._write_json(
-                bundle_dir=bundle_dir,
-                relative_path="event_connector_failures.json",
-                payload=[x.model_dump(mode="json") for x in failures],
+            files.append(
+                bundle.write_json(
+                    relative_path="event_connector_failures.json",
+                    payload=[x.model_dump(mode="json") for x in failures],
+                )
             )
-        )
-        files.append(
-            self._write_json(
-                bundle_dir=bundle_dir,
-                relative_path="event_coverage_summary.json",
-                payload=coverage.model_dump(mode="json"),
+            files.append(
+                bundle.write_json(
+                    relative_path="event_coverage_summary.json",
+                    payload=coverage.model_dump(mode="json"),
+                )
             )
-        )
-        summary["connector_runs"] = len(runs)
-        summary["connector_failures"] = len(failures)
-        summary["connector_open_sla_states"] = sum(1 for x in sla_states if x.is_open)
-
-        active_ruleset = self.event_nlp.get_active_ruleset(include_rules=req.include_ruleset_body)
-        drift_monitor = self.event_nlp.drift_monitor(
-            source_name=req.source_name,
-            limit=req.nlp_monitor_limit,
-        )
-        drift_snapshots = self.event_nlp.list_drift_snapshots(
-            source_name=req.source_name,
-            limit=req.nlp_snapshot_limit,
-        )
-        files.append(
-            self._write_json(
-                bundle_dir=bundle_dir,
-                relative_path="event_nlp_active_ruleset.json",
-                payload=active_ruleset.model_dump(mode="json") if active_ruleset else None,
+            summary["connector_runs"] = len(runs)
+            summary["connector_failures"] = len(failures)
+            summary["connector_open_sla_states"] = sum(1 for x in sla_states if x.is_open)
+
+            active_ruleset = self.event_nlp.get_active_ruleset(include_rules=req.include_ruleset_body)
+            drift_monitor = self.event_nlp.drift_monitor(
+                source_name=req.source_name,
+                limit=req.nlp_monitor_limit,
             )
-        )
-        files.append(
-            self._write_json(
-                bundle_dir=bundle_dir,
-                relative_path="event_nlp_drift_monitor.json",
-                payload=drift_monitor.model_dump(mode="json"),
+            drift_snapshots = self.event_nlp.list_drift_snapshots(
+                source_name=req.source_name,
+                limit=req.nlp_snapshot_limit,
             )
-        )
-        files.append(
-            self._write_json(
-                bundle_dir=bundle_dir,
-                relative_path="event_nlp_drift_snapshots.json",
-                payload=[x.model_dump(mode="json") for x in drift_snapshots],
+            files.append(
+                bundle.write_json(
+                    relative_path="event_nlp_active_ruleset.json",
+                    payload=active_ruleset.model_dump(mode="json") if active_ruleset else None,
+                )
             )
-        )
-        summary["nlp_drift_snapshots"] = len(drift_snapshots)
-        summary["nlp_latest_risk_level"] = drift_monitor.latest_risk_level.value
-
-        if req.include_feedback_summary:
-            end_date = now.date()
-            start_date = end_date - timedelta(days=max(1, req.event_lookback_days) - 1)
-            feedback_summary = self.event_nlp.feedback_summary(
-                source_name=req.source_name,
-                start_date=start_date,
-                end_date=end_date,
+            files.append(
+                bundle.write_json(
+                    relative_path="event_nlp_drift_monitor.json",
+                    payload=drift_monitor.model_dump(mode="json"),
+                )
             )
             files.append(
-                self._write_json(
-                    bundle_dir=bundle_dir,
-                    relative_path="event_nlp_feedback_summary.json",
-                    payload=feedback_summary.model_dump(mode="json"),
+                bundle.write_json(
+                    relative_path="event_nlp_drift_snapshots.json",
+                    payload=[x.model_dump(mode="json") for x in drift_snapshots],
                 )
             )
-            summary["nlp_feedback_samples"] = feedback_summary.sample_size
-
-        manifest_payload = {
-            "bundle_id": bundle_id,
-            "generated_at": now.isoformat(),
-            "request": req.model_dump(mode="json"),
-            "summary": summary,
-            "files": [x.model_dump(mode="json") for x in files],
-        }
-        files.append(
-            self._write_json(
-                bundle_dir=bundle_dir,
-                relative_path="manifest.json",
-                payload=manifest_payload,
+            summary["nlp_drift_snapshots"] = len(drift_snapshots)
+            summary["nlp_latest_risk_level"] = drift_monitor.latest_risk_level.value
+
+            if req.include_feedback_summary:
+                end_date = now.date()
+                start_date = end_date - timedelta(days=max(1, req.event_lookback_days) - 1)
+                feedback_summary = self.event_nlp.feedback_summary(
+                    source_name=req.source_name,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+                files.append(
+                    bundle.write_json(
+                        relative_path="event_nlp_feedback_summary.json",
+                        payload=feedback_summary.model_dump(mode="json"),
+                    )
+                )
+                summary["nlp_feedback_samples"] = feedback_summary.sample_size
+
+            manifest_payload = {
+                "bundle_id": bundle_id,
+                "generated_at": now.isoformat(),
+                "request": req.model_dump(mode="json"),
+                "summary": summary,
+                "files": [x.model_dump(mode="json") for x in files],
+            }
+            files.append(
+                bundle.write_json(
+                    relative_path="manifest.json",
+                    payload=manifest_payload,
+                )
             )
-        )
 
-        package_path = output_root / f"{bundle_id}.zip"
-        package_size = self._zip_bundle(bundle_dir=bundle_dir, package_path=package_path)
-        package_sha256 = hashlib.sha256(package_path.read_bytes()).hexdigest()
+        package_size = bundle.package_size
+        package_sha256 = bundle.package_sha256
         summary["package_sha256"] = package_sha256
         summary["package_size_bytes"] = package_size
 
@@ -500,7 +486,7 @@ class ComplianceEvidenceService:
                 message="package file does not exist",
             )
 
-        package_sha256 = hashlib.sha256(package_path.read_bytes()).hexdigest()
+        package_sha256 = _file_sha256(package_path)
         manifest_exists = False
         manifest_valid = False
         issues: list[str] = []
@@ -611,7 +597,7 @@ class ComplianceEvidenceService:
         if not package_path.exists() or not package_path.is_file():
             raise FileNotFoundError(f"package file does not exist: {req.package_path}")
 
-        package_sha256 = hashlib.sha256(package_path.read_bytes()).hexdigest()
+        package_sha256 = _file_sha256(package_path)
         secret = (req.signing_secret or self.default_signing_secret or "").strip()
         if not secret:
             raise ValueError("signing secret is empty")
@@ -815,54 +801,6 @@ class ComplianceEvidenceService:
             signed_at=signed_at,
         )
 
-    @staticmethod
-    def _write_json(
-        *,
-        bundle_dir: Path,
-        relative_path: str,
-        payload: object,
-    ) -> ComplianceEvidenceFileItem:
-        path = bundle_dir / relative_path
-        path.parent.mkdir(parents=True, exist_ok=True)
-        raw = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
-        path.write_bytes(raw)
-        return ComplianceEvidenceFileItem(
-            name=path.name,
-            relative_path=str(Path(relative_path).as_posix()),
-            size_bytes=len(raw),
-            sha256=hashlib.sha256(raw).hexdigest(),
-        )
-
-    @staticmethod
-    def _write_jsonl(
-        *,
-        bundle_dir: Path,
-        relative_path: str,
-        rows: list[dict],
-    ) -> ComplianceEvidenceFileItem:
-        path = bundle_dir / relative_path
-        path.parent.mkdir(parents=True, exist_ok=True)
-        lines = [json.dumps(row, ensure_ascii=False) for row in rows]
-        raw = ("\n".join(lines) + ("\n" if lines else "")).encode("utf-8")
-        path.write_bytes(raw)
-        return ComplianceEvidenceFileItem(
-            name=path.name,
-            relative_path=str(Path(relative_path).as_posix()),
-            size_bytes=len(raw),
-            sha256=hashlib.sha256(raw).hexdigest(),
-        )
-
-    @staticmethod
-    def _zip_bundle(*, bundle_dir: Path, package_path: Path) -> int:
-        package_path.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(package_path, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-            for path in sorted(bundle_dir.rglob("*")):
-                if not path.is_file():
-                    continue
-                arcname = path.relative_to(bundle_dir).as_posix()
-                zf.write(path, arcname=arcname)
-        return package_path.stat().st_size
-
     @staticmethod
     def _load_countersign_entries(path: Path) -> list[ComplianceEvidenceCounterSignEntry]:
         if not path.exists() or not path.is_file():
@@ -898,3 +836,146 @@ class ComplianceEvidenceService:
             path.chmod(0o444)
         except Exception:  # noqa: BLE001
             return
+
+
+_STREAM_CHUNK_CHARS = 64 * 1024
+
+
+def _file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fp:
+        while chunk := fp.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _HashingSink:
+    """Write-only file wrapper that hashes and counts bytes on their way to disk.
+
+    It has no ``seek``/``tell``, so ``zipfile`` writes each entry followed by a data
+    descriptor instead of seeking back, and the package digest is known once it closes.
+    """
+
+    def __init__(self, raw: BinaryIO) -> None:
+        self._raw = raw
+        self._sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self._raw.write(data)
+        self._sha256.update(data)
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        self._raw.flush()
+
+    def hexdigest(self) -> str:
+        return self._sha256.hexdigest()
+
+
+class _EvidenceBundleWriter:
+    """Streams bundle files into the zip package as they are produced.
+
+    Each file is encoded in bounded chunks, hashed incrementally and written directly into
+    its zip entry (and, unless ``bundle_dir`` is None, to a loose copy), so memory stays
+    flat however large the audit history is. On error the partial package is removed.
+    """
+
+    def __init__(self, *, package_path: Path, bundle_dir: Path | None) -> None:
+        self.package_path = package_path
+        self.bundle_dir = bundle_dir
+        self.package_size = 0
+        self.package_sha256 = ""
+        self._fp: BinaryIO | None = None
+        self._sink: _HashingSink | None = None
+        self._zf: zipfile.ZipFile | None = None
+
+    def __enter__(self) -> _EvidenceBundleWriter:
+        self.package_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.bundle_dir is not None:
+            self.bundle_dir.mkdir(parents=True, exist_ok=True)
+        self._fp = self.package_path.open("wb")
+        self._sink = _HashingSink(self._fp)
+        self._zf = zipfile.ZipFile(self._sink, mode="w", compression=zipfile.ZIP_DEFLATED)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        assert self._zf is not None and self._fp is not None and self._sink is not None
+        try:
+            self._zf.close()
+        finally:
+            self._fp.close()
+        if exc_type is not None:
+            self.package_path.unlink(missing_ok=True)
+            return
+        self.package_size = self._sink.size
+        self.package_sha256 = self._sink.hexdigest()
+
+    def write_json(self, *, relative_path: str, payload: object) -> ComplianceEvidenceFileItem:
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+        return self._write_entry(relative_path, encoder.iterencode(payload))
+
+    def write_jsonl(
+        self,
+        *,
+        relative_path: str,
+        rows: Iterable[dict],
+    ) -> tuple[ComplianceEvidenceFileItem, int]:
+        count = 0
+
+        def _lines() -> Iterator[str]:
+            nonlocal count
+            for row in rows:
+                count += 1
+                yield json.dumps(row, ensure_ascii=False)
+                yield "\n"
+
+        item = self._write_entry(relative_path, _lines())
+        return item, count
+
+    def _write_entry(self, relative_path: str, pieces: Iterable[str]) -> ComplianceEvidenceFileItem:
+        assert self._zf is not None
+        arcname = Path(relative_path).as_posix()
+        info = zipfile.ZipInfo(arcname, date_time=datetime.now().timetuple()[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = 0o644 << 16
+        digest = hashlib.sha256()
+        size = 0
+        loose = None
+        if self.bundle_dir is not None:
+            loose_path = self.bundle_dir / relative_path
+            loose_path.parent.mkdir(parents=True, exist_ok=True)
+            loose = loose_path.open("wb")
+        try:
+            # force_zip64: the entry size is unknown up front and audit exports may exceed 4 GiB.
+            with self._zf.open(info, mode="w", force_zip64=True) as entry:
+                buffer: list[str] = []
+                buffered = 0
+                for piece in pieces:
+                    buffer.append(piece)
+                    buffered += len(piece)
+                    if buffered < _STREAM_CHUNK_CHARS:
+                        continue
+                    size += self._emit("".join(buffer).encode("utf-8"), entry, digest, loose)
+                    buffer.clear()
+                    buffered = 0
+                if buffer:
+                    size += self._emit("".join(buffer).encode("utf-8"), entry, digest, loose)
+        finally:
+            if loose is not None:
+                loose.close()
+        return ComplianceEvidenceFileItem(
+            name=Path(relative_path).name,
+            relative_path=arcname,
+            size_bytes=size,
+            sha256=digest.hexdigest(),
+        )
+
+    @staticmethod
+    def _emit(raw: bytes, entry: BinaryIO, digest: hashlib._Hash, loose: BinaryIO | None) -> int:
+        entry.write(raw)
+        digest.update(raw)
+        if loose is not None:
+            loose.write(raw)
+        return len(raw)
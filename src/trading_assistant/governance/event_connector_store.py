@@ -22,6 +22,7 @@ from trading_assistant.core.models import (
     EventCoverageSourceItem,
     EventOpsCoverageSummary,
 )
+from trading_assistant.core.sqlite import SQLiteConnectionPool
 
 
 def _to_iso(dt: datetime | None) -> str | None:
@@ -42,12 +43,11 @@ class EventConnectorStore:
     def __init__(self, db_path: str) -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.db_path)
         self._init_schema()
 
     def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return self._pool.connection()
 
     def _init_schema(self) -> None:
         with self._conn() as conn:
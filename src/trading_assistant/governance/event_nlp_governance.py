@@ -501,10 +501,19 @@ class EventNLPGovernanceService:
         scoped = [x for x in snapshots if x.created_at >= start]
 
         points: list[EventNLPSLOPoint] = []
-        current = start.replace(minute=0, second=0, microsecond=0)
+        first = start.replace(minute=0, second=0, microsecond=0)
+        step = timedelta(hours=bucket)
+        # Assign each snapshot to its bucket once instead of rescanning all snapshots per bucket.
+        bucketed: dict[int, list[EventNLPDriftSnapshotRecord]] = {}
+        for snapshot in scoped:
+            if snapshot.created_at >= first:
+                bucketed.setdefault((snapshot.created_at - first) // step, []).append(snapshot)
+        current = first
+        index = 0
         while current < now:
-            next_dt = current + timedelta(hours=bucket)
-            rows = [x for x in scoped if current <= x.created_at < next_dt]
+            next_dt = current + step
+            rows = bucketed.get(index, [])
+            index += 1
             snapshots_count = len(rows)
             warning_count = 0
             critical_count = 0
@@ -846,76 +855,38 @@ class EventNLPGovernanceService:
         end_date: date,
         fallback_ruleset_version: str,
     ) -> EventNLPWindowMetrics:
-        rows = self.store.load_event_rows_for_metrics(
+        # Merges the per-day sketches maintained at ingest instead of rescanning event rows.
+        sketch = self.store.load_metric_sketch(
             source_name=source_name,
             start_date=start_date,
             end_date=end_date,
         )
-        sample_size = len(rows)
-        if sample_size == 0:
+        sample_size = sketch.sample_size
+        if sample_size <= 0:
             return EventNLPWindowMetrics(
                 source_name=source_name,
                 ruleset_version=fallback_ruleset_version,
                 sample_size=0,
             )
 
-        event_type_counter: Counter[str] = Counter()
-        ruleset_counter: Counter[str] = Counter()
-        scores: list[float] = []
-        hit_count = 0
-        positive = 0
-        negative = 0
-        neutral = 0
-
-        for row in rows:
-            event_type = str(row["event_type"])
-            event_type_counter[event_type] += 1
-            polarity = str(row["polarity"])
-            if polarity == "POSITIVE":
-                positive += 1
-            elif polarity == "NEGATIVE":
-                negative += 1
-            else:
-                neutral += 1
-
-            score = float(row["score"])
-            if math.isfinite(score):
-                scores.append(score)
-
-            metadata = self._safe_json_dict(str(row["metadata"]))
-            version = str(metadata.get("nlp_ruleset_version") or "").strip()
-            if version:
-                ruleset_counter[version] += 1
-            matched_raw = str(metadata.get("matched_rules") or "").strip()
-            matched_rules = [x.strip() for x in matched_raw.split(",") if x.strip()]
-            if matched_rules and event_type != "generic_announcement":
-                hit_count += 1
-
-        if not scores:
-            scores = [0.0]
-        scores_sorted = sorted(scores)
-
-        ruleset_version = "unknown"
-        if ruleset_counter:
-            ruleset_version = ruleset_counter.most_common(1)[0][0]
+        ruleset_version = sketch.top_ruleset() or "unknown"
         if ruleset_version == "unknown":
             ruleset_version = fallback_ruleset_version
 
-        top_event_types = dict(event_type_counter.most_common(8))
         return EventNLPWindowMetrics(
             source_name=source_name,
             ruleset_version=ruleset_version,
             sample_size=sample_size,
-            hit_count=hit_count,
-            hit_rate=round(hit_count / sample_size, 6),
-            score_mean=round(sum(scores_sorted) / len(scores_sorted), 6),
-            score_p10=round(self._quantile(scores_sorted, 0.1), 6),
-            score_p50=round(self._quantile(scores_sorted, 0.5), 6),
-            score_p90=round(self._quantile(scores_sorted, 0.9), 6),
-            positive_ratio=round(positive / sample_size, 6),
-            negative_ratio=round(negative / sample_size, 6),
-            neutral_ratio=round(neutral / sample_size, 6),
-            top_event_types=top_event_types,
+            hit_count=sketch.hit_count,
+            hit_rate=round(sketch.hit_count / sample_size, 6),
+            score_mean=round(sketch.score_mean(), 6),
+            score_p10=round(sketch.score_quantile(0.1), 6),
+            score_p50=round(sketch.score_quantile(0.5), 6),
+            score_p90=round(sketch.score_quantile(0.9), 6),
+            positive_ratio=round(sketch.positive / sample_size, 6),
+            negative_ratio=round(sketch.negative / sample_size, 6),
+            neutral_ratio=round(sketch.neutral / sample_size, 6),
+            top_event_types=sketch.top_event_types(8),
         )
 
     def _contribution_window(
@@ -967,33 +938,8 @@ class EventNLPGovernanceService:
         baseline_start = baseline_end - timedelta(days=days - 1)
         return baseline_start, baseline_end
 
-    @staticmethod
-    def _quantile(values_sorted: list[float], q: float) -> float:
-        if not values_sorted:
-            return 0.0
-        if len(values_sorted) == 1:
-            return float(values_sorted[0])
-        q = max(0.0, min(1.0, q))
-        pos = (len(values_sorted) - 1) * q
-        lo = int(math.floor(pos))
-        hi = int(math.ceil(pos))
-        if lo == hi:
-            return float(values_sorted[lo])
-        ratio = pos - lo
-        return float(values_sorted[lo] + (values_sorted[hi] - values_sorted[lo]) * ratio)
-
     @staticmethod
     def _optional_delta_trend(latest: float | None, first: float | None) -> float | None:
         if latest is None or first is None:
             return None
         return round(latest - first, 6)
-
-    @staticmethod
-    def _safe_json_dict(raw: str) -> dict:
-        try:
-            value = json.loads(raw)
-            if isinstance(value, dict):
-                return value
-        except Exception:  # noqa: BLE001
-            pass
-        return {}
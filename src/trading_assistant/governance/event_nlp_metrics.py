@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from itertools import accumulate
+import json
+import math
+import sqlite3
+
+# Scores are validated into [0, 1]; one histogram bin per 1e-4 keeps every quantile within
+# 5e-5 of the exact value (exact for scores with <= 4 decimals) and a day's sketch bounded.
+SCORE_SKETCH_BINS = 10_000
+# Score sums are kept as integers so deltas (re-ingested events) subtract without drift.
+_SCORE_SUM_SCALE = 10**9
+_GENERIC_EVENT_TYPE = "generic_announcement"
+
+
+@dataclass
+class EventNLPMetricSketch:
+    """Mergeable NLP drift metrics for one (source, day) or any union of them.
+
+    Everything is a count or an integer sum, so merging two sketches gives exactly the sketch
+    of the combined events, and an event can be removed by adding it with ``weight=-1``.
+    Label counters also keep the latest publish time seen, which reproduces the
+    newest-first tie-break of the former row scan.
+    """
+
+    sample_size: int = 0
+    hit_count: int = 0
+    positive: int = 0
+    negative: int = 0
+    neutral: int = 0
+    score_count: int = 0
+    score_sum_units: int = 0
+    score_bins: dict[int, int] = field(default_factory=dict)
+    event_types: dict[str, list] = field(default_factory=dict)
+    rulesets: dict[str, list] = field(default_factory=dict)
+
+    def add_event(
+        self,
+        *,
+        event_type: str,
+        polarity: str,
+        score: float,
+        metadata: dict,
+        publish_time: str,
+        weight: int = 1,
+    ) -> None:
+        self.sample_size += weight
+        _bump(self.event_types, event_type, weight, publish_time)
+        if polarity == "POSITIVE":
+            self.positive += weight
+        elif polarity == "NEGATIVE":
+            self.negative += weight
+        else:
+            self.neutral += weight
+
+        score = float(score)
+        if math.isfinite(score):
+            self.score_count += weight
+            self.score_sum_units += weight * round(score * _SCORE_SUM_SCALE)
+            key = round(min(1.0, max(0.0, score)) * SCORE_SKETCH_BINS)
+            self.score_bins[key] = self.score_bins.get(key, 0) + weight
+
+        version = str(metadata.get("nlp_ruleset_version") or "").strip()
+        if version:
+            _bump(self.rulesets, version, weight, publish_time)
+        matched_raw = str(metadata.get("matched_rules") or "").strip()
+        if any(x.strip() for x in matched_raw.split(",")) and event_type != _GENERIC_EVENT_TYPE:
+            self.hit_count += weight
+
+    def merge(self, other: EventNLPMetricSketch) -> EventNLPMetricSketch:
+        self.sample_size += other.sample_size
+        self.hit_count += other.hit_count
+        self.positive += other.positive
+        self.negative += other.negative
+        self.neutral += other.neutral
+        self.score_count += other.score_count
+        self.score_sum_units += other.score_sum_units
+        for key, count in other.score_bins.items():
+            self.score_bins[key] = self.score_bins.get(key, 0) + count
+        for name, (count, latest) in other.event_types.items():
+            _bump(self.event_types, name, count, latest)
+        for name, (count, latest) in other.rulesets.items():
+            _bump(self.rulesets, name, count, latest)
+        return self
+
+    def score_mean(self) -> float:
+        if self.score_count <= 0:
+            return 0.0
+        return self.score_sum_units / _SCORE_SUM_SCALE / self.score_count
+
+    def score_quantile(self, q: float) -> float:
+        """Linear-interpolated quantile of the binned scores (same rule as a sorted list)."""
+        keys = sorted(k for k, v in self.score_bins.items() if v > 0)
+        if not keys:
+            return 0.0
+        cumulative = list(accumulate(self.score_bins[k] for k in keys))
+        pos = (cumulative[-1] - 1) * max(0.0, min(1.0, q))
+        lo = int(math.floor(pos))
+        hi = int(math.ceil(pos))
+        lo_value = keys[bisect_right(cumulative, lo)] / SCORE_SKETCH_BINS
+        if lo == hi:
+            return lo_value
+        hi_value = keys[bisect_right(cumulative, hi)] / SCORE_SKETCH_BINS
+        return lo_value + (hi_value - lo_value) * (pos - lo)
+
+    def top_event_types(self, n: int) -> dict[str, int]:
+        return dict(_most_common(self.event_types)[:n])
+
+    def top_ruleset(self) -> str | None:
+        ranked = _most_common(self.rulesets)
+        return ranked[0][0] if ranked else None
+
+
+def _bump(counter: dict[str, list], name: str, count: int, latest: str) -> None:
+    entry = counter.get(name)
+    if entry is None:
+        counter[name] = [count, latest]
+        return
+    entry[0] += count
+    if latest > entry[1]:
+        entry[1] = latest
+
+
+def _most_common(counter: dict[str, list]) -> list[tuple[str, int]]:
+    items = [(name, int(count), str(latest)) for name, (count, latest) in counter.items() if count > 0]
+    items.sort(key=lambda x: (x[1], x[2]), reverse=True)
+    return [(name, count) for name, count, _ in items]
+
+
+def ensure_daily_metrics_schema(conn: sqlite3.Connection) -> None:
+    """Create the daily sketch table; backfill it from ``event_records`` when it is new."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'event_nlp_daily_metrics'"
+    ).fetchone()
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS event_nlp_daily_metrics (
+            source_name TEXT NOT NULL,
+            metric_date TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            sample_size INTEGER NOT NULL,
+            hit_count INTEGER NOT NULL,
+            positive_count INTEGER NOT NULL,
+            negative_count INTEGER NOT NULL,
+            neutral_count INTEGER NOT NULL,
+            score_count INTEGER NOT NULL,
+            score_sum_units INTEGER NOT NULL,
+            score_bins_json TEXT NOT NULL,
+            event_types_json TEXT NOT NULL,
+            rulesets_json TEXT NOT NULL,
+            PRIMARY KEY(source_name, metric_date)
+        )
+        """
+    )
+    if exists is None:
+        has_events = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'event_records'"
+        ).fetchone()
+        if has_events is not None:
+            rebuild_daily_metrics(conn)
+
+
+def rebuild_daily_metrics(conn: sqlite3.Connection) -> int:
+    """Recompute every daily sketch from ``event_records``; returns the number of sketches."""
+    sketches: dict[tuple[str, str], EventNLPMetricSketch] = {}
+    cursor = conn.execute(
+        "SELECT source_name, event_type, publish_time, polarity, score, metadata FROM event_records"
+    )
+    for row in cursor:
+        publish_time = str(row["publish_time"])
+        key = (str(row["source_name"]), publish_time[:10])
+        sketch = sketches.get(key)
+        if sketch is None:
+            sketch = sketches[key] = EventNLPMetricSketch()
+        sketch.add_event(
+            event_type=str(row["event_type"]),
+            polarity=str(row["polarity"]),
+            score=float(row["score"]),
+            metadata=_json_dict(str(row["metadata"])),
+            publish_time=publish_time,
+        )
+    conn.execute("DELETE FROM event_nlp_daily_metrics")
+    now = datetime.now(timezone.utc).isoformat()
+    for (source_name, metric_date), sketch in sketches.items():
+        _write_sketch(conn, source_name, metric_date, sketch, now)
+    return len(sketches)
+
+
+def apply_daily_metric_deltas(
+    conn: sqlite3.Connection,
+    deltas: dict[tuple[str, str], EventNLPMetricSketch],
+) -> None:
+    """Merge per-(source, day) deltas into the stored sketches inside the caller's transaction."""
+    now = datetime.now(timezone.utc).isoformat()
+    for (source_name, metric_date), delta in deltas.items():
+        row = conn.execute(
+            "SELECT * FROM event_nlp_daily_metrics WHERE source_name = ? AND metric_date = ?",
+            (source_name, metric_date),
+        ).fetchone()
+        merged = _to_sketch(row) if row is not None else EventNLPMetricSketch()
+        merged.merge(delta)
+        _write_sketch(conn, source_name, metric_date, merged, now)
+
+
+def load_window_sketch(
+    conn: sqlite3.Connection,
+    *,
+    source_name: str | None,
+    start_date: date,
+    end_date: date,
+) -> EventNLPMetricSketch:
+    sql = """
+        SELECT * FROM event_nlp_daily_metrics
+        WHERE metric_date >= ? AND metric_date <= ?
+    """
+    params: list[str] = [start_date.isoformat(), end_date.isoformat()]
+    if source_name:
+        sql += " AND source_name = ?"
+        params.append(source_name)
+    out = EventNLPMetricSketch()
+    for row in conn.execute(sql, params):
+        out.merge(_to_sketch(row))
+    return out
+
+
+def _write_sketch(
+    conn: sqlite3.Connection,
+    source_name: str,
+    metric_date: str,
+    sketch: EventNLPMetricSketch,
+    now: str,
+) -> None:
+    if sketch.sample_size <= 0:
+        conn.execute(
+            "DELETE FROM event_nlp_daily_metrics WHERE source_name = ? AND metric_date = ?",
+            (source_name, metric_date),
+        )
+        return
+    conn.execute(
+        """
+        INSERT OR REPLACE INTO event_nlp_daily_metrics(
+            source_name, metric_date, updated_at, sample_size, hit_count, positive_count, negative_count,
+            neutral_count, score_count, score_sum_units, score_bins_json, event_types_json, rulesets_json
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            source_name,
+            metric_date,
+            now,
+            sketch.sample_size,
+            sketch.hit_count,
+            sketch.positive,
+            sketch.negative,
+            sketch.neutral,
+            sketch.score_count,
+            sketch.score_sum_units,
+            json.dumps({str(k): v for k, v in sorted(sketch.score_bins.items()) if v}, separators=(",", ":")),
+            json.dumps({k: v for k, v in sketch.event_types.items() if v[0]}, ensure_ascii=False),
+            json.dumps({k: v for k, v in sketch.rulesets.items() if v[0]}, ensure_ascii=False),
+        ),
+    )
+
+
+def _to_sketch(row: sqlite3.Row) -> EventNLPMetricSketch:
+    return EventNLPMetricSketch(
+        sample_size=int(row["sample_size"]),
+        hit_count=int(row["hit_count"]),
+        positive=int(row["positive_count"]),
+        negative=int(row["negative_count"]),
+        neutral=int(row["neutral_count"]),
+        score_count=int(row["score_count"]),
+        score_sum_units=int(row["score_sum_units"]),
+        score_bins={int(k): int(v) for k, v in json.loads(str(row["score_bins_json"])).items()},
+        event_types={str(k): [int(v[0]), str(v[1])] for k, v in json.loads(str(row["event_types_json"])).items()},
+        rulesets={str(k): [int(v[0]), str(v[1])] for k, v in json.loads(str(row["rulesets_json"])).items()},
+    )
+
+
+def _json_dict(raw: str) -> dict:
+    try:
+        value = json.loads(raw)
+        if isinstance(value, dict):
+            return value
+    except Exception:  # noqa: BLE001
+        pass
+    return {}
@@ -20,6 +20,13 @@ from trading_assistant.core.models import (
     EventNLPRulesetUpsertRequest,
     EventNLPWindowMetrics,
 )
+from trading_assistant.core.sqlite import SQLiteConnectionPool
+from trading_assistant.governance.event_nlp_metrics import (
+    EventNLPMetricSketch,
+    ensure_daily_metrics_schema,
+    load_window_sketch,
+    rebuild_daily_metrics,
+)
 
 
 def _to_iso(dt: datetime) -> str:
@@ -40,12 +47,11 @@ class EventNLPStore:
     def __init__(self, db_path: str) -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.db_path)
         self._init_schema()
 
     def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return self._pool.connection()
 
     def _init_schema(self) -> None:
         with self._conn() as conn:
@@ -225,6 +231,7 @@ class EventNLPStore:
                 ON event_nlp_label_snapshots(source_name, created_at DESC)
                 """
             )
+            ensure_daily_metrics_schema(conn)
 
     @staticmethod
     def _ensure_columns(
@@ -339,27 +346,19 @@ class EventNLPStore:
             return None
         return ruleset.version, ruleset.rules
 
-    def load_event_rows_for_metrics(
+    def load_metric_sketch(
         self,
         *,
         source_name: str | None,
         start_date: date,
         end_date: date,
-        limit: int = 200000,
-    ) -> list[sqlite3.Row]:
-        sql = """
-            SELECT source_name, event_type, polarity, score, confidence, metadata
-            FROM event_records
-            WHERE publish_time >= ? AND publish_time <= ?
-        """
-        params: list[str | int] = [_to_iso_date_start(start_date), _to_iso_date_end(end_date)]
-        if source_name:
-            sql += " AND source_name = ?"
-            params.append(source_name)
-        sql += " ORDER BY publish_time DESC LIMIT ?"
-        params.append(max(1, min(limit, 500000)))
+    ) -> EventNLPMetricSketch:
         with self._conn() as conn:
-            return conn.execute(sql, params).fetchall()
+            return load_window_sketch(conn, source_name=source_name, start_date=start_date, end_date=end_date)
+
+    def rebuild_metric_sketches(self) -> int:
+        with self._conn() as conn:
+            return rebuild_daily_metrics(conn)
 
     def insert_drift_snapshot(
         self,
@@ -14,6 +14,12 @@ from trading_assistant.core.models import (
     EventSourceRegisterRequest,
     EventSourceType,
 )
+from trading_assistant.core.sqlite import SQLiteConnectionPool
+from trading_assistant.governance.event_nlp_metrics import (
+    EventNLPMetricSketch,
+    apply_daily_metric_deltas,
+    ensure_daily_metrics_schema,
+)
 
 
 def _to_iso(dt: datetime) -> str:
@@ -26,12 +32,11 @@ class EventStore:
     def __init__(self, db_path: str) -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.db_path)
         self._init_schema()
 
     def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return self._pool.connection()
 
     def _init_schema(self) -> None:
         with self._conn() as conn:
@@ -101,6 +106,7 @@ class EventStore:
                 ON event_records(event_id)
                 """
             )
+            ensure_daily_metrics_schema(conn)
 
     def register_source(self, req: EventSourceRegisterRequest) -> int:
         now = datetime.now(timezone.utc).isoformat()
@@ -180,12 +186,14 @@ class EventStore:
         inserted = 0
         updated = 0
         errors: list[str] = []
+        # Daily NLP metric sketches are updated in the same transaction as the rows they summarize.
+        deltas: dict[tuple[str, str], EventNLPMetricSketch] = {}
         with self._conn() as conn:
             for idx, event in enumerate(req.events):
                 try:
                     exists = conn.execute(
                         """
-                        SELECT 1
+                        SELECT event_type, publish_time, polarity, score, metadata
                         FROM event_records
                         WHERE source_name = ? AND event_id = ?
                         LIMIT 1
@@ -244,10 +252,55 @@ class EventStore:
                             ),
                         )
                         updated += 1
+                        self._add_metric_delta(
+                            deltas,
+                            source_name=req.source_name,
+                            event_type=str(exists["event_type"]),
+                            publish_time=str(exists["publish_time"]),
+                            polarity=str(exists["polarity"]),
+                            score=float(exists["score"]),
+                            metadata=dict(json.loads(str(exists["metadata"]))),
+                            weight=-1,
+                        )
+                    self._add_metric_delta(
+                        deltas,
+                        source_name=req.source_name,
+                        event_type=event.event_type,
+                        publish_time=_to_iso(event.publish_time),
+                        polarity=event.polarity.value,
+                        score=float(event.score),
+                        metadata=event.metadata,
+                    )
                 except Exception as exc:  # noqa: BLE001
                     errors.append(f"idx={idx}, event_id={event.event_id}: {exc}")
+            apply_daily_metric_deltas(conn, deltas)
         return inserted, updated, errors
 
+    @staticmethod
+    def _add_metric_delta(
+        deltas: dict[tuple[str, str], EventNLPMetricSketch],
+        *,
+        source_name: str,
+        event_type: str,
+        publish_time: str,
+        polarity: str,
+        score: float,
+        metadata: dict,
+        weight: int = 1,
+    ) -> None:
+        key = (source_name, publish_time[:10])
+        sketch = deltas.get(key)
+        if sketch is None:
+            sketch = deltas[key] = EventNLPMetricSketch()
+        sketch.add_event(
+            event_type=event_type,
+            polarity=polarity,
+            score=score,
+            metadata=metadata,
+            publish_time=publish_time,
+            weight=weight,
+        )
+
     def list_events(
         self,
         symbol: str | None = None,
@@ -6,18 +6,18 @@ from datetime import date, datetime, timezone
 from pathlib import Path
 
 from trading_assistant.core.models import DataLicenseRecord, DataLicenseRegisterRequest
+from trading_assistant.core.sqlite import SQLiteConnectionPool
 
 
 class DataLicenseStore:
     def __init__(self, db_path: str) -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.db_path)
         self._init_schema()
 
     def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return self._pool.connection()
 
     def _init_schema(self) -> None:
         with self._conn() as conn:
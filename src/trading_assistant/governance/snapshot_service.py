@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import pandas as pd
+
 from trading_assistant.core.models import DataSnapshotRecord, DataSnapshotRegisterRequest
+from trading_assistant.data.utils import dataframe_content_hash
 from trading_assistant.governance.snapshot_store import DataSnapshotStore
 
 
@@ -22,3 +25,12 @@ class DataSnapshotService:
     def latest(self, dataset_name: str, symbol: str) -> DataSnapshotRecord | None:
         return self.store.latest_snapshot(dataset_name=dataset_name, symbol=symbol)
 
+    def get(self, snapshot_id: int) -> DataSnapshotRecord | None:
+        return self.store.get_snapshot(snapshot_id)
+
+    def verify_frame(self, snapshot_id: int, frame: pd.DataFrame) -> bool | None:
+        """Recompute ``frame``'s hash with the snapshot's own algorithm; ``None`` if unknown id."""
+        record = self.store.get_snapshot(snapshot_id)
+        if record is None:
+            return None
+        return dataframe_content_hash(frame, algorithm=record.hash_algorithm) == record.content_hash
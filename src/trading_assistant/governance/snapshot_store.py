@@ -5,18 +5,22 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from trading_assistant.core.models import DataSnapshotRecord, DataSnapshotRegisterRequest
+from trading_assistant.core.sqlite import SQLiteConnectionPool
 
 
 class DataSnapshotStore:
     def __init__(self, db_path: str) -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.db_path)
         self._init_schema()
 
     def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return self._pool.connection()
+
+    def _table_columns(self, conn: sqlite3.Connection, table: str) -> set[str]:
+        rows = conn.execute(f"PRAGMA table_info({table})").fetchall()
+        return {str(r["name"]) for r in rows}
 
     def _init_schema(self) -> None:
         with self._conn() as conn:
@@ -32,10 +36,17 @@ class DataSnapshotStore:
                     provider TEXT NOT NULL,
                     row_count INTEGER NOT NULL,
                     schema_version TEXT NOT NULL,
-                    content_hash TEXT NOT NULL
+                    content_hash TEXT NOT NULL,
+                    hash_algorithm TEXT NOT NULL DEFAULT 'sha256-csv-v1'
                 )
                 """
             )
+            cols = self._table_columns(conn, "data_snapshots")
+            if "hash_algorithm" not in cols:
+                # Rows written before the column existed were hashed with the CSV scheme.
+                conn.execute(
+                    "ALTER TABLE data_snapshots ADD COLUMN hash_algorithm TEXT NOT NULL DEFAULT 'sha256-csv-v1'"
+                )
             conn.execute(
                 """
                 CREATE UNIQUE INDEX IF NOT EXISTS idx_snapshot_unique
@@ -53,9 +64,9 @@ class DataSnapshotStore:
                 """
                 INSERT OR IGNORE INTO data_snapshots(
                     created_at, dataset_name, symbol, start_date, end_date, provider,
-                    row_count, schema_version, content_hash
+                    row_count, schema_version, content_hash, hash_algorithm
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     now,
@@ -67,9 +78,11 @@ class DataSnapshotStore:
                     req.row_count,
                     req.schema_version,
                     req.content_hash,
+                    req.hash_algorithm,
                 ),
             )
-            if cur.lastrowid:
+            # lastrowid is left over from the pooled connection's previous insert when the row is ignored.
+            if cur.rowcount == 1:
                 return int(cur.lastrowid)
 
             # If duplicate inserted before, return existing id.
@@ -96,7 +109,7 @@ class DataSnapshotStore:
         limit = max(1, min(limit, 1000))
         sql = """
             SELECT id, created_at, dataset_name, symbol, start_date, end_date, provider,
-                   row_count, schema_version, content_hash
+                   row_count, schema_version, content_hash, hash_algorithm
             FROM data_snapshots
         """
         conditions: list[str] = []
@@ -116,12 +129,25 @@ class DataSnapshotStore:
             rows = conn.execute(sql, params).fetchall()
         return [self._to_record(row) for row in rows]
 
+    def get_snapshot(self, snapshot_id: int) -> DataSnapshotRecord | None:
+        with self._conn() as conn:
+            row = conn.execute(
+                """
+                SELECT id, created_at, dataset_name, symbol, start_date, end_date, provider,
+                       row_count, schema_version, content_hash, hash_algorithm
+                FROM data_snapshots
+                WHERE id = ?
+                """,
+                (int(snapshot_id),),
+            ).fetchone()
+        return self._to_record(row) if row else None
+
     def latest_snapshot(self, dataset_name: str, symbol: str) -> DataSnapshotRecord | None:
         with self._conn() as conn:
             row = conn.execute(
                 """
                 SELECT id, created_at, dataset_name, symbol, start_date, end_date, provider,
-                       row_count, schema_version, content_hash
+                       row_count, schema_version, content_hash, hash_algorithm
                 FROM data_snapshots
                 WHERE dataset_name = ? AND symbol = ?
                 ORDER BY id DESC
@@ -143,5 +169,6 @@ class DataSnapshotStore:
             row_count=int(row["row_count"]),
             schema_version=str(row["schema_version"]),
             content_hash=str(row["content_hash"]),
+            hash_algorithm=str(row["hash_algorithm"]),
         )
 
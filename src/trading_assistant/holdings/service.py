@@ -30,6 +30,13 @@ from trading_assistant.holdings.store import HoldingStore
 from trading_assistant.strategy.base import StrategyContext
 from trading_assistant.strategy.registry import StrategyRegistry
 
+_SNAPSHOT_LOOKBACK_DAYS = 280
+
+# symbol -> (provider_name, daily bars) fetched ahead of analysis, e.g. concurrently by the API.
+PrefetchedBars = dict[str, tuple[str, pd.DataFrame]]
+# symbol -> (provider_name, corporate event snapshot) from one batch provider call.
+PrefetchedEvents = dict[str, tuple[str, dict[str, object]]]
+
 
 @dataclass
 class _PositionState:
@@ -104,12 +111,27 @@ class HoldingService:
         result, _ = self._build_positions_and_snapshots(as_of_date=as_of_date)
         return result
 
-    def analyze(self, req: ManualHoldingAnalysisRequest) -> ManualHoldingAnalysisResult:
+    def analysis_symbols(self, req: ManualHoldingAnalysisRequest) -> list[str]:
+        held = [state.symbol for state in self._build_positions_state(as_of_date=req.as_of_date)]
+        candidates = [str(x).strip().upper() for x in req.candidate_symbols if str(x).strip()]
+        return list(dict.fromkeys(held + candidates))
+
+    @staticmethod
+    def snapshot_window(as_of_date: date) -> tuple[date, date]:
+        return as_of_date - timedelta(days=_SNAPSHOT_LOOKBACK_DAYS), as_of_date
+
+    def analyze(
+        self,
+        req: ManualHoldingAnalysisRequest,
+        *,
+        prefetched_bars: PrefetchedBars | None = None,
+    ) -> ManualHoldingAnalysisResult:
         strategy = self.registry.get(req.strategy_name)
         style_snapshot = self._market_style_snapshot(as_of_date=req.as_of_date)
         positions_result, snapshots = self._build_positions_and_snapshots(
             as_of_date=req.as_of_date,
             style_snapshot=style_snapshot,
+            prefetched_bars=prefetched_bars,
         )
         next_trade_date = self._next_trade_date(req.as_of_date)
 
@@ -254,6 +276,7 @@ class HoldingService:
                 strategy=strategy,
                 next_trade_date=next_trade_date,
                 style_snapshot=style_snapshot,
+                prefetched_bars=prefetched_bars,
             )
         )
 
@@ -300,6 +323,7 @@ class HoldingService:
         *,
         as_of_date: date,
         style_snapshot: dict[str, object] | None = None,
+        prefetched_bars: PrefetchedBars | None = None,
     ) -> tuple[ManualHoldingPositionsResult, dict[str, dict[str, object]]]:
         states = self._build_positions_state(as_of_date=as_of_date)
         if not states:
@@ -309,6 +333,10 @@ class HoldingService:
         items: list[ManualHoldingPositionItem] = []
         snapshots: dict[str, dict[str, object]] = {}
         provider_used = ""
+        prefetched_events = self._corporate_event_snapshots(
+            symbols=[state.symbol for state in states],
+            as_of_date=as_of_date,
+        )
 
         for state in states:
             load_error = ""
@@ -318,6 +346,8 @@ class HoldingService:
                     symbol=state.symbol,
                     as_of_date=as_of_date,
                     style_snapshot=style_snapshot,
+                    prefetched_bars=prefetched_bars,
+                    prefetched_events=prefetched_events,
                 )
             except Exception as exc:  # noqa: BLE001
                 load_error = str(exc)
@@ -475,9 +505,15 @@ class HoldingService:
         symbol: str,
         as_of_date: date,
         style_snapshot: dict[str, object] | None = None,
+        prefetched_bars: PrefetchedBars | None = None,
+        prefetched_events: PrefetchedEvents | None = None,
     ) -> dict[str, object]:
-        lookback_start = as_of_date - timedelta(days=280)
-        provider_name, bars = self.provider.get_daily_bars_with_source(symbol, lookback_start, as_of_date)
+        prefetched = (prefetched_bars or {}).get(symbol)
+        if prefetched is not None:
+            provider_name, bars = prefetched
+        else:
+            lookback_start, _ = self.snapshot_window(as_of_date)
+            provider_name, bars = self.provider.get_daily_bars_with_source(symbol, lookback_start, as_of_date)
         if bars is None or bars.empty:
             raise ValueError(f"{symbol}: no market bars available")
 
@@ -515,7 +551,9 @@ class HoldingService:
         provider_event: dict[str, object] = {}
         provider_event_source = ""
         try:
-            if hasattr(self.provider, "get_corporate_event_snapshot_with_source"):
+            if prefetched_events is not None and symbol in prefetched_events:
+                provider_event_source, provider_event = prefetched_events[symbol]
+            elif hasattr(self.provider, "get_corporate_event_snapshot_with_source"):
                 provider_event_source, provider_event = self.provider.get_corporate_event_snapshot_with_source(
                     symbol=symbol,
                     as_of=as_of_date,
@@ -562,6 +600,27 @@ class HoldingService:
             "style_snapshot": style,
         }
 
+    def _corporate_event_snapshots(self, *, symbols: list[str], as_of_date: date) -> PrefetchedEvents:
+        # One batch call scores every symbol from the same market-wide downloads.
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
+        try:
+            if hasattr(self.provider, "get_corporate_event_snapshots_many_with_source"):
+                source, payload = self.provider.get_corporate_event_snapshots_many_with_source(
+                    symbols=symbols,
+                    as_of=as_of_date,
+                    lookback_days=120,
+                )
+            elif hasattr(self.provider, "get_corporate_event_snapshots_many"):
+                source = ""
+                payload = self.provider.get_corporate_event_snapshots_many(symbols, as_of_date, lookback_days=120)
+            else:
+                return {}
+        except Exception:  # noqa: BLE001
+            return {symbol: ("", {}) for symbol in symbols}
+        return {symbol: (str(source), dict(payload.get(symbol) or {})) for symbol in symbols}
+
     def _market_style_snapshot(self, *, as_of_date: date) -> dict[str, object]:
         style: dict[str, object] = {
             "risk_on_score": 0.5,
@@ -1031,6 +1090,7 @@ class HoldingService:
         strategy,
         next_trade_date: date | None,
         style_snapshot: dict[str, object] | None = None,
+        prefetched_bars: PrefetchedBars | None = None,
     ) -> list[ManualHoldingRecommendationItem]:
         candidates = [str(x).strip().upper() for x in req.candidate_symbols if str(x).strip()]
         candidates = [x for x in dict.fromkeys(candidates) if x and x not in held_symbols]
@@ -1042,12 +1102,15 @@ class HoldingService:
             return []
 
         ranked: list[tuple[float, str, str, float, float, float, float | None, float | None]] = []
+        prefetched_events = self._corporate_event_snapshots(symbols=candidates, as_of_date=req.as_of_date)
         for symbol in candidates:
             try:
                 snapshot = self._load_symbol_snapshot(
                     symbol=symbol,
                     as_of_date=req.as_of_date,
                     style_snapshot=style_snapshot,
+                    prefetched_bars=prefetched_bars,
+                    prefetched_events=prefetched_events,
                 )
             except Exception:  # noqa: BLE001
                 continue
@@ -36,17 +36,23 @@ from trading_assistant.api.strategy_governance import router as strategy_governa
 from trading_assistant.api.system import router as system_router
 from trading_assistant.api.trading_ui import router as trading_ui_router
 from trading_assistant.core.config import get_settings
-from trading_assistant.core.container import get_job_scheduler_worker
+from trading_assistant.core.container import get_alert_outbox, get_job_scheduler_worker, get_sqlite_settings
+from trading_assistant.core.http_client import aclose_http_clients
 from trading_assistant.core.logging import setup_logging
 
 settings = get_settings()
 setup_logging(settings.log_level)
+get_sqlite_settings()
 
 
 @asynccontextmanager
 async def _lifespan(_: FastAPI):
     worker = None
     worker_task = None
+    outbox = None
+    if settings.alert_outbox_enabled:
+        outbox = get_alert_outbox()
+        outbox.start()
     if settings.ops_scheduler_enabled:
         worker = get_job_scheduler_worker()
         worker_task = asyncio.create_task(worker.run_forever(), name="ops-job-scheduler")
@@ -59,6 +65,9 @@ async def _lifespan(_: FastAPI):
             worker_task.cancel()
             with suppress(asyncio.CancelledError):
                 await worker_task
+        if outbox is not None:
+            await asyncio.to_thread(outbox.stop)
+        await aclose_http_clients()
 
 
 app = FastAPI(
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from calendar import monthrange
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Iterator
+
+# Longest gap between fires of any satisfiable expression (Feb 29 across a skipped leap year).
+_MAX_SEARCH_YEARS = 8
 
 
 def _parse_int(value: str, field: str) -> int:
@@ -30,6 +37,10 @@ class CronField:
     maximum: int
     values: frozenset[int]
     raw_any: bool = False
+    ordered: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "ordered", tuple(sorted(self.values)))
 
     @classmethod
     def parse(cls, name: str, token: str, minimum: int, maximum: int, *, allow_dow_7: bool = False) -> "CronField":
@@ -55,6 +66,16 @@ class CronField:
     def contains(self, value: int) -> bool:
         return value in self.values
 
+    def next_value(self, value: int) -> int | None:
+        """Smallest allowed value >= ``value``."""
+        idx = bisect_left(self.ordered, value)
+        return self.ordered[idx] if idx < len(self.ordered) else None
+
+    def previous_value(self, value: int) -> int | None:
+        """Largest allowed value <= ``value``."""
+        idx = bisect_right(self.ordered, value)
+        return self.ordered[idx - 1] if idx > 0 else None
+
 
 def _expand_part(part: str, field: str, minimum: int, maximum: int, *, allow_dow_7: bool) -> set[int]:
     step = 1
@@ -126,40 +147,108 @@ class CronSchedule:
 
     def matches(self, dt: datetime) -> bool:
         current = dt.replace(second=0, microsecond=0)
-        cron_dow = _python_weekday_to_cron(current.weekday())
-
         if not self.minute.contains(current.minute):
             return False
         if not self.hour.contains(current.hour):
             return False
         if not self.month.contains(current.month):
             return False
+        return self._day_matches(current.date())
 
-        dom_match = self.day_of_month.contains(current.day)
-        dow_match = self.day_of_week.contains(cron_dow)
+    def _day_matches(self, day: date) -> bool:
+        dom_match = self.day_of_month.contains(day.day)
+        dow_match = self.day_of_week.contains(_python_weekday_to_cron(day.weekday()))
         if self.day_of_month.raw_any and self.day_of_week.raw_any:
-            day_match = True
-        elif self.day_of_month.raw_any:
-            day_match = dow_match
-        elif self.day_of_week.raw_any:
-            day_match = dom_match
-        else:
-            # Standard cron behavior: when both are restricted, either match is accepted.
-            day_match = dom_match or dow_match
-        return day_match
+            return True
+        if self.day_of_month.raw_any:
+            return dow_match
+        if self.day_of_week.raw_any:
+            return dom_match
+        # Standard cron behavior: when both are restricted, either match is accepted.
+        return dom_match or dow_match
+
+    def next_fire(self, after: datetime) -> datetime | None:
+        """First fire strictly after ``after``.
+
+        Works on the wall clock of ``after`` (its tzinfo is kept), jumping to the next allowed
+        month, day, hour and minute instead of probing every minute. Returns ``None`` for
+        expressions that never fire (e.g. ``0 0 30 2 *``).
+        """
+        tz = after.tzinfo
+        t = after.replace(second=0, microsecond=0, tzinfo=None) + timedelta(minutes=1)
+        last_year = t.year + _MAX_SEARCH_YEARS
+        while t.year <= last_year:
+            month = self.month.next_value(t.month)
+            if month is None:
+                t = datetime(t.year + 1, 1, 1)
+                continue
+            if month != t.month:
+                t = datetime(t.year, month, 1)
+            if not self._day_matches(t.date()):
+                t = datetime(t.year, t.month, t.day) + timedelta(days=1)
+                continue
+            hour = self.hour.next_value(t.hour)
+            if hour is None:
+                t = datetime(t.year, t.month, t.day) + timedelta(days=1)
+                continue
+            if hour != t.hour:
+                t = t.replace(hour=hour, minute=0)
+            minute = self.minute.next_value(t.minute)
+            if minute is None:
+                t = t.replace(minute=0) + timedelta(hours=1)
+                continue
+            return t.replace(minute=minute, tzinfo=tz)
+        return None
 
-    def next_after(self, dt: datetime, max_minutes: int = 527040) -> datetime | None:
-        cursor = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
-        for _ in range(max_minutes):
-            if self.matches(cursor):
-                return cursor
-            cursor += timedelta(minutes=1)
+    def previous_fire(self, at_or_before: datetime) -> datetime | None:
+        """Latest fire at or before ``at_or_before`` (mirror of ``next_fire``)."""
+        tz = at_or_before.tzinfo
+        t = at_or_before.replace(second=0, microsecond=0, tzinfo=None)
+        first_year = t.year - _MAX_SEARCH_YEARS
+        while t.year >= first_year:
+            month = self.month.previous_value(t.month)
+            if month is None:
+                t = datetime(t.year - 1, 12, 31, 23, 59)
+                continue
+            if month != t.month:
+                t = datetime(t.year, month, monthrange(t.year, month)[1], 23, 59)
+            if not self._day_matches(t.date()):
+                t = datetime(t.year, t.month, t.day, 23, 59) - timedelta(days=1)
+                continue
+            hour = self.hour.previous_value(t.hour)
+            if hour is None:
+                t = datetime(t.year, t.month, t.day, 23, 59) - timedelta(days=1)
+                continue
+            if hour != t.hour:
+                t = t.replace(hour=hour, minute=59)
+            minute = self.minute.previous_value(t.minute)
+            if minute is None:
+                t = t.replace(minute=0) - timedelta(minutes=1)
+                continue
+            return t.replace(minute=minute, tzinfo=tz)
         return None
 
+    def fires_between(self, start: datetime, end: datetime) -> Iterator[datetime]:
+        """Yield every fire in ``(start, end]`` in order."""
+        cursor = self.next_fire(start)
+        while cursor is not None and cursor <= end:
+            yield cursor
+            cursor = self.next_fire(cursor)
+
+    def next_after(self, dt: datetime, max_minutes: int = 527040) -> datetime | None:
+        found = self.next_fire(dt)
+        if found is None or found > dt.replace(second=0, microsecond=0) + timedelta(minutes=max_minutes):
+            return None
+        return found
+
     def previous_at_or_before(self, dt: datetime, max_minutes: int = 527040) -> datetime | None:
-        cursor = dt.replace(second=0, microsecond=0)
-        for _ in range(max_minutes):
-            if self.matches(cursor):
-                return cursor
-            cursor -= timedelta(minutes=1)
-        return None
+        found = self.previous_fire(dt)
+        if found is None or found <= dt.replace(second=0, microsecond=0) - timedelta(minutes=max_minutes):
+            return None
+        return found
+
+
+@lru_cache(maxsize=4096)
+def compile_cron(expression: str) -> CronSchedule:
+    """Parse ``expression`` once; schedulers call this on every tick for every job."""
+    return CronSchedule.parse(expression)
@@ -8,7 +8,6 @@ from trading_assistant.core.models import (
     JobStatus,
     OpsAlertStats,
     OpsDashboardSummary,
-    OpsExecutionStats,
     OpsEventStats,
     OpsJobStats,
     SignalLevel,
@@ -55,7 +54,7 @@ class OpsDashboardService:
         unacked_warning = self.alerts.count_notifications(only_unacked=True, severity=SignalLevel.WARNING)
         unacked_critical = self.alerts.count_notifications(only_unacked=True, severity=SignalLevel.CRITICAL)
 
-        replay_report = self.replay.report(limit=max(1, min(replay_limit, 2000)))
+        execution_stats = self.replay.execution_stats(limit=max(1, min(replay_limit, 2000)))
         sla_report = self.jobs.evaluate_sla(as_of=now, grace_minutes=sla_grace_minutes)
         event_stats: OpsEventStats | None = None
         if self.event_connector is not None:
@@ -79,12 +78,7 @@ class OpsDashboardService:
                 unacked_warning=unacked_warning,
                 unacked_critical=unacked_critical,
             ),
-            execution=OpsExecutionStats(
-                sample_size=len(replay_report.items),
-                follow_rate=replay_report.follow_rate,
-                avg_delay_days=replay_report.avg_delay_days,
-                avg_slippage_bps=replay_report.avg_slippage_bps,
-            ),
+            execution=execution_stats,
             event=event_stats,
             sla=sla_report,
             recent_runs=recent_runs,
@@ -19,8 +19,6 @@ from trading_assistant.core.models import (
     EventConnectorSyncJobPayload,
     JobDefinitionRecord,
     JobRegisterRequest,
-    JobSLABreach,
-    JobSLABreachType,
     JobSLAReport,
     JobScheduleTickResult,
     JobRunRecord,
@@ -32,11 +30,12 @@ from trading_assistant.core.models import (
     PipelineRunRequest,
     ReportGenerateRequest,
     ResearchWorkflowRequest,
-    SignalLevel,
 )
+from trading_assistant.data.rate_limit import RequestPriority, provider_priority
 from trading_assistant.governance.compliance_evidence import ComplianceEvidenceService
 from trading_assistant.governance.event_connector_service import EventConnectorService
-from trading_assistant.ops.cron import CronSchedule
+from trading_assistant.ops.cron import CronSchedule, compile_cron
+from trading_assistant.ops.job_sla import JobSLATracker
 from trading_assistant.ops.job_store import JobStore
 from trading_assistant.pipeline.runner import DailyPipelineRunner
 from trading_assistant.replay.service import ReplayService
@@ -58,6 +57,7 @@ class JobService:
         replay: ReplayService | None = None,
         scheduler_timezone: str = "Asia/Shanghai",
         running_timeout_minutes: int = 120,
+        catchup_minutes: int = 1440,
     ) -> None:
         self.store = store
         self.pipeline = pipeline
@@ -70,6 +70,8 @@ class JobService:
         self.replay = replay
         self.scheduler_timezone = scheduler_timezone
         self.running_timeout_minutes = max(1, running_timeout_minutes)
+        self.catchup_minutes = max(0, catchup_minutes)
+        self._sla_tracker = JobSLATracker(store)
 
     def register(self, req: JobRegisterRequest) -> int:
         if req.schedule_cron:
@@ -99,7 +101,9 @@ class JobService:
             while True:
                 attempts += 1
                 try:
-                    summary = self._execute(job)
+                    # Jobs are backfills/batch work: interactive API calls go ahead of them upstream.
+                    with provider_priority(RequestPriority.BULK):
+                        summary = self._execute(job)
                     break
                 except Exception as exc:  # noqa: BLE001
                     last_error = str(exc)
@@ -154,26 +158,47 @@ class JobService:
         expected_utc = local_minute.astimezone(timezone.utc)
         result = JobScheduleTickResult(tick_time=now_utc, timezone=tz_name)
 
+        catchup_start = local_minute - timedelta(minutes=self.catchup_minutes)
+
         jobs = self.list_jobs(active_only=True, limit=1000)
         for job in jobs:
             if not job.schedule_cron:
                 continue
             try:
-                schedule = CronSchedule.parse(job.schedule_cron)
+                schedule = compile_cron(job.schedule_cron)
             except ValueError as exc:
                 result.errors.append(f"job_id={job.id} invalid cron '{job.schedule_cron}': {exc}")
                 continue
-            if not schedule.matches(local_minute):
+            if schedule.matches(local_minute):
+                result.matched_jobs.append(job.id)
+                latest = self.store.get_latest_run(job.id, triggered_by=triggered_by)
+                if latest is not None:
+                    latest_minute_utc = self._minute_floor(self._ensure_utc(latest.started_at))
+                    if latest_minute_utc == expected_utc:
+                        result.skipped_jobs.append(job.id)
+                        continue
+                run = self.trigger(job_id=job.id, triggered_by=triggered_by)
+                result.triggered_runs.append(run)
                 continue
 
-            result.matched_jobs.append(job.id)
-            latest = self.get_latest_run(job.id)
+            # Catch-up after downtime: only the latest missed fire, and only if it falls inside the
+            # window, after the job was registered, and after this trigger's last run started.
+            if self.catchup_minutes <= 0:
+                continue
+            missed_local = schedule.previous_fire(local_minute)
+            if missed_local is None or missed_local < catchup_start:
+                continue
+            missed_utc = missed_local.astimezone(timezone.utc)
+            if missed_utc < self._minute_floor(self._ensure_utc(job.created_at)):
+                continue
+            # Manual runs in between must not hide the fire this trigger already served.
+            latest = self.store.get_latest_run(job.id, triggered_by=triggered_by)
             if latest is not None:
                 latest_minute_utc = self._minute_floor(self._ensure_utc(latest.started_at))
-                if latest.triggered_by == triggered_by and latest_minute_utc == expected_utc:
-                    result.skipped_jobs.append(job.id)
+                if latest_minute_utc >= missed_utc:
                     continue
-
+            result.matched_jobs.append(job.id)
+            result.caught_up_jobs.append(job.id)
             run = self.trigger(job_id=job.id, triggered_by=triggered_by)
             result.triggered_runs.append(run)
         return result
@@ -186,94 +211,14 @@ class JobService:
     ) -> JobSLAReport:
         now_utc = self._ensure_utc(as_of or datetime.now(timezone.utc))
         tz_name, schedule_zone = self._schedule_zone()
-        local_now = now_utc.astimezone(schedule_zone).replace(second=0, microsecond=0)
-        active_jobs = self.list_jobs(active_only=True, limit=1000)
-        report = JobSLAReport(
-            checked_at=now_utc,
-            timezone=tz_name,
-            total_active_jobs=len(active_jobs),
-            total_scheduled_jobs=0,
+        return self._sla_tracker.report(
+            now_utc=now_utc,
+            tz_name=tz_name,
+            schedule_zone=schedule_zone,
+            grace=timedelta(minutes=max(0, grace_minutes)),
+            running_timeout=timedelta(minutes=max(1, running_timeout_minutes or self.running_timeout_minutes)),
         )
 
-        grace = timedelta(minutes=max(0, grace_minutes))
-        running_timeout = timedelta(minutes=max(1, running_timeout_minutes or self.running_timeout_minutes))
-
-        for job in active_jobs:
-            if not job.schedule_cron:
-                continue
-            report.total_scheduled_jobs += 1
-            try:
-                schedule = CronSchedule.parse(job.schedule_cron)
-            except ValueError as exc:
-                report.breaches.append(
-                    JobSLABreach(
-                        job_id=job.id,
-                        job_name=job.name,
-                        breach_type=JobSLABreachType.INVALID_CRON,
-                        severity=SignalLevel.CRITICAL,
-                        message=str(exc),
-                        schedule_cron=job.schedule_cron,
-                    )
-                )
-                continue
-
-            latest = self.get_latest_run(job.id)
-            latest_started_utc = self._ensure_utc(latest.started_at) if latest is not None else None
-            expected_local = schedule.previous_at_or_before(local_now)
-            if expected_local is None:
-                continue
-            expected_utc = expected_local.astimezone(timezone.utc)
-
-            if now_utc >= expected_utc + grace:
-                if latest_started_utc is None or self._minute_floor(latest_started_utc) < expected_utc:
-                    delay = int((now_utc - expected_utc).total_seconds() // 60)
-                    report.breaches.append(
-                        JobSLABreach(
-                            job_id=job.id,
-                            job_name=job.name,
-                            breach_type=JobSLABreachType.MISSED_RUN,
-                            severity=SignalLevel.WARNING,
-                            message="Scheduled run is overdue and has not started.",
-                            schedule_cron=job.schedule_cron,
-                            expected_run_at=expected_utc,
-                            last_run_at=latest_started_utc,
-                            delay_minutes=max(delay, 0),
-                        )
-                    )
-                    continue
-
-            if latest is not None and latest_started_utc is not None:
-                if latest.status == JobRunStatus.FAILED:
-                    report.breaches.append(
-                        JobSLABreach(
-                            job_id=job.id,
-                            job_name=job.name,
-                            breach_type=JobSLABreachType.LATEST_RUN_FAILED,
-                            severity=SignalLevel.CRITICAL,
-                            message=latest.error_message or "Latest scheduled run failed.",
-                            schedule_cron=job.schedule_cron,
-                            expected_run_at=expected_utc,
-                            last_run_at=latest_started_utc,
-                        )
-                    )
-                if latest.status == JobRunStatus.RUNNING and now_utc - latest_started_utc > running_timeout:
-                    delay = int((now_utc - latest_started_utc).total_seconds() // 60)
-                    report.breaches.append(
-                        JobSLABreach(
-                            job_id=job.id,
-                            job_name=job.name,
-                            breach_type=JobSLABreachType.RUNNING_TIMEOUT,
-                            severity=SignalLevel.WARNING,
-                            message="Latest run remains RUNNING beyond timeout threshold.",
-                            schedule_cron=job.schedule_cron,
-                            expected_run_at=expected_utc,
-                            last_run_at=latest_started_utc,
-                            delay_minutes=max(delay, 0),
-                        )
-                    )
-
-        return report
-
     def _execute(self, job: JobDefinitionRecord) -> dict:
         if job.job_type == JobType.PIPELINE_DAILY:
             req = PipelineRunRequest.model_validate(job.payload)
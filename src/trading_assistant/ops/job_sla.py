@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import heapq
+import threading
+from zoneinfo import ZoneInfo
+
+from trading_assistant.core.models import (
+    JobRunStatus,
+    JobSLABreach,
+    JobSLABreachType,
+    JobSLAReport,
+    JobStatus,
+    SignalLevel,
+)
+from trading_assistant.ops.cron import CronSchedule, compile_cron
+from trading_assistant.ops.job_store import JobSLAState, JobStore
+
+
+class ScheduleCursor:
+    """Next-fire iterator for one cron schedule, kept between SLA evaluations.
+
+    Holds the latest fire at or before the evaluated minute and the fire after it, so moving
+    forward in time only costs work when a fire time is actually crossed.
+    """
+
+    def __init__(self, schedule: CronSchedule, local_now: datetime) -> None:
+        self.schedule = schedule
+        self.expected_local = schedule.previous_at_or_before(local_now)
+        self.next_local = schedule.next_after(local_now)
+
+    def advance(self, local_now: datetime) -> None:
+        while self.next_local is not None and self.next_local <= local_now:
+            self.expected_local = self.next_local
+            self.next_local = self.schedule.next_after(self.next_local)
+
+
+@dataclass
+class _JobSLAEntry:
+    state: JobSLAState
+    cursor: ScheduleCursor | None = None
+    cron_error: str | None = None
+    breach: tuple[JobSLABreachType, datetime | None] | None = None
+    wake_at: datetime | None = None
+
+
+@dataclass
+class _TrackerState:
+    key: tuple[str, timedelta, timedelta] | None = None
+    seq: int = 0
+    last_now: datetime | None = None
+    active: set[int] = field(default_factory=set)
+    entries: dict[int, _JobSLAEntry] = field(default_factory=dict)
+    wakeups: list[tuple[datetime, int]] = field(default_factory=list)
+
+
+class JobSLATracker:
+    """Incremental job SLA evaluation.
+
+    ``JobStore`` keeps a ``job_sla_state`` row per job that is rewritten (with a new ``seq``)
+    when the job is registered or its latest run starts or finishes. The tracker reads only
+    rows past the last seen ``seq`` and re-evaluates a job only when its state changed or
+    when one of its deadlines passes (next cron fire, fire + grace, run start + timeout),
+    tracked in a min-heap. An evaluation therefore costs O(changed jobs), not O(all jobs).
+    Moving ``as_of`` backwards or changing grace/timeout rebuilds from scratch.
+    """
+
+    def __init__(self, store: JobStore) -> None:
+        self.store = store
+        self._lock = threading.Lock()
+        self._state = _TrackerState()
+
+    def report(
+        self,
+        *,
+        now_utc: datetime,
+        tz_name: str,
+        schedule_zone: ZoneInfo,
+        grace: timedelta,
+        running_timeout: timedelta,
+    ) -> JobSLAReport:
+        local_now = now_utc.astimezone(schedule_zone).replace(second=0, microsecond=0)
+        key = (tz_name, grace, running_timeout)
+        with self._lock:
+            st = self._state
+            if st.key != key or (st.last_now is not None and now_utc < st.last_now):
+                st = self._state = _TrackerState(key=key)
+            st.last_now = now_utc
+
+            dirty: set[int] = set()
+            for change in self.store.list_sla_state_changes(after_seq=st.seq):
+                st.seq = max(st.seq, change.seq)
+                if change.status != JobStatus.ACTIVE:
+                    st.active.discard(change.job_id)
+                    st.entries.pop(change.job_id, None)
+                    continue
+                st.active.add(change.job_id)
+                if not change.schedule_cron:
+                    st.entries.pop(change.job_id, None)
+                    continue
+                entry = st.entries.get(change.job_id)
+                if entry is None or entry.state.schedule_cron != change.schedule_cron:
+                    entry = self._compile(change, local_now)
+                    st.entries[change.job_id] = entry
+                else:
+                    entry.state = change
+                dirty.add(change.job_id)
+
+            while st.wakeups and st.wakeups[0][0] <= now_utc:
+                wake_at, job_id = heapq.heappop(st.wakeups)
+                entry = st.entries.get(job_id)
+                if entry is not None and entry.wake_at == wake_at:
+                    dirty.add(job_id)
+
+            for job_id in dirty:
+                entry = st.entries[job_id]
+                self._evaluate(entry, now_utc=now_utc, local_now=local_now, grace=grace, timeout=running_timeout)
+                if entry.wake_at is not None:
+                    heapq.heappush(st.wakeups, (entry.wake_at, job_id))
+
+            report = JobSLAReport(
+                checked_at=now_utc,
+                timezone=tz_name,
+                total_active_jobs=len(st.active),
+                total_scheduled_jobs=len(st.entries),
+            )
+            # Same order as the former scan over list_jobs (newest job first).
+            for job_id in sorted((k for k, v in st.entries.items() if v.breach is not None), reverse=True):
+                report.breaches.append(self._to_breach(st.entries[job_id], now_utc=now_utc))
+        return report
+
+    @staticmethod
+    def _compile(state: JobSLAState, local_now: datetime) -> _JobSLAEntry:
+        try:
+            schedule = compile_cron(state.schedule_cron or "")
+        except ValueError as exc:
+            return _JobSLAEntry(state=state, cron_error=str(exc))
+        return _JobSLAEntry(state=state, cursor=ScheduleCursor(schedule, local_now))
+
+    @staticmethod
+    def _evaluate(
+        entry: _JobSLAEntry,
+        *,
+        now_utc: datetime,
+        local_now: datetime,
+        grace: timedelta,
+        timeout: timedelta,
+    ) -> None:
+        entry.breach = None
+        entry.wake_at = None
+        if entry.cursor is None:
+            entry.breach = (JobSLABreachType.INVALID_CRON, None)
+            return
+        entry.cursor.advance(local_now)
+        wakes: list[datetime] = []
+        if entry.cursor.next_local is not None:
+            wakes.append(entry.cursor.next_local.astimezone(timezone.utc))
+        expected_local = entry.cursor.expected_local
+        if expected_local is None:
+            entry.wake_at = min(wakes) if wakes else None
+            return
+
+        expected_utc = expected_local.astimezone(timezone.utc)
+        state = entry.state
+        started_utc = _ensure_utc(state.last_started_at) if state.last_started_at is not None else None
+        if now_utc >= expected_utc + grace:
+            if started_utc is None or started_utc.replace(second=0, microsecond=0) < expected_utc:
+                entry.breach = (JobSLABreachType.MISSED_RUN, expected_utc)
+        else:
+            wakes.append(expected_utc + grace)
+
+        if entry.breach is None and started_utc is not None:
+            if state.last_status == JobRunStatus.FAILED:
+                entry.breach = (JobSLABreachType.LATEST_RUN_FAILED, expected_utc)
+            elif state.last_status == JobRunStatus.RUNNING:
+                if now_utc - started_utc > timeout:
+                    entry.breach = (JobSLABreachType.RUNNING_TIMEOUT, expected_utc)
+                else:
+                    wakes.append(started_utc + timeout + timedelta(microseconds=1))
+        entry.wake_at = min(wakes) if wakes else None
+
+    @staticmethod
+    def _to_breach(entry: _JobSLAEntry, *, now_utc: datetime) -> JobSLABreach:
+        assert entry.breach is not None
+        breach_type, expected_utc = entry.breach
+        state = entry.state
+        cron = state.schedule_cron or ""
+        started_utc = _ensure_utc(state.last_started_at) if state.last_started_at is not None else None
+        if breach_type == JobSLABreachType.INVALID_CRON:
+            return JobSLABreach(
+                job_id=state.job_id,
+                job_name=state.name,
+                breach_type=breach_type,
+                severity=SignalLevel.CRITICAL,
+                message=entry.cron_error or "invalid cron",
+                schedule_cron=cron,
+            )
+        if breach_type == JobSLABreachType.MISSED_RUN:
+            assert expected_utc is not None
+            return JobSLABreach(
+                job_id=state.job_id,
+                job_name=state.name,
+                breach_type=breach_type,
+                severity=SignalLevel.WARNING,
+                message="Scheduled run is overdue and has not started.",
+                schedule_cron=cron,
+                expected_run_at=expected_utc,
+                last_run_at=started_utc,
+                delay_minutes=max(int((now_utc - expected_utc).total_seconds() // 60), 0),
+            )
+        if breach_type == JobSLABreachType.LATEST_RUN_FAILED:
+            return JobSLABreach(
+                job_id=state.job_id,
+                job_name=state.name,
+                breach_type=breach_type,
+                severity=SignalLevel.CRITICAL,
+                message=state.last_error or "Latest scheduled run failed.",
+                schedule_cron=cron,
+                expected_run_at=expected_utc,
+                last_run_at=started_utc,
+            )
+        assert started_utc is not None
+        return JobSLABreach(
+            job_id=state.job_id,
+            job_name=state.name,
+            breach_type=breach_type,
+            severity=SignalLevel.WARNING,
+            message="Latest run remains RUNNING beyond timeout threshold.",
+            schedule_cron=cron,
+            expected_run_at=expected_utc,
+            last_run_at=started_utc,
+            delay_minutes=max(int((now_utc - started_utc).total_seconds() // 60), 0),
+        )
+
+
+def _ensure_utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
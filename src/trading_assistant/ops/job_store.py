@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 import json
 import sqlite3
 from datetime import datetime, timezone
@@ -13,18 +14,37 @@ from trading_assistant.core.models import (
     JobStatus,
     JobType,
 )
+from trading_assistant.core.sqlite import SQLiteConnectionPool
+
+
+@dataclass(frozen=True)
+class JobSLAState:
+    """Per-job row of ``job_sla_state``: the definition fields SLA needs plus the latest run."""
+
+    job_id: int
+    seq: int
+    name: str
+    schedule_cron: str | None
+    status: JobStatus
+    last_run_id: str | None
+    last_started_at: datetime | None
+    last_status: JobRunStatus | None
+    last_error: str | None
+
+
+# Bumps on every state write so readers can ask "what changed since seq N" via the index.
+_NEXT_SLA_SEQ = "(SELECT COALESCE(MAX(seq), 0) + 1 FROM job_sla_state)"
 
 
 class JobStore:
     def __init__(self, db_path: str) -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.db_path)
         self._init_schema()
 
     def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return self._pool.connection()
 
     def _init_schema(self) -> None:
         with self._conn() as conn:
@@ -62,6 +82,47 @@ class JobStore:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_job_def_status ON job_definitions(status, id DESC)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_job_run_job_id ON job_runs(job_id, started_at DESC)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_job_run_started_at ON job_runs(started_at DESC)")
+            self._ensure_sla_state(conn)
+
+    def _ensure_sla_state(self, conn: sqlite3.Connection) -> None:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_sla_state'"
+        ).fetchone()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS job_sla_state (
+                job_id INTEGER PRIMARY KEY,
+                seq INTEGER NOT NULL,
+                updated_at TEXT NOT NULL,
+                last_run_id TEXT,
+                last_started_at TEXT,
+                last_finished_at TEXT,
+                last_status TEXT,
+                last_triggered_by TEXT,
+                last_error TEXT,
+                FOREIGN KEY(job_id) REFERENCES job_definitions(id)
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_job_sla_state_seq ON job_sla_state(seq)")
+        if exists is not None:
+            return
+        # Databases from before the state table: seed it with each job's latest run.
+        conn.execute(
+            """
+            INSERT INTO job_sla_state(
+                job_id, seq, updated_at, last_run_id, last_started_at, last_finished_at,
+                last_status, last_triggered_by, last_error
+            )
+            SELECT
+                j.id, j.id, j.updated_at, r.run_id, r.started_at, r.finished_at,
+                r.status, r.triggered_by, r.error_message
+            FROM job_definitions j
+            LEFT JOIN job_runs r ON r.run_id = (
+                SELECT run_id FROM job_runs WHERE job_id = j.id ORDER BY started_at DESC LIMIT 1
+            )
+            """
+        )
 
     def register(self, req: JobRegisterRequest) -> int:
         now = datetime.now(timezone.utc).isoformat()
@@ -85,7 +146,12 @@ class JobStore:
                     req.description,
                 ),
             )
-            return int(cur.lastrowid)
+            job_id = int(cur.lastrowid)
+            conn.execute(
+                f"INSERT INTO job_sla_state(job_id, seq, updated_at) VALUES (?, {_NEXT_SLA_SEQ}, ?)",
+                (job_id, now),
+            )
+            return job_id
 
     def list_jobs(self, active_only: bool = False, limit: int = 200) -> list[JobDefinitionRecord]:
         sql = """
@@ -127,6 +193,25 @@ class JobStore:
                 """,
                 (run_id, job_id, now, JobRunStatus.RUNNING.value, triggered_by, "{}"),
             )
+            conn.execute(
+                f"""
+                INSERT INTO job_sla_state(
+                    job_id, seq, updated_at, last_run_id, last_started_at, last_finished_at,
+                    last_status, last_triggered_by, last_error
+                )
+                VALUES (?, {_NEXT_SLA_SEQ}, ?, ?, ?, NULL, ?, ?, NULL)
+                ON CONFLICT(job_id) DO UPDATE SET
+                    seq = excluded.seq,
+                    updated_at = excluded.updated_at,
+                    last_run_id = excluded.last_run_id,
+                    last_started_at = excluded.last_started_at,
+                    last_finished_at = NULL,
+                    last_status = excluded.last_status,
+                    last_triggered_by = excluded.last_triggered_by,
+                    last_error = NULL
+                """,
+                (job_id, now, run_id, now, JobRunStatus.RUNNING.value, triggered_by),
+            )
 
     def finish_run(
         self,
@@ -151,6 +236,15 @@ class JobStore:
                     run_id,
                 ),
             )
+            # Only the job's latest run drives its SLA state.
+            conn.execute(
+                f"""
+                UPDATE job_sla_state
+                SET seq = {_NEXT_SLA_SEQ}, updated_at = ?, last_finished_at = ?, last_status = ?, last_error = ?
+                WHERE last_run_id = ?
+                """,
+                (now, now, status.value, error_message, run_id),
+            )
 
     def list_runs(self, job_id: int, limit: int = 200) -> list[JobRunRecord]:
         with self._conn() as conn:
@@ -179,18 +273,19 @@ class JobStore:
             ).fetchone()
         return self._to_run(row) if row else None
 
-    def get_latest_run(self, job_id: int) -> JobRunRecord | None:
+    def get_latest_run(self, job_id: int, triggered_by: str | None = None) -> JobRunRecord | None:
+        sql = """
+            SELECT run_id, job_id, started_at, finished_at, status, triggered_by, error_message, result_summary
+            FROM job_runs
+            WHERE job_id = ?
+        """
+        params: list[str | int] = [job_id]
+        if triggered_by is not None:
+            sql += " AND triggered_by = ?"
+            params.append(triggered_by)
+        sql += " ORDER BY started_at DESC LIMIT 1"
         with self._conn() as conn:
-            row = conn.execute(
-                """
-                SELECT run_id, job_id, started_at, finished_at, status, triggered_by, error_message, result_summary
-                FROM job_runs
-                WHERE job_id = ?
-                ORDER BY started_at DESC
-                LIMIT 1
-                """,
-                (job_id,),
-            ).fetchone()
+            row = conn.execute(sql, tuple(params)).fetchone()
         return self._to_run(row) if row else None
 
     def list_recent_runs(
@@ -219,6 +314,38 @@ class JobStore:
             rows = conn.execute(sql, params).fetchall()
         return [self._to_run(row) for row in rows]
 
+    def list_sla_state_changes(self, after_seq: int = 0) -> list[JobSLAState]:
+        """Jobs whose definition or latest run changed after ``after_seq``, in seq order."""
+        with self._conn() as conn:
+            rows = conn.execute(
+                """
+                SELECT
+                    s.job_id, s.seq, s.last_run_id, s.last_started_at, s.last_status, s.last_error,
+                    j.name, j.schedule_cron, j.status
+                FROM job_sla_state s
+                JOIN job_definitions j ON j.id = s.job_id
+                WHERE s.seq > ?
+                ORDER BY s.seq ASC
+                """,
+                (max(0, int(after_seq)),),
+            ).fetchall()
+        return [
+            JobSLAState(
+                job_id=int(row["job_id"]),
+                seq=int(row["seq"]),
+                name=str(row["name"]),
+                schedule_cron=str(row["schedule_cron"]) if row["schedule_cron"] else None,
+                status=JobStatus(str(row["status"])),
+                last_run_id=str(row["last_run_id"]) if row["last_run_id"] else None,
+                last_started_at=(
+                    datetime.fromisoformat(str(row["last_started_at"])) if row["last_started_at"] else None
+                ),
+                last_status=JobRunStatus(str(row["last_status"])) if row["last_status"] else None,
+                last_error=str(row["last_error"]) if row["last_error"] else None,
+            )
+            for row in rows
+        ]
+
     def _to_job(self, row: sqlite3.Row) -> JobDefinitionRecord:
         return JobDefinitionRecord(
             id=int(row["id"]),
@@ -55,6 +55,7 @@ class JobSchedulerWorker:
                     "matched_jobs": len(tick.matched_jobs),
                     "triggered_runs": len(tick.triggered_runs),
                     "skipped_jobs": len(tick.skipped_jobs),
+                    "caught_up_jobs": len(tick.caught_up_jobs),
                     "errors": "; ".join(tick.errors[:5]),
                 },
             )
@@ -12,11 +12,12 @@ from trading_assistant.core.models import (
     PipelineRunResult,
     PipelineSymbolResult,
     RiskCheckRequest,
+    SignalCandidate,
     SignalLevel,
 )
 from trading_assistant.autotune.service import AutoTuneService
 from trading_assistant.data.composite_provider import CompositeDataProvider
-from trading_assistant.data.utils import dataframe_content_hash
+from trading_assistant.data.utils import CONTENT_HASH_ALGORITHM, dataframe_content_hash
 from trading_assistant.factors.engine import FactorEngine
 from trading_assistant.fundamentals.service import FundamentalService
 from trading_assistant.governance.data_quality import DataQualityService
@@ -93,6 +94,8 @@ class DailyPipelineRunner:
         started_at = datetime.now(timezone.utc)
         strategy = self.registry.get(req.strategy_name)
         results: list[PipelineSymbolResult] = []
+        # (result index, signals, risk requests) per symbol; risk is evaluated once for the whole run
+        pending_risk: list[tuple[int, list[SignalCandidate], list[RiskCheckRequest]]] = []
         use_event_enrichment = req.enable_event_enrichment or req.strategy_name == "event_driven"
 
         for symbol in req.symbols:
@@ -155,6 +158,7 @@ class DailyPipelineRunner:
                     provider=used_provider,
                     row_count=len(bars),
                     content_hash=dataframe_content_hash(bars),
+                    hash_algorithm=CONTENT_HASH_ALGORITHM,
                 )
             )
 
@@ -237,8 +241,6 @@ class DailyPipelineRunner:
                     },
                 ),
             )
-            blocked_count = 0
-            warning_count = 0
             latest = features.sort_values("trade_date").iloc[-1]
             latest_close = float(latest.get("close", 0.0))
             required_cash = required_cash_for_min_lot(
@@ -257,8 +259,7 @@ class DailyPipelineRunner:
                 stamp_duty_sell_rate=self.fee_stamp_duty_sell_rate,
                 slippage_rate=self.default_slippage_rate,
             )
-            small_capital_note: str | None = None
-            small_capital_blocked = False
+            risk_reqs: list[RiskCheckRequest] = []
             def _opt_float(value):
                 return float(value) if (value is not None and value == value) else None
 
@@ -326,26 +327,16 @@ class DailyPipelineRunner:
                     min_expected_edge_bps=float(req.small_capital_min_expected_edge_bps),
                     small_capital_cash_buffer_ratio=self.small_capital_cash_buffer_ratio,
                 )
-                risk_result = self.risk_engine.evaluate(risk_req)
-                _ = self.signal_service.to_trade_prep_sheet(signal, risk_result)
-                small_hits_all = [x for x in risk_result.hits if x.rule_name == "small_capital_tradability"]
-                small_hits_failed = [x for x in small_hits_all if not x.passed]
-                if small_hits_all and small_capital_note is None:
-                    small_capital_note = (small_hits_failed[0].message if small_hits_failed else small_hits_all[0].message)
-                if any(x.level == SignalLevel.CRITICAL for x in small_hits_failed):
-                    small_capital_blocked = True
-                if risk_result.blocked:
-                    blocked_count += 1
-                elif risk_result.level == SignalLevel.WARNING:
-                    warning_count += 1
+                risk_reqs.append(risk_req)
 
+            pending_risk.append((len(results), candidates, risk_reqs))
             results.append(
                 PipelineSymbolResult(
                     symbol=symbol,
                     provider=used_provider,
                     signal_count=len(candidates),
-                    blocked_count=blocked_count,
-                    warning_count=warning_count,
+                    blocked_count=0,
+                    warning_count=0,
                     quality_passed=quality.passed,
                     snapshot_id=snapshot_id,
                     event_rows_used=int(event_stats.get("events_loaded", 0)),
@@ -354,11 +345,10 @@ class DailyPipelineRunner:
                     if bool(latest.get("fundamental_available", False))
                     else None,
                     fundamental_source=str(fundamental_stats.get("source")) if fundamental_stats.get("source") else None,
-                    small_capital_blocked=small_capital_blocked,
-                    small_capital_note=small_capital_note,
                 )
             )
 
+        self._apply_risk(results, pending_risk)
         finished_at = datetime.now(timezone.utc)
         total_signals = sum(r.signal_count for r in results)
         total_blocked = sum(r.blocked_count for r in results)
@@ -374,3 +364,39 @@ class DailyPipelineRunner:
             total_blocked=total_blocked,
             total_warnings=total_warnings,
         )
+
+    def _apply_risk(
+        self,
+        results: list[PipelineSymbolResult],
+        pending_risk: list[tuple[int, list[SignalCandidate], list[RiskCheckRequest]]],
+    ) -> None:
+        all_reqs = [risk_req for _, _, risk_reqs in pending_risk for risk_req in risk_reqs]
+        if not all_reqs:
+            return
+        risk_results = iter(self.risk_engine.evaluate_many(all_reqs))
+        for result_idx, signals, _ in pending_risk:
+            blocked_count = 0
+            warning_count = 0
+            small_capital_note: str | None = None
+            small_capital_blocked = False
+            for signal in signals:
+                risk_result = next(risk_results)
+                _ = self.signal_service.to_trade_prep_sheet(signal, risk_result)
+                small_hits_all = [x for x in risk_result.hits if x.rule_name == "small_capital_tradability"]
+                small_hits_failed = [x for x in small_hits_all if not x.passed]
+                if small_hits_all and small_capital_note is None:
+                    small_capital_note = (small_hits_failed[0].message if small_hits_failed else small_hits_all[0].message)
+                if any(x.level == SignalLevel.CRITICAL for x in small_hits_failed):
+                    small_capital_blocked = True
+                if risk_result.blocked:
+                    blocked_count += 1
+                elif risk_result.level == SignalLevel.WARNING:
+                    warning_count += 1
+            results[result_idx] = results[result_idx].model_copy(
+                update={
+                    "blocked_count": blocked_count,
+                    "warning_count": warning_count,
+                    "small_capital_blocked": small_capital_blocked,
+                    "small_capital_note": small_capital_note,
+                }
+            )
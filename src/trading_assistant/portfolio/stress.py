@@ -1,27 +1,81 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from typing import Sequence
 
-from trading_assistant.core.models import StressScenarioResult, StressTestRequest, StressTestResult
+import numpy as np
+
+from trading_assistant.core.models import (
+    OptimizedWeight,
+    StressScenario,
+    StressScenarioResult,
+    StressTestRequest,
+    StressTestResult,
+)
 
 
 class PortfolioStressTester:
     def run(self, req: StressTestRequest) -> StressTestResult:
-        outputs: list[StressScenarioResult] = []
-        for scenario in req.scenarios:
-            total_ret = 0.0
-            breakdown: dict[str, float] = defaultdict(float)
-            for w in req.weights:
-                shock = scenario.shocks.get(w.industry, scenario.default_shock)
-                contrib = w.weight * shock
-                total_ret += contrib
-                breakdown[w.industry] += contrib
-            outputs.append(
-                StressScenarioResult(
-                    scenario=scenario.name,
-                    portfolio_return=round(total_ret, 6),
-                    industry_breakdown={k: round(v, 6) for k, v in breakdown.items()},
+        return self.run_many([req.weights], req.scenarios)[0]
+
+    def run_many(
+        self,
+        portfolios: Sequence[Sequence[OptimizedWeight]],
+        scenarios: Sequence[StressScenario],
+    ) -> list[StressTestResult]:
+        """Stress many portfolios against shared scenarios in matrix form.
+
+        Scenario shocks become a (scenario x industry) matrix; gathering its columns for every
+        weight gives a (scenario x weight) contribution matrix for all portfolios at once.
+        Totals and industry breakdowns are accumulated from it with unbuffered ``np.add.at``
+        in weight order, so rounded outputs equal the per-weight summation exactly.
+        """
+        industry_index: dict[str, int] = {}
+        held_names: list[list[str]] = []
+        owner: list[int] = []
+        slot: list[int] = []
+        industry_col: list[int] = []
+        weight_values: list[float] = []
+        n_slots = 0
+        for p, weights in enumerate(portfolios):
+            local: dict[str, int] = {}
+            for w in weights:
+                industry_col.append(industry_index.setdefault(w.industry, len(industry_index)))
+                slot.append(n_slots + local.setdefault(w.industry, len(local)))
+                owner.append(p)
+                weight_values.append(float(w.weight))
+            held_names.append(list(local))
+            n_slots += len(local)
+
+        shocks = np.repeat(
+            np.asarray([float(s.default_shock) for s in scenarios], dtype=float)[:, None], len(industry_index), axis=1
+        )
+        for s, scenario in enumerate(scenarios):
+            for industry, shock in scenario.shocks.items():
+                col = industry_index.get(industry)
+                if col is not None:
+                    shocks[s, col] = float(shock)
+
+        contrib = shocks[:, np.asarray(industry_col, dtype=np.intp)] * np.asarray(weight_values, dtype=float)
+        totals = np.zeros((len(scenarios), len(portfolios)), dtype=float)
+        np.add.at(totals, (slice(None), np.asarray(owner, dtype=np.intp)), contrib)
+        breakdown = np.zeros((len(scenarios), n_slots), dtype=float)
+        np.add.at(breakdown, (slice(None), np.asarray(slot, dtype=np.intp)), contrib)
+
+        out: list[StressTestResult] = []
+        offset = 0
+        for p, names in enumerate(held_names):
+            block = breakdown[:, offset : offset + len(names)].tolist()
+            offset += len(names)
+            out.append(
+                StressTestResult(
+                    results=[
+                        StressScenarioResult(
+                            scenario=scenario.name,
+                            portfolio_return=round(float(totals[s, p]), 6),
+                            industry_breakdown={k: round(v, 6) for k, v in zip(names, block[s])},
+                        )
+                        for s, scenario in enumerate(scenarios)
+                    ]
                 )
             )
-        return StressTestResult(results=outputs)
-
+        return out
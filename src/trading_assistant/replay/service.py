@@ -1,9 +1,13 @@
 ﻿from __future__ import annotations
 
-from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import date, datetime, timezone
+import math
 from statistics import fmean, pstdev
 
+import numpy as np
+import pandas as pd
+
 from trading_assistant.core.models import (
     CostModelCalibrationRecord,
     CostModelCalibrationRequest,
@@ -14,12 +18,72 @@ from trading_assistant.core.models import (
     ExecutionRecordCreate,
     ExecutionReplayItem,
     ExecutionReplayReport,
+    OpsExecutionStats,
     SignalAction,
     SignalDecisionRecord,
     SignalLevel,
 )
 from trading_assistant.replay.store import ReplayStore
 
+_NO_ACTION = -1
+_BUY = list(SignalAction).index(SignalAction.BUY)
+_SELL = list(SignalAction).index(SignalAction.SELL)
+
+_REASON_RULES: dict[str, tuple[str, SignalLevel]] = {
+    "NO_EXECUTION": (
+        "Increase execution coverage and prioritize high-confidence signals first.",
+        SignalLevel.WARNING,
+    ),
+    "ACTION_MISMATCH": (
+        "Review execution SOP and the action mapping table to avoid BUY/SELL reversals.",
+        SignalLevel.WARNING,
+    ),
+    "EXECUTION_DELAY": (
+        "Shorten manual approval latency or tune strategy holding period for delay tolerance.",
+        SignalLevel.WARNING,
+    ),
+    "HIGH_SLIPPAGE": (
+        "Increase liquidity threshold and raise slippage/impact settings in backtest assumptions.",
+        SignalLevel.WARNING,
+    ),
+}
+
+
+@dataclass
+class _ReplayColumns:
+    """Replay rows as parallel columns, one entry per signal, in report order."""
+
+    signal_id: list[str]
+    symbol: list[str]
+    strategy_name: list[str]
+    signal_date: list[date]
+    execution_date: list[date]
+    signal_action: list[SignalAction]
+    executed_action: list[SignalAction | None]
+    confidence: np.ndarray
+    quantity: np.ndarray
+    executed_price: np.ndarray
+    slippage_bps: np.ndarray
+    slippage_rounded: list[float]
+    slippage_available: np.ndarray
+    followed: np.ndarray
+    delay_days: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.signal_id)
+
+
+@dataclass(frozen=True)
+class _ReplayStats:
+    follow_rate: float
+    avg_slippage_bps: float
+    avg_delay_days: float
+
+
+def _sequential_sum(values: np.ndarray) -> float:
+    # Left-to-right like the per-row loop this replaced, so rounded report fields stay identical.
+    return float(np.cumsum(values)[-1]) if values.size else 0.0
+
 
 class ReplayService:
     def __init__(self, store: ReplayStore) -> None:
@@ -44,84 +108,35 @@ class ReplayService:
         end_date: date | None = None,
         limit: int = 500,
     ) -> ExecutionReplayReport:
-        rows = self.store.load_pairs(
+        cols = self._load_columns(
             symbol=symbol,
             strategy_name=strategy_name,
             start_date=start_date,
             end_date=end_date,
             limit=limit,
         )
-        items: list[ExecutionReplayItem] = []
-        followed_count = 0
-        slippage_sum = 0.0
-        slippage_count = 0
-        delay_sum = 0
-        delay_count = 0
-
-        for row in rows:
-            signal_action = self.store.parse_action(str(row["signal_action"]))
-            if signal_action is None:
-                continue
-            executed_action = self.store.parse_action(str(row["executed_action"])) if row["executed_action"] else None
-            confidence = float(row["confidence"])
-            quantity = int(row["quantity"] or 0)
-            executed_price = float(row["price"] or 0.0)
-            reference_price = float(row["reference_price"] or 0.0)
-            signal_date = datetime.fromisoformat(str(row["trade_date"])).date()
-            execution_date = (
-                datetime.fromisoformat(str(row["execution_date"])).date() if row["execution_date"] else signal_date
-            )
-
-            followed = signal_action == executed_action and quantity > 0
-            if followed:
-                followed_count += 1
-
-            slippage_bps = 0.0
-            slippage_available = False
-            if quantity > 0 and reference_price > 0 and executed_action is not None:
-                slippage_available = True
-                if executed_action == SignalAction.BUY:
-                    slippage_bps = (executed_price - reference_price) / reference_price * 10000.0
-                elif executed_action == SignalAction.SELL:
-                    slippage_bps = (reference_price - executed_price) / reference_price * 10000.0
-                else:
-                    slippage_bps = 0.0
-                slippage_sum += slippage_bps
-                slippage_count += 1
-
-            delay_days = max(0, (execution_date - signal_date).days) if quantity > 0 else 0
-            if quantity > 0:
-                delay_sum += delay_days
-                delay_count += 1
-
-            items.append(
-                ExecutionReplayItem(
-                    signal_id=str(row["signal_id"]),
-                    symbol=str(row["symbol"]),
-                    strategy_name=str(row["strategy_name"]),
-                    signal_date=signal_date,
-                    execution_date=execution_date,
-                    signal_action=signal_action,
-                    executed_action=executed_action,
-                    signal_confidence=confidence,
-                    executed_quantity=quantity,
-                    executed_price=executed_price,
-                    slippage_bps=round(slippage_bps, 6),
-                    slippage_available=slippage_available,
-                    followed=followed,
-                    delay_days=delay_days,
-                )
-            )
-
-        total = len(items)
-        follow_rate = 0.0 if total == 0 else followed_count / total
-        avg_slippage_bps = 0.0 if slippage_count == 0 else slippage_sum / slippage_count
-        avg_delay_days = 0.0 if delay_count == 0 else delay_sum / delay_count
+        stats = self._stats(cols)
         return ExecutionReplayReport(
-            items=items,
-            follow_rate=round(follow_rate, 6),
-            avg_slippage_bps=round(avg_slippage_bps, 6),
-            avg_delay_days=round(avg_delay_days, 6),
+            items=self._replay_items(cols),
+            follow_rate=stats.follow_rate,
+            avg_slippage_bps=stats.avg_slippage_bps,
+            avg_delay_days=stats.avg_delay_days,
+        )
+
+    def execution_stats(
+        self,
+        symbol: str | None = None,
+        strategy_name: str | None = None,
+        limit: int = 500,
+    ) -> OpsExecutionStats:
+        """``report`` aggregates without building per-signal items (used by the ops dashboard)."""
+        cols = self._load_columns(symbol=symbol, strategy_name=strategy_name, limit=limit)
+        stats = self._stats(cols)
+        return OpsExecutionStats(
+            sample_size=len(cols),
+            follow_rate=stats.follow_rate,
+            avg_delay_days=stats.avg_delay_days,
+            avg_slippage_bps=stats.avg_slippage_bps,
         )
 
     def attribution(
@@ -132,85 +147,74 @@ class ReplayService:
         end_date: date | None = None,
         limit: int = 500,
     ) -> ExecutionAttributionReport:
-        replay = self.report(
+        cols = self._load_columns(
             symbol=symbol,
             strategy_name=strategy_name,
             start_date=start_date,
             end_date=end_date,
             limit=limit,
         )
-        reason_counts: dict[str, int] = {}
-        reason_cost_bps: dict[str, float] = {}
-        items: list[ExecutionAttributionItem] = []
-
-        def _add(
-            reason_code: str,
-            item: ExecutionReplayItem,
-            detail: str,
-            suggestion: str,
-            severity: SignalLevel,
-            drag_bps: float,
-        ) -> None:
-            reason_counts[reason_code] = reason_counts.get(reason_code, 0) + 1
-            reason_cost_bps[reason_code] = reason_cost_bps.get(reason_code, 0.0) + max(0.0, float(drag_bps))
-            items.append(
-                ExecutionAttributionItem(
-                    signal_id=item.signal_id,
-                    symbol=item.symbol,
-                    strategy_name=item.strategy_name,
-                    reason_code=reason_code,
-                    severity=severity,
-                    detail=detail,
-                    estimated_drag_bps=round(max(0.0, float(drag_bps)), 4),
-                    suggestion=suggestion,
-                )
-            )
+        stats = self._stats(cols)
+        executed = cols.quantity > 0
+        slippage_rounded = np.asarray(cols.slippage_rounded, dtype=float)
+        # Reason masks and drags for every signal at once; a signal without execution only gets
+        # NO_EXECUTION, the other reasons can stack (in this order) on one executed signal.
+        reasons: list[tuple[str, np.ndarray, np.ndarray]] = [
+            ("NO_EXECUTION", ~executed, np.maximum(8.0, (cols.confidence - 0.5) * 180.0)),
+            (
+                "ACTION_MISMATCH",
+                executed & ~cols.followed,
+                15.0 + np.maximum(0.0, (cols.confidence - 0.5) * 60.0),
+            ),
+            ("EXECUTION_DELAY", executed & (cols.delay_days >= 2), cols.delay_days.astype(float) * 6.0),
+            (
+                "HIGH_SLIPPAGE",
+                executed & cols.slippage_available & (np.abs(slippage_rounded) >= 35),
+                np.maximum(0.0, slippage_rounded),
+            ),
+        ]
 
-        for item in replay.items:
-            if item.executed_quantity <= 0:
-                no_exec_drag = max(8.0, (item.signal_confidence - 0.5) * 180.0)
-                _add(
-                    "NO_EXECUTION",
-                    item,
-                    "Signal has no manual execution record.",
-                    "Increase execution coverage and prioritize high-confidence signals first.",
-                    SignalLevel.WARNING,
-                    no_exec_drag,
-                )
+        hit_counts: dict[str, int] = {}
+        reason_cost_bps: dict[str, float] = {}
+        first_seen: list[tuple[int, int, str]] = []
+        hit_rows: list[np.ndarray] = []
+        hit_ranks: list[np.ndarray] = []
+        for rank, (reason_code, mask, drag) in enumerate(reasons):
+            rows = np.flatnonzero(mask)
+            if rows.size == 0:
                 continue
-            if not item.followed:
-                mismatch_drag = 15.0 + max(0.0, (item.signal_confidence - 0.5) * 60.0)
-                _add(
-                    "ACTION_MISMATCH",
-                    item,
-                    f"Signal={item.signal_action.value}, execution={item.executed_action.value if item.executed_action else 'NONE'}.",
-                    "Review execution SOP and the action mapping table to avoid BUY/SELL reversals.",
-                    SignalLevel.WARNING,
-                    mismatch_drag,
-                )
-            if item.delay_days >= 2:
-                delay_drag = float(item.delay_days) * 6.0
-                _add(
-                    "EXECUTION_DELAY",
-                    item,
-                    f"Execution delayed by {item.delay_days} days.",
-                    "Shorten manual approval latency or tune strategy holding period for delay tolerance.",
-                    SignalLevel.WARNING,
-                    delay_drag,
-                )
-            if item.slippage_available and abs(float(item.slippage_bps)) >= 35:
-                slip_drag = max(0.0, float(item.slippage_bps))
-                _add(
-                    "HIGH_SLIPPAGE",
-                    item,
-                    f"Observed slippage={item.slippage_bps:.1f} bps.",
-                    "Increase liquidity threshold and raise slippage/impact settings in backtest assumptions.",
-                    SignalLevel.WARNING,
-                    slip_drag,
+            first_seen.append((int(rows[0]), rank, reason_code))
+            hit_counts[reason_code] = int(rows.size)
+            reason_cost_bps[reason_code] = _sequential_sum(np.maximum(0.0, drag[rows]))
+            hit_rows.append(rows)
+            hit_ranks.append(np.full(rows.size, rank))
+        # Keep the order in which reasons first appear in the item list.
+        reason_counts = {reason_code: hit_counts[reason_code] for _, _, reason_code in sorted(first_seen)}
+
+        items: list[ExecutionAttributionItem] = []
+        if hit_rows:
+            all_rows = np.concatenate(hit_rows)
+            all_ranks = np.concatenate(hit_ranks)
+            order = np.lexsort((all_ranks, all_rows))
+            for row, rank in zip(all_rows[order].tolist(), all_ranks[order].tolist()):
+                reason_code, _, drag = reasons[rank]
+                suggestion, severity = _REASON_RULES[reason_code]
+                items.append(
+                    ExecutionAttributionItem(
+                        signal_id=cols.signal_id[row],
+                        symbol=cols.symbol[row],
+                        strategy_name=cols.strategy_name[row],
+                        reason_code=reason_code,
+                        severity=severity,
+                        detail=self._attribution_detail(reason_code, cols, row),
+                        estimated_drag_bps=round(max(0.0, float(drag[row])), 4),
+                        suggestion=suggestion,
+                    )
                 )
 
+        sample_size = len(cols)
         suggestions: list[str] = []
-        total = max(1, len(replay.items))
+        total = max(1, sample_size)
         no_exec_ratio = reason_counts.get("NO_EXECUTION", 0) / total
         mismatch_ratio = reason_counts.get("ACTION_MISMATCH", 0) / total
         delay_ratio = reason_counts.get("EXECUTION_DELAY", 0) / total
@@ -222,11 +226,11 @@ class ReplayService:
             suggestions.append(
                 "Action mismatch is elevated: tighten decision thresholds and avoid borderline action flips."
             )
-        if delay_ratio >= 0.20 or replay.avg_delay_days >= 1.0:
+        if delay_ratio >= 0.20 or stats.avg_delay_days >= 1.0:
             suggestions.append(
                 "Execution delay is elevated: increase holding horizon tolerance and cut short-cycle turnover."
             )
-        if replay.follow_rate <= 0.60:
+        if stats.follow_rate <= 0.60:
             suggestions.append(
                 "Follow rate is weak: lower concurrent positions or raise per-symbol confidence threshold."
             )
@@ -236,19 +240,19 @@ class ReplayService:
             )
 
         reason_rates = {
-            key: round(value / max(1, len(replay.items)), 6) for key, value in sorted(reason_counts.items())
+            key: round(value / max(1, sample_size), 6) for key, value in sorted(reason_counts.items())
         }
         reason_cost_bps = {key: round(value, 6) for key, value in sorted(reason_cost_bps.items())}
         total_drag_bps = round(sum(reason_cost_bps.values()), 6)
-        avg_drag_bps = round(total_drag_bps / max(1, len(replay.items)), 6)
-        top_symbols = self._top_buckets(replay.items, key_fn=lambda x: x.symbol)
-        top_strategies = self._top_buckets(replay.items, key_fn=lambda x: x.strategy_name)
+        avg_drag_bps = round(total_drag_bps / max(1, sample_size), 6)
+        top_symbols = self._top_buckets(cols, cols.symbol)
+        top_strategies = self._top_buckets(cols, cols.strategy_name)
 
         return ExecutionAttributionReport(
-            sample_size=len(replay.items),
-            follow_rate=replay.follow_rate,
-            avg_delay_days=replay.avg_delay_days,
-            avg_slippage_bps=replay.avg_slippage_bps,
+            sample_size=sample_size,
+            follow_rate=stats.follow_rate,
+            avg_delay_days=stats.avg_delay_days,
+            avg_slippage_bps=stats.avg_slippage_bps,
             reason_counts=reason_counts,
             reason_rates=reason_rates,
             reason_cost_bps=reason_cost_bps,
@@ -261,24 +265,26 @@ class ReplayService:
         )
 
     def calibrate_cost_model(self, req: CostModelCalibrationRequest) -> CostModelCalibrationResult:
-        replay = self.report(
+        cols = self._load_columns(
             symbol=req.symbol,
             strategy_name=req.strategy_name,
             start_date=req.start_date,
             end_date=req.end_date,
             limit=req.limit,
         )
-        executed = [item for item in replay.items if item.executed_quantity > 0]
-        slippage_values = [abs(item.slippage_bps) for item in executed if item.slippage_available]
-        signed_slippage = [item.slippage_bps for item in executed if item.slippage_available]
-
-        sample_size = len(replay.items)
-        executed_samples = len(executed)
+        replay = self._stats(cols)
+        executed = cols.quantity > 0
+        measured = np.flatnonzero(executed & cols.slippage_available).tolist()
+        signed_slippage = [cols.slippage_rounded[i] for i in measured]
+        slippage_values = [abs(value) for value in signed_slippage]
+
+        sample_size = len(cols)
+        executed_samples = int(np.count_nonzero(executed))
         slippage_coverage = (len(slippage_values) / executed_samples) if executed_samples > 0 else 0.0
         median_abs_slippage_bps = self._quantile(slippage_values, 0.50)
         p90_abs_slippage_bps = self._quantile(slippage_values, 0.90)
         avg_slippage_bps = fmean(signed_slippage) if signed_slippage else 0.0
-        no_exec_ratio = sum(1 for item in replay.items if item.executed_quantity <= 0) / max(1, sample_size)
+        no_exec_ratio = (sample_size - executed_samples) / max(1, sample_size)
 
         sample_weight = min(1.0, sample_size / max(1, req.min_samples))
         data_weight = sample_weight * slippage_coverage
@@ -356,28 +362,226 @@ class ReplayService:
     def list_cost_calibrations(self, symbol: str | None = None, limit: int = 30) -> list[CostModelCalibrationRecord]:
         return self.store.list_cost_calibrations(symbol=symbol, limit=limit)
 
+    def _load_columns(
+        self,
+        symbol: str | None = None,
+        strategy_name: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        limit: int = 500,
+    ) -> _ReplayColumns:
+        rows = self.store.load_pairs(
+            symbol=symbol,
+            strategy_name=strategy_name,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+        )
+        actions = list(SignalAction)
+        action_cache: dict[str, SignalAction | None] = {}
+        date_cache: dict[str, date] = {}
+
+        def _action(value: object) -> SignalAction | None:
+            key = str(value) if value else ""
+            if key not in action_cache:
+                action_cache[key] = self.store.parse_action(key)
+            return action_cache[key]
+
+        def _date(value: object) -> date:
+            key = str(value)
+            if key not in date_cache:
+                date_cache[key] = datetime.fromisoformat(key).date()
+            return date_cache[key]
+
+        signal_id: list[str] = []
+        symbols: list[str] = []
+        strategies: list[str] = []
+        signal_dates: list[date] = []
+        execution_dates: list[date] = []
+        signal_actions: list[SignalAction] = []
+        executed_actions: list[SignalAction | None] = []
+        numeric: list[tuple[float, int, float, float]] = []
+        for row in rows:
+            signal_action = _action(row["signal_action"])
+            if signal_action is None:
+                continue
+            signal_date = _date(row["trade_date"])
+            signal_id.append(str(row["signal_id"]))
+            symbols.append(str(row["symbol"]))
+            strategies.append(str(row["strategy_name"]))
+            signal_dates.append(signal_date)
+            execution_dates.append(_date(row["execution_date"]) if row["execution_date"] else signal_date)
+            signal_actions.append(signal_action)
+            executed_actions.append(_action(row["executed_action"]))
+            numeric.append(
+                (
+                    float(row["confidence"]),
+                    int(row["quantity"] or 0),
+                    float(row["price"] or 0.0),
+                    float(row["reference_price"] or 0.0),
+                )
+            )
+
+        values = np.asarray(numeric, dtype=float).reshape(-1, 4)
+        confidence = values[:, 0]
+        quantity = values[:, 1].astype(np.int64)
+        executed_price = values[:, 2]
+        reference_price = values[:, 3]
+        signal_code = np.asarray([actions.index(a) for a in signal_actions], dtype=np.int64)
+        executed_code = np.asarray(
+            [_NO_ACTION if a is None else actions.index(a) for a in executed_actions], dtype=np.int64
+        )
+        executed = quantity > 0
+
+        followed = (signal_code == executed_code) & executed
+        slippage_available = executed & (reference_price > 0) & (executed_code != _NO_ACTION)
+        safe_reference = np.where(slippage_available, reference_price, 1.0)
+        buy = slippage_available & (executed_code == _BUY)
+        sell = slippage_available & (executed_code == _SELL)
+        slippage_bps = np.zeros(len(signal_id), dtype=float)
+        slippage_bps[buy] = ((executed_price - safe_reference) / safe_reference * 10000.0)[buy]
+        slippage_bps[sell] = ((safe_reference - executed_price) / safe_reference * 10000.0)[sell]
+
+        day_gap = np.asarray(
+            [(e - s).days for s, e in zip(signal_dates, execution_dates)], dtype=np.int64
+        ).reshape(-1)
+        delay_days = np.where(executed, np.maximum(0, day_gap), 0)
+        return _ReplayColumns(
+            signal_id=signal_id,
+            symbol=symbols,
+            strategy_name=strategies,
+            signal_date=signal_dates,
+            execution_date=execution_dates,
+            signal_action=signal_actions,
+            executed_action=executed_actions,
+            confidence=confidence,
+            quantity=quantity,
+            executed_price=executed_price,
+            slippage_bps=slippage_bps,
+            slippage_rounded=[round(value, 6) for value in slippage_bps.tolist()],
+            slippage_available=slippage_available,
+            followed=followed,
+            delay_days=delay_days,
+        )
+
+    @staticmethod
+    def _stats(cols: _ReplayColumns) -> _ReplayStats:
+        total = len(cols)
+        executed = cols.quantity > 0
+        slippage = cols.slippage_bps[cols.slippage_available]
+        delay_count = int(np.count_nonzero(executed))
+        follow_rate = 0.0 if total == 0 else int(np.count_nonzero(cols.followed)) / total
+        avg_slippage_bps = 0.0 if slippage.size == 0 else _sequential_sum(slippage) / slippage.size
+        avg_delay_days = 0.0 if delay_count == 0 else int(cols.delay_days[executed].sum()) / delay_count
+        return _ReplayStats(
+            follow_rate=round(follow_rate, 6),
+            avg_slippage_bps=round(avg_slippage_bps, 6),
+            avg_delay_days=round(avg_delay_days, 6),
+        )
+
+    @staticmethod
+    def _replay_items(cols: _ReplayColumns) -> list[ExecutionReplayItem]:
+        return [
+            ExecutionReplayItem(
+                signal_id=signal_id,
+                symbol=symbol,
+                strategy_name=strategy_name,
+                signal_date=signal_date,
+                execution_date=execution_date,
+                signal_action=signal_action,
+                executed_action=executed_action,
+                signal_confidence=confidence,
+                executed_quantity=quantity,
+                executed_price=executed_price,
+                slippage_bps=slippage_bps,
+                slippage_available=slippage_available,
+                followed=followed,
+                delay_days=delay_days,
+            )
+            for (
+                signal_id,
+                symbol,
+                strategy_name,
+                signal_date,
+                execution_date,
+                signal_action,
+                executed_action,
+                confidence,
+                quantity,
+                executed_price,
+                slippage_bps,
+                slippage_available,
+                followed,
+                delay_days,
+            ) in zip(
+                cols.signal_id,
+                cols.symbol,
+                cols.strategy_name,
+                cols.signal_date,
+                cols.execution_date,
+                cols.signal_action,
+                cols.executed_action,
+                cols.confidence.tolist(),
+                cols.quantity.tolist(),
+                cols.executed_price.tolist(),
+                cols.slippage_rounded,
+                cols.slippage_available.tolist(),
+                cols.followed.tolist(),
+                cols.delay_days.tolist(),
+            )
+        ]
+
+    @staticmethod
+    def _attribution_detail(reason_code: str, cols: _ReplayColumns, row: int) -> str:
+        if reason_code == "NO_EXECUTION":
+            return "Signal has no manual execution record."
+        if reason_code == "ACTION_MISMATCH":
+            executed_action = cols.executed_action[row]
+            return (
+                f"Signal={cols.signal_action[row].value}, "
+                f"execution={executed_action.value if executed_action else 'NONE'}."
+            )
+        if reason_code == "EXECUTION_DELAY":
+            return f"Execution delayed by {int(cols.delay_days[row])} days."
+        return f"Observed slippage={cols.slippage_rounded[row]:.1f} bps."
+
     def _top_buckets(
         self,
-        items: list[ExecutionReplayItem],
-        key_fn: Callable[[ExecutionReplayItem], str],
+        cols: _ReplayColumns,
+        keys: list[str],
         top_n: int = 8,
     ) -> list[ExecutionAttributionBucket]:
-        groups: dict[str, list[ExecutionReplayItem]] = {}
-        for item in items:
-            key = str(key_fn(item) or "UNKNOWN")
-            groups.setdefault(key, []).append(item)
+        if len(cols) == 0:
+            return []
+        # Group codes follow first appearance, like the dict grouping they replace.
+        codes, uniques = pd.factorize(pd.Series([str(key or "UNKNOWN") for key in keys], dtype=object))
+        n_groups = len(uniques)
+        sizes = np.bincount(codes, minlength=n_groups)
+        followed = np.bincount(codes, weights=cols.followed.astype(float), minlength=n_groups)
+        delay_sums = np.bincount(codes, weights=cols.delay_days.astype(float), minlength=n_groups)
+
+        avail = np.flatnonzero(cols.slippage_available)
+        slippage_rounded = np.asarray(cols.slippage_rounded, dtype=float)[avail]
+        avail_codes = codes[avail]
+        order = np.argsort(avail_codes, kind="stable")
+        bounds = np.searchsorted(avail_codes[order], np.arange(n_groups + 1))
+        slippage_means = [
+            math.fsum(chunk) / len(chunk) if len(chunk) else 0.0
+            for chunk in (
+                slippage_rounded[order[bounds[g] : bounds[g + 1]]].tolist() for g in range(n_groups)
+            )
+        ]
 
         buckets: list[ExecutionAttributionBucket] = []
-        for key, group in groups.items():
-            total = len(group)
-            follow_rate = sum(1 for x in group if x.followed) / max(1, total)
-            avg_delay_days = sum(float(x.delay_days) for x in group) / max(1, total)
-            slippage_vals = [float(x.slippage_bps) for x in group if x.slippage_available]
-            avg_slippage_bps = fmean(slippage_vals) if slippage_vals else 0.0
+        for g, key in enumerate(uniques.tolist()):
+            total = int(sizes[g])
+            follow_rate = int(followed[g]) / max(1, total)
+            avg_delay_days = float(delay_sums[g]) / max(1, total)
+            avg_slippage_bps = slippage_means[g]
             deviation_score = (1.0 - follow_rate) * 55.0 + avg_delay_days * 8.0 + max(0.0, avg_slippage_bps) / 12.0
             buckets.append(
                 ExecutionAttributionBucket(
-                    key=key,
+                    key=str(key),
                     sample_size=total,
                     follow_rate=round(follow_rate, 6),
                     avg_delay_days=round(avg_delay_days, 6),
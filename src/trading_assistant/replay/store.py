@@ -12,18 +12,18 @@ from trading_assistant.core.models import (
     SignalAction,
     SignalDecisionRecord,
 )
+from trading_assistant.core.sqlite import SQLiteConnectionPool
 
 
 class ReplayStore:
     def __init__(self, db_path: str) -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.db_path)
         self._init_schema()
 
     def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return self._pool.connection()
 
     def _init_schema(self) -> None:
         with self._conn() as conn:
@@ -79,6 +79,31 @@ class ReplayStore:
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_signal_symbol_date ON signal_records(symbol, trade_date DESC)"
             )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_signal_date ON signal_records(trade_date DESC)")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_signal_strategy_date ON signal_records(strategy_name, trade_date DESC)"
+            )
+            summary_exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'execution_summary'"
+            ).fetchone()
+            # One row per executed signal, kept current by record_execution so replay reads are a join.
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS execution_summary (
+                    signal_id TEXT PRIMARY KEY,
+                    execution_count INTEGER NOT NULL,
+                    last_execution_date TEXT NOT NULL,
+                    last_side TEXT NOT NULL,
+                    quantity INTEGER NOT NULL,
+                    notional REAL NOT NULL,
+                    reference_quantity INTEGER NOT NULL,
+                    reference_notional REAL NOT NULL,
+                    fee REAL NOT NULL
+                )
+                """
+            )
+            if not summary_exists:
+                self._rebuild_execution_summary(conn)
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_cost_calibration_created ON cost_model_calibration_runs(created_at DESC)"
             )
@@ -129,8 +154,82 @@ class ReplayStore:
                     record.note,
                 ),
             )
+            has_reference = record.reference_price is not None and record.reference_price > 0
+            conn.execute(
+                """
+                INSERT INTO execution_summary(
+                    signal_id, execution_count, last_execution_date, last_side, quantity, notional,
+                    reference_quantity, reference_notional, fee
+                )
+                VALUES (?, 1, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(signal_id) DO UPDATE SET
+                    execution_count = execution_count + 1,
+                    last_side = CASE
+                        WHEN excluded.last_execution_date >= last_execution_date THEN excluded.last_side
+                        ELSE last_side
+                    END,
+                    last_execution_date = MAX(last_execution_date, excluded.last_execution_date),
+                    quantity = quantity + excluded.quantity,
+                    notional = notional + excluded.notional,
+                    reference_quantity = reference_quantity + excluded.reference_quantity,
+                    reference_notional = reference_notional + excluded.reference_notional,
+                    fee = fee + excluded.fee
+                """,
+                (
+                    record.signal_id,
+                    record.execution_date.isoformat(),
+                    record.side.value,
+                    record.quantity,
+                    record.price * record.quantity,
+                    record.quantity if has_reference else 0,
+                    record.reference_price * record.quantity if has_reference else 0.0,
+                    record.fee,
+                ),
+            )
             return int(cur.lastrowid)
 
+    def rebuild_execution_summary(self) -> int:
+        """Recompute ``execution_summary`` from ``execution_records``; returns the row count."""
+        with self._conn() as conn:
+            return self._rebuild_execution_summary(conn)
+
+    @staticmethod
+    def _rebuild_execution_summary(conn: sqlite3.Connection) -> int:
+        conn.execute("DELETE FROM execution_summary")
+        conn.execute(
+            """
+            INSERT INTO execution_summary(
+                signal_id, execution_count, last_execution_date, last_side, quantity, notional,
+                reference_quantity, reference_notional, fee
+            )
+            SELECT
+                agg.signal_id, agg.execution_count, agg.last_execution_date, latest.side, agg.quantity,
+                agg.notional, agg.reference_quantity, agg.reference_notional, agg.fee
+            FROM (
+                SELECT
+                    signal_id,
+                    COUNT(*) AS execution_count,
+                    MAX(execution_date) AS last_execution_date,
+                    SUM(quantity) AS quantity,
+                    SUM(price * quantity) AS notional,
+                    SUM(CASE WHEN reference_price > 0 THEN quantity ELSE 0 END) AS reference_quantity,
+                    SUM(CASE WHEN reference_price > 0 THEN reference_price * quantity ELSE 0.0 END)
+                        AS reference_notional,
+                    SUM(fee) AS fee
+                FROM execution_records
+                GROUP BY signal_id
+            ) agg
+            JOIN (
+                SELECT
+                    signal_id,
+                    side,
+                    ROW_NUMBER() OVER (PARTITION BY signal_id ORDER BY execution_date DESC, id DESC) AS rn
+                FROM execution_records
+            ) latest ON latest.signal_id = agg.signal_id AND latest.rn = 1
+            """
+        )
+        return int(conn.execute("SELECT COUNT(*) FROM execution_summary").fetchone()[0])
+
     def load_pairs(
         self,
         symbol: str | None = None,
@@ -147,55 +246,17 @@ class ReplayStore:
                 s.trade_date,
                 s.action AS signal_action,
                 s.confidence,
-                (
-                    SELECT x.side
-                    FROM execution_records x
-                    WHERE x.signal_id = s.signal_id
-                    ORDER BY x.execution_date DESC, x.id DESC
-                    LIMIT 1
-                ) AS executed_action,
-                (
-                    SELECT MAX(x.execution_date)
-                    FROM execution_records x
-                    WHERE x.signal_id = s.signal_id
-                ) AS execution_date,
-                (
-                    SELECT COALESCE(SUM(x.quantity), 0)
-                    FROM execution_records x
-                    WHERE x.signal_id = s.signal_id
-                ) AS quantity,
-                (
-                    SELECT
-                        CASE
-                            WHEN SUM(x.quantity) > 0 THEN SUM(x.price * x.quantity) / SUM(x.quantity)
-                            ELSE 0.0
-                        END
-                    FROM execution_records x
-                    WHERE x.signal_id = s.signal_id
-                ) AS price,
-                (
-                    SELECT
-                        CASE
-                            WHEN SUM(CASE WHEN x.reference_price IS NOT NULL AND x.reference_price > 0 THEN x.quantity ELSE 0 END) > 0
-                                THEN
-                                    SUM(
-                                        CASE
-                                            WHEN x.reference_price IS NOT NULL AND x.reference_price > 0
-                                                THEN x.reference_price * x.quantity
-                                            ELSE 0.0
-                                        END
-                                    ) / SUM(CASE WHEN x.reference_price IS NOT NULL AND x.reference_price > 0 THEN x.quantity ELSE 0 END)
-                            ELSE NULL
-                        END
-                    FROM execution_records x
-                    WHERE x.signal_id = s.signal_id
-                ) AS reference_price,
-                (
-                    SELECT COALESCE(SUM(x.fee), 0.0)
-                    FROM execution_records x
-                    WHERE x.signal_id = s.signal_id
-                ) AS fee
+                x.last_side AS executed_action,
+                x.last_execution_date AS execution_date,
+                COALESCE(x.quantity, 0) AS quantity,
+                CASE WHEN x.quantity > 0 THEN x.notional / x.quantity ELSE 0.0 END AS price,
+                CASE
+                    WHEN x.reference_quantity > 0 THEN x.reference_notional / x.reference_quantity
+                    ELSE NULL
+                END AS reference_price,
+                COALESCE(x.fee, 0.0) AS fee
             FROM signal_records s
+            LEFT JOIN execution_summary x ON x.signal_id = s.signal_id
         """
         conditions: list[str] = []
         params: list[str | int] = []
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Any, Iterable
+
+import numpy as np
+
+from trading_assistant.core.models import RiskCheckRequest, SignalAction, SignalLevel
+
+ACTION_BUY = 0
+ACTION_SELL = 1
+ACTION_WATCH = 2
+_ACTION_CODES = {
+    SignalAction.BUY: ACTION_BUY,
+    SignalAction.SELL: ACTION_SELL,
+    SignalAction.WATCH: ACTION_WATCH,
+}
+
+LEVEL_INFO = 0
+LEVEL_WARNING = 1
+LEVEL_CRITICAL = 2
+LEVEL_TO_SIGNAL = {
+    LEVEL_INFO: SignalLevel.INFO,
+    LEVEL_WARNING: SignalLevel.WARNING,
+    LEVEL_CRITICAL: SignalLevel.CRITICAL,
+}
+
+_FLOAT_COLUMNS = (
+    "suggested_position",
+    "available_quantity",
+    "avg_turnover_20d",
+    "portfolio_drawdown",
+    "industry_exposure",
+    "fundamental_score",
+    "fundamental_stale_days",
+    "tushare_disclosure_risk_score",
+    "tushare_audit_opinion_risk",
+    "tushare_forecast_pchg_mid",
+    "tushare_pledge_ratio",
+    "tushare_share_float_unlock_ratio",
+    "tushare_overhang_risk_score",
+    "available_cash",
+    "small_capital_principal",
+    "required_cash_for_min_lot",
+    "estimated_roundtrip_cost_bps",
+    "expected_edge_bps",
+    "min_expected_edge_bps",
+)
+_BOOL_COLUMNS = (
+    "is_st",
+    "is_suspended",
+    "at_limit_up",
+    "at_limit_down",
+    "enable_small_capital_mode",
+)
+
+
+def encode_actions(actions: Iterable[Any]) -> np.ndarray:
+    out = []
+    for action in actions:
+        if isinstance(action, (int, np.integer)):
+            out.append(int(action))
+        else:
+            out.append(_ACTION_CODES[SignalAction(getattr(action, "value", action))])
+    return np.asarray(out, dtype=np.int8)
+
+
+def _opt(value: float | int | None) -> float:
+    return float("nan") if value is None else float(value)
+
+
+@dataclass
+class RiskBatch:
+    """Columnar risk-check inputs, one element per signal.
+
+    Optional request fields are encoded as NaN. ``industry_exposure`` carries the current
+    portfolio exposure of the signal's industry (NaN when there is no portfolio or no
+    industry tag), ``available_quantity`` is NaN when there is no position, and
+    ``fundamental_pit_ok`` uses -1 for unknown, 0 for failed and 1 for passed.
+    """
+
+    action: np.ndarray
+    suggested_position: np.ndarray
+    available_quantity: np.ndarray
+    is_st: np.ndarray
+    is_suspended: np.ndarray
+    at_limit_up: np.ndarray
+    at_limit_down: np.ndarray
+    avg_turnover_20d: np.ndarray
+    portfolio_drawdown: np.ndarray
+    industry_exposure: np.ndarray
+    fundamental_score: np.ndarray
+    fundamental_pit_ok: np.ndarray
+    fundamental_stale_days: np.ndarray
+    tushare_disclosure_risk_score: np.ndarray
+    tushare_audit_opinion_risk: np.ndarray
+    tushare_forecast_pchg_mid: np.ndarray
+    tushare_pledge_ratio: np.ndarray
+    tushare_share_float_unlock_ratio: np.ndarray
+    tushare_overhang_risk_score: np.ndarray
+    enable_small_capital_mode: np.ndarray
+    available_cash: np.ndarray
+    small_capital_principal: np.ndarray
+    required_cash_for_min_lot: np.ndarray
+    estimated_roundtrip_cost_bps: np.ndarray
+    expected_edge_bps: np.ndarray
+    min_expected_edge_bps: np.ndarray
+    small_capital_cash_buffer_ratio: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.action.shape[0])
+
+    @classmethod
+    def from_columns(cls, *, action: Iterable[Any], **columns: Any) -> "RiskBatch":
+        """Build a batch from array-likes; omitted columns take RiskCheckRequest defaults."""
+        action_codes = encode_actions(action)
+        n = int(action_codes.shape[0])
+        known = {f.name for f in fields(cls)}
+        unknown = set(columns) - known
+        if unknown:
+            raise ValueError(f"unknown risk batch columns: {sorted(unknown)}")
+
+        values: dict[str, np.ndarray] = {"action": action_codes}
+        for name in _FLOAT_COLUMNS:
+            raw = columns.get(name)
+            values[name] = np.full(n, np.nan) if raw is None else np.asarray(raw, dtype=float).reshape(n)
+        for name in _BOOL_COLUMNS:
+            raw = columns.get(name)
+            values[name] = np.zeros(n, dtype=bool) if raw is None else np.asarray(raw, dtype=bool).reshape(n)
+        pit = columns.get("fundamental_pit_ok")
+        values["fundamental_pit_ok"] = (
+            np.full(n, -1, dtype=np.int8) if pit is None else np.asarray(pit, dtype=np.int8).reshape(n)
+        )
+        buffer_ratio = columns.get("small_capital_cash_buffer_ratio")
+        values["small_capital_cash_buffer_ratio"] = (
+            np.full(n, 0.1) if buffer_ratio is None else np.broadcast_to(np.asarray(buffer_ratio, dtype=float), (n,)).copy()
+        )
+        return cls(**values)
+
+    @classmethod
+    def from_requests(cls, requests: Iterable[RiskCheckRequest]) -> "RiskBatch":
+        reqs = list(requests)
+        industry_exposure: list[float] = []
+        for req in reqs:
+            if req.portfolio is not None and req.symbol_industry:
+                industry_exposure.append(float(req.portfolio.industry_exposure.get(req.symbol_industry, 0.0)))
+            else:
+                industry_exposure.append(float("nan"))
+        return cls.from_columns(
+            action=[req.signal.action for req in reqs],
+            suggested_position=[_opt(req.signal.suggested_position) for req in reqs],
+            available_quantity=[_opt(req.position.available_quantity if req.position else None) for req in reqs],
+            is_st=[req.is_st for req in reqs],
+            is_suspended=[req.is_suspended for req in reqs],
+            at_limit_up=[req.at_limit_up for req in reqs],
+            at_limit_down=[req.at_limit_down for req in reqs],
+            avg_turnover_20d=[_opt(req.avg_turnover_20d) for req in reqs],
+            portfolio_drawdown=[_opt(req.portfolio.current_drawdown if req.portfolio else None) for req in reqs],
+            industry_exposure=industry_exposure,
+            fundamental_score=[_opt(req.fundamental_score) for req in reqs],
+            fundamental_pit_ok=[-1 if req.fundamental_pit_ok is None else int(req.fundamental_pit_ok) for req in reqs],
+            fundamental_stale_days=[_opt(req.fundamental_stale_days) for req in reqs],
+            tushare_disclosure_risk_score=[_opt(req.tushare_disclosure_risk_score) for req in reqs],
+            tushare_audit_opinion_risk=[_opt(req.tushare_audit_opinion_risk) for req in reqs],
+            tushare_forecast_pchg_mid=[_opt(req.tushare_forecast_pchg_mid) for req in reqs],
+            tushare_pledge_ratio=[_opt(req.tushare_pledge_ratio) for req in reqs],
+            tushare_share_float_unlock_ratio=[_opt(req.tushare_share_float_unlock_ratio) for req in reqs],
+            tushare_overhang_risk_score=[_opt(req.tushare_overhang_risk_score) for req in reqs],
+            enable_small_capital_mode=[req.enable_small_capital_mode for req in reqs],
+            available_cash=[_opt(req.available_cash) for req in reqs],
+            small_capital_principal=[_opt(req.small_capital_principal) for req in reqs],
+            required_cash_for_min_lot=[_opt(req.required_cash_for_min_lot) for req in reqs],
+            estimated_roundtrip_cost_bps=[_opt(req.estimated_roundtrip_cost_bps) for req in reqs],
+            expected_edge_bps=[_opt(req.expected_edge_bps) for req in reqs],
+            min_expected_edge_bps=[_opt(req.min_expected_edge_bps) for req in reqs],
+            small_capital_cash_buffer_ratio=[float(req.small_capital_cash_buffer_ratio) for req in reqs],
+        )
+
+
+@dataclass
+class RiskBatchResult:
+    """Per-rule outcome matrices of shape (n_rules, n_signals).
+
+    ``levels`` holds LEVEL_INFO for passed checks and LEVEL_WARNING/LEVEL_CRITICAL for
+    failures; ``reasons`` holds the rule-specific reason code used to render messages.
+    """
+
+    rule_names: list[str]
+    levels: np.ndarray
+    reasons: np.ndarray
+
+    @property
+    def passed(self) -> np.ndarray:
+        return self.levels == LEVEL_INFO
+
+    @property
+    def blocked(self) -> np.ndarray:
+        return (self.levels == LEVEL_CRITICAL).any(axis=0)
+
+    @property
+    def level(self) -> np.ndarray:
+        if self.levels.shape[0] == 0:
+            return np.zeros(self.levels.shape[1], dtype=np.int8)
+        return self.levels.max(axis=0)
+
+    def rule_passed(self, rule_name: str) -> np.ndarray:
+        return self.passed[self.rule_names.index(rule_name)]
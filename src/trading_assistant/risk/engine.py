@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-import math
+from typing import Iterable
+
+import numpy as np
 
 from trading_assistant.core.models import (
     PortfolioRiskRequest,
@@ -11,6 +13,7 @@ from trading_assistant.core.models import (
     SignalAction,
     SignalLevel,
 )
+from trading_assistant.risk.metrics import historical_var_es, historical_var_es_many
 from trading_assistant.risk.rules import (
     DrawdownRule,
     FundamentalQualityRule,
@@ -25,6 +28,7 @@ from trading_assistant.risk.rules import (
     TPlusOneRule,
     TushareDisclosureAndOverhangRule,
 )
+from trading_assistant.risk.batch import LEVEL_INFO, LEVEL_TO_SIGNAL, RiskBatch, RiskBatchResult
 
 
 class RiskEngine:
@@ -76,7 +80,42 @@ class RiskEngine:
         self.max_industry_exposure = max_industry_exposure
 
     def evaluate(self, req: RiskCheckRequest) -> RiskCheckResult:
-        hits = [rule.check(req) for rule in self.rules]
+        return self._summarize([rule.check(req) for rule in self.rules])
+
+    def evaluate_batch(self, batch: RiskBatch) -> RiskBatchResult:
+        """Run every rule over a columnar batch and return per-rule level/reason matrices."""
+        n = len(batch)
+        levels = np.zeros((len(self.rules), n), dtype=np.int8)
+        reasons = np.zeros((len(self.rules), n), dtype=np.int32)
+        for row, rule in enumerate(self.rules):
+            levels[row], reasons[row] = rule.check_batch(batch)
+        return RiskBatchResult(rule_names=[rule.name for rule in self.rules], levels=levels, reasons=reasons)
+
+    def evaluate_many(self, requests: Iterable[RiskCheckRequest]) -> list[RiskCheckResult]:
+        """Batch counterpart of ``evaluate``; results are identical to per-request evaluation."""
+        batch = RiskBatch.from_requests(requests)
+        return self.materialize(batch, self.evaluate_batch(batch))
+
+    def materialize(self, batch: RiskBatch, result: RiskBatchResult) -> list[RiskCheckResult]:
+        """Expand batch masks into RiskCheckResult objects (messages rendered per row)."""
+        out: list[RiskCheckResult] = []
+        for idx in range(len(batch)):
+            hits = []
+            for row, rule in enumerate(self.rules):
+                level = int(result.levels[row, idx])
+                hits.append(
+                    RuleHit(
+                        rule_name=rule.name,
+                        passed=level == LEVEL_INFO,
+                        level=LEVEL_TO_SIGNAL[level],
+                        message=rule.describe(batch, idx, int(result.reasons[row, idx])),
+                    )
+                )
+            out.append(self._summarize(hits))
+        return out
+
+    @staticmethod
+    def _summarize(hits: list[RuleHit]) -> RiskCheckResult:
         failed_critical = [h for h in hits if (not h.passed) and h.level == SignalLevel.CRITICAL]
         failed_warning = [h for h in hits if (not h.passed) and h.level == SignalLevel.WARNING]
 
@@ -115,9 +154,17 @@ class RiskEngine:
             recommendations=recommendations,
         )
 
-    def evaluate_portfolio(self, req: PortfolioRiskRequest) -> PortfolioRiskResult:
+    def evaluate_portfolio(
+        self,
+        req: PortfolioRiskRequest,
+        *,
+        var_es: tuple[float | None, float | None] | None = None,
+    ) -> PortfolioRiskResult:
+        """Portfolio-level checks; ``var_es`` lets callers pass VaR/ES kept by a ``RollingVarEs``."""
         hits: list[RuleHit] = []
-        var_value, es_value = self._historical_var_es(req.daily_returns, confidence=req.var_confidence)
+        if var_es is None:
+            var_es = self._historical_var_es(req.daily_returns, confidence=req.var_confidence)
+        var_value, es_value = var_es
         if req.portfolio.current_drawdown > req.max_drawdown:
             hits.append(
                 RuleHit(
@@ -269,6 +316,19 @@ class RiskEngine:
             es_value=es_value,
         )
 
+    def evaluate_portfolio_many(self, requests: Iterable[PortfolioRiskRequest]) -> list[PortfolioRiskResult]:
+        """Batch counterpart of ``evaluate_portfolio``; VaR/ES are computed per confidence group."""
+        reqs = list(requests)
+        var_es: list[tuple[float | None, float | None]] = [(None, None)] * len(reqs)
+        by_confidence: dict[float, list[int]] = {}
+        for pos, req in enumerate(reqs):
+            by_confidence.setdefault(float(req.var_confidence), []).append(pos)
+        for confidence, positions in by_confidence.items():
+            values = historical_var_es_many([reqs[p].daily_returns for p in positions], confidence=confidence)
+            for pos, value in zip(positions, values):
+                var_es[pos] = value
+        return [self.evaluate_portfolio(req, var_es=value) for req, value in zip(reqs, var_es)]
+
     @staticmethod
     def _consecutive_losses(pnls: list[float]) -> int:
         count = 0
@@ -281,14 +341,4 @@ class RiskEngine:
 
     @staticmethod
     def _historical_var_es(returns: list[float], *, confidence: float) -> tuple[float | None, float | None]:
-        if not returns:
-            return None, None
-        losses = sorted(max(0.0, -float(x)) for x in returns)
-        if not losses:
-            return 0.0, 0.0
-        idx = int(math.ceil(confidence * len(losses))) - 1
-        idx = max(0, min(len(losses) - 1, idx))
-        var_value = float(losses[idx])
-        tail = losses[idx:]
-        es_value = float(sum(tail) / len(tail)) if tail else var_value
-        return var_value, es_value
+        return historical_var_es(returns, confidence=confidence)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import deque
+import math
+from typing import Iterable, Sequence
+
+import numpy as np
+
+
+def _tail_index(n: int, confidence: float) -> int:
+    idx = int(math.ceil(confidence * n)) - 1
+    return max(0, min(n - 1, idx))
+
+
+def historical_var_es(returns: Sequence[float], *, confidence: float) -> tuple[float | None, float | None]:
+    """Historical VaR/ES as positive loss fractions.
+
+    VaR is the ``ceil(confidence * n)``-th smallest loss (losses are ``max(0, -r)``) and ES
+    the mean of the losses from that order statistic upward. ``np.partition`` puts the tail
+    in place in O(n), so no full sort is needed.
+    """
+    if len(returns) == 0:
+        return None, None
+    losses = np.maximum(0.0, -np.asarray(returns, dtype=float))
+    idx = _tail_index(losses.size, confidence)
+    part = np.partition(losses, idx)
+    return float(part[idx]), float(np.mean(part[idx:]))
+
+
+def historical_var_es_many(
+    return_sets: Sequence[Sequence[float]], *, confidence: float
+) -> list[tuple[float | None, float | None]]:
+    """``historical_var_es`` for many portfolios; equal-length histories share one partition call."""
+    out: list[tuple[float | None, float | None]] = [(None, None)] * len(return_sets)
+    by_length: dict[int, list[int]] = {}
+    for pos, values in enumerate(return_sets):
+        if len(values):
+            by_length.setdefault(len(values), []).append(pos)
+    for n, positions in by_length.items():
+        losses = np.maximum(0.0, -np.asarray([return_sets[p] for p in positions], dtype=float))
+        idx = _tail_index(n, confidence)
+        part = np.partition(losses, idx, axis=1)
+        var_values = part[:, idx]
+        es_values = np.mean(part[:, idx:], axis=1)
+        for row, pos in enumerate(positions):
+            out[pos] = (float(var_values[row]), float(es_values[row]))
+    return out
+
+
+class RollingVarEs:
+    """Historical VaR/ES over the last ``window`` returns, updated one return at a time.
+
+    Losses are kept in a sorted list (``bisect`` search plus a memmove insert/delete, which
+    beats heap-with-lazy-deletion schemes in CPython for windows up to a few thousand) and
+    the ES tail sum is adjusted incrementally as the VaR order statistic moves. Values match
+    ``historical_var_es`` on the same window.
+    """
+
+    def __init__(self, window: int, *, confidence: float) -> None:
+        if int(window) <= 0:
+            raise ValueError("window must be positive.")
+        if not 0.0 < float(confidence) < 1.0:
+            raise ValueError("confidence must be in (0, 1).")
+        self.window = int(window)
+        self.confidence = float(confidence)
+        self._arrivals: deque[float] = deque()
+        self._sorted: list[float] = []
+        self._tail_start = 0
+        self._tail_sum = 0.0
+        self._since_resync = 0
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def update(self, daily_return: float) -> tuple[float | None, float | None]:
+        loss = max(0.0, -float(daily_return))
+        self._arrivals.append(loss)
+        self._insert(loss)
+        if len(self._arrivals) > self.window:
+            self._remove(self._arrivals.popleft())
+        self._move_tail()
+        self._since_resync += 1
+        if self._since_resync >= self.window:
+            # Bound floating-point drift of the running tail sum.
+            self._tail_sum = math.fsum(self._sorted[self._tail_start :])
+            self._since_resync = 0
+        return self.value()
+
+    def extend(self, returns: Iterable[float]) -> tuple[float | None, float | None]:
+        for value in returns:
+            self.update(value)
+        return self.value()
+
+    def value(self) -> tuple[float | None, float | None]:
+        n = len(self._sorted)
+        if n == 0:
+            return None, None
+        return float(self._sorted[self._tail_start]), float(self._tail_sum / (n - self._tail_start))
+
+    def _insert(self, loss: float) -> None:
+        pos = bisect_right(self._sorted, loss)
+        self._sorted.insert(pos, loss)
+        if pos < self._tail_start:
+            self._tail_start += 1
+        else:
+            self._tail_sum += loss
+
+    def _remove(self, loss: float) -> None:
+        pos = bisect_left(self._sorted, loss)
+        del self._sorted[pos]
+        if pos < self._tail_start:
+            self._tail_start -= 1
+        else:
+            self._tail_sum -= loss
+
+    def _move_tail(self) -> None:
+        target = _tail_index(len(self._sorted), self.confidence)
+        while self._tail_start < target:
+            self._tail_sum -= self._sorted[self._tail_start]
+            self._tail_start += 1
+        while self._tail_start > target:
+            self._tail_start -= 1
+            self._tail_sum += self._sorted[self._tail_start]
@@ -2,7 +2,29 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from trading_assistant.core.models import RiskCheckRequest, RuleHit, SignalAction, SignalLevel
+from trading_assistant.risk.batch import (
+    ACTION_BUY,
+    ACTION_SELL,
+    LEVEL_CRITICAL,
+    LEVEL_INFO,
+    LEVEL_WARNING,
+    RiskBatch,
+)
+
+
+def _select(
+    branches: list[tuple[np.ndarray, int, int]],
+    *,
+    default_reason: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """First-match vectorized branch selection mirroring the scalar if/elif chains."""
+    conds = [cond for cond, _, _ in branches]
+    levels = np.select(conds, [level for _, level, _ in branches], LEVEL_INFO).astype(np.int8)
+    reasons = np.select(conds, [reason for _, _, reason in branches], default_reason).astype(np.int32)
+    return levels, reasons
 
 
 class RiskRule(ABC):
@@ -12,6 +34,14 @@ class RiskRule(ABC):
     def check(self, req: RiskCheckRequest) -> RuleHit:
         """Validate one risk rule and return rule hit details."""
 
+    @abstractmethod
+    def check_batch(self, batch: RiskBatch) -> tuple[np.ndarray, np.ndarray]:
+        """Validate the rule for every row of a batch; returns (level codes, reason codes)."""
+
+    @abstractmethod
+    def describe(self, batch: RiskBatch, idx: int, reason: int) -> str:
+        """Render the message ``check`` would produce for batch row ``idx``."""
+
 
 class TPlusOneRule(RiskRule):
     name = "t_plus_one"
@@ -30,6 +60,25 @@ class TPlusOneRule(RiskRule):
             )
         return RuleHit(rule_name=self.name, passed=True, level=SignalLevel.INFO, message="T+1 validation passed.")
 
+    _MESSAGES = {
+        0: "Not a SELL action.",
+        1: "T+1 validation passed.",
+        2: "T+1 constraint hit: no available quantity for selling.",
+    }
+
+    def check_batch(self, batch: RiskBatch) -> tuple[np.ndarray, np.ndarray]:
+        available_qty = np.nan_to_num(batch.available_quantity, nan=0.0)
+        return _select(
+            [
+                (batch.action != ACTION_SELL, LEVEL_INFO, 0),
+                (available_qty <= 0, LEVEL_CRITICAL, 2),
+            ],
+            default_reason=1,
+        )
+
+    def describe(self, batch: RiskBatch, idx: int, reason: int) -> str:
+        return self._MESSAGES[reason]
+
 
 class STRule(RiskRule):
     name = "st_filter"
@@ -44,6 +93,17 @@ class STRule(RiskRule):
             )
         return RuleHit(rule_name=self.name, passed=True, level=SignalLevel.INFO, message="ST validation passed.")
 
+    _MESSAGES = {
+        0: "ST validation passed.",
+        1: "ST/risk-warning stock is blocked for new BUY signals.",
+    }
+
+    def check_batch(self, batch: RiskBatch) -> tuple[np.ndarray, np.ndarray]:
+        return _select([((batch.action == ACTION_BUY) & batch.is_st, LEVEL_CRITICAL, 1)], default_reason=0)
+
+    def describe(self, batch: RiskBatch, idx: int, reason: int) -> str:
+        return self._MESSAGES[reason]
+
 
 class SuspensionRule(RiskRule):
     name = "suspension_filter"
@@ -58,6 +118,18 @@ class SuspensionRule(RiskRule):
             )
         return RuleHit(rule_name=self.name, passed=True, level=SignalLevel.INFO, message="Suspension validation passed.")
 
+    _MESSAGES = {
+        0: "Suspension validation passed.",
+        1: "Security is suspended.",
+    }
+
+    def check_batch(self, batch: RiskBatch) -> tuple[np.ndarray, np.ndarray]:
+        executable = (batch.action == ACTION_BUY) | (batch.action == ACTION_SELL)
+        return _select([(executable & batch.is_suspended, LEVEL_CRITICAL, 1)], default_reason=0)
+
+    def describe(self, batch: RiskBatch, idx: int, reason: int) -> str:
+        return self._MESSAGES[reason]
+
 
 class LimitPriceRule(RiskRule):
     name = "limit_price"
@@ -79,6 +151,24 @@ class LimitPriceRule(RiskRule):
             )
         return RuleHit(rule_name=self.name, passed=True, level=SignalLevel.INFO, message="Limit-price validation passed.")
 
+    _MESSAGES = {
+        0: "Limit-price validation passed.",
+        1: "Near/up-limit-up, BUY may not be filled.",
+        2: "Near/at-limit-down, SELL may not be filled.",
+    }
+
+    def check_batch(self, batch: RiskBatch) -> tuple[np.ndarray, np.ndarray]:
+        return _select(
+            [
+                ((batch.action == ACTION_BUY) & batch.at_limit_up, LEVEL_WARNING, 1),
+                ((batch.action == ACTION_SELL) & batch.at_limit_down, LEVEL_WARNING, 2),
+            ],
+            default_reason=0,
+        )
+
+    def describe(self, batch: RiskBatch, idx: int, reason: int) -> str:
+        return self._MESSAGES[reason]
+
 
 class PositionLimitRule(RiskRule):
     name = "single_position_limit"
@@ -97,6 +187,17 @@ class PositionLimitRule(RiskRule):
             )
         return RuleHit(rule_name=self.name, passed=True, level=SignalLevel.INFO, message="Single-position limit passed.")
 
+    def check_batch(self, batch: RiskBatch) -> tuple[np.ndarray, np.ndarray]:
+        # NaN targets compare False, matching the scalar ``target is not None`` guard.
+        over = (batch.action == ACTION_BUY) & (batch.suggested_position > self.max_single_position)
+        return _select([(over, LEVEL_CRITICAL, 1)], default_reason=0)
+
+    def describe(self, batch: RiskBatch, idx: int, reason: int) -> str:
+        if reason == 1:
+            target = float(batch.suggested_position[idx])
+            return f"Target position {target:.2%} exceeds limit {self.max_single_position:.2%}."
+        return "Single-position limit passed."
+
 
 class LiquidityRule(RiskRule):
     name = "liquidity_min_turnover"
@@ -118,6 +219,25 @@ class LiquidityRule(RiskRule):
             )
         return RuleHit(rule_name=self.name, passed=True, level=SignalLevel.INFO, message="Liquidity validation passed.")
 
+    def check_batch(self, batch: RiskBatch) -> tuple[np.ndarray, np.ndarray]:
+        executable = (batch.action == ACTION_BUY) | (batch.action == ACTION_SELL)
+        turnover = np.nan_to_num(batch.avg_turnover_20d, nan=0.0)
+        return _select(
+            [
+                (~executable, LEVEL_INFO, 0),
+                (turnover < self.min_turnover_20d, LEVEL_WARNING, 2),
+            ],
+            default_reason=1,
+        )
+
+    def describe(self, batch: RiskBatch, idx: int, reason: int) -> str:
+        if reason == 0:
+            return "Not an executable signal."
+        if reason == 2:
+            turnover = float(np.nan_to_num(batch.avg_turnover_20d[idx], nan=0.0))
+            return f"Avg turnover20 {turnover:.2f} below threshold {self.min_turnover_20d:.2f}."
+        return "Liquidity validation passed."
+
 
 class DrawdownRule(RiskRule):
     name = "portfolio_drawdown"
@@ -141,6 +261,26 @@ class DrawdownRule(RiskRule):
             )
         return RuleHit(rule_name=self.name, passed=True, level=SignalLevel.INFO, message="Drawdown validation passed.")
 
+    def check_batch(self, batch: RiskBatch) -> tuple[np.ndarray, np.ndarray]:
+        drawdown = batch.portfolio_drawdown
+        return _select(
+            [
+                (np.isnan(drawdown), LEVEL_INFO, 0),
+                (drawdown > self.max_drawdown, LEVEL_CRITICAL, 2),
+            ],
+            default_reason=1,
+        )
+
+    def describe(self, batch: RiskBatch, idx: int, reason: int) -> str:
+        if reason == 0:
+            return "No portfolio snapshot."
+        if reason == 2:
+            return (
+                f"Portfolio drawdown {float(batch.portfolio_drawdown[idx]):.2%} "
+                f"exceeds limit {self.max_drawdown:.2%}."
+            )
+        return "Drawdown validation passed."
+
 
 class IndustryExposureRule(RiskRule):
     name = "industry_exposure"
@@ -167,6 +307,27 @@ class IndustryExposureRule(RiskRule):
             )
         return RuleHit(rule_name=self.name, passed=True, level=SignalLevel.INFO, message="Industry exposure validation passed.")
 
+    def check_batch(self, batch: RiskBatch) -> tuple[np.ndarray, np.ndarray]:
+        projected = batch.industry_exposure + np.nan_to_num(batch.suggested_position, nan=0.0)
+        return _select(
+            [
+                (np.isnan(batch.industry_exposure) | (batch.action != ACTION_BUY), LEVEL_INFO, 0),
+                (projected > self.max_industry_exposure, LEVEL_WARNING, 2),
+            ],
+            default_reason=1,
+        )
+
+    def describe(self, batch: RiskBatch, idx: int, reason: int) -> str:
+        if reason == 0:
+            return "Industry check not applicable."
+        if reason == 2:
+            projected = float(batch.industry_exposure[idx]) + float(np.nan_to_num(batch.suggested_position[idx], nan=0.0))
+            return (
+                f"Projected industry exposure {projected:.2%} exceeds "
+                f"limit {self.max_industry_exposure:.2%}."
+            )
+        return "Industry exposure validation passed."
+
 
 class FundamentalQualityRule(RiskRule):
     name = "fundamental_quality"
@@ -238,6 +399,40 @@ class FundamentalQualityRule(RiskRule):
             )
         return RuleHit(rule_name=self.name, passed=True, level=SignalLevel.INFO, message="Fundamental quality passed.")
 
+    def check_batch(self, batch: RiskBatch) -> tuple[np.ndarray, np.ndarray]:
+        score = batch.fundamental_score
+        stale = batch.fundamental_stale_days
+        missing = np.isnan(score)
+        return _select(
+            [
+                (batch.action != ACTION_BUY, LEVEL_INFO, 0),
+                (batch.fundamental_pit_ok == 0, LEVEL_CRITICAL, 2),
+                (missing, LEVEL_WARNING if self.require_data_for_buy else LEVEL_INFO, 3 if self.require_data_for_buy else 4),
+                (score < self.critical_score, LEVEL_CRITICAL, 5),
+                (score < self.warning_score, LEVEL_WARNING, 6),
+                ((stale >= 0) & (stale > 540), LEVEL_WARNING, 7),
+            ],
+            default_reason=1,
+        )
+
+    def describe(self, batch: RiskBatch, idx: int, reason: int) -> str:
+        score = float(batch.fundamental_score[idx])
+        if reason == 0:
+            return "Not a BUY action."
+        if reason == 2:
+            return "Fundamental PIT check failed (publish time later than trade as-of)."
+        if reason == 3:
+            return "No fundamental snapshot found; require manual confirmation."
+        if reason == 4:
+            return "No fundamental snapshot; fallback to technical/event factors."
+        if reason == 5:
+            return f"Fundamental score {score:.3f} below critical floor {self.critical_score:.3f}."
+        if reason == 6:
+            return f"Fundamental score {score:.3f} below warning floor {self.warning_score:.3f}."
+        if reason == 7:
+            return f"Fundamental snapshot is stale ({int(batch.fundamental_stale_days[idx])} days)."
+        return "Fundamental quality passed."
+
 
 class TushareDisclosureAndOverhangRule(RiskRule):
     name = "tushare_disclosure_overhang"
@@ -335,6 +530,96 @@ class TushareDisclosureAndOverhangRule(RiskRule):
 
         return RuleHit(rule_name=self.name, passed=True, level=SignalLevel.INFO, message="Tushare disclosure/overhang passed.")
 
+    # Batch reason codes: 0 = not a BUY, 1 = passed, otherwise a bitmask of the flags below.
+    FLAG_AUDIT = 1 << 2
+    FLAG_FORECAST_CRITICAL = 1 << 3
+    FLAG_DISCLOSURE_CRITICAL = 1 << 4
+    FLAG_PLEDGE = 1 << 5
+    FLAG_UNLOCK_CRITICAL = 1 << 6
+    FLAG_FORECAST_WARNING = 1 << 7
+    FLAG_DISCLOSURE_WARNING = 1 << 8
+    FLAG_UNLOCK_WARNING = 1 << 9
+    FLAG_OVERHANG = 1 << 10
+    _CRITICAL_FLAGS = FLAG_AUDIT | FLAG_FORECAST_CRITICAL | FLAG_DISCLOSURE_CRITICAL | FLAG_PLEDGE | FLAG_UNLOCK_CRITICAL
+
+    def check_batch(self, batch: RiskBatch) -> tuple[np.ndarray, np.ndarray]:
+        small_cap = batch.enable_small_capital_mode
+        forecast = batch.tushare_forecast_pchg_mid
+        disclosure = batch.tushare_disclosure_risk_score
+        unlock = batch.tushare_share_float_unlock_ratio
+        forecast_critical = forecast <= self.forecast_critical_pct
+        disclosure_critical = disclosure >= self.disclosure_critical_score
+        unlock_critical = small_cap & (unlock >= self.small_cap_unlock_critical_ratio)
+        flag_masks = (
+            (self.FLAG_AUDIT, batch.tushare_audit_opinion_risk >= self.disclosure_critical_score),
+            (self.FLAG_FORECAST_CRITICAL, forecast_critical),
+            (self.FLAG_DISCLOSURE_CRITICAL, disclosure_critical),
+            (self.FLAG_PLEDGE, small_cap & (batch.tushare_pledge_ratio >= self.small_cap_pledge_critical_ratio)),
+            (self.FLAG_UNLOCK_CRITICAL, unlock_critical),
+            (self.FLAG_FORECAST_WARNING, ~forecast_critical & (forecast <= self.forecast_warning_pct)),
+            (self.FLAG_DISCLOSURE_WARNING, ~disclosure_critical & (disclosure >= self.disclosure_warning_score)),
+            (self.FLAG_UNLOCK_WARNING, ~unlock_critical & small_cap & (unlock >= self.small_cap_unlock_warning_ratio)),
+            (self.FLAG_OVERHANG, small_cap & (batch.tushare_overhang_risk_score >= self.small_cap_overhang_warning_score)),
+        )
+        flags = np.zeros(len(batch), dtype=np.int32)
+        for flag, mask in flag_masks:
+            flags |= np.where(mask, flag, 0).astype(np.int32)
+
+        buy = batch.action == ACTION_BUY
+        flags = np.where(buy, flags, 0)
+        levels = np.where(
+            (flags & self._CRITICAL_FLAGS) != 0,
+            LEVEL_CRITICAL,
+            np.where(flags != 0, LEVEL_WARNING, LEVEL_INFO),
+        ).astype(np.int8)
+        reasons = np.where(buy, np.where(flags != 0, flags, 1), 0).astype(np.int32)
+        return levels, reasons
+
+    def describe(self, batch: RiskBatch, idx: int, reason: int) -> str:
+        if reason == 0:
+            return "Not a BUY action."
+        if reason == 1:
+            return "Tushare disclosure/overhang passed."
+        audit = float(batch.tushare_audit_opinion_risk[idx])
+        forecast = float(batch.tushare_forecast_pchg_mid[idx])
+        disclosure = float(batch.tushare_disclosure_risk_score[idx])
+        pledge = float(batch.tushare_pledge_ratio[idx])
+        unlock = float(batch.tushare_share_float_unlock_ratio[idx])
+        overhang = float(batch.tushare_overhang_risk_score[idx])
+        critical = [
+            (self.FLAG_AUDIT, f"Audit opinion risk {audit:.2f} >= {self.disclosure_critical_score:.2f}."),
+            (self.FLAG_FORECAST_CRITICAL, f"Forecast mid growth {forecast:.1f}% <= {self.forecast_critical_pct:.1f}%."),
+            (
+                self.FLAG_DISCLOSURE_CRITICAL,
+                f"Disclosure risk score {disclosure:.2f} >= {self.disclosure_critical_score:.2f}.",
+            ),
+            (
+                self.FLAG_PLEDGE,
+                f"Pledge ratio {pledge:.1f}% >= {self.small_cap_pledge_critical_ratio:.1f}% (small-cap).",
+            ),
+            (
+                self.FLAG_UNLOCK_CRITICAL,
+                f"Unlock pressure {unlock:.1%} >= {self.small_cap_unlock_critical_ratio:.1%} (small-cap).",
+            ),
+        ]
+        warning = [
+            (self.FLAG_FORECAST_WARNING, f"Forecast mid growth {forecast:.1f}% <= {self.forecast_warning_pct:.1f}%."),
+            (
+                self.FLAG_DISCLOSURE_WARNING,
+                f"Disclosure risk score {disclosure:.2f} >= {self.disclosure_warning_score:.2f}.",
+            ),
+            (
+                self.FLAG_UNLOCK_WARNING,
+                f"Unlock pressure {unlock:.1%} >= {self.small_cap_unlock_warning_ratio:.1%} (small-cap).",
+            ),
+            (
+                self.FLAG_OVERHANG,
+                f"Overhang risk score {overhang:.2f} >= {self.small_cap_overhang_warning_score:.2f} (small-cap).",
+            ),
+        ]
+        chosen = critical if reason & self._CRITICAL_FLAGS else warning
+        return "; ".join(text for flag, text in chosen if reason & flag)
+
 
 class SmallCapitalTradabilityRule(RiskRule):
     name = "small_capital_tradability"
@@ -394,3 +679,42 @@ class SmallCapitalTradabilityRule(RiskRule):
                 )
 
         return RuleHit(rule_name=self.name, passed=True, level=SignalLevel.INFO, message="Small-capital tradability passed.")
+
+    def check_batch(self, batch: RiskBatch) -> tuple[np.ndarray, np.ndarray]:
+        available_cash = np.where(np.isnan(batch.available_cash), batch.small_capital_principal, batch.available_cash)
+        max_usable_cash = available_cash * np.maximum(0.0, 1.0 - batch.small_capital_cash_buffer_ratio)
+        required = batch.estimated_roundtrip_cost_bps + batch.min_expected_edge_bps
+        return _select(
+            [
+                (~batch.enable_small_capital_mode, LEVEL_INFO, 0),
+                (batch.action != ACTION_BUY, LEVEL_INFO, 1),
+                (np.isnan(available_cash), LEVEL_WARNING, 2),
+                (max_usable_cash < batch.required_cash_for_min_lot, LEVEL_CRITICAL, 3),
+                (batch.expected_edge_bps < required, LEVEL_WARNING, 4),
+            ],
+            default_reason=5,
+        )
+
+    def describe(self, batch: RiskBatch, idx: int, reason: int) -> str:
+        if reason == 0:
+            return "Small-capital mode disabled."
+        if reason == 1:
+            return "Small-capital tradability check applies to BUY actions only."
+        if reason == 2:
+            return "Small-capital mode is enabled but available cash is unknown."
+        if reason == 3:
+            available_cash = float(batch.available_cash[idx])
+            if np.isnan(available_cash):
+                available_cash = float(batch.small_capital_principal[idx])
+            max_usable_cash = available_cash * max(0.0, 1.0 - float(batch.small_capital_cash_buffer_ratio[idx]))
+            return (
+                f"Not tradable for small account: usable_cash={max_usable_cash:.2f}, "
+                f"required_cash_for_lot={float(batch.required_cash_for_min_lot[idx]):.2f}."
+            )
+        if reason == 4:
+            required = float(batch.estimated_roundtrip_cost_bps[idx]) + float(batch.min_expected_edge_bps[idx])
+            return (
+                f"Expected edge {float(batch.expected_edge_bps[idx]):.1f}bps < required {required:.1f}bps "
+                "(cost + safety margin)."
+            )
+        return "Small-capital tradability passed."
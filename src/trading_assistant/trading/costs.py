@@ -2,7 +2,14 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 from trading_assistant.core.models import SignalAction
+from trading_assistant.risk.batch import ACTION_BUY, ACTION_SELL
+
+
+_FILL_LOGIT_CAP = 700.0
 
 
 def calc_commission(notional: float, rate: float, min_commission: float) -> float:
@@ -194,8 +201,9 @@ def estimate_fill_probability(
     if adv <= 0 or notional <= 0:
         return 1.0
     participation = max(0.0, notional / max(adv, 1.0))
-    # Logistic decay on participation ratio.
-    prob = 1.0 / (1.0 + math.exp(18.0 * (participation - 0.035)))
+    # Logistic decay on participation ratio; the exponent is capped so huge orders
+    # (participation beyond ~39x ADV) bottom out at the floor instead of overflowing.
+    prob = 1.0 / (1.0 + math.exp(min(_FILL_LOGIT_CAP, 18.0 * (participation - 0.035))))
     return max(floor, min(1.0, prob))
 
 
@@ -205,3 +213,198 @@ def filled_quantity_by_probability(*, desired_qty: int, lot_size: int, fill_prob
     prob = max(0.0, min(1.0, float(fill_probability)))
     filled = int((desired_qty * prob) // lot_size) * lot_size
     return max(0, min(int(desired_qty), filled))
+
+
+# ---------------------------------------------------------------------------
+# Array-in/array-out counterparts.
+#
+# Each ``*_many`` function mirrors the scalar function above element-wise and broadcasts
+# its array arguments (scalars are accepted anywhere). Optional inputs that the scalar
+# versions take as ``None`` are NaN in arrays. ``side`` is either one ``SignalAction`` or
+# an array of ``risk.batch`` action codes, the columnar encoding used by ``RiskBatch``.
+# ---------------------------------------------------------------------------
+
+_SLIPPAGE_TIER_BOUNDS = np.array([0.005, 0.015, 0.03, 0.06])
+_SLIPPAGE_TIER_UPLIFT = np.array([0.0, 0.0002, 0.0005, 0.0010, 0.0020])
+
+
+def _missing_as_zero(values: ArrayLike | None) -> np.ndarray:
+    if values is None:
+        return np.asarray(0.0)
+    arr = np.asarray(values, dtype=float)
+    return np.where(np.isnan(arr), 0.0, arr)
+
+
+def _side_masks(side: SignalAction | ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+    if isinstance(side, str):
+        action = SignalAction(side)
+        return np.asarray(action == SignalAction.BUY), np.asarray(action == SignalAction.SELL)
+    codes = np.asarray(side)
+    return codes == ACTION_BUY, codes == ACTION_SELL
+
+
+def calc_side_fee_many(
+    *,
+    notional: ArrayLike,
+    commission_rate: ArrayLike,
+    min_commission: ArrayLike,
+    transfer_fee_rate: ArrayLike,
+    stamp_duty_sell_rate: ArrayLike,
+    is_sell: ArrayLike,
+) -> np.ndarray:
+    notional = np.asarray(notional, dtype=float)
+    commission = np.maximum(np.asarray(min_commission, dtype=float), notional * np.asarray(commission_rate, dtype=float))
+    transfer = notional * np.asarray(transfer_fee_rate, dtype=float)
+    stamp = np.where(np.asarray(is_sell, dtype=bool), notional * np.asarray(stamp_duty_sell_rate, dtype=float), 0.0)
+    return np.where(notional > 0, commission + transfer + stamp, 0.0)
+
+
+def estimate_roundtrip_cost_bps_many(
+    *,
+    price: ArrayLike,
+    lot_size: ArrayLike,
+    commission_rate: ArrayLike,
+    min_commission: ArrayLike,
+    transfer_fee_rate: ArrayLike,
+    stamp_duty_sell_rate: ArrayLike,
+    slippage_rate: ArrayLike,
+) -> np.ndarray:
+    price = np.asarray(price, dtype=float)
+    lot_size = np.asarray(lot_size, dtype=np.int64)
+    notional = price * lot_size
+    fees = dict(
+        commission_rate=commission_rate,
+        min_commission=min_commission,
+        transfer_fee_rate=transfer_fee_rate,
+        stamp_duty_sell_rate=stamp_duty_sell_rate,
+    )
+    buy_fee = calc_side_fee_many(notional=notional, is_sell=False, **fees)
+    sell_fee = calc_side_fee_many(notional=notional, is_sell=True, **fees)
+    slip_cost = notional * np.maximum(0.0, np.asarray(slippage_rate, dtype=float)) * 2.0
+    total = buy_fee + sell_fee + slip_cost
+    valid = (price > 0) & (lot_size > 0) & (notional > 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(valid, total / notional * 10000.0, 0.0)
+
+
+def required_cash_for_min_lot_many(
+    *,
+    price: ArrayLike,
+    lot_size: ArrayLike,
+    commission_rate: ArrayLike,
+    min_commission: ArrayLike,
+    transfer_fee_rate: ArrayLike,
+) -> np.ndarray:
+    price = np.asarray(price, dtype=float)
+    lot_size = np.asarray(lot_size, dtype=np.int64)
+    notional = price * lot_size
+    buy_fee = calc_side_fee_many(
+        notional=notional,
+        commission_rate=commission_rate,
+        min_commission=min_commission,
+        transfer_fee_rate=transfer_fee_rate,
+        stamp_duty_sell_rate=0.0,
+        is_sell=False,
+    )
+    return np.where((price > 0) & (lot_size > 0), notional + buy_fee, 0.0)
+
+
+def infer_expected_edge_bps_many(
+    *,
+    confidence: ArrayLike,
+    momentum20: ArrayLike | None = None,
+    event_score: ArrayLike | None = None,
+    fundamental_score: ArrayLike | None = None,
+) -> np.ndarray:
+    c = np.clip(np.asarray(confidence, dtype=float), 0.0, 1.0)
+    base = np.maximum(0.0, (c - 0.5) * 400.0)
+    for values, scale, offset, low, high in (
+        (momentum20, 300.0, 0.0, -80.0, 120.0),
+        (event_score, 200.0, 0.5, 0.0, 80.0),
+        (fundamental_score, 120.0, 0.5, -40.0, 60.0),
+    ):
+        if values is None:
+            continue
+        arr = np.asarray(values, dtype=float)
+        with np.errstate(invalid="ignore"):
+            term = np.clip((arr - offset) * scale, low, high)
+        base = np.where(np.isfinite(arr), base + term, base)
+    return np.maximum(0.0, base)
+
+
+def tiered_slippage_rate_many(
+    *,
+    order_notional: ArrayLike,
+    avg_turnover_20d: ArrayLike | None,
+    base_slippage_rate: ArrayLike,
+) -> np.ndarray:
+    base = np.maximum(0.0, np.asarray(base_slippage_rate, dtype=float))
+    adv = _missing_as_zero(avg_turnover_20d)
+    notional = np.asarray(order_notional, dtype=float)
+    ratio = notional / np.maximum(adv, 1.0)
+    uplift = _SLIPPAGE_TIER_UPLIFT[np.searchsorted(_SLIPPAGE_TIER_BOUNDS, ratio, side="left")]
+    return np.where((notional <= 0) | (adv <= 0), base, base + uplift)
+
+
+def estimate_market_impact_rate_many(
+    *,
+    order_notional: ArrayLike,
+    avg_turnover_20d: ArrayLike | None,
+    impact_coeff: ArrayLike,
+    impact_exponent: ArrayLike,
+) -> np.ndarray:
+    adv = _missing_as_zero(avg_turnover_20d)
+    notional = np.asarray(order_notional, dtype=float)
+    ratio = np.maximum(0.0, notional / np.maximum(adv, 1.0))
+    coeff = np.maximum(0.0, np.asarray(impact_coeff, dtype=float))
+    exponent = np.clip(np.asarray(impact_exponent, dtype=float), 0.1, 2.0)
+    return np.where((notional <= 0) | (adv <= 0), 0.0, coeff * (ratio**exponent) * 0.001)
+
+
+def estimate_fill_probability_many(
+    *,
+    side: SignalAction | ArrayLike,
+    is_suspended: ArrayLike,
+    at_limit_up: ArrayLike = False,
+    at_limit_down: ArrayLike = False,
+    is_one_word_limit_up: ArrayLike = False,
+    is_one_word_limit_down: ArrayLike = False,
+    avg_turnover_20d: ArrayLike | None = None,
+    order_notional: ArrayLike | None = None,
+    probability_floor: ArrayLike = 0.02,
+) -> np.ndarray:
+    floor = np.clip(np.asarray(probability_floor, dtype=float), 0.0, 1.0)
+    is_buy, is_sell = _side_masks(side)
+    adv = _missing_as_zero(avg_turnover_20d)
+    notional = _missing_as_zero(order_notional)
+    participation = np.maximum(0.0, notional / np.maximum(adv, 1.0))
+    prob = 1.0 / (1.0 + np.exp(np.minimum(_FILL_LOGIT_CAP, 18.0 * (participation - 0.035))))
+    prob = np.where((adv <= 0) | (notional <= 0), 1.0, np.maximum(floor, np.minimum(1.0, prob)))
+    limit_floor = np.maximum(floor, 0.15)
+    # np.select takes the first matching branch, mirroring the early returns above.
+    return np.select(
+        [
+            np.asarray(is_suspended, dtype=bool),
+            is_buy & np.asarray(is_one_word_limit_up, dtype=bool),
+            is_sell & np.asarray(is_one_word_limit_down, dtype=bool),
+            is_buy & np.asarray(at_limit_up, dtype=bool),
+            is_sell & np.asarray(at_limit_down, dtype=bool),
+        ],
+        [0.0, floor, floor, limit_floor, limit_floor],
+        default=prob,
+    )
+
+
+def filled_quantity_by_probability_many(
+    *,
+    desired_qty: ArrayLike,
+    lot_size: ArrayLike,
+    fill_probability: ArrayLike,
+) -> np.ndarray:
+    desired = np.asarray(desired_qty, dtype=np.int64)
+    lots = np.asarray(lot_size, dtype=np.int64)
+    prob = np.clip(np.asarray(fill_probability, dtype=float), 0.0, 1.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        filled = np.floor_divide(desired * prob, np.maximum(lots, 1)).astype(np.int64) * lots
+    filled = np.clip(filled, 0, np.maximum(desired, 0))
+    return np.where((desired <= 0) | (lots <= 0), 0, filled)
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+
+def is_buy_candidate(row: dict[str, Any]) -> bool:
+    return (
+        str(row.get("action", "")) == "BUY"
+        and (not bool(row.get("blocked", False)))
+        and str(row.get("risk_level", "")) != "CRITICAL"
+        and row.get("close") is not None
+        and row.get("max_buy_price") is not None
+        and float(row.get("close")) <= float(row.get("max_buy_price"))
+        and row.get("buy_price_high") is not None
+    )
+
+
+def write_json_atomic(path: Path, payload: dict[str, Any]) -> None:
+    """Write JSON via a temp file + rename so readers never observe a partial document."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+_RETRYABLE_ACTIONS = frozenset({"TIMEOUT", "ERROR"})
+
+
+def is_retryable_row(row: dict[str, Any]) -> bool:
+    """Timed-out or failed symbols are scanned again by a resumed run."""
+    return str(row.get("action", "")).upper() in _RETRYABLE_ACTIONS
+
+
+def scan_checkpoint_path(jsonl_path: Path) -> Path:
+    return jsonl_path.with_name(f"{jsonl_path.stem}.checkpoint.json")
+
+
+def universe_digest(symbols: list[str]) -> str:
+    return hashlib.sha256("\n".join(sorted(symbols)).encode("utf-8")).hexdigest()
+
+
+def write_scan_checkpoint(jsonl_path: Path, *, params: dict[str, Any], universe: list[str]) -> None:
+    """Record the parameters and universe a scan JSONL was produced with."""
+    write_json_atomic(
+        scan_checkpoint_path(jsonl_path),
+        {
+            "params": dict(params),
+            "universe": list(universe),
+            "universe_sha256": universe_digest(universe),
+        },
+    )
+
+
+def load_scan_checkpoint(jsonl_path: Path, *, params: dict[str, Any]) -> list[str]:
+    """Universe of the run being resumed; ValueError if it was started with other parameters."""
+    path = scan_checkpoint_path(jsonl_path)
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise ValueError(f"cannot resume: checkpoint {path} is missing or unreadable") from exc
+    universe = payload.get("universe") if isinstance(payload, dict) else None
+    if not isinstance(universe, list) or payload.get("universe_sha256") != universe_digest([str(x) for x in universe]):
+        raise ValueError(f"cannot resume: checkpoint {path} has a corrupt universe")
+    saved = payload.get("params") if isinstance(payload.get("params"), dict) else {}
+    mismatched = sorted(key for key in set(saved) | set(params) if saved.get(key) != params.get(key))
+    if mismatched:
+        details = ", ".join(f"{key}: {saved.get(key)!r} != {params.get(key)!r}" for key in mismatched)
+        raise ValueError(f"cannot resume: run parameters differ from the checkpoint ({details})")
+    return [str(x) for x in universe]
+
+
+class ScanResultAggregator:
+    """Streaming counters and bounded top-N heap over full-market scan rows.
+
+    Rows are folded in as they are produced, so progress and the candidate list never
+    require re-reading the scan JSONL. A symbol is counted once; later duplicates (for
+    example rows appended by a resumed run) are ignored.
+    """
+
+    def __init__(self, top_n: int) -> None:
+        self.top_n = max(1, int(top_n))
+        self.scanned = 0
+        self.buy_pass = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.last_symbol: str | None = None
+        self._seen: set[str] = set()
+        self._heap: list[tuple[float, int, dict[str, Any]]] = []
+        self._row_idx = 0
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._seen
+
+    @property
+    def scanned_symbols(self) -> set[str]:
+        return set(self._seen)
+
+    def add(self, row: dict[str, Any]) -> bool:
+        symbol = str(row.get("symbol", ""))
+        if not symbol or symbol in self._seen:
+            return False
+        self._seen.add(symbol)
+        self.scanned += 1
+        self.last_symbol = symbol
+        if str(row.get("action", "")).upper() == "TIMEOUT":
+            self.timeouts += 1
+        elif row.get("error") is not None:
+            self.errors += 1
+
+        row_idx = self._row_idx
+        self._row_idx += 1
+        if not is_buy_candidate(row):
+            return True
+        self.buy_pass += 1
+        confidence = float(row.get("confidence", 0.0))
+        item = (confidence, row_idx, row)
+        if len(self._heap) < self.top_n:
+            heapq.heappush(self._heap, item)
+        elif confidence > self._heap[0][0]:
+            heapq.heapreplace(self._heap, item)
+        return True
+
+    def top_candidates(self) -> list[dict[str, Any]]:
+        top = sorted(self._heap, key=lambda x: x[0], reverse=True)
+        return [x[2] for x in top]
+
+    def counters(self) -> dict[str, int]:
+        return {
+            "scanned_symbols": int(self.scanned),
+            "buy_pass_symbols": int(self.buy_pass),
+            "error_symbols": int(self.errors),
+            "timeout_symbols": int(self.timeouts),
+        }
+
+    def snapshot(self, *, total_symbols: int, **extra: Any) -> dict[str, Any]:
+        total = max(0, int(total_symbols))
+        payload: dict[str, Any] = {
+            **extra,
+            "total_symbols": total,
+            **self.counters(),
+            "progress_pct": round(float(self.scanned) / max(float(total), 1.0) * 100.0, 2),
+            "top_candidates": self.top_candidates(),
+        }
+        return payload
+
+
+def compact_scan_jsonl(jsonl_path: Path, aggregator: ScanResultAggregator) -> dict[str, int]:
+    """Fold a partial run's rows into ``aggregator`` and rewrite the file with only those rows.
+
+    Corrupt or torn lines are skipped rather than ending the read, and TIMEOUT/ERROR rows
+    are dropped so the resumed run scans those symbols again. The rewrite goes through a
+    temp file + rename, so a crash mid-compaction leaves the original intact.
+    """
+    counts = {"kept": 0, "retry": 0, "corrupt": 0}
+    if not jsonl_path.exists():
+        return counts
+    tmp_path = jsonl_path.with_name(f".{jsonl_path.name}.{os.getpid()}.tmp")
+    with jsonl_path.open("rb") as src, tmp_path.open("wb") as dst:
+        for raw in src:
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line.decode("utf-8")) if raw.endswith(b"\n") else None
+            except ValueError:
+                row = None
+            if not isinstance(row, dict):
+                counts["corrupt"] += 1
+                continue
+            if is_retryable_row(row):
+                counts["retry"] += 1
+                continue
+            if aggregator.add(row):
+                dst.write(line + b"\n")
+                counts["kept"] += 1
+    os.replace(tmp_path, jsonl_path)
+    return counts
+
+
+class JsonSnapshotReader:
+    """Caches parsed JSON snapshot files, re-reading only when the file changes on disk."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._cache: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+    def read(self, path: Path) -> dict[str, Any]:
+        key = str(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            with self._lock:
+                self._cache.pop(key, None)
+            return {}
+        signature = (int(stat.st_mtime_ns), int(stat.st_size))
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return dict(cached[1])
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+        if not isinstance(payload, dict):
+            return {}
+        with self._lock:
+            self._cache[key] = (signature, payload)
+        return dict(payload)
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+import logging
+import multiprocessing as mp
+from multiprocessing.connection import wait as wait_connections
+import time
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+Row = dict[str, Any]
+
+
+@dataclass
+class _WorkerSlot:
+    slot_id: int
+    process: Any = None
+    conn: Any = None
+    ready: bool = False
+    started_at: float = 0.0
+    current_symbol: str | None = None
+    shard: deque[str] = field(default_factory=deque)
+    init_failures: int = 0
+
+
+def split_shards(symbols: list[str], shard_size: int) -> list[list[str]]:
+    size = max(1, int(shard_size))
+    return [symbols[i : i + size] for i in range(0, len(symbols), size)]
+
+
+def _next_symbol(slot: _WorkerSlot, slots: list[_WorkerSlot], pending: deque[list[str]]) -> str | None:
+    if not slot.shard:
+        if pending:
+            slot.shard.extend(pending.popleft())
+        else:
+            # steal the tail half of the largest remaining shard held by another worker
+            victim = max(
+                (other for other in slots if other is not slot and len(other.shard) > 1),
+                key=lambda other: len(other.shard),
+                default=None,
+            )
+            if victim is not None:
+                take = len(victim.shard) // 2
+                stolen = [victim.shard.pop() for _ in range(take)]
+                slot.shard.extend(reversed(stolen))
+    return slot.shard.popleft() if slot.shard else None
+
+
+class ShardedScanScheduler:
+    """Runs symbol scans on N spawn workers with per-symbol timeouts.
+
+    ``worker_main(conn, worker_config)`` runs in each worker process: it sends
+    ``("ready", None)`` or ``("init_error", message)`` once, then answers every symbol it
+    receives with ``("row", row)`` until it receives ``None``. It must be a module-level
+    function so the spawn context can import it.
+
+    Symbols are grouped into shards; an idle worker takes the next shard, or steals half
+    of the largest unfinished shard once the queue is drained. A symbol that exceeds its
+    timeout (or crashes its worker) only recycles that worker, the others keep going.
+    ``dispatch_interval_sec`` spaces symbol hand-outs across all workers, so upstream
+    pressure does not grow with the worker count.
+    """
+
+    max_init_failures = 3
+
+    def __init__(
+        self,
+        *,
+        worker_main: Callable[[Any, dict[str, Any]], None],
+        worker_config: dict[str, Any],
+        workers: int,
+        shard_size: int,
+        symbol_timeout_sec: float,
+        timeout_row: Callable[[str, float], Row],
+        crash_row: Callable[[str], Row],
+        dispatch_interval_sec: float = 0.0,
+        init_timeout_sec: float | None = None,
+    ) -> None:
+        self.worker_main = worker_main
+        self.worker_config = dict(worker_config)
+        self.workers = max(1, int(workers))
+        self.shard_size = max(1, int(shard_size))
+        self.symbol_timeout_sec = float(symbol_timeout_sec)
+        self.timeout_row = timeout_row
+        self.crash_row = crash_row
+        self.dispatch_interval_sec = max(0.0, float(dispatch_interval_sec))
+        self.init_timeout_sec = (
+            max(60.0, self.symbol_timeout_sec) if init_timeout_sec is None else float(init_timeout_sec)
+        )
+        self.recycled_workers = 0
+        self.retired_workers = 0
+        self._mp_ctx = mp.get_context("spawn")
+
+    def run(self, symbols: list[str], emit: Callable[[Row], None]) -> list[str]:
+        """Scan symbols, calling emit(row) as rows complete.
+
+        Returns symbols left unscanned because every worker failed to start, so the
+        caller can fall back to scanning them in-process.
+        """
+        pending: deque[list[str]] = deque(split_shards(symbols, self.shard_size))
+        slots = [_WorkerSlot(slot_id=idx) for idx in range(min(self.workers, max(1, len(pending))))]
+        for slot in slots:
+            self._spawn(slot)
+        next_dispatch = 0.0
+        try:
+            while True:
+                for slot in slots:
+                    if slot.process is None or not slot.ready or slot.current_symbol is not None:
+                        continue
+                    if time.monotonic() < next_dispatch:
+                        break
+                    symbol = _next_symbol(slot, slots, pending)
+                    if symbol is None:
+                        continue
+                    slot.conn.send(symbol)
+                    slot.current_symbol = symbol
+                    slot.started_at = time.monotonic()
+                    next_dispatch = slot.started_at + self.dispatch_interval_sec
+
+                active = [
+                    slot
+                    for slot in slots
+                    if slot.process is not None and ((not slot.ready) or slot.current_symbol is not None)
+                ]
+                # An idle worker held back only by the dispatch interval still has work to do.
+                throttled = (
+                    time.monotonic() < next_dispatch
+                    and (bool(pending) or any(slot.shard for slot in slots))
+                    and any(slot.process is not None and slot.ready and slot.current_symbol is None for slot in slots)
+                )
+                if not active and not throttled:
+                    break
+                wait_sec = min(0.5, max(0.0, next_dispatch - time.monotonic())) if throttled else 0.5
+                if not active:
+                    time.sleep(wait_sec)
+                    continue
+                readable = wait_connections([slot.conn for slot in active], timeout=wait_sec)
+                for slot in active:
+                    if slot.conn in readable:
+                        self._receive(slot, slots, pending, emit)
+                    elif time.monotonic() - slot.started_at > self._deadline(slot):
+                        self._expire(slot, slots, pending, emit)
+        finally:
+            for slot in slots:
+                self._shutdown(slot)
+
+        leftover: list[str] = []
+        for slot in slots:
+            leftover.extend(slot.shard)
+        for shard in pending:
+            leftover.extend(shard)
+        return leftover
+
+    def _deadline(self, slot: _WorkerSlot) -> float:
+        return self.symbol_timeout_sec if slot.ready else self.init_timeout_sec
+
+    def _spawn(self, slot: _WorkerSlot) -> None:
+        parent_conn, child_conn = self._mp_ctx.Pipe()
+        process = self._mp_ctx.Process(
+            target=self.worker_main,
+            args=(child_conn, self.worker_config),
+            name=f"full-market-scan-{slot.slot_id}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        slot.process = process
+        slot.conn = parent_conn
+        slot.ready = False
+        slot.current_symbol = None
+        slot.started_at = time.monotonic()
+
+    def _shutdown(self, slot: _WorkerSlot, *, force: bool = False) -> None:
+        if slot.process is None:
+            return
+        try:
+            if not force:
+                slot.conn.send(None)
+                slot.process.join(timeout=5)
+        except Exception:
+            pass
+        if slot.process.is_alive():
+            slot.process.terminate()
+            slot.process.join(timeout=5)
+        try:
+            slot.conn.close()
+        except Exception:
+            pass
+        slot.process = None
+        slot.conn = None
+        slot.ready = False
+
+    def _retire(self, slot: _WorkerSlot, pending: deque[list[str]]) -> None:
+        # hand the slot's remaining symbols back to the queue for the other workers
+        if slot.shard:
+            pending.appendleft(list(slot.shard))
+            slot.shard.clear()
+        self.retired_workers += 1
+
+    def _recycle(self, slot: _WorkerSlot, slots: list[_WorkerSlot], pending: deque[list[str]]) -> None:
+        self._shutdown(slot, force=True)
+        self.recycled_workers += 1
+        if slot.init_failures >= self.max_init_failures:
+            logger.warning("scan worker %s retired after %s failed starts", slot.slot_id, slot.init_failures)
+            self._retire(slot, pending)
+            return
+        try:
+            self._spawn(slot)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("scan worker %s respawn failed: %s", slot.slot_id, exc)
+            slot.init_failures = self.max_init_failures
+            self._retire(slot, pending)
+
+    def _receive(
+        self,
+        slot: _WorkerSlot,
+        slots: list[_WorkerSlot],
+        pending: deque[list[str]],
+        emit: Callable[[Row], None],
+    ) -> None:
+        try:
+            kind, payload = slot.conn.recv()
+        except (EOFError, OSError):
+            symbol = slot.current_symbol
+            if symbol is not None:
+                emit(self.crash_row(symbol))
+            else:
+                slot.init_failures += 1
+            self._recycle(slot, slots, pending)
+            return
+        if kind == "ready":
+            slot.ready = True
+            slot.init_failures = 0
+            return
+        if kind == "init_error":
+            logger.warning("scan worker %s init failed: %s", slot.slot_id, payload)
+            slot.init_failures += 1
+            self._recycle(slot, slots, pending)
+            return
+        slot.current_symbol = None
+        emit(payload)
+
+    def _expire(
+        self,
+        slot: _WorkerSlot,
+        slots: list[_WorkerSlot],
+        pending: deque[list[str]],
+        emit: Callable[[Row], None],
+    ) -> None:
+        symbol = slot.current_symbol
+        if symbol is not None:
+            emit(self.timeout_row(symbol, self.symbol_timeout_sec))
+        else:
+            slot.init_failures += 1
+        self._recycle(slot, slots, pending)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import sys
+import types
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from trading_assistant.data.akshare_provider import AkshareProvider
+
+
+def _fake_akshare() -> types.SimpleNamespace:
+    calls: list[tuple[str, str]] = []
+
+    def stock_yjyg_em(date: str) -> pd.DataFrame:
+        calls.append(("stock_yjyg_em", date))
+        return pd.DataFrame(
+            [
+                {"股票代码": "000001", "公告日期": "2025-04-20", "预告净利润变动幅度下限": 30.0, "预告净利润变动幅度上限": 50.0},
+                {"股票代码": "600000.SH", "公告日期": "2025-04-25", "预告净利润变动幅度下限": -80.0, "预告净利润变动幅度上限": -60.0},
+                {"股票代码": "000002", "公告日期": "2025-06-01", "预告净利润变动幅度下限": 90.0, "预告净利润变动幅度上限": 95.0},
+            ]
+        )
+
+    def stock_yjkb_em(date: str) -> pd.DataFrame:
+        calls.append(("stock_yjkb_em", date))
+        return pd.DataFrame([{"股票代码": "000002", "公告日期": "2025-04-28", "净利润同比增长": 25.0}])
+
+    def stock_notice_report(symbol: str, date: str) -> pd.DataFrame:
+        calls.append(("stock_notice_report", date))
+        return pd.DataFrame([{"代码": "000001", "公告标题": "notice", "公告日期": date}])
+
+    return types.SimpleNamespace(
+        calls=calls,
+        stock_yjyg_em=stock_yjyg_em,
+        stock_yjkb_em=stock_yjkb_em,
+        stock_notice_report=stock_notice_report,
+    )
+
+
+def test_corporate_event_snapshots_share_market_wide_downloads(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _fake_akshare()
+    monkeypatch.setitem(sys.modules, "akshare", fake)
+    provider = AkshareProvider()
+    as_of = date(2025, 5, 10)
+
+    many = provider.get_corporate_event_snapshots_many(["000001", "000002", "600000", "300750"], as_of)
+    downloads = len(fake.calls)
+    assert downloads == len(set(fake.calls))
+
+    # Single-symbol lookups reuse the cached tables and agree with the batch result.
+    assert provider.get_corporate_event_snapshot("000002", as_of) == many["000002"]
+    assert len(fake.calls) == downloads
+
+    assert many["000001"]["forecast_pchg_mid"] == 40.0
+    assert many["000001"]["notice_count"] > 0
+    assert many["600000"]["forecast_pchg_mid"] == -70.0
+    assert many["600000"]["negative_event_score"] > 0
+    # The 000002 forecast is published after as_of and must be ignored (PIT).
+    assert many["000002"]["forecast_pchg_mid"] is None
+    assert many["000002"]["express_yoy_net_profit"] == 25.0
+    assert many["300750"]["event_count"] == 0
+
+
+def test_empty_market_tables_are_cached_and_failures_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _fake_akshare()
+    failures = {"stock_yjkb_em": 1}
+
+    def stock_notice_report(symbol: str, date: str) -> pd.DataFrame:
+        fake.calls.append(("stock_notice_report", date))
+        return pd.DataFrame()
+
+    def stock_yjkb_em(date: str) -> pd.DataFrame:
+        fake.calls.append(("stock_yjkb_em", date))
+        if failures["stock_yjkb_em"] > 0:
+            failures["stock_yjkb_em"] -= 1
+            raise RuntimeError("upstream timeout")
+        return pd.DataFrame()
+
+    fake.stock_notice_report = stock_notice_report
+    fake.stock_yjkb_em = stock_yjkb_em
+    monkeypatch.setitem(sys.modules, "akshare", fake)
+    provider = AkshareProvider()
+    as_of = date(2025, 5, 10)
+
+    first = provider.get_corporate_event_snapshot("000001", as_of)
+    first_calls = list(fake.calls)
+    second = provider.get_corporate_event_snapshot("000002", as_of)
+    repeated = fake.calls[len(first_calls) :]
+
+    # Only the one failed download is fetched again; empty tables come from the cache.
+    assert len(repeated) == 1 and repeated[0][0] == "stock_yjkb_em"
+    assert first["notice_count"] == 0 and second["notice_count"] == 0
+    assert first["forecast_pchg_mid"] == 40.0
@@ -1,14 +1,21 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import hashlib
 import hmac
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import json
 from pathlib import Path
+import threading
+import time
 
+from trading_assistant.alerts.dispatcher import AlertSendResult, RealAlertDispatcher
+from trading_assistant.alerts.outbox import AlertOutboxDispatcher
 from trading_assistant.alerts.service import AlertService
 from trading_assistant.alerts.store import AlertStore
 from trading_assistant.audit.service import AuditService
 from trading_assistant.audit.store import AuditStore
+from trading_assistant.core.config import Settings
 from trading_assistant.core.models import (
+    AlertDeliveryStatus,
     AlertEscalationStage,
     OncallCallbackRequest,
     OncallReconcileRequest,
@@ -487,3 +494,159 @@ def test_alert_noise_reduction_rules(tmp_path: Path) -> None:
     )
     second = service.sync_from_audit(limit=100)
     assert second == 1
+
+
+def test_outbox_coalesces_digest_and_retries_against_http_stub(tmp_path: Path) -> None:
+    received: list[dict] = []
+    state = {"status": 200}
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            received.append(json.loads(body.decode("utf-8")))
+            self.send_response(state["status"])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *_args) -> None:
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    webhook = f"http://127.0.0.1:{server.server_address[1]}/hook"
+    try:
+        store = AlertStore(str(tmp_path / "alert.db"))
+        audit = AuditService(AuditStore(str(tmp_path / "audit.db")))
+        outbox = AlertOutboxDispatcher(
+            store=store,
+            dispatcher=RealAlertDispatcher(settings=Settings(alert_im_enabled=True, alert_notify_timeout_seconds=5)),
+            max_attempts=3,
+            backoff_seconds=30,
+            coalesce=True,
+        )
+        service = AlertService(store=store, audit=audit, outbox=outbox)
+        _ = service.create_subscription(
+            AlertSubscriptionCreateRequest(
+                name="im-ops",
+                owner="ops",
+                event_types=["event_connector_sla"],
+                min_severity=SignalLevel.WARNING,
+                dedupe_window_sec=1,
+                enabled=True,
+                channel="dingtalk",
+                channel_config={"webhooks": [webhook]},
+            )
+        )
+        for idx, severity in enumerate(["WARNING", "CRITICAL", "WARNING"]):
+            audit.log(
+                "event_connector_sla",
+                "freshness",
+                {"connector_name": f"ann_{idx}", "severity": severity, "message": f"lag #{idx}"},
+                status="ERROR",
+            )
+
+        # Sync only queues; nothing is sent until the outbox drains.
+        assert service.sync_from_audit(limit=100) == 3
+        assert received == []
+        assert service.list_deliveries(limit=10) == []
+
+        result = service.drain_outbox()
+        assert (result.claimed, result.messages_sent, result.delivered, result.coalesced) == (3, 1, 3, 2)
+        assert len(received) == 1
+        assert received[0]["markdown"]["title"].startswith("[CRITICAL] 3 alerts")
+        deliveries = service.list_deliveries(limit=10)
+        assert len(deliveries) == 3
+        assert all(x.status == AlertDeliveryStatus.SENT and x.payload["digest_size"] == 3 for x in deliveries)
+
+        state["status"] = 503
+        audit.log(
+            "event_connector_sla",
+            "freshness",
+            {"connector_name": "ann_retry", "severity": "CRITICAL", "message": "lag retry"},
+            status="ERROR",
+        )
+        assert service.sync_from_audit(limit=100) == 1
+        assert service.drain_outbox().retried == 1
+        assert service.drain_outbox().claimed == 0  # still backing off
+
+        state["status"] = 200
+        result = service.drain_outbox(now=datetime.now(timezone.utc) + timedelta(minutes=5))
+        assert (result.claimed, result.delivered) == (1, 1)
+        retried = service.list_deliveries(limit=10)[0]
+        assert retried.status == AlertDeliveryStatus.SENT
+        assert retried.payload["attempts"] == 2
+        assert len(received) == 3
+
+        stats = service.outbox_stats()
+        assert stats is not None
+        assert (stats.pending, stats.sent, stats.failed) == (0, 4, 0)
+        assert stats.channels[0].channel == "dingtalk"
+        assert stats.channels[0].samples == 4
+        assert 0 <= stats.channels[0].latency_p50_ms <= stats.channels[0].latency_max_ms
+    finally:
+        server.shutdown()
+        server.server_close()
+        outbox.stop()
+
+
+class _RecordingSender:
+    def __init__(self, delay_sec: float = 0.0) -> None:
+        self.delay_sec = delay_sec
+        self.sent: list[dict] = []
+        self._lock = threading.Lock()
+
+    def send(self, *, channel: str, target: str, subject: str, message: str, payload: dict) -> AlertSendResult:
+        time.sleep(self.delay_sec)
+        with self._lock:
+            self.sent.append({"channel": channel, "target": target, "subject": subject, "payload": payload})
+        return AlertSendResult(success=True, provider_status="200")
+
+
+def _enqueue(outbox: AlertOutboxDispatcher, channel: str, count: int, **extra) -> None:
+    for idx in range(count):
+        outbox.enqueue(
+            notification_id=idx + 1,
+            subscription_id=1,
+            channel=channel,
+            target="https://hooks.example/ops",
+            subject=f"alert {idx}",
+            message=f"lag #{idx}",
+            payload={"severity": "WARNING", "source": "ops", **extra},
+        )
+
+
+def test_outbox_keeps_single_alert_schema_unless_digest_applies(tmp_path: Path) -> None:
+    store = AlertStore(str(tmp_path / "alert.db"))
+    sender = _RecordingSender()
+    default = AlertOutboxDispatcher(store=store, dispatcher=sender)
+    _enqueue(default, "dingtalk", 3)
+    assert (default.drain().messages_sent, len(sender.sent)) == (3, 3)
+    assert all("digest" not in x["payload"] for x in sender.sent)
+
+    sender.sent.clear()
+    coalescing = AlertOutboxDispatcher(store=store, dispatcher=sender, coalesce=True)
+    _enqueue(coalescing, "im", 2)
+    _enqueue(coalescing, "pagerduty", 2, pagerduty_routing_key="rk")
+    # Two escalation stages of one notification to the same target stay two pages.
+    _enqueue(coalescing, "dingtalk", 1, oncall_ref="n1-l1")
+    _enqueue(coalescing, "dingtalk", 1, oncall_ref="n1-l2")
+    result = coalescing.drain()
+    assert (result.messages_sent, result.coalesced) == (6, 0)
+    assert all("digest" not in x["payload"] for x in sender.sent)
+
+
+def test_outbox_renews_leases_while_sends_are_in_flight(tmp_path: Path) -> None:
+    store = AlertStore(str(tmp_path / "alert.db"))
+    outbox = AlertOutboxDispatcher(store=store, dispatcher=_RecordingSender(delay_sec=1.5), lease_seconds=1)
+    _enqueue(outbox, "im", 1)
+    drained: list = []
+    worker = threading.Thread(target=lambda: drained.append(outbox.drain()))
+    worker.start()
+    try:
+        time.sleep(1.2)
+        # The original 1s lease has expired, but the heartbeat keeps a second drainer out.
+        assert store.claim_outbox(now=datetime.now(timezone.utc), limit=10, lease_seconds=60) == []
+    finally:
+        worker.join()
+        outbox.stop()
+    assert drained[0].delivered == 1
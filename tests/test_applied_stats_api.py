@@ -186,3 +186,32 @@ def test_applied_stats_market_factor_case_endpoint(tmp_path: Path) -> None:
         assert "interpretation" in payload
     finally:
         app.dependency_overrides.clear()
+
+
+def test_applied_stats_cross_sectional_factor_endpoint(tmp_path: Path) -> None:
+    _setup_overrides(tmp_path)
+    client = TestClient(app)
+    try:
+        resp = client.post(
+            "/applied-stats/cases/cross-sectional-factor-study",
+            json={
+                "symbols": ["000001", "000002", "600000"],
+                "start_date": "2025-01-01",
+                "end_date": "2025-06-30",
+                "factors": ["momentum20"],
+                "horizons": [5],
+                "min_symbols": 3,
+            },
+        )
+        assert resp.status_code == 200
+        payload = resp.json()
+        assert payload["symbol_count"] == 3
+        assert payload["factors"][0]["factor"] == "momentum20"
+
+        bad = client.post(
+            "/applied-stats/cases/cross-sectional-factor-study",
+            json={"symbols": [], "start_date": "2025-01-01", "end_date": "2025-06-30"},
+        )
+        assert bad.status_code == 422
+    finally:
+        app.dependency_overrides.clear()
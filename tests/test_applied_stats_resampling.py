@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from trading_assistant.applied_stats import statistics
+from trading_assistant.applied_stats.statistics import bootstrap_confidence_interval, two_sample_mean_test
+
+
+def _loop_permutation_p_value(a: np.ndarray, b: np.ndarray, permutations: int, seed: int) -> float:
+    rng = np.random.default_rng(seed)
+    pooled = np.concatenate([a, b])
+    diff = abs(float(np.mean(a) - np.mean(b)))
+    hits = 0
+    for _ in range(permutations):
+        shuffled = rng.permutation(pooled)
+        if abs(float(np.mean(shuffled[: a.size]) - np.mean(shuffled[a.size :]))) >= diff:
+            hits += 1
+    return (hits + 1) / (permutations + 1)
+
+
+def _loop_bootstrap_ci(values: np.ndarray, stat_fn, samples: int, seed: int) -> tuple[float, float]:
+    rng = np.random.default_rng(seed)
+    estimates = [float(stat_fn(rng.choice(values, size=values.size, replace=True))) for _ in range(samples)]
+    return float(np.quantile(estimates, 0.025)), float(np.quantile(estimates, 0.975))
+
+
+def test_blocked_kernels_match_per_replicate_loops(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = np.random.default_rng(7)
+    a = np.round(rng.standard_t(3, size=83), 2)
+    b = rng.normal(0.2, 1.0, size=41)
+    # Tiny blocks force several block boundaries inside one call.
+    monkeypatch.setattr(statistics, "_RESAMPLE_BLOCK_ELEMENTS", 500)
+
+    out = two_sample_mean_test(a, b, permutations=700, random_seed=11)
+    assert out["p_value_permutation"] == _loop_permutation_p_value(a, b, 700, 11)
+
+    for name, fn in (("mean", np.mean), ("median", np.median)):
+        ci = bootstrap_confidence_interval(a, statistic=name, bootstrap_samples=450, random_seed=5)
+        assert (ci["ci95_low"], ci["ci95_high"]) == _loop_bootstrap_ci(a, fn, 450, 5)
+
+
+def test_parallel_mode_is_deterministic_across_worker_counts(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = np.random.default_rng(3)
+    a = rng.normal(size=60)
+    b = rng.normal(0.3, size=60)
+    monkeypatch.setattr(statistics, "_PARALLEL_CHUNK", 300)
+
+    two = two_sample_mean_test(a, b, permutations=1500, random_seed=9, parallel_workers=2)
+    three = two_sample_mean_test(a, b, permutations=1500, random_seed=9, parallel_workers=3)
+    assert two == three
+    assert bootstrap_confidence_interval(a, bootstrap_samples=1200, parallel_workers=2) == bootstrap_confidence_interval(
+        a, bootstrap_samples=1200, parallel_workers=4
+    )
@@ -129,3 +129,22 @@ def test_market_factor_study_runs() -> None:
     assert result["target_selection_mode"] == "fixed_horizon"
     assert "ols" in result
     assert len(result["interpretation"]) >= 3
+
+
+def test_cross_sectional_factor_study_builds_panel_over_symbols() -> None:
+    service = _build_service()
+    result = service.cross_sectional_factor_study(
+        symbols=["000001", "000002", "600000", "600519", "300750", "000001"],
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 6, 30),
+        factors=["momentum5", "zscore20"],
+        horizons=[10, 5],
+        quantiles=3,
+        min_symbols=3,
+    )
+    assert result["symbol_count"] == 5
+    assert result["requested_symbols"] == 5
+    assert result["failed_symbols"] == []
+    assert result["horizons"] == [5, 10]
+    assert [item["factor"] for item in result["factors"]] == ["momentum5", "zscore20"]
+    assert len(result["factors"][0]["horizons"][0]["quantile_mean_return"]) == 3
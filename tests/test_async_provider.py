@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+import threading
+import time
+
+import httpx
+import pandas as pd
+import pytest
+
+from trading_assistant.data.async_provider import AsyncDataProvider
+from trading_assistant.data.rate_limit import RequestPriority, current_priority, provider_priority
+from trading_assistant.governance import announcement_connectors
+from trading_assistant.governance.announcement_connectors import HttpJsonAnnouncementConnector
+
+
+class BlockingProvider:
+    def __init__(self, delay_sec: float = 0.2) -> None:
+        self.delay_sec = delay_sec
+        self.lanes: list[RequestPriority] = []
+        self._lock = threading.Lock()
+
+    def get_daily_bars_with_source(self, symbol: str, start_date: date, end_date: date):
+        with self._lock:
+            self.lanes.append(current_priority())
+        time.sleep(self.delay_sec)
+        if symbol == "BAD":
+            raise RuntimeError("upstream down")
+        return "blocking", pd.DataFrame({"trade_date": [end_date], "symbol": symbol, "close": 10.0})
+
+
+def test_gather_daily_bars_runs_blocking_calls_concurrently() -> None:
+    provider = BlockingProvider()
+    symbols = ["000001", "000002", "600000", "300750", "BAD", "000001"]
+
+    async def run() -> dict:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            async_provider = AsyncDataProvider(provider, executor=executor)
+            with provider_priority(RequestPriority.BULK):
+                return await async_provider.gather_daily_bars_with_source(
+                    symbols, date(2025, 1, 1), date(2025, 1, 10)
+                )
+
+    started = time.perf_counter()
+    out = asyncio.run(run())
+    elapsed = time.perf_counter() - started
+
+    assert sorted(out) == ["000001", "000002", "300750", "600000"]
+    assert out["600000"][0] == "blocking"
+    # Five unique symbols at 0.2s each would take 1s serially.
+    assert elapsed < 0.6
+    # The caller's priority lane follows the call into the worker threads.
+    assert provider.lanes == [RequestPriority.BULK] * 5
+
+
+def test_http_json_connector_fetch_async_uses_pooled_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(
+            200,
+            json={"data": [{"id": "a1", "symbol": "000001", "title": "notice", "publish_time": "2025-02-05 09:15:00"}]},
+        )
+
+    connector = HttpJsonAnnouncementConnector(
+        {"url": "https://example.com/ann", "records_path": "data", "query_params": {"market": "sz"}}
+    )
+
+    async def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(announcement_connectors, "get_async_http_client", lambda: client)
+        try:
+            return await connector.fetch_async(cursor="2025-02-01T00:00:00+08:00", limit=10)
+        finally:
+            await client.aclose()
+
+    result = asyncio.run(run())
+    assert [r.source_event_id for r in result.records] == ["a1"]
+    assert result.next_cursor is not None
+    params = dict(seen[0].url.params)
+    assert params["market"] == "sz"
+    assert params["limit"] == "10"
+    assert params["cursor"] == "2025-02-01T00:00:00+08:00"
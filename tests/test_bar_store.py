@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_assistant.data.bar_store import MemoryMappedBarStore
+
+
+def _bars(symbol: str, n: int, start: float) -> pd.DataFrame:
+    dates = pd.date_range("2025-01-01", periods=n, freq="B")
+    return pd.DataFrame(
+        {
+            "trade_date": [d.date() for d in dates][::-1],
+            "symbol": symbol,
+            "close": np.linspace(start, start + n, n)[::-1],
+            "volume": np.arange(n, dtype=np.int64)[::-1] * 100,
+            "is_st": False,
+        }
+    )
+
+
+def test_bar_store_round_trip_and_shared_mapping(tmp_path: Path) -> None:
+    bars = {"000001": _bars("000001", 30, 10.0), "600000": _bars("600000", 12, 5.0)}
+    MemoryMappedBarStore.build(tmp_path, bars, sources={"000001": "tushare"})
+
+    store = MemoryMappedBarStore.open(tmp_path)
+    assert store.symbols == ["000001", "600000"]
+    assert store.source("000001") == "tushare"
+    assert store.source("600000") == ""
+    for symbol, raw in bars.items():
+        expected = raw.sort_values("trade_date").reset_index(drop=True)
+        pd.testing.assert_frame_equal(store.frame(symbol), expected)
+        assert store.dates(symbol).dtype == np.dtype("datetime64[D]")
+
+    close = store.column("600000", "close")
+    assert isinstance(close, np.memmap)
+    assert np.shares_memory(store.frame("600000")["close"].to_numpy(), close)
+    assert close[0] == pytest.approx(5.0)
+
+    # Workers get copy-on-write pages: local writes never reach the file or other readers.
+    frame = store.frame("000001")
+    frame.loc[0, "close"] = -1.0
+    assert MemoryMappedBarStore.open(tmp_path).frame("000001").loc[0, "close"] == pytest.approx(10.0)
+
+    read_only = MemoryMappedBarStore.open(tmp_path, mmap_mode="r")
+    with pytest.raises(ValueError):
+        read_only.column("000001", "close")[0] = 0.0
+    with pytest.raises(KeyError):
+        store.frame("300750")
+    assert store.frame("000001")["trade_date"].iloc[0] == date(2025, 1, 1)
+
+
+def test_bar_store_coerces_object_columns_to_fixed_dtypes(tmp_path: Path) -> None:
+    frame = pd.DataFrame(
+        {
+            "trade_date": [date(2025, 1, 2), date(2025, 1, 3), date(2025, 1, 6)],
+            "turnover": pd.Series([1.5, None, 2.0], dtype=object),
+            "is_suspended": pd.Series([False, None, True], dtype=object),
+            "ann_date": pd.Series([date(2024, 12, 31), None, date(2025, 1, 5)], dtype=object),
+            "updated_at": pd.to_datetime(["2025-01-02 15:00", "2025-01-03 15:00", "2025-01-06 15:00"]),
+            "symbol": pd.Series(["000001", None, "000001"], dtype=object),
+        }
+    )
+    store = MemoryMappedBarStore.build(tmp_path, {"000001": frame})
+    out = store.frame("000001")
+
+    assert out["turnover"].dtype == np.float64
+    assert out["turnover"].iloc[0] == pytest.approx(1.5)
+    assert np.isnan(out["turnover"].iloc[1])
+    assert out["is_suspended"].dtype == bool
+    assert out["is_suspended"].tolist() == [False, False, True]
+    assert out["ann_date"].iloc[0] == date(2024, 12, 31)
+    assert pd.isna(out["ann_date"].iloc[1])
+    assert pd.api.types.is_datetime64_dtype(out["updated_at"].dtype)
+    assert out["symbol"].tolist() == ["000001", "", "000001"]
+
+
+def test_bar_store_rejects_columns_without_a_fixed_dtype(tmp_path: Path) -> None:
+    frame = pd.DataFrame(
+        {
+            "trade_date": [date(2025, 1, 2), date(2025, 1, 3)],
+            "note": pd.Series([1.5, "halted"], dtype=object),
+        }
+    )
+    with pytest.raises(ValueError, match="note"):
+        MemoryMappedBarStore.build(tmp_path, {"000001": frame})
+
+
+def test_bar_store_pads_missing_numeric_columns_with_nan(tmp_path: Path) -> None:
+    bars = {"000001": _bars("000001", 3, 10.0), "600000": _bars("600000", 2, 5.0).drop(columns=["volume"])}
+    store = MemoryMappedBarStore.build(tmp_path, bars)
+    assert np.isnan(store.column("600000", "volume")).all()
+    assert store.column("000001", "volume").tolist() == [0.0, 100.0, 200.0]
+    assert "volume" not in store.frame("600000").columns
@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+import hashlib
 import json
 from pathlib import Path
 import zipfile
@@ -301,3 +302,56 @@ def test_compliance_evidence_signature_verify_and_vault_copy(tmp_path: Path) ->
     assert verify.countersign_checked is True
     assert verify.countersign_valid is True
     assert verify.countersign_count == 1
+
+
+def test_compliance_evidence_export_streams_paged_audit_history(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "event.db")
+    audit = AuditService(AuditStore(str(tmp_path / "audit.db")))
+    for i in range(2500):
+        audit.log("order", "submit", {"i": i, "note": "订单"})
+    audit.log("autotune", "apply", {"profile": "p1"})
+
+    paged = list(audit.iter_events(event_type="order", limit=2100, page_size=400))
+    assert [x.payload["i"] for x in paged] == list(range(2499, 399, -1))
+    assert [x.id for x in audit.iter_events(limit=5, page_size=2)] == [x.id for x in audit.query(limit=5)]
+
+    event_service = EventService(store=EventStore(db_path))
+    service = ComplianceEvidenceService(
+        audit=audit,
+        strategy_gov=StrategyGovernanceService(
+            store=StrategyGovernanceStore(str(tmp_path / "strategy_gov.db")),
+            required_approval_roles=["risk"],
+            min_approval_count=1,
+        ),
+        event_connector=EventConnectorService(
+            event_service=event_service,
+            connector_store=EventConnectorStore(db_path),
+            standardizer=EventStandardizer(),
+        ),
+        event_nlp=EventNLPGovernanceService(store=EventNLPStore(db_path)),
+    )
+    result = service.export_bundle(
+        ComplianceEvidenceExportRequest(
+            output_dir=str(tmp_path / "reports"),
+            audit_event_type="order",
+            audit_event_limit=2200,
+            sign_bundle=False,
+        )
+    )
+    package_path = Path(result.package_path)
+    assert result.package_sha256 == hashlib.sha256(package_path.read_bytes()).hexdigest()
+    assert result.package_size_bytes == package_path.stat().st_size
+    assert result.summary["audit_events"] == 2200
+    assert result.summary["autotune_events"] == 1
+
+    with zipfile.ZipFile(package_path, "r") as zf:
+        assert zf.testzip() is None
+        manifest = json.loads(zf.read("manifest.json").decode("utf-8"))
+        for item in manifest["files"]:
+            raw = zf.read(item["relative_path"])
+            assert hashlib.sha256(raw).hexdigest() == item["sha256"]
+            assert len(raw) == item["size_bytes"]
+            assert (Path(result.bundle_dir) / item["relative_path"]).read_bytes() == raw
+        lines = zf.read("audit_events.jsonl").decode("utf-8").splitlines()
+    assert len(lines) == 2200
+    assert json.loads(lines[0])["payload"] == {"i": 2499, "note": "订单"}
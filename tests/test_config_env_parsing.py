@@ -11,3 +11,11 @@ def test_settings_strip_string_values_for_bool_fields() -> None:
     assert settings.auth_enabled is False
     assert settings.enforce_data_license is True
 
+
+
+def test_settings_parse_market_data_rate_limits() -> None:
+    settings = Settings(market_data_rate_limits="tushare=400, Tushare.get_daily_bars=300,bad,x=abc,y=0")
+    assert settings.market_data_rate_limits_map == {
+        "tushare": 400.0,
+        "tushare.get_daily_bars": 300.0,
+    }
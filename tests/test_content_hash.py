@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_assistant.core.models import DataSnapshotRegisterRequest
+from trading_assistant.data.utils import (
+    CONTENT_HASH_ALGORITHM,
+    CONTENT_HASH_CSV_V1,
+    dataframe_content_hash,
+    dataframe_content_hash_chunks,
+)
+
+
+def _bars(n: int = 40) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    close = 10.0 + rng.normal(0.0, 0.2, n).cumsum()
+    return pd.DataFrame(
+        {
+            "trade_date": [date(2025, 1, 1) + timedelta(days=i) for i in range(n)],
+            "symbol": "000001",
+            "close": close,
+            "volume": rng.integers(1_000, 9_000, n),
+            "bar_time": pd.date_range("2025-01-01 09:30", periods=n, freq="min", tz="Asia/Shanghai"),
+            "is_st": False,
+        }
+    )
+
+
+def test_columnar_hash_is_stable_and_content_sensitive() -> None:
+    bars = _bars()
+    digest = dataframe_content_hash(bars)
+    assert digest == dataframe_content_hash(bars.copy())
+    # Column order and index labels are not content.
+    assert digest == dataframe_content_hash(bars[list(reversed(bars.columns))].set_index(bars.index + 100))
+    # Integer width does not change the canonical buffer.
+    assert digest == dataframe_content_hash(bars.astype({"volume": "int32"}))
+
+    changed = bars.copy()
+    changed.loc[7, "close"] += 1e-9
+    assert dataframe_content_hash(changed) != digest
+    renamed = bars.rename(columns={"close": "close_adj"})
+    assert dataframe_content_hash(renamed) != digest
+    assert dataframe_content_hash(bars.iloc[:-1]) != digest
+
+    with_nan = bars.assign(close=np.where(np.arange(len(bars)) % 5 == 0, np.nan, bars["close"]))
+    other_nan = with_nan.copy()
+    other_nan.loc[0, "close"] = -np.nan
+    assert dataframe_content_hash(with_nan) == dataframe_content_hash(other_nan)
+
+
+def test_chunked_hash_equals_whole_frame_hash() -> None:
+    bars = _bars(103)
+    chunks = [bars.iloc[i : i + 17] for i in range(0, len(bars), 17)]
+    assert dataframe_content_hash_chunks(chunks) == dataframe_content_hash(bars)
+    with pytest.raises(ValueError):
+        dataframe_content_hash_chunks([bars.iloc[:5], bars.iloc[5:].drop(columns=["is_st"])])
+
+
+def test_legacy_csv_hash_is_still_available() -> None:
+    bars = _bars()
+    assert dataframe_content_hash(bars, algorithm=CONTENT_HASH_CSV_V1) != dataframe_content_hash(bars)
+    assert len(dataframe_content_hash(pd.DataFrame(), algorithm=CONTENT_HASH_CSV_V1)) == 64
+    with pytest.raises(ValueError):
+        dataframe_content_hash(bars, algorithm="md5-v0")
+    assert DataSnapshotRegisterRequest.model_fields["hash_algorithm"].default == CONTENT_HASH_CSV_V1
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_assistant.factors import cross_section
+from trading_assistant.factors.cross_section import (
+    CrossSectionalFactorEngine,
+    FactorPanelBuilder,
+    grouped_average_ranks,
+)
+
+
+def _synthetic_frames(n_symbols: int, n_dates: int, seed: int) -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2024-01-01", periods=n_dates)
+    frames: dict[str, pd.DataFrame] = {}
+    for idx in range(n_symbols):
+        # Staggered listings/delistings leave ragged edges in the panel.
+        lo = int(rng.integers(0, 10))
+        hi = n_dates - int(rng.integers(0, 10))
+        close = 10.0 * np.exp(np.cumsum(rng.normal(0.0, 0.02, size=hi - lo)))
+        momentum = np.round(rng.normal(size=hi - lo), 1)  # coarse values -> ties
+        momentum[rng.random(hi - lo) < 0.05] = np.nan
+        frames[f"{idx:06d}"] = pd.DataFrame(
+            {"trade_date": dates[lo:hi].date, "close": close, "momentum5": momentum}
+        )
+    return frames
+
+
+def test_panel_metrics_match_pandas_groupby(monkeypatch: pytest.MonkeyPatch) -> None:
+    frames = _synthetic_frames(n_symbols=37, n_dates=60, seed=3)
+    # Small blocks force several row blocks per evaluation.
+    monkeypatch.setattr(cross_section, "_RANK_BLOCK_ELEMENTS", 200)
+    builder = FactorPanelBuilder(["momentum5", "zscore20"])
+    for symbol, frame in frames.items():
+        builder.add(symbol, frame)
+    engine = CrossSectionalFactorEngine(builder.build(), min_symbols=10)
+    ic, buckets = engine.rank_ic_and_quantiles("momentum5", 3, quantiles=4)
+    turnover = engine.top_quantile_turnover("momentum5", quantiles=4)
+
+    long = pd.concat([f.assign(symbol=s) for s, f in frames.items()])
+    wide_close = long.pivot(index="trade_date", columns="symbol", values="close")
+    wide_factor = long.pivot(index="trade_date", columns="symbol", values="momentum5")
+    fwd = wide_close.shift(-3) / wide_close - 1.0
+    assert np.allclose(engine.forward_returns(3), fwd.to_numpy(), equal_nan=True, rtol=0, atol=1e-6)
+    assert np.all(np.isnan(engine.panel.factors["zscore20"]))
+
+    fwd = pd.DataFrame(engine.forward_returns(3).astype(float), index=fwd.index, columns=fwd.columns)
+    factor = wide_factor.astype(np.float32).astype(float)
+    for row, trade_date in enumerate(factor.index):
+        x, y = factor.loc[trade_date], fwd.loc[trade_date]
+        mask = x.notna() & y.notna()
+        if mask.sum() < 10:
+            assert np.isnan(ic[row]) and np.isnan(buckets[row]).all()
+            continue
+        ranks = x[mask].rank(method="average")
+        assert ic[row] == pytest.approx(ranks.corr(y[mask].rank(method="average")), abs=1e-12)
+        bucket = np.floor((ranks - 1.0) * 4 / mask.sum()).astype(int)
+        expected = y[mask].groupby(bucket).mean().reindex(range(4))
+        np.testing.assert_allclose(buckets[row], expected.to_numpy(), rtol=0, atol=1e-12)
+
+    valid_rows = factor.notna().sum(axis=1) >= 10
+    top = factor.rank(axis=1, method="average").sub(1.0).mul(4).div(factor.notna().sum(axis=1), axis=0)
+    top = (np.floor(top) >= 3) & valid_rows.to_numpy()[:, None]
+    for row in range(1, len(factor)):
+        prev, cur = top.iloc[row - 1], top.iloc[row]
+        if not prev.any() or not cur.any():
+            assert np.isnan(turnover[row])
+            continue
+        assert turnover[row] == pytest.approx(1.0 - (cur & prev).sum() / cur.sum())
+
+
+def test_grouped_average_ranks_matches_pandas_rank() -> None:
+    rng = np.random.default_rng(0)
+    values = np.round(rng.normal(size=(9, 25)), 0)
+    valid = rng.random(values.shape) > 0.2
+    expected = pd.DataFrame(np.where(valid, values, np.nan)).rank(axis=1, method="average").to_numpy()
+    np.testing.assert_array_equal(grouped_average_ranks(values, valid), expected)
+
+
+def test_evaluate_reports_summary_per_factor_and_horizon() -> None:
+    builder = FactorPanelBuilder(["momentum5"])
+    for symbol, frame in _synthetic_frames(n_symbols=30, n_dates=40, seed=9).items():
+        builder.add(symbol, frame)
+    engine = CrossSectionalFactorEngine(builder.build(), min_symbols=10)
+    out = engine.evaluate(horizons=[1, 5], quantiles=5)
+
+    assert out["symbol_count"] == 30
+    item = out["factors"][0]
+    assert item["factor"] == "momentum5"
+    assert [h["horizon"] for h in item["horizons"]] == [1, 5]
+    assert len(item["horizons"][0]["quantile_mean_return"]) == 5
+    assert item["horizons"][0]["rank_ic"]["count"] > 20
+    # Forward-return panels are cached per horizon.
+    assert engine.forward_returns(5) is engine.forward_returns(5)
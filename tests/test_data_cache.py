@@ -15,6 +15,7 @@ class CountingProvider(MarketDataProvider):
 
     def __init__(self) -> None:
         self.calls: list[tuple[date, date]] = []
+        self.calendar_calls: list[tuple[date, date]] = []
         self.intraday_calls: list[tuple[datetime, datetime, str]] = []
 
     def get_daily_bars(self, symbol: str, start_date: date, end_date: date) -> pd.DataFrame:
@@ -41,6 +42,7 @@ class CountingProvider(MarketDataProvider):
         return pd.DataFrame(rows)
 
     def get_trade_calendar(self, start_date: date, end_date: date) -> pd.DataFrame:
+        self.calendar_calls.append((start_date, end_date))
         rows = []
         cursor = start_date
         while cursor <= end_date:
@@ -140,6 +142,82 @@ def test_composite_provider_backfills_internal_missing_dates(tmp_path: Path) ->
     assert provider.calls[0] == (gap_day, gap_day)
 
 
+def test_trade_calendar_is_persisted_and_extended_incrementally(tmp_path: Path) -> None:
+    provider = CountingProvider()
+    db_path = str(tmp_path / "market_cache_calendar.db")
+    composite = CompositeDataProvider([provider], cache_store=LocalTimeseriesCache(db_path), enable_cache=True)
+    start = date(2025, 1, 1)
+    end = date(2025, 1, 10)
+
+    composite.get_daily_bars_with_source("000001", start, end)
+    composite.get_daily_bars_with_source("000001", start, end)
+    assert provider.calendar_calls == [(start, end)]
+    assert len(provider.calls) == 1
+
+    composite.get_daily_bars_with_source("000001", start, date(2025, 1, 15))
+    assert provider.calendar_calls[-1] == (date(2025, 1, 11), date(2025, 1, 15))
+
+    # A fresh provider over the same database answers warm requests without any upstream call.
+    fresh = CountingProvider()
+    warm = CompositeDataProvider([fresh], cache_store=LocalTimeseriesCache(db_path), enable_cache=True)
+    _, bars = warm.get_daily_bars_with_source("000001", date(2025, 1, 3), date(2025, 1, 12))
+    assert len(bars) == 10
+    assert fresh.calendar_calls == []
+    assert fresh.calls == []
+
+
+class OpenDaysOnlyProvider(CountingProvider):
+    """Lists open days only, like akshare; weekend-only ranges come back empty."""
+
+    def __init__(self, *, fail_before: date | None = None) -> None:
+        super().__init__()
+        self.fail_before = fail_before
+
+    def get_trade_calendar(self, start_date: date, end_date: date) -> pd.DataFrame:
+        self.calendar_calls.append((start_date, end_date))
+        if self.fail_before is not None and start_date < self.fail_before:
+            raise RuntimeError("calendar upstream unavailable")
+        days = [d for d in pd.date_range(start=start_date, end=end_date, freq="D").date if d.weekday() < 5]
+        return pd.DataFrame({"trade_date": days})
+
+
+def test_trade_calendar_records_coverage_for_closed_only_ranges(tmp_path: Path) -> None:
+    provider = OpenDaysOnlyProvider()
+    composite = CompositeDataProvider(
+        [provider],
+        cache_store=LocalTimeseriesCache(str(tmp_path / "market_cache_weekend.db")),
+        enable_cache=True,
+    )
+    composite.get_daily_bars_with_source("000001", date(2025, 1, 6), date(2025, 1, 10))
+    composite.get_daily_bars_with_source("000001", date(2025, 1, 6), date(2025, 1, 12))
+    composite.get_daily_bars_with_source("000001", date(2025, 1, 6), date(2025, 1, 12))
+    assert provider.calendar_calls == [
+        (date(2025, 1, 6), date(2025, 1, 10)),
+        (date(2025, 1, 11), date(2025, 1, 12)),
+    ]
+    assert len(provider.calls) == 1
+
+
+def test_trade_calendar_keeps_fetched_edge_when_sibling_edge_fails(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "market_cache_partial.db")
+    seed = OpenDaysOnlyProvider()
+    CompositeDataProvider([seed], cache_store=LocalTimeseriesCache(db_path), enable_cache=True).get_daily_bars_with_source(
+        "000001", date(2025, 1, 6), date(2025, 1, 10)
+    )
+
+    provider = OpenDaysOnlyProvider(fail_before=date(2025, 1, 6))
+    composite = CompositeDataProvider([provider], cache_store=LocalTimeseriesCache(db_path), enable_cache=True)
+    composite.get_daily_bars_with_source("000001", date(2025, 1, 1), date(2025, 1, 17))
+    assert provider.calendar_calls == [
+        (date(2025, 1, 1), date(2025, 1, 5)),
+        (date(2025, 1, 11), date(2025, 1, 17)),
+    ]
+
+    provider.calendar_calls.clear()
+    composite.get_daily_bars_with_source("000001", date(2025, 1, 6), date(2025, 1, 17))
+    assert provider.calendar_calls == []
+
+
 def test_composite_provider_intraday_cache_reuse(tmp_path: Path) -> None:
     provider = CountingProvider()
     cache = LocalTimeseriesCache(str(tmp_path / "market_cache_intraday.db"))
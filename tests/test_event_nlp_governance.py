@@ -466,3 +466,54 @@ def test_nlp_label_adjudication_consistency_and_snapshot(tmp_path: Path) -> None
     assert snapshot.consensus_size == 1
     assert snapshot.conflict_size == 0
     assert snapshot.hash_sha256
+
+
+def test_drift_window_metrics_merge_daily_sketches_maintained_at_ingest(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "event.db")
+    event_service = EventService(store=EventStore(db_path))
+    _ = event_service.register_source(
+        EventSourceRegisterRequest(source_name="sketch_feed", source_type="ANNOUNCEMENT", provider="mock", created_by="qa")
+    )
+
+    def _event(i: int, score: float, day: int, matched: str = "share_buyback") -> EventRecordCreate:
+        return EventRecordCreate(
+            event_id=f"s-{i}",
+            symbol="000001",
+            event_type="share_buyback" if matched else "generic_announcement",
+            publish_time=datetime(2025, 3, day, 9, 30, tzinfo=timezone.utc),
+            polarity=EventPolarity.POSITIVE if matched else EventPolarity.NEUTRAL,
+            score=score,
+            metadata={"matched_rules": matched, "nlp_ruleset_version": "ruleset-v3"},
+        )
+
+    events = [_event(i, 0.1 * (i + 1), day=1 + i % 3, matched="share_buyback" if i % 2 else "") for i in range(9)]
+    _ = event_service.ingest(EventBatchIngestRequest(source_name="sketch_feed", events=events))
+    # Re-ingesting moves s-0 to another day and changes its score: the old contribution is subtracted.
+    _ = event_service.ingest(EventBatchIngestRequest(source_name="sketch_feed", events=[_event(0, 0.95, day=5)]))
+
+    store = EventNLPStore(db_path)
+    service = EventNLPGovernanceService(store=store)
+    metrics = service._window_metrics(
+        source_name="sketch_feed",
+        start_date=date(2025, 3, 1),
+        end_date=date(2025, 3, 3),
+        fallback_ruleset_version="fallback",
+    )
+    scores = sorted(round(0.1 * (i + 1), 10) for i in range(1, 9))
+    assert metrics.sample_size == 8
+    assert metrics.hit_count == 4
+    assert metrics.hit_rate == 0.5
+    assert metrics.ruleset_version == "ruleset-v3"
+    assert metrics.score_mean == round(sum(scores) / len(scores), 6)
+    assert metrics.score_p10 == round(scores[0] + (scores[1] - scores[0]) * 0.7, 6)
+    assert metrics.score_p50 == round((scores[3] + scores[4]) / 2, 6)
+    assert metrics.top_event_types == {"share_buyback": 4, "generic_announcement": 4}
+
+    moved = store.load_metric_sketch(source_name="sketch_feed", start_date=date(2025, 3, 5), end_date=date(2025, 3, 5))
+    assert moved.sample_size == 1
+    assert moved.score_quantile(0.5) == 0.95
+
+    before = store.load_metric_sketch(source_name=None, start_date=date(2025, 3, 1), end_date=date(2025, 3, 31))
+    assert store.rebuild_metric_sketches() == 4
+    after = store.load_metric_sketch(source_name=None, start_date=date(2025, 3, 1), end_date=date(2025, 3, 31))
+    assert after == before
@@ -145,6 +145,63 @@ def test_holding_service_positions_and_analysis(tmp_path: Path) -> None:
     assert result.positions[0].style_regime
 
 
+class BatchEventProvider(FakeProvider):
+    def __init__(self) -> None:
+        self.event_batches: list[list[str]] = []
+
+    def get_corporate_event_snapshots_many_with_source(
+        self,
+        *,
+        symbols: list[str],
+        as_of: date,
+        lookback_days: int = 120,
+    ) -> tuple[str, dict[str, dict[str, object]]]:
+        _ = (as_of, lookback_days)
+        self.event_batches.append(list(symbols))
+        return "fake_events", {symbol: {"event_score": 0.6, "event_count": 1} for symbol in symbols}
+
+    def get_corporate_event_snapshot_with_source(self, **kwargs):
+        raise AssertionError("holdings analysis should fetch event snapshots in one batch")
+
+
+def test_holding_analysis_fetches_event_snapshots_in_batches(tmp_path: Path) -> None:
+    provider = BatchEventProvider()
+    service = HoldingService(
+        store=HoldingStore(str(tmp_path / "holdings.db")),
+        provider=provider,  # type: ignore[arg-type]
+        factor_engine=FactorEngine(),
+        registry=StrategyRegistry(),
+        autotune=DummyAutotune(),  # type: ignore[arg-type]
+    )
+    for symbol in ("000001", "000002"):
+        service.record_trade(
+            req=ManualHoldingTradeCreate(
+                trade_date=date(2025, 1, 2),
+                symbol=symbol,
+                symbol_name=symbol,
+                side="BUY",
+                price=10.0,
+                lots=1,
+                lot_size=100,
+                fee=1.0,
+                note="",
+            )
+        )
+
+    service.analyze(
+        req=ManualHoldingAnalysisRequest(
+            as_of_date=date(2025, 1, 10),
+            strategy_name="trend_following",
+            use_autotune_profile=False,
+            available_cash=20_000,
+            candidate_symbols=["600000", "600001", "000001"],
+            max_new_buys=2,
+            lot_size=100,
+        )
+    )
+    assert provider.event_batches == [["000001", "000002"], ["600000", "600001"]]
+
+
 def test_holdings_api_flow(tmp_path: Path) -> None:
     service = _build_service(tmp_path)
     audit = AuditService(AuditStore(str(tmp_path / "audit.db")))
@@ -1,9 +1,11 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from types import SimpleNamespace
+from zoneinfo import ZoneInfo
 
 from trading_assistant.core.models import (
     JobRegisterRequest,
+    JobRunStatus,
     JobSLABreachType,
     JobType,
 )
@@ -43,7 +45,7 @@ class FakeReportingService:
         )
 
 
-def _service(tmp_path: Path) -> JobService:
+def _service(tmp_path: Path, catchup_minutes: int = 1440) -> JobService:
     return JobService(
         store=JobStore(str(tmp_path / "job.db")),
         pipeline=FakePipelineRunner(),
@@ -51,6 +53,7 @@ def _service(tmp_path: Path) -> JobService:
         reporting=FakeReportingService(),
         scheduler_timezone="Asia/Shanghai",
         running_timeout_minutes=60,
+        catchup_minutes=catchup_minutes,
     )
 
 
@@ -60,6 +63,32 @@ def test_cron_schedule_matches_weekday_rule() -> None:
     assert schedule.matches(datetime(2026, 1, 4, 17, 0, 0)) is False  # Sunday
 
 
+def test_cron_next_fire_jumps_fields_and_matches_minute_walk() -> None:
+    zone = ZoneInfo("Asia/Shanghai")
+    schedule = CronSchedule.parse("*/20 9-10 1,15 * 1")
+    start = datetime(2026, 1, 30, 23, 59, 40, tzinfo=zone)
+    end = start + timedelta(days=40)
+    walked = []
+    cursor = start.replace(second=0) + timedelta(minutes=1)
+    while cursor <= end:
+        if schedule.matches(cursor):
+            walked.append(cursor)
+        cursor += timedelta(minutes=1)
+    fires = list(schedule.fires_between(start, end))
+    assert fires == walked
+    assert fires[0] == datetime(2026, 2, 1, 9, 0, tzinfo=zone)  # the 1st (dom), a Sunday
+    assert fires[0].tzinfo is zone
+    assert schedule.next_fire(start) == fires[0]
+    assert schedule.previous_fire(fires[3]) == fires[3]
+    assert schedule.previous_fire(fires[3] - timedelta(minutes=1)) == fires[2]
+
+    leap = CronSchedule.parse("0 0 29 2 *")
+    assert leap.next_fire(datetime(2097, 3, 1)) == datetime(2104, 2, 29)
+    assert leap.previous_fire(datetime(2026, 1, 1)) == datetime(2024, 2, 29)
+    assert leap.previous_at_or_before(datetime(2026, 1, 1)) is None  # outside the one-year window
+    assert CronSchedule.parse("0 0 30 2 *").next_fire(datetime(2026, 1, 1)) is None
+
+
 def test_scheduler_tick_triggers_once_per_minute(tmp_path: Path) -> None:
     service = _service(tmp_path)
     job_id = service.register(
@@ -120,3 +149,100 @@ def test_scheduler_sla_detects_missed_run(tmp_path: Path) -> None:
     breaches = [b for b in report.breaches if b.job_id == job_id]
     assert len(breaches) == 1
     assert breaches[0].breach_type == JobSLABreachType.MISSED_RUN
+
+
+def test_sla_state_updates_incrementally_on_run_start_and_finish(tmp_path: Path) -> None:
+    service = _service(tmp_path)
+    job_id = service.register(
+        JobRegisterRequest(
+            name="close-report",
+            job_type=JobType.REPORT_GENERATE,
+            owner="ops",
+            schedule_cron="0 17 * * 1-5",
+            payload={"report_type": "risk", "save_to_file": False},
+        )
+    )
+    store = service.store
+    # Monday 17:30 Shanghai: the 17:00 run is overdue.
+    as_of = datetime(2026, 1, 5, 9, 30, tzinfo=timezone.utc)
+    report = service.evaluate_sla(as_of=as_of, grace_minutes=15)
+    assert [(b.job_id, b.breach_type) for b in report.breaches] == [(job_id, JobSLABreachType.MISSED_RUN)]
+    assert report.breaches[0].delay_minutes == 30
+    seq = max(x.seq for x in store.list_sla_state_changes())
+
+    store.create_run(run_id="run-1", job_id=job_id, triggered_by="scheduler")
+    with store._conn() as conn:
+        conn.execute("UPDATE job_runs SET started_at = ? WHERE run_id = 'run-1'", ("2026-01-05T09:01:00+00:00",))
+        conn.execute("UPDATE job_sla_state SET last_started_at = ? WHERE job_id = ?", ("2026-01-05T09:01:00+00:00", job_id))
+    assert [x.job_id for x in store.list_sla_state_changes(after_seq=seq)] == [job_id]
+    assert service.evaluate_sla(as_of=as_of, grace_minutes=15).breaches == []
+
+    # Still RUNNING an hour past the run timeout (60 minutes in _service).
+    late = datetime(2026, 1, 5, 10, 30, tzinfo=timezone.utc)
+    report = service.evaluate_sla(as_of=late, grace_minutes=15)
+    assert [b.breach_type for b in report.breaches] == [JobSLABreachType.RUNNING_TIMEOUT]
+
+    store.finish_run(run_id="run-1", status=JobRunStatus.FAILED, result_summary={}, error_message="boom")
+    report = service.evaluate_sla(as_of=late, grace_minutes=15)
+    assert [(b.breach_type, b.message) for b in report.breaches] == [(JobSLABreachType.LATEST_RUN_FAILED, "boom")]
+    assert store.list_sla_state_changes(after_seq=max(x.seq for x in store.list_sla_state_changes())) == []
+
+    # Next weekday's fire is reached by advancing the cached cursor, not by re-reading the store.
+    report = service.evaluate_sla(as_of=datetime(2026, 1, 6, 9, 20, tzinfo=timezone.utc), grace_minutes=15)
+    assert [b.breach_type for b in report.breaches] == [JobSLABreachType.MISSED_RUN]
+    assert report.breaches[0].expected_run_at == datetime(2026, 1, 6, 9, 0, tzinfo=timezone.utc)
+
+
+def test_scheduler_tick_catches_up_latest_missed_fire(tmp_path: Path) -> None:
+    service = _service(tmp_path)
+    job_id = service.register(
+        JobRegisterRequest(
+            name="close-report",
+            job_type=JobType.REPORT_GENERATE,
+            owner="ops",
+            schedule_cron="0 17 * * 1-5",
+            payload={"report_type": "risk", "save_to_file": False},
+        )
+    )
+    with service.store._conn() as conn:
+        conn.execute("UPDATE job_definitions SET created_at = ? WHERE id = ?", ("2026-01-01T00:00:00+00:00", job_id))
+
+    # Scheduler was down over Monday 17:00 Shanghai (09:00 UTC); it comes back at 18:30.
+    back_online = datetime(2026, 1, 5, 10, 30, tzinfo=timezone.utc)
+    lagging = _service(tmp_path, catchup_minutes=60).scheduler_tick(as_of=back_online)
+    assert lagging.triggered_runs == []
+
+    first = service.scheduler_tick(as_of=back_online)
+    assert first.caught_up_jobs == [job_id]
+    assert first.matched_jobs == [job_id]
+    assert len(first.triggered_runs) == 1
+
+    second = service.scheduler_tick(as_of=back_online + timedelta(minutes=1))
+    assert second.triggered_runs == []
+    assert second.matched_jobs == []
+
+
+def test_scheduler_catchup_ignores_manual_runs_after_served_fire(tmp_path: Path) -> None:
+    service = _service(tmp_path)
+    job_id = service.register(
+        JobRegisterRequest(
+            name="close-report",
+            job_type=JobType.REPORT_GENERATE,
+            owner="ops",
+            schedule_cron="0 17 * * 1-5",
+            payload={"report_type": "risk", "save_to_file": False},
+        )
+    )
+    with service.store._conn() as conn:
+        conn.execute("UPDATE job_definitions SET created_at = ? WHERE id = ?", ("2026-01-01T00:00:00+00:00", job_id))
+
+    fire = datetime(2026, 1, 5, 9, 0, tzinfo=timezone.utc)
+    on_time = service.scheduler_tick(as_of=fire)
+    assert len(on_time.triggered_runs) == 1
+
+    service.trigger(job_id=job_id, triggered_by="manual")
+
+    later = service.scheduler_tick(as_of=fire + timedelta(minutes=6))
+    assert later.caught_up_jobs == []
+    assert later.triggered_runs == []
+    assert len(service.list_runs(job_id)) == 2
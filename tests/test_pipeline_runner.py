@@ -229,3 +229,53 @@ def test_pipeline_small_capital_mode_flags_blocked_symbol(tmp_path: Path) -> Non
     result = runner.run(req)
     assert len(result.results) == 1
     assert result.results[0].small_capital_note is not None
+
+
+class RecordingRiskEngine(RiskEngine):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.batches: list[list] = []
+
+    def evaluate(self, req):
+        raise AssertionError("pipeline should evaluate risk in one batch")
+
+    def evaluate_many(self, requests):
+        reqs = list(requests)
+        self.batches.append(reqs)
+        return super().evaluate_many(reqs)
+
+
+def test_pipeline_evaluates_risk_once_for_all_symbols(tmp_path: Path) -> None:
+    risk_engine = RecordingRiskEngine(
+        max_single_position=0.05,
+        max_drawdown=0.12,
+        max_industry_exposure=0.2,
+        min_turnover_20d=1000,
+    )
+    runner = DailyPipelineRunner(
+        provider=CompositeDataProvider([ExpensiveProvider()]),
+        factor_engine=FactorEngine(),
+        registry=StrategyRegistry(),
+        risk_engine=risk_engine,
+        signal_service=SignalService(),
+        quality_service=DataQualityService(),
+        pit_validator=PITValidator(),
+        snapshot_service=DataSnapshotService(DataSnapshotStore(str(tmp_path / "snapshot.db"))),
+        small_capital_mode_enabled=True,
+        small_capital_principal_cny=2000,
+    )
+    req = PipelineRunRequest(
+        symbols=["000001", "000002", "000003"],
+        start_date=date(2025, 1, 2),
+        end_date=date(2025, 1, 2),
+        strategy_name="multi_factor",
+        enable_small_capital_mode=True,
+        small_capital_principal=2000,
+    )
+    result = runner.run(req)
+
+    assert len(risk_engine.batches) == 1
+    assert len(risk_engine.batches[0]) == result.total_signals > 0
+    expected = [RiskEngine.evaluate(risk_engine, risk_req) for risk_req in risk_engine.batches[0]]
+    assert result.total_blocked == sum(1 for item in expected if item.blocked)
+    assert all(item.small_capital_note is not None for item in result.results)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import date, timedelta
+import math
 
 import pandas as pd
 
@@ -153,3 +154,35 @@ def test_portfolio_backtest_risk_circuit_breaker_blocks_rebalance() -> None:
     )
     assert result.metrics.risk_blocked_days >= 1
     assert result.metrics.trade_count >= 1
+
+
+def test_portfolio_panel_aligns_symbols_on_union_calendar() -> None:
+    from trading_assistant.backtest.portfolio_panel import PortfolioPanel
+
+    start = date(2025, 1, 1)
+    early = _bars("000001", start, 10.0, days=30)
+    late = _bars("000002", start + timedelta(days=5), 12.0, days=25)
+    late = late.drop(index=[3, 4])  # gap: two missing sessions
+    late.loc[late.index[-1], "is_suspended"] = True
+
+    panel = PortfolioPanel.build(
+        bars_by_symbol={"000001": early.iloc[::-1], "000002": late},
+        symbols=["000001", "000002", "000003"],
+        factor_engine=FactorEngine(),
+    )
+    assert panel.dates == sorted(early["trade_date"])
+    assert panel.close.shape == (30, 3)
+    assert panel.row[4, 1] == -1 and panel.row[5, 1] == 0
+    gap = panel.dates.index(start + timedelta(days=8))
+    assert math.isnan(panel.close[gap, 1])
+    assert panel.row[gap, 1] == panel.row[gap - 1, 1]  # latest known row is carried over the gap
+    assert panel.close[-1, 1] == late["close"].iloc[-1]
+    assert bool(panel.flags["is_suspended"][-1, 1]) is True
+    assert (panel.row[:, 2] == -1).all()
+    # Feature row k equals recomputing on the first k + 1 bars.
+    k = int(panel.row[20, 0])
+    prefix = FactorEngine().compute(early.sort_values("trade_date").iloc[: k + 1].reset_index(drop=True))
+    pd.testing.assert_series_equal(
+        panel.features[0].iloc[k][["ma20", "zscore20", "turnover20"]],
+        prefix.iloc[-1][["ma20", "zscore20", "turnover20"]],
+    )
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import date, datetime
+
+import httpx
+import pandas as pd
+import pytest
+
+from trading_assistant.data.base import MarketDataProvider
+from trading_assistant.data.composite_provider import CompositeDataProvider
+from trading_assistant.data.rate_limit import (
+    ProviderScheduler,
+    RequestPriority,
+    TokenBucket,
+    is_throttle_error,
+    provider_priority,
+)
+
+
+class ThrottlingProvider(MarketDataProvider):
+    name = "fake"
+
+    def __init__(self, throttle_first: int = 0) -> None:
+        self.throttle_first = throttle_first
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_daily_bars(self, symbol: str, start_date: date, end_date: date) -> pd.DataFrame:
+        with self._lock:
+            self.calls += 1
+            throttled = self.calls <= self.throttle_first
+        if throttled:
+            raise RuntimeError("抱歉，您每分钟最多访问该接口200次")
+        return pd.DataFrame({"trade_date": [start_date], "symbol": symbol, "close": 10.0})
+
+    def get_trade_calendar(self, start_date: date, end_date: date) -> pd.DataFrame:
+        return pd.DataFrame()
+
+    def get_security_status(self, symbol: str) -> dict[str, bool]:
+        return {"is_st": False, "is_suspended": False}
+
+    def get_intraday_bars(
+        self,
+        symbol: str,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        *,
+        interval: str = "15m",
+    ) -> pd.DataFrame:
+        return pd.DataFrame()
+
+
+def test_token_bucket_refills_at_configured_rate() -> None:
+    now = [0.0]
+    bucket = TokenBucket(60, burst=2, clock=lambda: now[0])
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == pytest.approx(1.0)
+    now[0] = 0.5
+    assert bucket.try_acquire() == pytest.approx(0.5)
+    now[0] = 1.0
+    assert bucket.try_acquire() == 0.0
+
+
+def test_throttle_detection_ignores_429_inside_symbols_and_counts() -> None:
+    assert not is_throttle_error(RuntimeError("no daily bars returned for 600429.SH"))
+    assert not is_throttle_error(ValueError("expected 1429 rows, got 0 for 002429"))
+    assert is_throttle_error(RuntimeError("HTTP 429 from upstream"))
+    assert is_throttle_error(RuntimeError("status_code=429"))
+    assert is_throttle_error(RuntimeError("抱歉，您每分钟最多访问该接口200次"))
+    request = httpx.Request("GET", "https://example.invalid/daily")
+    response = httpx.Response(429, request=request)
+    assert is_throttle_error(httpx.HTTPStatusError("slow down", request=request, response=response))
+    not_found = httpx.Response(404, request=request)
+    assert not is_throttle_error(httpx.HTTPStatusError("missing 600429", request=request, response=not_found))
+
+
+def test_provider_rate_limit_is_shared_across_endpoints() -> None:
+    scheduler = ProviderScheduler(rate_limits_per_min={"fake": 60, "fake.ep_b": 600})
+    for endpoint in ("ep_a", "ep_b"):
+        scheduler.call("fake", endpoint, lambda: None)
+    # The provider bucket (burst 5 at 60/min) is one budget for both endpoints.
+    for endpoint in ("ep_a", "ep_b", "ep_a"):
+        scheduler.call("fake", endpoint, lambda: None)
+    started = time.monotonic()
+    scheduler.call("fake", "ep_b", lambda: None)
+    assert time.monotonic() - started >= 0.5
+
+    rows = {row["endpoint"]: row for row in scheduler.stats()}
+    assert rows["ep_a"]["rate_limit_per_min"] is None
+    assert rows["ep_b"]["rate_limit_per_min"] == 600
+    assert {row["provider_rate_limit_per_min"] for row in rows.values()} == {60}
+
+
+def test_throttle_errors_halve_endpoint_concurrency_and_surface_in_stats() -> None:
+    provider = ThrottlingProvider(throttle_first=2)
+    scheduler = ProviderScheduler(max_concurrency=8)
+    composite = CompositeDataProvider([provider], scheduler=scheduler)
+
+    for day in (1, 2):
+        with pytest.raises(Exception):
+            composite.get_daily_bars_with_source("000001", date(2025, 1, day), date(2025, 1, day))
+    source, _ = composite.get_daily_bars_with_source("000001", date(2025, 1, 3), date(2025, 1, 3))
+    assert source == "fake"
+
+    [row] = composite.scheduler_stats()
+    assert (row["provider"], row["endpoint"]) == ("fake", "get_daily_bars")
+    assert row["calls"] == 3
+    assert row["throttle_events"] == 2
+    assert row["inflight"] == 0
+    # 8 -> 4 -> 2 after two throttles, then additive increase by 1/limit.
+    assert row["concurrency_limit"] == pytest.approx(2.5)
+
+
+def test_interactive_calls_are_admitted_before_waiting_bulk_calls() -> None:
+    scheduler = ProviderScheduler(max_concurrency=1)
+    gate = threading.Event()
+    order: list[str] = []
+
+    holder = threading.Thread(target=lambda: scheduler.call("fake", "ep", lambda: gate.wait(2.0)))
+    holder.start()
+    time.sleep(0.05)
+
+    def bulk() -> None:
+        with provider_priority(RequestPriority.BULK):
+            scheduler.call("fake", "ep", lambda: order.append("bulk"))
+
+    def interactive() -> None:
+        scheduler.call("fake", "ep", lambda: order.append("interactive"))
+
+    bulk_thread = threading.Thread(target=bulk)
+    bulk_thread.start()
+    time.sleep(0.05)
+    interactive_thread = threading.Thread(target=interactive)
+    interactive_thread.start()
+    time.sleep(0.05)
+
+    [row] = scheduler.stats()
+    assert (row["waiting_bulk"], row["waiting_interactive"]) == (1, 1)
+    gate.set()
+    for t in (holder, bulk_thread, interactive_thread):
+        t.join()
+    assert order == ["interactive", "bulk"]
+    assert scheduler.stats()[0]["queue_wait_ms_max"] > 0
@@ -1,5 +1,6 @@
 from datetime import date
 from pathlib import Path
+import sqlite3
 
 from trading_assistant.core.models import (
     CostModelCalibrationRequest,
@@ -234,3 +235,68 @@ def test_replay_aggregates_multiple_executions_per_signal(tmp_path: Path) -> Non
     assert item.executed_quantity == 300
     assert abs(item.executed_price - ((100 * 10.0 + 200 * 10.2) / 300.0)) < 1e-9
     assert item.slippage_available is True
+
+
+def test_replay_execution_summary_tracks_latest_side_and_backfills(tmp_path: Path) -> None:
+    db_path = tmp_path / "replay.db"
+    service = ReplayService(ReplayStore(str(db_path)))
+    for signal_id, action in (("sig-a", SignalAction.BUY), ("sig-b", SignalAction.SELL), ("sig-c", SignalAction.BUY)):
+        service.record_signal(
+            SignalDecisionRecord(
+                signal_id=signal_id,
+                symbol="000001",
+                strategy_name="trend_following",
+                trade_date=date(2025, 2, 3),
+                action=action,
+                confidence=0.7,
+                reason="x",
+            )
+        )
+    # A late-recorded fill with an earlier date must not replace the latest executed side.
+    fills = ((date(2025, 2, 6), SignalAction.SELL, 10.4), (date(2025, 2, 4), SignalAction.BUY, 10.1))
+    for execution_date, side, price in fills:
+        service.record_execution(
+            ExecutionRecordCreate(
+                signal_id="sig-a",
+                symbol="000001",
+                execution_date=execution_date,
+                side=side,
+                quantity=100,
+                price=price,
+                reference_price=10.0,
+            )
+        )
+    service.record_execution(
+        ExecutionRecordCreate(
+            signal_id="sig-b",
+            symbol="000001",
+            execution_date=date(2025, 2, 3),
+            side=SignalAction.SELL,
+            quantity=200,
+            price=9.9,
+        )
+    )
+
+    report = service.report(symbol="000001")
+    by_id = {item.signal_id: item for item in report.items}
+    assert by_id["sig-a"].executed_action == SignalAction.SELL
+    assert by_id["sig-a"].execution_date == date(2025, 2, 6)
+    assert by_id["sig-a"].delay_days == 3
+    assert by_id["sig-b"].followed is True and by_id["sig-b"].slippage_available is False
+    assert by_id["sig-c"].executed_quantity == 0
+
+    stats = service.execution_stats(symbol="000001")
+    assert stats.sample_size == 3
+    assert (stats.follow_rate, stats.avg_delay_days, stats.avg_slippage_bps) == (
+        report.follow_rate,
+        report.avg_delay_days,
+        report.avg_slippage_bps,
+    )
+
+    # Databases written before the summary table existed are backfilled on open.
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP TABLE execution_summary")
+    conn.close()
+    reopened = ReplayService(ReplayStore(str(db_path)))
+    assert reopened.report(symbol="000001") == report
+    assert reopened.store.rebuild_execution_summary() == 2
@@ -0,0 +1,102 @@
+import random
+from datetime import date
+
+import numpy as np
+
+from trading_assistant.core.models import (
+    PortfolioSnapshot,
+    Position,
+    RiskCheckRequest,
+    SignalAction,
+    SignalCandidate,
+)
+from trading_assistant.risk.batch import ACTION_BUY, LEVEL_CRITICAL, RiskBatch
+from trading_assistant.risk.engine import RiskEngine
+
+
+def build_engine(require_data: bool = False) -> RiskEngine:
+    return RiskEngine(
+        max_single_position=0.05,
+        max_drawdown=0.12,
+        max_industry_exposure=0.2,
+        min_turnover_20d=5_000_000,
+        fundamental_require_data_for_buy=require_data,
+    )
+
+
+def _maybe(rng: random.Random, value: float, p_none: float = 0.3) -> float | None:
+    return None if rng.random() < p_none else value
+
+
+def _random_request(rng: random.Random) -> RiskCheckRequest:
+    action = rng.choice(list(SignalAction))
+    portfolio = None
+    if rng.random() < 0.7:
+        portfolio = PortfolioSnapshot(
+            current_drawdown=rng.uniform(0.0, 0.25),
+            industry_exposure={"bank": rng.uniform(0.0, 0.25)} if rng.random() < 0.6 else {},
+        )
+    position = None
+    if rng.random() < 0.6:
+        position = Position(symbol="000001", quantity=200, available_quantity=rng.choice([0, 100]))
+    return RiskCheckRequest(
+        signal=SignalCandidate(
+            symbol="000001",
+            trade_date=date(2025, 1, 2),
+            action=action,
+            reason="property",
+            suggested_position=_maybe(rng, rng.uniform(0.0, 0.1)),
+        ),
+        position=position,
+        portfolio=portfolio,
+        is_st=rng.random() < 0.15,
+        is_suspended=rng.random() < 0.15,
+        at_limit_up=rng.random() < 0.2,
+        at_limit_down=rng.random() < 0.2,
+        avg_turnover_20d=_maybe(rng, rng.uniform(0, 10_000_000)),
+        symbol_industry=rng.choice([None, "bank", "media"]),
+        fundamental_score=_maybe(rng, rng.uniform(0.0, 1.0)),
+        fundamental_pit_ok=rng.choice([None, True, False]),
+        fundamental_stale_days=_maybe(rng, rng.randint(0, 900)),
+        tushare_disclosure_risk_score=_maybe(rng, rng.uniform(0.0, 1.0)),
+        tushare_audit_opinion_risk=_maybe(rng, rng.uniform(0.0, 1.0)),
+        tushare_forecast_pchg_mid=_maybe(rng, rng.uniform(-90.0, 50.0)),
+        tushare_pledge_ratio=_maybe(rng, rng.uniform(0.0, 80.0)),
+        tushare_share_float_unlock_ratio=_maybe(rng, rng.uniform(0.0, 0.6)),
+        tushare_overhang_risk_score=_maybe(rng, rng.uniform(0.0, 1.0)),
+        enable_small_capital_mode=rng.random() < 0.5,
+        small_capital_principal=_maybe(rng, rng.uniform(1_000, 20_000)),
+        available_cash=_maybe(rng, rng.uniform(0, 20_000)),
+        required_cash_for_min_lot=_maybe(rng, rng.uniform(500, 15_000)),
+        estimated_roundtrip_cost_bps=_maybe(rng, rng.uniform(0, 80)),
+        expected_edge_bps=_maybe(rng, rng.uniform(0, 150)),
+        min_expected_edge_bps=_maybe(rng, rng.uniform(0, 60)),
+        small_capital_cash_buffer_ratio=rng.uniform(0.0, 0.5),
+    )
+
+
+def test_evaluate_many_matches_per_request_evaluation() -> None:
+    rng = random.Random(20250102)
+    reqs = [_random_request(rng) for _ in range(400)]
+    for require_data in (False, True):
+        engine = build_engine(require_data)
+        batched = engine.evaluate_many(reqs)
+        assert [r.model_dump() for r in batched] == [engine.evaluate(req).model_dump() for req in reqs]
+
+
+def test_evaluate_batch_from_columns_exposes_masks() -> None:
+    engine = build_engine()
+    batch = RiskBatch.from_columns(
+        action=["BUY", "BUY", "SELL"],
+        suggested_position=[0.03, 0.08, np.nan],
+        avg_turnover_20d=[9_000_000, 9_000_000, 1_000],
+        available_quantity=[np.nan, np.nan, 100],
+    )
+    result = engine.evaluate_batch(batch)
+
+    assert result.levels.shape == (len(engine.rules), 3)
+    assert result.blocked.tolist() == [False, True, False]
+    assert result.rule_passed("single_position_limit").tolist() == [True, False, True]
+    assert result.rule_passed("liquidity_min_turnover").tolist() == [True, True, False]
+    assert int(result.level[1]) == LEVEL_CRITICAL
+    assert int(batch.action[0]) == ACTION_BUY
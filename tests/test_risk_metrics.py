@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from trading_assistant.core.models import OptimizedWeight, StressScenario, StressTestRequest
+from trading_assistant.portfolio.stress import PortfolioStressTester
+from trading_assistant.risk.metrics import RollingVarEs, historical_var_es, historical_var_es_many
+
+
+def _sorted_var_es(returns: list[float], confidence: float) -> tuple[float, float]:
+    losses = sorted(max(0.0, -float(x)) for x in returns)
+    idx = max(0, min(len(losses) - 1, int(math.ceil(confidence * len(losses))) - 1))
+    tail = losses[idx:]
+    return losses[idx], sum(tail) / len(tail)
+
+
+@pytest.mark.parametrize("confidence", [0.5, 0.95, 0.99])
+def test_rolling_var_es_matches_full_recomputation(confidence: float) -> None:
+    rng = np.random.default_rng(5)
+    # Rounded returns produce many tied losses, including at the VaR boundary.
+    returns = np.round(rng.standard_t(3, size=600) * 0.01, 3).tolist()
+    window = 60
+    rolling = RollingVarEs(window, confidence=confidence)
+    for end, value in enumerate(returns, start=1):
+        var_value, es_value = rolling.update(value)
+        expected_var, expected_es = _sorted_var_es(returns[max(0, end - window) : end], confidence)
+        assert var_value == expected_var
+        assert es_value == pytest.approx(expected_es, rel=1e-12, abs=1e-15)
+    assert len(rolling) == window
+
+
+def test_partition_var_es_matches_sorted_reference_single_and_batched() -> None:
+    rng = np.random.default_rng(8)
+    histories = [rng.normal(0.0, 0.02, size=n).tolist() for n in (1, 5, 40, 40, 40, 251)] + [[]]
+    batched = historical_var_es_many(histories, confidence=0.95)
+    for values, pair in zip(histories, batched):
+        if not values:
+            assert pair == (None, None) == historical_var_es(values, confidence=0.95)
+            continue
+        expected_var, expected_es = _sorted_var_es(values, 0.95)
+        for got in (pair, historical_var_es(values, confidence=0.95)):
+            assert got[0] == expected_var
+            assert got[1] == pytest.approx(expected_es, rel=1e-12)
+
+
+def test_stress_run_many_matches_single_portfolio_runs() -> None:
+    scenarios = [
+        StressScenario(name="crash", shocks={"bank": -0.081, "tech": -0.153}, default_shock=-0.05),
+        StressScenario(name="rotation", shocks={"tech": 0.021, "energy": -0.034}),
+    ]
+    portfolios = [
+        [
+            OptimizedWeight(symbol="600000", weight=0.1235, industry="bank", score=0.6),
+            OptimizedWeight(symbol="300750", weight=0.2005, industry="tech", score=0.7),
+            OptimizedWeight(symbol="600036", weight=0.0715, industry="bank", score=0.5),
+        ],
+        [OptimizedWeight(symbol="601857", weight=0.3, industry="energy", score=0.4)],
+    ]
+    tester = PortfolioStressTester()
+    many = tester.run_many(portfolios, scenarios)
+    for weights, result in zip(portfolios, many):
+        assert result == tester.run(StressTestRequest(weights=weights, scenarios=scenarios))
+
+    crash = many[0].results[0]
+    assert list(crash.industry_breakdown) == ["bank", "tech"]
+    assert crash.industry_breakdown["bank"] == round(0.1235 * -0.081 + 0.0715 * -0.081, 6)
+    assert crash.portfolio_return == round(0.1235 * -0.081 + 0.2005 * -0.153 + 0.0715 * -0.081, 6)
+    assert many[1].results[0].portfolio_return == round(0.3 * -0.05, 6)
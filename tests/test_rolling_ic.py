@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_assistant.applied_stats import statistics
+from trading_assistant.applied_stats.statistics import (
+    information_coefficient,
+    rolling_ic_matrix,
+    rolling_information_coefficient,
+    rolling_information_coefficient_many,
+)
+
+
+def _naive_rolling_ic(x: np.ndarray, y: np.ndarray, window: int, method: str, min_obs: int) -> list[float | None]:
+    out: list[float | None] = []
+    for end in range(window - 1, x.size):
+        xs = x[end - window + 1 : end + 1]
+        ys = y[end - window + 1 : end + 1]
+        mask = np.isfinite(xs) & np.isfinite(ys)
+        out.append(information_coefficient(xs[mask], ys[mask], method=method) if mask.sum() >= min_obs else None)
+    return out
+
+
+@pytest.mark.parametrize("method", ["spearman", "pearson"])
+def test_rolling_ic_matrix_matches_per_window_recomputation(method: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = np.random.default_rng(12)
+    t_len = 160
+    factors = np.round(rng.normal(size=(t_len, 3)), 1)
+    targets = rng.normal(size=(t_len, 2)) + 0.4 * factors[:, :2]
+    targets[:, 1] = np.round(targets[:, 1])
+    factors[rng.random(factors.shape) < 0.1] = np.nan
+    targets[rng.random(targets.shape) < 0.1] = np.nan
+    factors[40:90, 2] = 1.5  # constant stretch -> degenerate windows
+    # Small blocks exercise the block boundaries of the Spearman kernel.
+    monkeypatch.setattr(statistics, "_RANK_BLOCK_ELEMENTS", 16200)
+
+    ic = rolling_ic_matrix(factors, targets, window=30, method=method, min_obs=12)
+    assert ic.shape == (t_len - 29, 3, 2)
+    for f in range(3):
+        for k in range(2):
+            expected = _naive_rolling_ic(factors[:, f], targets[:, k], 30, method, 12)
+            got = ic[:, f, k]
+            assert [v is None for v in expected] == list(np.isnan(got))
+            np.testing.assert_allclose(
+                [v for v in expected if v is not None], got[np.isfinite(got)], rtol=0, atol=1e-10
+            )
+
+
+def test_rolling_information_coefficient_payload_shape() -> None:
+    dates = pd.date_range("2025-01-01", periods=12, freq="D").date
+    x = np.arange(12, dtype=float)
+    out = rolling_information_coefficient(trade_dates=dates, factor=x, target=x * 2.0, window=5, min_obs=5)
+    assert out["window"] == 5
+    assert [row["trade_date"] for row in out["series"]][0] == "2025-01-05"
+    assert out["summary"]["count"] == 8
+    assert out["summary"]["mean"] == pytest.approx(1.0)
+
+
+def test_rolling_ic_handles_empty_factor_sets() -> None:
+    dates = pd.date_range("2025-01-01", periods=12, freq="D").date
+    x = np.arange(12, dtype=float)
+    assert rolling_information_coefficient_many(trade_dates=dates, factors={}, targets={"fwd": x}, window=5) == {}
+    assert rolling_information_coefficient_many(trade_dates=dates, factors={"x": x}, targets={}, window=5) == {}
+    for method in ("spearman", "pearson"):
+        assert rolling_ic_matrix(np.empty((12, 0)), x, window=5, method=method).shape == (8, 0, 1)
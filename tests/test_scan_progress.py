@@ -0,0 +1,121 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from trading_assistant.workflow.scan_progress import (
+    JsonSnapshotReader,
+    ScanResultAggregator,
+    compact_scan_jsonl,
+    load_scan_checkpoint,
+    scan_checkpoint_path,
+    write_json_atomic,
+    write_scan_checkpoint,
+)
+
+
+def _buy_row(symbol: str, confidence: float) -> dict[str, object]:
+    return {
+        "symbol": symbol,
+        "action": "BUY",
+        "blocked": False,
+        "risk_level": "INFO",
+        "close": 5.0,
+        "max_buy_price": 10.0,
+        "buy_price_high": 5.05,
+        "confidence": confidence,
+        "error": None,
+    }
+
+
+def test_aggregator_keeps_bounded_top_n_and_counters() -> None:
+    agg = ScanResultAggregator(top_n=2)
+    agg.add(_buy_row("000001", 0.70))
+    agg.add(_buy_row("000002", 0.90))
+    agg.add(_buy_row("000003", 0.80))
+    agg.add({"symbol": "000004", "action": "TIMEOUT", "error": "timeout"})
+    agg.add({"symbol": "000005", "action": "ERROR", "error": "boom"})
+
+    assert [row["symbol"] for row in agg.top_candidates()] == ["000002", "000003"]
+    assert agg.counters() == {
+        "scanned_symbols": 5,
+        "buy_pass_symbols": 3,
+        "error_symbols": 1,
+        "timeout_symbols": 1,
+    }
+    snap = agg.snapshot(total_symbols=10, status="RUNNING")
+    assert snap["progress_pct"] == 50.0
+    assert snap["status"] == "RUNNING"
+    assert len(snap["top_candidates"]) == 2
+
+
+def test_aggregator_ignores_duplicate_symbols() -> None:
+    agg = ScanResultAggregator(top_n=5)
+    assert agg.add(_buy_row("000001", 0.70)) is True
+    assert agg.add(_buy_row("000001", 0.99)) is False
+    assert agg.scanned == 1
+    assert agg.top_candidates()[0]["confidence"] == 0.70
+    assert "000001" in agg
+
+
+def test_snapshot_reader_reparses_only_on_change(tmp_path: Path) -> None:
+    path = tmp_path / "progress.json"
+    write_json_atomic(path, {"scanned_symbols": 1})
+    reader = JsonSnapshotReader()
+    assert reader.read(path)["scanned_symbols"] == 1
+
+    # same mtime/size signature -> cached payload is served without parsing
+    stat = path.stat()
+    path.write_text(json.dumps({"scanned_symbols": 7}), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert reader.read(path)["scanned_symbols"] == 1
+
+    write_json_atomic(path, {"scanned_symbols": 42})
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert reader.read(path)["scanned_symbols"] == 42
+    assert reader.read(tmp_path / "missing.json") == {}
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_compact_scan_jsonl_skips_corrupt_lines_and_retries_failures(tmp_path: Path) -> None:
+    path = tmp_path / "scan.jsonl"
+    lines = [
+        json.dumps(_buy_row("000001", 0.70)),
+        "{not json",
+        json.dumps({"symbol": "000002", "action": "TIMEOUT", "error": "symbol timeout"}),
+        json.dumps(_buy_row("000003", 0.80)),
+        json.dumps({"symbol": "000004", "action": "ERROR", "error": "boom"}),
+        json.dumps({"symbol": "000005", "action": "SKIP", "error": None}),
+    ]
+    path.write_text("\n".join(lines) + "\n" + '{"symbol": "000006", "act', encoding="utf-8")
+
+    agg = ScanResultAggregator(top_n=5)
+    counts = compact_scan_jsonl(path, agg)
+
+    # Rows after the corrupt line survive; failed rows and the torn tail are dropped.
+    assert counts == {"kept": 3, "retry": 2, "corrupt": 2}
+    assert agg.scanned_symbols == {"000001", "000003", "000005"}
+    kept = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [row["symbol"] for row in kept] == ["000001", "000003", "000005"]
+    assert compact_scan_jsonl(tmp_path / "missing.jsonl", ScanResultAggregator(top_n=1))["kept"] == 0
+
+
+def test_scan_checkpoint_refuses_resume_with_other_parameters(tmp_path: Path) -> None:
+    path = tmp_path / "scan.jsonl"
+    params = {"start_date": "2025-01-01", "end_date": "2025-06-30", "principal": 2000.0}
+    write_scan_checkpoint(path, params=params, universe=["600000", "000001"])
+
+    assert load_scan_checkpoint(path, params=dict(params)) == ["600000", "000001"]
+    with pytest.raises(ValueError, match="end_date"):
+        load_scan_checkpoint(path, params={**params, "end_date": "2025-07-31"})
+    with pytest.raises(ValueError, match="principal"):
+        load_scan_checkpoint(path, params={**params, "principal": 5000.0})
+
+    payload = json.loads(scan_checkpoint_path(path).read_text(encoding="utf-8"))
+    payload["universe"].append("300750")
+    scan_checkpoint_path(path).write_text(json.dumps(payload), encoding="utf-8")
+    with pytest.raises(ValueError, match="universe"):
+        load_scan_checkpoint(path, params=params)
+    with pytest.raises(ValueError, match="missing"):
+        load_scan_checkpoint(tmp_path / "other.jsonl", params=params)
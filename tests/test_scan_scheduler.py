@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from collections import deque
+import os
+import time
+
+from trading_assistant.workflow.scan_scheduler import ShardedScanScheduler, _next_symbol, _WorkerSlot
+
+
+def _echo_worker(conn, config) -> None:
+    conn.send(("ready", None))
+    while True:
+        symbol = conn.recv()
+        if symbol is None:
+            break
+        if symbol.startswith("hang"):
+            time.sleep(60)
+        if symbol.startswith("crash"):
+            os._exit(1)
+        conn.send(("row", {"symbol": symbol, "action": "NONE", "received_at": time.monotonic()}))
+    conn.close()
+
+
+def _failing_worker(conn, config) -> None:
+    conn.send(("init_error", "no data provider available in worker"))
+    conn.close()
+
+
+def _scheduler(worker_main, **overrides) -> ShardedScanScheduler:
+    params = {
+        "worker_main": worker_main,
+        "worker_config": {},
+        "workers": 2,
+        "shard_size": 2,
+        "symbol_timeout_sec": 2.0,
+        "timeout_row": lambda symbol, timeout_sec: {"symbol": symbol, "action": "TIMEOUT"},
+        "crash_row": lambda symbol: {"symbol": symbol, "action": "ERROR"},
+        "init_timeout_sec": 30.0,
+    }
+    params.update(overrides)
+    return ShardedScanScheduler(**params)
+
+
+def test_idle_worker_steals_tail_half_of_largest_shard() -> None:
+    idle = _WorkerSlot(slot_id=0)
+    busy = _WorkerSlot(slot_id=1, shard=deque(["a", "b", "c", "d", "e"]))
+    small = _WorkerSlot(slot_id=2, shard=deque(["x", "y"]))
+    slots = [idle, busy, small]
+
+    assert _next_symbol(idle, slots, deque()) == "d"
+    assert list(idle.shard) == ["e"]
+    assert list(busy.shard) == ["a", "b", "c"]
+
+    # Queued shards are taken before stealing.
+    other = _WorkerSlot(slot_id=3)
+    assert _next_symbol(other, slots + [other], deque([["q1", "q2"]])) == "q1"
+    assert _next_symbol(_WorkerSlot(slot_id=4, shard=deque()), [_WorkerSlot(slot_id=5, shard=deque(["z"]))], deque()) is None
+
+
+def test_scheduler_recycles_workers_on_timeout_and_crash() -> None:
+    scheduler = _scheduler(_echo_worker)
+    rows: list[dict] = []
+    leftover = scheduler.run(["a", "hang-1", "b", "crash-1", "c", "d"], rows.append)
+
+    assert leftover == []
+    by_symbol = {row["symbol"]: row["action"] for row in rows}
+    assert by_symbol == {"a": "NONE", "hang-1": "TIMEOUT", "b": "NONE", "crash-1": "ERROR", "c": "NONE", "d": "NONE"}
+    assert scheduler.recycled_workers == 2
+    assert scheduler.retired_workers == 0
+
+
+def test_scheduler_retires_workers_that_fail_to_start_and_returns_leftover() -> None:
+    scheduler = _scheduler(_failing_worker)
+    rows: list[dict] = []
+    symbols = ["a", "b", "c", "d", "e"]
+    leftover = scheduler.run(symbols, rows.append)
+
+    assert rows == []
+    assert sorted(leftover) == symbols
+    assert scheduler.retired_workers == 2
+    assert scheduler.recycled_workers == 2 * ShardedScanScheduler.max_init_failures
+
+
+def test_dispatch_interval_is_global_across_workers() -> None:
+    scheduler = _scheduler(_echo_worker, workers=3, shard_size=1, dispatch_interval_sec=0.2)
+    rows: list[dict] = []
+    assert scheduler.run(["a", "b", "c", "d"], rows.append) == []
+
+    received = sorted(row["received_at"] for row in rows)
+    gaps = [later - earlier for earlier, later in zip(received, received[1:])]
+    assert len(rows) == 4
+    assert min(gaps) >= 0.15
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+from trading_assistant.data.base import MarketDataProvider
+from trading_assistant.data.composite_provider import CompositeDataProvider
+from trading_assistant.data.single_flight import SingleFlight
+
+
+class SlowProvider(MarketDataProvider):
+    name = "slow"
+
+    def __init__(self, delay_sec: float = 0.2) -> None:
+        self.delay_sec = delay_sec
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_daily_bars(self, symbol: str, start_date: date, end_date: date) -> pd.DataFrame:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay_sec)
+        days = pd.date_range(start=start_date, end=end_date, freq="D").date
+        return pd.DataFrame({"trade_date": days, "symbol": symbol, "close": 10.0})
+
+    def get_trade_calendar(self, start_date: date, end_date: date) -> pd.DataFrame:
+        return pd.DataFrame()
+
+    def get_security_status(self, symbol: str) -> dict[str, bool]:
+        return {"is_st": False, "is_suspended": False}
+
+    def get_intraday_bars(
+        self,
+        symbol: str,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        *,
+        interval: str = "15m",
+    ) -> pd.DataFrame:
+        return pd.DataFrame()
+
+
+def test_concurrent_identical_daily_requests_share_one_upstream_call() -> None:
+    provider = SlowProvider()
+    composite = CompositeDataProvider([provider])
+    start, end = date(2025, 1, 1), date(2025, 1, 10)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: composite.get_daily_bars_with_source("000001", start, end), range(8)))
+
+    assert provider.calls == 1
+    assert all(source == "slow" and len(bars) == 10 for source, bars in results)
+    # Followers receive their own frame copies.
+    assert len({id(bars) for _, bars in results}) == 8
+    stats = composite.coalescing_stats()
+    assert stats["calls"] == 8
+    assert stats["executed"] == 1
+    assert stats["coalesced"] == 7
+    assert stats["inflight"] == 0
+
+    composite.get_daily_bars_with_source("000001", start, end + timedelta(days=1))
+    assert provider.calls == 2
+
+
+def test_single_flight_bounds_waiting_on_a_stuck_leader() -> None:
+    flight = SingleFlight(wait_timeout_sec=0.05)
+    release = threading.Event()
+
+    def stuck() -> str:
+        release.wait(2.0)
+        return "leader"
+
+    leader = threading.Thread(target=lambda: flight.do("k", stuck))
+    leader.start()
+    time.sleep(0.02)
+    assert flight.do("k", lambda: "own") == "own"
+    release.set()
+    leader.join()
+    stats = flight.stats()
+    assert stats["wait_timeouts"] == 1
+    assert stats["executed"] == 2
+
+
+def test_single_flight_shares_leader_errors() -> None:
+    flight = SingleFlight(wait_timeout_sec=2.0)
+    gate = threading.Event()
+
+    def failing() -> str:
+        gate.wait(2.0)
+        raise RuntimeError("upstream down")
+
+    errors: list[BaseException] = []
+
+    def call() -> None:
+        try:
+            flight.do("err", failing)
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    gate.set()
+    for t in threads:
+        t.join()
+    assert len(errors) == 3
+    # Each caller raises its own instance so tracebacks from different threads never mix.
+    assert len({id(exc) for exc in errors}) == 3
+    assert all(str(exc) == "upstream down" for exc in errors)
+    assert flight.stats()["errors"] == 1
+    assert flight.stats()["executed"] == 1
+
+
+def test_single_flight_leader_mutation_does_not_leak_to_followers() -> None:
+    flight = SingleFlight(wait_timeout_sec=2.0)
+    gate = threading.Event()
+    frame = pd.DataFrame({"close": [10.0, 10.5]})
+
+    def fetch() -> tuple[pd.DataFrame, dict]:
+        gate.wait(2.0)
+        return frame, {"meta": {"tags": ["a"]}}
+
+    results: list[tuple[pd.DataFrame, dict]] = []
+    lock = threading.Lock()
+
+    def call() -> None:
+        bars, info = flight.do("k", fetch)
+        # Callers enrich their result in place, as the signal pipeline does.
+        bars["is_st"] = True
+        info["meta"]["tags"].append("mutated")
+        with lock:
+            results.append((bars, info))
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    gate.set()
+    for t in threads:
+        t.join()
+
+    assert "is_st" not in frame.columns
+    assert all(info["meta"]["tags"] == ["a", "mutated"] for _, info in results)
+    assert len({id(bars) for bars, _ in results}) == 4
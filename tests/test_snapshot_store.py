@@ -1,7 +1,14 @@
 from datetime import date
 from pathlib import Path
+import sqlite3
+
+import pandas as pd
+from pydantic import ValidationError
+import pytest
 
 from trading_assistant.core.models import DataSnapshotRegisterRequest
+from trading_assistant.data.utils import CONTENT_HASH_ALGORITHM, CONTENT_HASH_CSV_V1, dataframe_content_hash
+from trading_assistant.governance.snapshot_service import DataSnapshotService
 from trading_assistant.governance.snapshot_store import DataSnapshotStore
 
 
@@ -22,3 +29,88 @@ def test_snapshot_store_register_and_latest(tmp_path: Path) -> None:
     latest = store.latest_snapshot("daily_bars", "000001")
     assert latest is not None
     assert latest.content_hash == "hash123"
+
+
+def test_snapshot_store_duplicate_returns_existing_id_after_other_insert(tmp_path: Path) -> None:
+    store = DataSnapshotStore(str(tmp_path / "snapshot.db"))
+
+    def _req(content_hash: str) -> DataSnapshotRegisterRequest:
+        return DataSnapshotRegisterRequest(
+            dataset_name="daily_bars",
+            symbol="000001",
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 1, 31),
+            provider="akshare",
+            row_count=20,
+            content_hash=content_hash,
+        )
+
+    first_id = store.register(_req("a"))
+    second_id = store.register(_req("b"))
+    assert second_id != first_id
+    assert store.register(_req("a")) == first_id
+    assert store.register(_req("b")) == second_id
+
+
+def test_snapshot_store_keeps_legacy_hashes_verifiable(tmp_path: Path) -> None:
+    db_path = tmp_path / "snapshot.db"
+    bars = pd.DataFrame({"trade_date": [date(2025, 1, 2), date(2025, 1, 3)], "close": [10.0, 10.2]})
+    with sqlite3.connect(db_path) as conn:
+        # Table layout written by releases before hash algorithm ids were stored.
+        conn.execute(
+            """
+            CREATE TABLE data_snapshots (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, created_at TEXT NOT NULL, dataset_name TEXT NOT NULL,
+                symbol TEXT NOT NULL, start_date TEXT NOT NULL, end_date TEXT NOT NULL, provider TEXT NOT NULL,
+                row_count INTEGER NOT NULL, schema_version TEXT NOT NULL, content_hash TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO data_snapshots VALUES (1, '2025-01-04T00:00:00+00:00', 'daily_bars', '000001',"
+            " '2025-01-02', '2025-01-03', 'akshare', 2, 'v1', ?)",
+            (dataframe_content_hash(bars, algorithm=CONTENT_HASH_CSV_V1),),
+        )
+    conn.close()
+
+    service = DataSnapshotService(DataSnapshotStore(str(db_path)))
+    legacy = service.get(1)
+    assert legacy is not None and legacy.hash_algorithm == CONTENT_HASH_CSV_V1
+    assert service.verify_frame(1, bars) is True
+
+    new_id = service.register(
+        DataSnapshotRegisterRequest(
+            dataset_name="daily_bars",
+            symbol="000001",
+            start_date=date(2025, 1, 2),
+            end_date=date(2025, 1, 3),
+            provider="akshare",
+            row_count=2,
+            content_hash=dataframe_content_hash(bars),
+            hash_algorithm=CONTENT_HASH_ALGORITHM,
+        )
+    )
+    assert service.get(new_id).hash_algorithm == CONTENT_HASH_ALGORITHM
+    assert service.verify_frame(new_id, bars) is True
+    assert service.verify_frame(new_id, bars.assign(close=[10.0, 10.3])) is False
+    assert service.verify_frame(999, bars) is None
+
+
+def test_snapshot_register_request_defaults_client_hashes_to_csv_v1(tmp_path: Path) -> None:
+    bars = pd.DataFrame({"trade_date": [date(2025, 1, 2), date(2025, 1, 3)], "close": [10.0, 10.2]})
+    service = DataSnapshotService(DataSnapshotStore(str(tmp_path / "snapshot.db")))
+    payload = {
+        "dataset_name": "daily_bars",
+        "symbol": "000001",
+        "start_date": "2025-01-02",
+        "end_date": "2025-01-03",
+        "provider": "client",
+        "row_count": 2,
+        "content_hash": dataframe_content_hash(bars, algorithm=CONTENT_HASH_CSV_V1),
+    }
+    snapshot_id = service.register(DataSnapshotRegisterRequest.model_validate(payload))
+    assert service.get(snapshot_id).hash_algorithm == CONTENT_HASH_CSV_V1
+    assert service.verify_frame(snapshot_id, bars) is True
+
+    with pytest.raises(ValidationError):
+        DataSnapshotRegisterRequest.model_validate({**payload, "hash_algorithm": "md5-v0"})
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+
+from trading_assistant.audit.store import AuditStore
+from trading_assistant.core.sqlite import SQLiteConnectionPool, SQLiteSettings, configure_sqlite, sqlite_settings
+
+
+@pytest.fixture(autouse=True)
+def _restore_sqlite_settings():
+    previous = sqlite_settings()
+    yield
+    configure_sqlite(previous)
+
+
+def test_pool_reuses_one_configured_connection_per_thread(tmp_path) -> None:
+    configure_sqlite(SQLiteSettings(busy_timeout_ms=2500, mmap_size_bytes=1 << 20))
+    pool = SQLiteConnectionPool(tmp_path / "pool.db")
+    conn = pool.connection()
+    assert pool.connection() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 2500
+
+    with conn:
+        conn.execute("CREATE TABLE t (v INTEGER)")
+        conn.execute("INSERT INTO t VALUES (1)")
+
+    seen: dict[str, object] = {}
+
+    def _worker() -> None:
+        other = pool.connection()
+        seen["same"] = other is conn
+        with other:
+            other.execute("INSERT INTO t VALUES (2)")
+        seen["rows"] = [row["v"] for row in other.execute("SELECT v FROM t ORDER BY v")]
+
+    thread = threading.Thread(target=_worker)
+    thread.start()
+    thread.join()
+    assert seen == {"same": False, "rows": [1, 2]}
+    assert [row[0] for row in conn.execute("SELECT v FROM t ORDER BY v")] == [1, 2]
+
+    pool.close_all()
+    assert pool.connection() is not conn
+
+
+def test_close_all_closes_connections_owned_by_live_threads(tmp_path) -> None:
+    pool = SQLiteConnectionPool(tmp_path / "pool.db")
+    opened = threading.Event()
+    closed = threading.Event()
+    seen: dict[str, object] = {}
+
+    def _worker() -> None:
+        conn = pool.connection()
+        opened.set()
+        closed.wait(2.0)
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        seen["reopened"] = pool.connection().execute("SELECT 1").fetchone()[0]
+
+    thread = threading.Thread(target=_worker)
+    thread.start()
+    opened.wait(2.0)
+    pool.close_all()
+    closed.set()
+    thread.join()
+    assert seen == {"reopened": 1}
+
+
+def test_unpooled_mode_opens_fresh_default_connections(tmp_path) -> None:
+    configure_sqlite(SQLiteSettings(pooled=False))
+    pool = SQLiteConnectionPool(tmp_path / "legacy.db")
+    first = pool.connection()
+    assert pool.connection() is not first
+    assert first.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+
+
+def test_settings_reject_unknown_pragma_values() -> None:
+    with pytest.raises(ValueError):
+        SQLiteSettings(journal_mode="wal; DROP TABLE x")
+    with pytest.raises(ValueError):
+        SQLiteSettings(synchronous="SOMETIMES")
+
+
+def test_store_round_trip_through_pooled_connection(tmp_path) -> None:
+    store = AuditStore(str(tmp_path / "audit.db"))
+    with store._conn() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert store._conn() is store._conn()
@@ -339,3 +339,38 @@ def test_validation_diagnostic_hint_tplus1_blocked_sell_only() -> None:
     hint = StrategyChallengeService._build_validation_diagnostic_hint(vm)
     assert hint is not None
     assert "T+1" in hint
+
+
+class CountingProvider(FakeProvider):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_daily_bars_with_source(self, symbol: str, start_date: date, end_date: date):
+        self.calls += 1
+        return super().get_daily_bars_with_source(symbol, start_date, end_date)
+
+
+def test_strategy_challenge_loads_bars_once_and_mapped_store_matches(tmp_path: Path) -> None:
+    from trading_assistant.data.bar_store import MemoryMappedBarStore
+
+    provider = CountingProvider()
+    service = _service(tmp_path, provider=provider)
+    req = StrategyChallengeRequest(
+        symbol="000001",
+        start_date=date(2024, 1, 1),
+        end_date=date(2025, 12, 31),
+        strategy_names=["trend_following", "mean_reversion"],
+        per_strategy_max_combinations=8,
+    )
+    results, _ = service._evaluate_strategies_sequential(req=req, strategy_names=req.strategy_names)
+    assert provider.calls == 1
+
+    provider_name, bars = service._load_bars(req)
+    store = MemoryMappedBarStore.build(tmp_path / "bars", {req.symbol: bars}, sources={req.symbol: provider_name})
+    mapped = (store.source(req.symbol), store.frame(req.symbol))
+    for expected in results:
+        item, _ = service._evaluate_single_strategy(req=req, strategy_name=expected.strategy_name, shared=mapped)
+        assert item.error is None
+        assert item.provider == "fake_provider"
+        assert item.best_params == expected.best_params
+        assert item.full_backtest_metrics == expected.full_backtest_metrics
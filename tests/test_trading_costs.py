@@ -1,13 +1,26 @@
+import numpy as np
+import pytest
+
 from trading_assistant.trading.costs import (
     calc_side_fee,
+    calc_side_fee_many,
     estimate_fill_probability,
+    estimate_fill_probability_many,
     estimate_market_impact_rate,
+    estimate_market_impact_rate_many,
     estimate_roundtrip_cost_bps,
+    estimate_roundtrip_cost_bps_many,
     filled_quantity_by_probability,
+    filled_quantity_by_probability_many,
+    infer_expected_edge_bps,
+    infer_expected_edge_bps_many,
     required_cash_for_min_lot,
+    required_cash_for_min_lot_many,
     tiered_slippage_rate,
+    tiered_slippage_rate_many,
 )
 from trading_assistant.core.models import SignalAction
+from trading_assistant.risk.batch import ACTION_BUY, ACTION_SELL, ACTION_WATCH
 
 
 def test_side_fee_respects_min_commission() -> None:
@@ -87,3 +100,160 @@ def test_fill_probability_and_partial_fill() -> None:
     qty = filled_quantity_by_probability(desired_qty=2000, lot_size=100, fill_probability=0.35)
     assert qty % 100 == 0
     assert 0 <= qty <= 2000
+
+
+# Property tests: every *_many function must agree element-wise with its scalar version
+# over random draws that include the branch edges (zero/negative sizes, missing ADV,
+# exact tier boundaries, minimum-commission crossover, lot rounding).
+
+def _draws(seed: int, n: int = 400) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    notional = rng.choice([0.0, -10.0, 500.0, 16_666.67, 1e5, 2e6, 5e7], size=n) * rng.uniform(0.5, 1.5, size=n)
+    adv = rng.choice([np.nan, 0.0, 0.5, 1e6, 8e7], size=n) * rng.uniform(0.5, 1.5, size=n)
+    boundary = rng.random(n) < 0.2
+    adv[boundary] = 1e6
+    notional[boundary] = rng.choice([0.005, 0.015, 0.03, 0.06], size=int(boundary.sum())) * 1e6
+    return {
+        "notional": notional,
+        "adv": adv,
+        "price": rng.choice([-1.0, 0.0, 1.23, 9.8, 150.0], size=n),
+        "lot": rng.choice([-100, 0, 1, 100, 200], size=n),
+        "rate": rng.choice([0.0, 0.0001, 0.00025, 0.0003], size=n),
+        "min_comm": rng.choice([0.0, 5.0], size=n),
+        "is_sell": rng.random(n) < 0.5,
+        "prob": rng.uniform(-0.2, 1.2, size=n),
+        "qty": rng.choice([-100, 0, 100, 250, 2000, 12345], size=n),
+        "score": np.where(rng.random(n) < 0.2, np.nan, rng.normal(0.5, 0.4, size=n)),
+        "flags": rng.random((5, n)) < 0.15,
+        "side": rng.choice([ACTION_BUY, ACTION_SELL, ACTION_WATCH], size=n),
+    }
+
+
+def _opt(value: float) -> float | None:
+    return None if np.isnan(value) else float(value)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_array_fee_and_cost_functions_match_scalar_versions(seed: int) -> None:
+    d = _draws(seed)
+    fees = calc_side_fee_many(
+        notional=d["notional"],
+        commission_rate=d["rate"],
+        min_commission=d["min_comm"],
+        transfer_fee_rate=0.00001,
+        stamp_duty_sell_rate=0.0005,
+        is_sell=d["is_sell"],
+    )
+    bps = estimate_roundtrip_cost_bps_many(
+        price=d["price"],
+        lot_size=d["lot"],
+        commission_rate=d["rate"],
+        min_commission=d["min_comm"],
+        transfer_fee_rate=0.00001,
+        stamp_duty_sell_rate=0.0005,
+        slippage_rate=0.0005,
+    )
+    cash = required_cash_for_min_lot_many(
+        price=d["price"], lot_size=d["lot"], commission_rate=d["rate"], min_commission=d["min_comm"], transfer_fee_rate=0.00001
+    )
+    edge = infer_expected_edge_bps_many(
+        confidence=d["prob"], momentum20=d["score"] - 0.5, event_score=d["score"], fundamental_score=d["score"][::-1]
+    )
+    for i in range(d["notional"].size):
+        rate, min_comm = float(d["rate"][i]), float(d["min_comm"][i])
+        assert fees[i] == calc_side_fee(
+            notional=float(d["notional"][i]),
+            commission_rate=rate,
+            min_commission=min_comm,
+            transfer_fee_rate=0.00001,
+            stamp_duty_sell_rate=0.0005,
+            is_sell=bool(d["is_sell"][i]),
+        )
+        price, lot = float(d["price"][i]), int(d["lot"][i])
+        assert bps[i] == estimate_roundtrip_cost_bps(
+            price=price,
+            lot_size=lot,
+            commission_rate=rate,
+            min_commission=min_comm,
+            transfer_fee_rate=0.00001,
+            stamp_duty_sell_rate=0.0005,
+            slippage_rate=0.0005,
+        )
+        assert cash[i] == required_cash_for_min_lot(
+            price=price, lot_size=lot, commission_rate=rate, min_commission=min_comm, transfer_fee_rate=0.00001
+        )
+        score = float(d["score"][i])
+        assert edge[i] == infer_expected_edge_bps(
+            confidence=float(d["prob"][i]),
+            momentum20=_opt(score - 0.5),
+            event_score=_opt(score),
+            fundamental_score=_opt(float(d["score"][::-1][i])),
+        )
+
+
+@pytest.mark.parametrize("seed", [3, 4, 5])
+def test_array_liquidity_and_fill_functions_match_scalar_versions(seed: int) -> None:
+    d = _draws(seed)
+    slip = tiered_slippage_rate_many(order_notional=d["notional"], avg_turnover_20d=d["adv"], base_slippage_rate=0.0005)
+    impact = estimate_market_impact_rate_many(
+        order_notional=d["notional"], avg_turnover_20d=d["adv"], impact_coeff=0.18, impact_exponent=0.6
+    )
+    up, down, word_up, word_down, suspended = d["flags"]
+    fill = estimate_fill_probability_many(
+        side=d["side"],
+        is_suspended=suspended,
+        at_limit_up=up,
+        at_limit_down=down,
+        is_one_word_limit_up=word_up,
+        is_one_word_limit_down=word_down,
+        avg_turnover_20d=d["adv"],
+        order_notional=d["notional"],
+        probability_floor=0.02,
+    )
+    filled = filled_quantity_by_probability_many(desired_qty=d["qty"], lot_size=d["lot"], fill_probability=d["prob"])
+    actions = {ACTION_BUY: SignalAction.BUY, ACTION_SELL: SignalAction.SELL, ACTION_WATCH: SignalAction.WATCH}
+    for i in range(d["notional"].size):
+        notional, adv = float(d["notional"][i]), _opt(float(d["adv"][i]))
+        assert slip[i] == tiered_slippage_rate(order_notional=notional, avg_turnover_20d=adv, base_slippage_rate=0.0005)
+        # np.power/np.exp and their libm counterparts may differ in the last ulp.
+        assert impact[i] == pytest.approx(
+            estimate_market_impact_rate(order_notional=notional, avg_turnover_20d=adv, impact_coeff=0.18, impact_exponent=0.6),
+            rel=1e-15,
+            abs=0.0,
+        )
+        expected_fill = estimate_fill_probability(
+            side=actions[int(d["side"][i])],
+            is_suspended=bool(suspended[i]),
+            at_limit_up=bool(up[i]),
+            at_limit_down=bool(down[i]),
+            is_one_word_limit_up=bool(word_up[i]),
+            is_one_word_limit_down=bool(word_down[i]),
+            avg_turnover_20d=adv,
+            order_notional=notional,
+            probability_floor=0.02,
+        )
+        assert fill[i] == pytest.approx(expected_fill, rel=1e-15, abs=0.0)
+        assert filled[i] == filled_quantity_by_probability(
+            desired_qty=int(d["qty"][i]), lot_size=int(d["lot"][i]), fill_probability=float(d["prob"][i])
+        )
+
+
+def test_fill_probability_many_accepts_single_side_and_broadcasts() -> None:
+    out = estimate_fill_probability_many(
+        side=SignalAction.SELL,
+        is_suspended=np.array([False, True, False]),
+        at_limit_down=np.array([True, False, False]),
+        avg_turnover_20d=2e7,
+        order_notional=np.array([1e5, 1e5, 1e5]),
+    )
+    assert out.tolist()[:2] == [0.15, 0.0]
+    assert out[2] == estimate_fill_probability(
+        side=SignalAction.SELL, is_suspended=False, avg_turnover_20d=2e7, order_notional=1e5
+    )
+
+
+def test_fill_probability_for_orders_far_above_adv_hits_floor() -> None:
+    # Participation of 1000x ADV used to overflow math.exp.
+    assert estimate_fill_probability(
+        side=SignalAction.BUY, is_suspended=False, avg_turnover_20d=1e6, order_notional=1e9, probability_floor=0.02
+    ) == 0.02